@@ -1,6 +1,7 @@
 from .connections import (
     get_application_connection_credentials,
-    get_connection_type
+    get_connection_type,
+    CredentialResolver
 )
 from .types import (
     ConnectionType,
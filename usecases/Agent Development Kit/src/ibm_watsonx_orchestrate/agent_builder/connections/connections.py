@@ -1,6 +1,7 @@
 import os
 import logging
-from typing import List
+from threading import Lock
+from typing import List, Mapping
 from ibm_watsonx_orchestrate.agent_builder.connections.types import (
     BasicAuthCredentials,
     BearerTokenAuthCredentials,
@@ -17,6 +18,11 @@ from ibm_watsonx_orchestrate.utils.utils import sanatize_app_id
 logger = logging.getLogger(__name__)
 
 _PREFIX_TEMPLATE = "WXO_CONNECTION_{app_id}_"
+_SCHEMA_KEY_TEMPLATE = "WXO_SECURITY_SCHEMA_{app_id}"
+# Prefixes of every environment variable the credentials of a connection can come from
+_CONNECTION_VARIABLE_PREFIXES = ("WXO_CONNECTION_", "WXO_SECURITY_SCHEMA_")
+
+_AUTH_TYPES = {e.value for e in ConnectionType}
 
 connection_type_requirements_mapping = {
     BasicAuthCredentials: ["username", "password"],
@@ -56,7 +62,7 @@ def _build_credentials_model(credentials_type: type[CREDENTIALS], vars: dict[str
     requirements = connection_type_requirements_mapping[credentials_type]
 
     if requirements:
-        requirements.append("url")
+        requirements = requirements + ["url"]
         model_dict={}
 
         for requirement in requirements:
@@ -78,10 +84,10 @@ def _build_credentials_model(credentials_type: type[CREDENTIALS], vars: dict[str
 def _validate_schema_type(requested_type: ConnectionType, expected_type: ConnectionType) -> bool:
         return expected_type == requested_type
 
-def _get_credentials_model(connection_type: ConnectionType, app_id: str) -> type[CREDENTIALS]:
+def _get_credentials_model(connection_type: ConnectionType, app_id: str, environ: Mapping[str, str] | None = None) -> type[CREDENTIALS]:
     base_prefix = _PREFIX_TEMPLATE.format(app_id=app_id)
     variables = {}
-    for key, value in os.environ.items():
+    for key, value in (os.environ if environ is None else environ).items():
         if key.startswith(base_prefix):
             variables[key] = value
     
@@ -93,31 +99,82 @@ def _get_credentials_model(connection_type: ConnectionType, app_id: str) -> type
 
     return _build_credentials_model(credentials_type=credentials_type, vars=variables, base_prefix=base_prefix)
 
-def get_connection_type(app_id: str) -> ConnectionType:
+def get_connection_type(app_id: str, environ: Mapping[str, str] | None = None) -> ConnectionType:
     sanitized_app_id = sanatize_app_id(app_id=app_id)
-    expected_schema_key = f"WXO_SECURITY_SCHEMA_{sanitized_app_id}"
-    expected_schema = os.environ.get(expected_schema_key)
+    expected_schema_key = _SCHEMA_KEY_TEMPLATE.format(app_id=sanitized_app_id)
+    expected_schema = (os.environ if environ is None else environ).get(expected_schema_key)
 
     if not expected_schema:
         message = f"No credentials found for connections '{app_id}'"
         logger.error(message)
         raise ValueError(message)
 
-    auth_types = {e.value for e in ConnectionType}
-    if expected_schema not in auth_types:
-        message = f"The expected type '{expected_schema}' cannot be resolved into a valid connection auth type ({', '.join(list(auth_types))})"
+    if expected_schema not in _AUTH_TYPES:
+        message = f"The expected type '{expected_schema}' cannot be resolved into a valid connection auth type ({', '.join(list(_AUTH_TYPES))})"
         logger.error(message)
         raise ValueError(message)
 
     return expected_schema
 
-def get_application_connection_credentials(type: ConnectionType, app_id: str) -> CREDENTIALS:
+def get_application_connection_credentials(type: ConnectionType, app_id: str, environ: Mapping[str, str] | None = None) -> CREDENTIALS:
     sanitized_app_id = sanatize_app_id(app_id=app_id)
-    expected_schema = get_connection_type(app_id=app_id)
+    expected_schema = get_connection_type(app_id=app_id, environ=environ)
 
     if not _validate_schema_type(requested_type=type, expected_type=expected_schema):
-        message = f"The requested type '{type.__name__}' does not match the type '{expected_schema}' for the connection '{app_id}'"
+        message = f"The requested type '{getattr(type, '__name__', type)}' does not match the type '{expected_schema}' for the connection '{app_id}'"
         logger.error(message)
         raise ValueError(message)
 
-    return _get_credentials_model(connection_type=type, app_id=sanitized_app_id)
\ No newline at end of file
+    return _get_credentials_model(connection_type=type, app_id=sanitized_app_id, environ=environ)
+
+def _copy_credentials(credentials: CREDENTIALS) -> CREDENTIALS:
+    if isinstance(credentials, KeyValueConnectionCredentials):
+        return KeyValueConnectionCredentials(credentials)
+    return credentials.model_copy()
+
+class CredentialResolver:
+    """
+    Resolves connection credentials for tools that look them up on every invocation.
+
+    The connection variables are read from the environment once and the credentials built for each app id and
+    type are kept, so repeated lookups skip the environment scan and model validation. Call refresh() after
+    the connection variables in the environment change.
+    """
+
+    def __init__(self, environ: Mapping[str, str] | None = None):
+        self.environ = os.environ if environ is None else environ
+        self._lock = Lock()
+        self._variables: dict[str, str] | None = None
+        self._credentials: dict[tuple[ConnectionType, str], CREDENTIALS] = {}
+
+    def _get_variables(self) -> dict[str, str]:
+        with self._lock:
+            if self._variables is None:
+                self._variables = {key: value for key, value in self.environ.items() if key.startswith(_CONNECTION_VARIABLE_PREFIXES)}
+            return self._variables
+
+    def get_connection_type(self, app_id: str) -> ConnectionType:
+        return get_connection_type(app_id=app_id, environ=self._get_variables())
+
+    def get_credentials(self, type: ConnectionType, app_id: str) -> CREDENTIALS:
+        """
+        Returns a copy of the credentials of type for the connection app_id, building them on the first lookup
+        """
+        key = (type, app_id)
+        credentials = self._credentials.get(key)
+        if credentials is None:
+            variables = self._get_variables()
+            credentials = get_application_connection_credentials(type=type, app_id=app_id, environ=variables)
+            with self._lock:
+                # Drop credentials built from variables that were refreshed in the meantime
+                if self._variables is variables:
+                    self._credentials[key] = credentials
+        return _copy_credentials(credentials)
+
+    def refresh(self) -> None:
+        """
+        Forgets the indexed environment and every credential built from it
+        """
+        with self._lock:
+            self._variables = None
+            self._credentials = {}
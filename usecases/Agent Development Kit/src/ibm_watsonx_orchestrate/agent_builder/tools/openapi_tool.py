@@ -2,7 +2,8 @@ import copy
 import json
 import os.path
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, List, Tuple
+from urllib.parse import unquote
 
 import yaml
 import yaml.constructor
@@ -14,7 +15,7 @@ from .types import ToolSpec
 from .base_tool import BaseTool
 from .types import HTTP_METHOD, ToolPermission, ToolRequestBody, ToolResponseBody, \
     OpenApiToolBinding, \
-    JsonSchemaObject, ToolBinding, OpenApiSecurityScheme, CallbackBinding
+    JsonSchemaObject, ToolBinding, OpenApiSecurityScheme, CallbackBinding, OpenApiOperationFilter
 
 import json
 
@@ -25,6 +26,102 @@ yaml.constructor.SafeConstructor.yaml_constructors[u'tag:yaml.org,2002:timestamp
     yaml.constructor.SafeConstructor.yaml_constructors[u'tag:yaml.org,2002:str']
 
 
+# Keys kept when a circular $ref is cut short, so the placeholder still describes the kind of value expected
+_CIRCULAR_REF_STUB_KEYS = ('type', 'title', 'description', 'format', 'nullable')
+
+
+class _OpenAPIRefResolver:
+    """
+    Resolves the $refs of an openapi document in a single pass.
+
+    Each local $ref target is resolved once and the result shared by every place referencing it.
+    A $ref that points back into a schema currently being resolved is replaced by a shallow stub
+    of its target, so circular schemas resolve to a finite document.
+    """
+
+    def __init__(self, document: dict):
+        self.document = document
+        self._resolved: Dict[str, Any] = {}
+        self._resolving: set[str] = set()
+
+    def resolve(self, node: Any) -> Any:
+        if isinstance(node, dict):
+            ref = node.get('$ref')
+            if isinstance(ref, str):
+                return self._resolve_ref(node, ref)
+            return {key: self.resolve(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [self.resolve(value) for value in node]
+        return node
+
+    def _resolve_ref(self, node: dict, ref: str) -> Any:
+        if not ref.startswith('#'):
+            # references to other documents are left to jsonref to load
+            return jsonref.replace_refs(node, jsonschema=True)
+
+        if ref in self._resolved:
+            return self._resolved[ref]
+
+        target = self._get_pointer(ref)
+        if ref in self._resolving:
+            logger.debug(f"Circular $ref {ref} found, replacing nested occurrence with a stub")
+            if isinstance(target, dict):
+                return {key: target[key] for key in _CIRCULAR_REF_STUB_KEYS if key in target}
+            return {}
+
+        self._resolving.add(ref)
+        try:
+            resolved = self.resolve(target)
+        finally:
+            self._resolving.discard(ref)
+        self._resolved[ref] = resolved
+        return resolved
+
+    def _get_pointer(self, ref: str) -> Any:
+        node = self.document
+        pointer = ref[1:].strip('/')
+        for part in pointer.split('/') if pointer else []:
+            part = unquote(part).replace('~1', '/').replace('~0', '~')
+            try:
+                node = node[int(part)] if isinstance(node, list) else node[part]
+            except (KeyError, IndexError, ValueError, TypeError):
+                raise ValueError(f"Invalid openapi spec, unable to resolve $ref '{ref}'")
+        return node
+
+
+# Top level sections that tools are not built from, only resolved when the whole document is
+_UNUSED_OPENAPI_SECTIONS = ('paths', 'components', 'webhooks')
+
+
+def _select_operations(openapi_spec: dict, operations: Iterable[Tuple[str, str]]) -> dict:
+    selected = {key: value for key, value in openapi_spec.items() if key not in _UNUSED_OPENAPI_SECTIONS}
+    if 'securitySchemes' in openapi_spec.get('components', {}):
+        selected['components'] = {'securitySchemes': openapi_spec['components']['securitySchemes']}
+
+    all_paths = openapi_spec.get('paths', {})
+    paths = selected['paths'] = {}
+    for http_path, http_method in operations:
+        path_item = all_paths[http_path]
+        if '$ref' in path_item:
+            paths[http_path] = path_item
+        else:
+            paths.setdefault(http_path, {})[http_method] = path_item[http_method]
+    return selected
+
+
+def resolve_openapi_refs(openapi_spec: dict, operations: Iterable[Tuple[str, str]] = None) -> dict:
+    """
+    Returns a copy of openapi_spec with its $refs replaced by their targets.
+    Shared targets are resolved once and circular $refs are cut short rather than recursing forever.
+    With operations, a list of (path, method) pairs, the copy only has those operations under paths, along with
+    the servers and security schemes, so schemas that none of them use are never resolved.
+    """
+    resolver = _OpenAPIRefResolver(openapi_spec)
+    if operations is None:
+        return resolver.resolve(openapi_spec)
+    return resolver.resolve(_select_operations(openapi_spec, operations))
+
+
 class HTTPException(Exception):
     def __init__(self, status_code: int, message: str):
         self.status_code = status_code
@@ -101,10 +198,38 @@ def create_openapi_json_tool(
     :param connection_id: The connection id of the application containing the credentials needed to authenticate against this api
     :return: An OpenAPITool that can be used by an agent
     """
+    return _create_openapi_json_tool_from_resolved(
+        openapi_spec=openapi_spec,
+        openapi_contents=resolve_openapi_refs(openapi_spec),
+        http_path=http_path,
+        http_method=http_method,
+        http_success_response_code=http_success_response_code,
+        http_response_content_type=http_response_content_type,
+        name=name,
+        description=description,
+        permission=permission,
+        input_schema=input_schema,
+        output_schema=output_schema,
+        connection_id=connection_id
+    )
 
-    # limitation does not support circular $refs
-    openapi_contents = jsonref.replace_refs(openapi_spec, jsonschema=True)
 
+def _create_openapi_json_tool_from_resolved(
+        openapi_spec: dict,
+        openapi_contents: dict,
+        http_path: str,
+        http_method: HTTP_METHOD,
+        http_success_response_code: int = 200,
+        http_response_content_type='application/json',
+        name: str = None,
+        description: str = None,
+        permission: ToolPermission = None,
+        input_schema: ToolRequestBody = None,
+        output_schema: ToolResponseBody = None,
+        connection_id: str = None
+) -> OpenAPITool:
+    # openapi_contents is the output of resolve_openapi_refs, which shares resolved $ref targets
+    # between operations, so anything taken from it is copied before being modified
     paths = openapi_contents.get('paths', {})
     route = paths.get(http_path)
     if route is None:
@@ -148,9 +273,10 @@ def create_openapi_json_tool(
         name = f"{parameter['in']}_{parameter['name']}"
         if parameter.get('required'):
             spec.input_schema.required.append(name)
-        parameter['schema']['title'] = parameter['name']
-        parameter['schema']['description'] = parameter.get('description', None)
-        spec.input_schema.properties[name] = JsonSchemaObject.model_validate(parameter['schema'])
+        parameter_schema = dict(parameter['schema'])
+        parameter_schema['title'] = parameter['name']
+        parameter_schema['description'] = parameter.get('description', None)
+        spec.input_schema.properties[name] = JsonSchemaObject.model_validate(parameter_schema)
         spec.input_schema.properties[name].in_field = parameter['in']
         spec.input_schema.properties[name].aliasName = parameter['name']
 
@@ -171,7 +297,7 @@ def create_openapi_json_tool(
     responses = route_spec.get('responses', {})
     response = responses.get(str(http_success_response_code), {})
     response_description = response.get('description')
-    response_schema = response.get('content', {}).get(http_response_content_type, {}).get('schema', {})
+    response_schema = dict(response.get('content', {}).get(http_response_content_type, {}).get('schema', {}))
 
     response_schema['required'] = []
     spec.output_schema = ToolResponseBody.model_validate(response_schema)
@@ -337,35 +463,51 @@ async def create_openapi_json_tool_from_uri(
 
 async def create_openapi_json_tools_from_uri(
         openapi_uri: str,
-        connection_id: str = None
+        connection_id: str = None,
+        operation_filter: OpenApiOperationFilter = None
 ) -> List[OpenAPITool]:
     openapi_contents = await _get_openapi_spec_from_uri(openapi_uri)
-    tools: List[OpenAPITool] = await create_openapi_json_tools_from_content(openapi_contents, connection_id)
+    tools: List[OpenAPITool] = await create_openapi_json_tools_from_content(openapi_contents, connection_id, operation_filter=operation_filter)
 
     return tools
 
+
 async def create_openapi_json_tools_from_content(
         openapi_contents: dict,
-        connection_id: str = None
+        connection_id: str = None,
+        operation_filter: OpenApiOperationFilter = None
 ) -> List[OpenAPITool]:
-   
-    tools: List[OpenAPITool] = []
+    """
+    Creates a tool for every operation of an openapi spec
 
-    for path, methods in openapi_contents.get('paths', {}).items():
-        for method, spec in methods.items():
-            if method.lower() == 'head':
-                continue
-            success_codes = list(filter(lambda code: 200 <= int(code) < 300, spec['responses'].keys()))
-            if len(success_codes) > 1:
-                logger.warning(
-                    f"There were multiple candidate success codes for {method} {path}, using {success_codes[0]} to generate output schema")
-
-            tools.append(create_openapi_json_tool(
-                openapi_contents,
-                http_path=path,
-                http_method=method.upper(),
-                http_success_response_code=success_codes[0] if len(success_codes) > 0 else None,
-                connection_id=connection_id
-            ))
+    :param openapi_contents: The parsed dictionary representation of an openapi spec
+    :param connection_id: The connection id of the application containing the credentials needed to authenticate against this api
+    :param operation_filter: Only create tools for the operations selected by this filter, the others are skipped before any conversion
+    :return: The OpenAPITools in the order their operations appear in the spec
+    """
+    tools: List[OpenAPITool] = []
+    operations = [
+        (path, method, spec)
+        for path, methods in openapi_contents.get('paths', {}).items()
+        for method, spec in methods.items()
+        if method.lower() != 'head' and (operation_filter is None or operation_filter.matches(path, spec))
+    ]
+    # Only the operations that were kept are resolved
+    resolved_contents = resolve_openapi_refs(openapi_contents, operations=[(path, method) for path, method, _ in operations])
+
+    for path, method, spec in operations:
+        success_codes = list(filter(lambda code: 200 <= int(code) < 300, spec['responses'].keys()))
+        if len(success_codes) > 1:
+            logger.warning(
+                f"There were multiple candidate success codes for {method} {path}, using {success_codes[0]} to generate output schema")
+
+        tools.append(_create_openapi_json_tool_from_resolved(
+            openapi_spec=openapi_contents,
+            openapi_contents=resolved_contents,
+            http_path=path,
+            http_method=method.upper(),
+            http_success_response_code=success_codes[0] if len(success_codes) > 0 else None,
+            connection_id=connection_id
+        ))
 
     return tools
@@ -1,4 +1,5 @@
 from enum import Enum
+from fnmatch import fnmatchcase
 from typing import List, Any, Dict, Literal, Optional, Union
 
 from pydantic import BaseModel, model_validator, ConfigDict, Field, AliasChoices
@@ -115,6 +116,34 @@ class OpenApiToolBinding(BaseModel):
         return self
 
 
+class OpenApiOperationFilter(BaseModel):
+    """
+    Selects which operations of an openapi spec are turned into tools. An operation is kept when no include
+    filter is set or it matches at least one of them, and it does not match any exclude filter.
+    Paths are matched as globs, e.g. /accounts/*
+    """
+    include_tags: List[str] = []
+    exclude_tags: List[str] = []
+    include_operation_ids: List[str] = []
+    exclude_operation_ids: List[str] = []
+    include_paths: List[str] = []
+    exclude_paths: List[str] = []
+
+    @staticmethod
+    def _matches_any(http_path: str, operation: dict, tags: List[str], operation_ids: List[str], paths: List[str]) -> bool:
+        return (
+            any(tag in tags for tag in operation.get('tags') or [])
+            or operation.get('operationId') in operation_ids
+            or any(fnmatchcase(http_path, pattern) for pattern in paths)
+        )
+
+    def matches(self, http_path: str, operation: dict) -> bool:
+        if (self.include_tags or self.include_operation_ids or self.include_paths) and \
+                not self._matches_any(http_path, operation, self.include_tags, self.include_operation_ids, self.include_paths):
+            return False
+        return not self._matches_any(http_path, operation, self.exclude_tags, self.exclude_operation_ids, self.exclude_paths)
+
+
 class PythonToolBinding(BaseModel):
     function: str
     requirements: Optional[List[str]] = []
@@ -0,0 +1,160 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Callable, List, Tuple
+
+from ibm_watsonx_orchestrate.agent_builder.agents import AgentKind
+from ibm_watsonx_orchestrate.client.agents.agent_client import AgentClient
+from ibm_watsonx_orchestrate.client.agents.external_agent_client import ExternalAgentClient
+from ibm_watsonx_orchestrate.client.agents.assistant_agent_client import AssistantAgentClient
+
+# Order in which a match is preferred when an id or name is found on more than one endpoint
+AGENT_KINDS = (AgentKind.NATIVE, AgentKind.EXTERNAL, AgentKind.ASSISTANT)
+# Keeps the names=... and ids=... query string of a single lookup well within URL length limits
+AGENT_LOOKUP_BATCH_SIZE = 50
+
+NAME_LOOKUPS = ("get_draft_by_name", "get_drafts_by_names")
+ID_LOOKUPS = ("get_draft_by_id", "get_drafts_by_ids")
+
+# Leaves room for a few lookups in flight at once, each fanning out to every endpoint
+AGENT_LOOKUP_WORKERS = 4 * len(AGENT_KINDS)
+
+AgentDrafts = dict[AgentKind, List[dict]]
+
+logger = logging.getLogger(__name__)
+
+
+class AgentDirectory:
+    """
+    Looks agents up on the native, external and assistant endpoints concurrently and merges the results.
+
+    Lookups are memoised for the lifetime of the directory, which is meant to span a single command.
+    Call forget() after creating, updating or removing an agent so later lookups see the change,
+    and close() once done, or use the directory as a context manager, to stop its worker threads.
+
+    An endpoint that fails fails the lookup, since callers decide whether to create, update or remove
+    agents based on what was found. Pass tolerate_failures=True on paths that only display results.
+    """
+
+    def __init__(self, native_client: AgentClient, external_client: ExternalAgentClient, assistant_client: AssistantAgentClient):
+        self.clients = (native_client, external_client, assistant_client)
+        self._clients_by_kind = dict(zip(AGENT_KINDS, self.clients))
+        # Memoised results per client method, keyed by the name or id that was looked up
+        self._cache: dict[str, dict[str, AgentDrafts]] = {method: {} for method in NAME_LOOKUPS + ID_LOOKUPS}
+        self._lock = Lock()
+        # Shared by every lookup rather than started per lookup, the worker threads are reused while idle
+        self._executor = ThreadPoolExecutor(max_workers=AGENT_LOOKUP_WORKERS, thread_name_prefix="agent-directory")
+
+    def close(self) -> None:
+        """
+        Shuts down the worker threads shared by the lookups
+        """
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "AgentDirectory":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _fan_out(self, lookup: Callable[[AgentClient | ExternalAgentClient | AssistantAgentClient], List[dict] | dict], tolerate_failures: bool) -> Tuple[dict[AgentKind, List[dict] | dict], bool]:
+        """
+        Runs lookup against every endpoint and returns the results along with whether every endpoint answered.
+        An endpoint that fails raises its error, unless tolerate_failures is set in which case it is logged
+        and treated as having no matches
+        """
+        futures = {kind: self._executor.submit(lookup, client) for kind, client in self._clients_by_kind.items()}
+        results = {}
+        complete = True
+        for kind, future in futures.items():
+            try:
+                results[kind] = future.result()
+            except Exception as e:
+                if not tolerate_failures:
+                    raise
+                logger.warning(f"Failed to look up {kind.value} agents: {e}")
+                results[kind] = []
+                complete = False
+        return results, complete
+
+    def _lookup_one(self, method: str, key: str, tolerate_failures: bool = False) -> AgentDrafts:
+        cache = self._cache[method]
+        with self._lock:
+            cached = cache.get(key)
+        if cached is None:
+            results, complete = self._fan_out(lambda client: getattr(client, method)(key), tolerate_failures)
+            cached = {kind: results[kind] if isinstance(results[kind], list) else [results[kind]] if results[kind] else [] for kind in AGENT_KINDS}
+            # Results missing an endpoint are not memoised so the next lookup tries it again
+            if complete:
+                with self._lock:
+                    cache[key] = cached
+        return {kind: list(drafts) for kind, drafts in cached.items()}
+
+    def _lookup_many(self, method: str, keys: List[str], key_field: str, tolerate_failures: bool = False) -> AgentDrafts:
+        cache = self._cache[method]
+        unique_keys = list(dict.fromkeys(keys))
+        with self._lock:
+            missing = [key for key in unique_keys if key not in cache]
+
+        # Results missing an endpoint are only used for this call and not memoised
+        uncached = {}
+        for i in range(0, len(missing), AGENT_LOOKUP_BATCH_SIZE):
+            batch = missing[i:i + AGENT_LOOKUP_BATCH_SIZE]
+            results, complete = self._fan_out(lambda client: getattr(client, method)(batch), tolerate_failures)
+            found = {key: {kind: [] for kind in AGENT_KINDS} for key in batch}
+            for kind, drafts in results.items():
+                for draft in drafts or []:
+                    if draft.get(key_field) in found:
+                        found[draft.get(key_field)][kind].append(draft)
+            if complete:
+                with self._lock:
+                    cache.update(found)
+            else:
+                uncached.update(found)
+
+        with self._lock:
+            drafts_by_key = {key: uncached.get(key) or cache[key] for key in unique_keys}
+        return {kind: [draft for key in unique_keys for draft in drafts_by_key[key][kind]] for kind in AGENT_KINDS}
+
+    def get_drafts_by_name(self, name: str) -> AgentDrafts:
+        """
+        Returns the drafts matching name on each endpoint
+        """
+        return self._lookup_one("get_draft_by_name", name)
+
+    def get_drafts_by_names(self, names: List[str]) -> AgentDrafts:
+        """
+        Returns the drafts matching any of names on each endpoint, looking up only the names not seen before
+        """
+        return self._lookup_many("get_drafts_by_names", names, "name")
+
+    def get_drafts_by_ids(self, ids: List[str], tolerate_failures: bool = False) -> AgentDrafts:
+        """
+        Returns the drafts matching any of ids on each endpoint, looking up only the ids not seen before
+        """
+        return self._lookup_many("get_drafts_by_ids", ids, "id", tolerate_failures)
+
+    def get_draft_by_id(self, id: str) -> Tuple[AgentKind, dict] | None:
+        """
+        Returns the kind and draft of the agent with id, preferring native over external over assistant agents
+        """
+        drafts = self._lookup_one("get_draft_by_id", id)
+        for kind in AGENT_KINDS:
+            if drafts[kind]:
+                return kind, drafts[kind][0]
+        return None
+
+    def forget(self, name: str) -> None:
+        """
+        Drops everything memoised about the agents named name
+        """
+        with self._lock:
+            ids = set()
+            for method in NAME_LOOKUPS:
+                drafts = self._cache[method].pop(name, {})
+                ids.update(draft.get("id") for kind_drafts in drafts.values() for draft in kind_drafts)
+            for method in ID_LOOKUPS:
+                cache = self._cache[method]
+                for id, drafts in list(cache.items()):
+                    if id in ids or any(draft.get("name") == name for kind_drafts in drafts.values() for draft in kind_drafts):
+                        del cache[id]
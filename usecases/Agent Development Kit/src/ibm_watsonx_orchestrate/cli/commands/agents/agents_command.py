@@ -19,10 +19,14 @@ def agent_import(
             help='The app id of the connection to associate with this external agent. An application connection represents the server authentication credentials needed to connection to this agent (for example Api Keys, Basic, Bearer or OAuth credentials).'
         )
     ] = None,
+    plan: Annotated[
+        bool,
+        typer.Option("--plan", help="Show the changes the import would make to the active env without making them"),
+    ] = False,
 ):
-    agents_controller = AgentsController()
-    agent_specs = agents_controller.import_agent(file=file, app_id=app_id)
-    agents_controller.publish_or_update_agents(agent_specs)
+    with AgentsController() as agents_controller:
+        agent_specs = agents_controller.import_agent(file=file, app_id=app_id)
+        agents_controller.publish_or_update_agents(agent_specs, plan=plan)
 
 
 @agents_app.command(name="create", help='Create and import an agent into the active env')
@@ -169,33 +173,33 @@ def agent_create(
     auth_config_dict = json.loads(auth_config) if auth_config else {}
     structured_output_dict = json.loads(structured_output) if structured_output else None
 
-    agents_controller = AgentsController()
-    agent = agents_controller.generate_agent_spec(
-        name=name,
-        kind=kind,
-        description=description,
-        title=title,
-        api_url=api_url,
-        auth_scheme=auth_scheme,
-        auth_config=auth_config_dict,
-        provider=provider,
-        llm=llm,
-        style=style,
-        custom_join_tool=custom_join_tool,
-        structured_output=structured_output_dict,
-        collaborators=collaborators,
-        tools=tools,
-        knowledge_base=knowledge_base,
-        tags=tags,
-        chat_params=chat_params_dict,
-        config=config_dict,
-        nickname=nickname,
-        app_id=app_id,
-        output_file=output_file,
-        context_access_enabled=context_access_enabled,
-        context_variables=context_variables,
-    )
-    agents_controller.publish_or_update_agents([agent])
+    with AgentsController() as agents_controller:
+        agent = agents_controller.generate_agent_spec(
+            name=name,
+            kind=kind,
+            description=description,
+            title=title,
+            api_url=api_url,
+            auth_scheme=auth_scheme,
+            auth_config=auth_config_dict,
+            provider=provider,
+            llm=llm,
+            style=style,
+            custom_join_tool=custom_join_tool,
+            structured_output=structured_output_dict,
+            collaborators=collaborators,
+            tools=tools,
+            knowledge_base=knowledge_base,
+            tags=tags,
+            chat_params=chat_params_dict,
+            config=config_dict,
+            nickname=nickname,
+            app_id=app_id,
+            output_file=output_file,
+            context_access_enabled=context_access_enabled,
+            context_variables=context_variables,
+        )
+        agents_controller.publish_or_update_agents([agent])
 
 @agents_app.command(name="list", help='List all agents in the active env')
 def list_agents(
@@ -208,8 +212,8 @@ def list_agents(
         typer.Option("--verbose", "-v", help="List full details of all agents in json format"),
     ] = False,
 ):  
-    agents_controller = AgentsController()
-    agents_controller.list_agents(kind=kind, verbose=verbose)
+    with AgentsController() as agents_controller:
+        agents_controller.list_agents(kind=kind, verbose=verbose)
 
 @agents_app.command(name="remove", help='Remove an agent from the active env')
 def remove_agent(
@@ -251,5 +255,5 @@ def export_agent(
         ),
     ]=False
 ):  
-    agents_controller = AgentsController()
-    agents_controller.export_agent(name=name, kind=kind, output_path=output_file, agent_only_flag=agent_only_flag)
+    with AgentsController() as agents_controller:
+        agents_controller.export_agent(name=name, kind=kind, output_path=output_file, agent_only_flag=agent_only_flag)
@@ -8,10 +8,11 @@ import zipfile
 import sys
 import io
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from copy import deepcopy
 
-from typing import Iterable, List, TypeVar
+from typing import Any, Callable, Collection, Iterable, List, TypeVar
 from ibm_watsonx_orchestrate.agent_builder.agents.types import AgentStyle
 from ibm_watsonx_orchestrate.agent_builder.tools.types import ToolSpec
 from ibm_watsonx_orchestrate.cli.commands.tools.tools_controller import import_python_tool, ToolsController
@@ -29,17 +30,29 @@ from ibm_watsonx_orchestrate.client.agents.agent_client import AgentClient, Agen
 from ibm_watsonx_orchestrate.client.agents.external_agent_client import ExternalAgentClient
 from ibm_watsonx_orchestrate.client.agents.assistant_agent_client import AssistantAgentClient
 from ibm_watsonx_orchestrate.client.tools.tool_client import ToolClient
-from ibm_watsonx_orchestrate.client.connections import get_connections_client
+from ibm_watsonx_orchestrate.client.connections import get_connections_client, get_connections_index
 from ibm_watsonx_orchestrate.client.knowledge_bases.knowledge_base_client import KnowledgeBaseClient
+from ibm_watsonx_orchestrate.cli.commands.agents.agent_directory import AgentDirectory
 
 from ibm_watsonx_orchestrate.client.utils import instantiate_client
-from ibm_watsonx_orchestrate.utils.utils import check_file_in_zip
+from ibm_watsonx_orchestrate.utils.utils import check_file_in_zip, copy_zip_entry
 
 logger = logging.getLogger(__name__)
 
 # Helper generic type for any agent
 AnyAgentT = TypeVar("AnyAgentT", bound=Agent | ExternalAgent | AssistantAgent)
 
+# Keeps the ids=... query string of a single lookup well within URL length limits
+ID_LOOKUP_BATCH_SIZE = 50
+
+# Lookups and tool artifact downloads in flight at once while exporting an agent and its collaborators
+EXPORT_CONCURRENCY = 8
+
+# Fields that identify an agent or its spec file rather than describe it, never compared when planning an update
+AGENT_DIFF_IGNORED_FIELDS = {"id", "spec_version"}
+# Longest value printed for a planned change before it is truncated
+PLAN_VALUE_MAX_LENGTH = 60
+
 def import_python_agent(file: str) -> List[Agent | ExternalAgent | AssistantAgent]:
     # Import tools
     import_python_tool(file)
@@ -169,17 +182,15 @@ def parse_create_assistant_args(name: str, kind: AgentKind, description: str | N
     return agent_details
 
 def get_conn_id_from_app_id(app_id: str) -> str:
-    connections_client = get_connections_client()
-    connection = connections_client.get_draft_by_app_id(app_id=app_id)
-    if not connection:
+    connection_id = get_connections_index(get_connections_client()).get_connection_id(app_id)
+    if not connection_id:
         logger.error(f"No connection exists with the app-id '{app_id}'")
         exit(1)
-    return connection.connection_id
+    return connection_id
 
 def get_app_id_from_conn_id(conn_id: str) -> str:
-    connections_client = get_connections_client()
-    app_id = connections_client.get_draft_by_id(conn_id=conn_id)
-    if not app_id or app_id == conn_id:
+    app_id = get_connections_index(get_connections_client()).get_app_id(conn_id)
+    if not app_id:
         logger.error(f"No connection exists with the connection id '{conn_id}'")
         exit(1)
     return app_id
@@ -195,6 +206,91 @@ def get_agent_details(name: str, client: AgentClient | ExternalAgentClient | Ass
 
     return agent_specs[0]
 
+def get_names_by_ids(get_drafts_by_ids: Callable[[List[str]], List[dict]], ids: List[str]) -> dict[str, str]:
+    """
+    Looks up the drafts for ids in batches, returning a map of id to name. Ids that cannot be found are left out
+    """
+    names = {}
+    unique_ids = list(dict.fromkeys(ids))
+    for i in range(0, len(unique_ids), ID_LOOKUP_BATCH_SIZE):
+        batch = set(unique_ids[i:i + ID_LOOKUP_BATCH_SIZE])
+        try:
+            drafts = get_drafts_by_ids(unique_ids[i:i + ID_LOOKUP_BATCH_SIZE])
+        except Exception as e:
+            logger.debug(f"Failed to look up ids {sorted(batch)}: {e}")
+            continue
+        for draft in drafts or []:
+            if draft.get("id") in batch:
+                names[draft["id"]] = draft.get("name")
+    return names
+
+def normalise_agent_spec(agent: Agent | ExternalAgent | AssistantAgent) -> dict:
+    """
+    Returns the agent as it is sent to the server on update, without the fields that are never compared
+    """
+    spec = agent.model_dump(mode='json', exclude_none=True, by_alias=True)
+    # The server only keeps the connection_id an app_id was dereferenced to
+    for section in (spec, spec.get("config")):
+        if isinstance(section, dict) and "connection_id" in section:
+            section.pop("app_id", None)
+    return {key: value for key, value in spec.items() if key not in AGENT_DIFF_IGNORED_FIELDS}
+
+def diff_agent_specs(existing: dict, desired: dict, path: str = "") -> List[tuple[str, Any, Any]]:
+    """
+    Returns (field, current value, new value) for every field of desired that differs from existing.
+    Top level fields missing from desired are not reported, an update leaves them as they are. Nested
+    objects are replaced as a whole, so their keys missing from desired are reported as removed
+    """
+    changes = []
+    for key, value in desired.items():
+        field = f"{path}.{key}" if path else key
+        current = existing.get(key)
+        if isinstance(value, dict) and isinstance(current, dict):
+            changes.extend(diff_agent_specs(current, value, field))
+        elif current != value:
+            changes.append((field, current, value))
+    if path:
+        changes.extend((f"{path}.{key}", current, None) for key, current in existing.items() if key not in desired and current is not None)
+    return changes
+
+def _format_plan_value(value: Any) -> str:
+    if value is None:
+        return "<unset>"
+    text = value if isinstance(value, str) else json.dumps(value)
+    text = " ".join(text.split())
+    return text if len(text) <= PLAN_VALUE_MAX_LENGTH else text[:PLAN_VALUE_MAX_LENGTH - 3] + "..."
+
+def format_agent_change(field: str, current: Any, new: Any, names: dict[str, str] = None) -> str:
+    """
+    Renders a change from diff_agent_specs on a single line, showing ids by name where names knows them
+    """
+    names = names or {}
+    display = lambda value: names.get(value, value) if isinstance(value, str) else value
+    if isinstance(current, list) and isinstance(new, list) and all(isinstance(value, str) for value in current + new):
+        added = [f"+{display(value)}" for value in new if value not in current]
+        removed = [f"-{display(value)}" for value in current if value not in new]
+        return f"{field}: {', '.join(added + removed) or 'reordered'}"
+    return f"{field}: {_format_plan_value(display(current))} -> {_format_plan_value(display(new))}"
+
+def _dereferenced_names(agent: AnyAgentT, deref_agent: AnyAgentT) -> dict[str, str]:
+    """
+    Maps the ids in deref_agent back to the names they were dereferenced from in agent
+    """
+    if not isinstance(agent, Agent):
+        section, deref_section = (agent, deref_agent) if agent.kind == AgentKind.EXTERNAL else (agent.config, deref_agent.config)
+        app_id, connection_id = getattr(section, "app_id", None), getattr(deref_section, "connection_id", None)
+        return {connection_id: app_id} if app_id and connection_id else {}
+
+    names = {}
+    for field in ("tools", "collaborators", "knowledge_base"):
+        names.update(zip(getattr(deref_agent, field) or [], getattr(agent, field) or []))
+    if isinstance(agent.custom_join_tool, str) and isinstance(deref_agent.custom_join_tool, str):
+        names[deref_agent.custom_join_tool] = agent.custom_join_tool
+    for guideline, deref_guideline in zip(agent.guidelines or [], deref_agent.guidelines or []):
+        if isinstance(guideline.tool, str) and isinstance(deref_guideline.tool, str):
+            names[deref_guideline.tool] = guideline.tool
+    return names
+
 def _raise_guidelines_warning(response: AgentUpsertResponse) -> None:
     if response.warning:
         logger.warning(f"Agent Configuration Issue: {response.warning}")
@@ -206,6 +302,7 @@ class AgentsController:
         self.assistant_client = None
         self.tool_client = None
         self.knowledge_base_client = None
+        self.agent_directory = None
 
     def get_native_client(self):
         if not self.native_client:
@@ -231,6 +328,25 @@ class AgentsController:
         if not self.knowledge_base_client:
             self.knowledge_base_client = instantiate_client(KnowledgeBaseClient)
         return self.knowledge_base_client
+
+    def get_agent_directory(self) -> AgentDirectory:
+        clients = (self.get_native_client(), self.get_external_client(), self.get_assistant_client())
+        if not self.agent_directory or self.agent_directory.clients != clients:
+            self.close()
+            self.agent_directory = AgentDirectory(*clients)
+        return self.agent_directory
+
+    def close(self) -> None:
+        """Stops the worker threads of the agent directory, if one was started."""
+        if self.agent_directory:
+            self.agent_directory.close()
+            self.agent_directory = None
+
+    def __enter__(self) -> "AgentsController":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
     
     @staticmethod
     def import_agent(file: str, app_id: str) -> List[Agent | ExternalAgent | AssistantAgent]:
@@ -272,16 +388,16 @@ class AgentsController:
     def get_all_agents(self, client: None):
         return {entry["name"]: entry["id"] for entry in client.get()}
 
-    def dereference_collaborators(self, agent: Agent) -> Agent:
-        native_client = self.get_native_client()
-        external_client = self.get_external_client()
-        assistant_client = self.get_assistant_client()
-
+    def dereference_collaborators(self, agent: Agent, planned_names: Collection[str] = ()) -> Agent:
+        """
+        Replaces the collaborator names of agent with their ids. Names in planned_names belong to agents
+        that are only planned to be created, so they have no id yet and are left as they are
+        """
         deref_agent = deepcopy(agent)
-        matching_native_agents = native_client.get_drafts_by_names(deref_agent.collaborators)
-        matching_external_agents = external_client.get_drafts_by_names(deref_agent.collaborators)
-        matching_assistant_agents = assistant_client.get_drafts_by_names(deref_agent.collaborators)
-        matching_agents = matching_native_agents + matching_external_agents + matching_assistant_agents
+        matching_drafts = self.get_agent_directory().get_drafts_by_names(
+            [name for name in deref_agent.collaborators if name not in planned_names]
+        )
+        matching_agents = [draft for drafts in matching_drafts.values() for draft in drafts]
 
         name_id_lookup = {}
         for a in matching_agents:
@@ -292,6 +408,9 @@ class AgentsController:
         
         deref_collaborators = []
         for name in agent.collaborators:
+            if name in planned_names:
+                deref_collaborators.append(name)
+                continue
             id = name_id_lookup.get(name)
             if not id:
                 logger.error(f"Failed to find collaborator. No agents found with the name '{name}'")
@@ -302,15 +421,9 @@ class AgentsController:
         return deref_agent
     
     def reference_collaborators(self, agent: Agent) -> Agent:
-        native_client = self.get_native_client()
-        external_client = self.get_external_client()
-        assistant_client = self.get_assistant_client()
-
         ref_agent = deepcopy(agent)
-        matching_native_agents = native_client.get_drafts_by_ids(ref_agent.collaborators)
-        matching_external_agents = external_client.get_drafts_by_ids(ref_agent.collaborators)
-        matching_assistant_agents = assistant_client.get_drafts_by_ids(ref_agent.collaborators)
-        matching_agents = matching_native_agents + matching_external_agents + matching_assistant_agents
+        matching_drafts = self.get_agent_directory().get_drafts_by_ids(ref_agent.collaborators)
+        matching_agents = [draft for drafts in matching_drafts.values() for draft in drafts]
         
         id_name_lookup = {}
         for a in matching_agents:
@@ -529,9 +642,9 @@ class AgentsController:
         return agent
 
 
-    def dereference_native_agent_dependencies(self, agent: Agent) -> Agent:
+    def dereference_native_agent_dependencies(self, agent: Agent, planned_names: Collection[str] = ()) -> Agent:
         if agent.collaborators and len(agent.collaborators):
-            agent = self.dereference_collaborators(agent)
+            agent = self.dereference_collaborators(agent, planned_names=planned_names)
         if (agent.tools and len(agent.tools)) or (agent.style == AgentStyle.PLANNER and agent.custom_join_tool):
             agent = self.dereference_tools(agent)
         if agent.knowledge_base and len(agent.knowledge_base):
@@ -570,9 +683,9 @@ class AgentsController:
         return agent
     
     # Convert all names used in an agent to the corresponding ids
-    def dereference_agent_dependencies(self, agent: AnyAgentT) -> AnyAgentT:
+    def dereference_agent_dependencies(self, agent: AnyAgentT, planned_names: Collection[str] = ()) -> AnyAgentT:
         if isinstance(agent, Agent):
-            return self.dereference_native_agent_dependencies(agent)
+            return self.dereference_native_agent_dependencies(agent, planned_names=planned_names)
         if isinstance(agent, ExternalAgent) or isinstance(agent, AssistantAgent):
             return self.dereference_external_or_assistant_agent_dependencies(agent)
 
@@ -584,24 +697,27 @@ class AgentsController:
             return self.reference_external_or_assistant_agent_dependencies(agent)
 
     def publish_or_update_agents(
-        self, agents: Iterable[Agent | ExternalAgent | AssistantAgent]
+        self, agents: Iterable[Agent | ExternalAgent | AssistantAgent], plan: bool = False
     ):
+        """
+        Creates each agent, or updates the existing agent of the same name if its spec changed.
+        With plan, only prints the changes that would be made.
+        """
+        agent_directory = self.get_agent_directory()
+        planned_changes = []
+        # Agents planned to be created earlier in this import, which later agents may use as collaborators
+        planned_names = set()
         for agent in agents:
             agent_name = agent.name
+            source_agent = agent
 
-            native_client = self.get_native_client()
-            external_client = self.get_external_client()
-            assistant_client = self.get_assistant_client()
-
-            existing_native_agents = native_client.get_draft_by_name(agent_name)
-            existing_native_agents = [Agent.model_validate(agent) for agent in existing_native_agents]
-            existing_external_clients = external_client.get_draft_by_name(agent_name)
-            existing_external_clients = [ExternalAgent.model_validate(agent) for agent in existing_external_clients]
-            existing_assistant_clients = assistant_client.get_draft_by_name(agent_name)
-            existing_assistant_clients = [AssistantAgent.model_validate(agent) for agent in existing_assistant_clients]
+            existing_drafts = agent_directory.get_drafts_by_name(agent_name)
+            existing_native_agents = [Agent.model_validate(agent) for agent in existing_drafts[AgentKind.NATIVE]]
+            existing_external_clients = [ExternalAgent.model_validate(agent) for agent in existing_drafts[AgentKind.EXTERNAL]]
+            existing_assistant_clients = [AssistantAgent.model_validate(agent) for agent in existing_drafts[AgentKind.ASSISTANT]]
 
             all_existing_agents = existing_external_clients + existing_native_agents + existing_assistant_clients
-            agent = self.dereference_agent_dependencies(agent)
+            agent = self.dereference_agent_dependencies(agent, planned_names=planned_names)
 
             if isinstance(agent, Agent) and agent.style == AgentStyle.PLANNER and isinstance(agent.custom_join_tool, str):
                 tool_client = self.get_tool_client()
@@ -629,10 +745,37 @@ class AgentsController:
                         logger.error(f"An agent with the name '{agent_name}' already exists with a different kind. Failed to create agent")
                         sys.exit(1)
                     agent_id = existing_agent.id
-                    self.update_agent(agent_id=agent_id, agent=agent)
+                    changes = diff_agent_specs(normalise_agent_spec(existing_agent), normalise_agent_spec(agent))
+                    if plan:
+                        names = _dereferenced_names(source_agent, agent)
+                        planned_changes.append(("~" if changes else "=", agent, [format_agent_change(*change, names=names) for change in changes]))
+                    elif not changes:
+                        logger.info(f"Agent '{agent_name}' is unchanged, skipping")
+                    else:
+                        self.update_agent(agent_id=agent_id, agent=agent)
+            elif plan:
+                planned_changes.append(("+", agent, []))
+                planned_names.add(agent_name)
             else:
                 self.publish_agent(agent)
 
+            if not plan:
+                # Later agents in this import may reference this one as a collaborator
+                agent_directory.forget(agent_name)
+
+        if plan:
+            self.print_agent_plan(planned_changes)
+
+    @staticmethod
+    def print_agent_plan(planned_changes: List[tuple[str, Agent | ExternalAgent | AssistantAgent, List[str]]]) -> None:
+        counts = {symbol: sum(1 for planned in planned_changes if planned[0] == symbol) for symbol in ("+", "~", "=")}
+        rich.print(f"Plan: {counts['+']} to create, {counts['~']} to update, {counts['=']} unchanged")
+        styles = {"+": "green", "~": "yellow", "=": "dim"}
+        for symbol, agent, changes in planned_changes:
+            rich.print(f"[{styles[symbol]}]{symbol} {agent.kind.value} agent '{agent.name}'[/{styles[symbol]}]")
+            for change in changes:
+                rich.print(f"    {rich.markup.escape(change)}")
+
     def publish_agent(self, agent: Agent, **kwargs) -> None:
         if isinstance(agent, Agent):
             response = self.get_native_client().create(agent.model_dump(exclude_none=True))
@@ -670,68 +813,42 @@ class AgentsController:
 
     def get_agent_tool_names(self, tool_ids: List[str]) -> List[str]:
         """Retrieve tool names for a given agent based on tool IDs."""
-        tool_client = self.get_tool_client()
+        tool_names = get_names_by_ids(self.get_tool_client().get_drafts_by_ids, tool_ids)
         tools = []
         for tool_id in tool_ids:
-            try:
-                tool = tool_client.get_draft_by_id(tool_id)
-                tools.append(tool["name"])
-            except Exception as e:
+            if tool_id not in tool_names:
                 logger.warning(f"Tool with ID {tool_id} not found. Returning Tool ID")
-                tools.append(tool_id)
+            tools.append(tool_names.get(tool_id, tool_id))
         return tools
 
     def get_agent_collaborator_names(self, agent_ids: List[str]) -> List[str]:
         """Retrieve collaborator names for a given agent based on collaborator IDs."""
-        collaborator_client = self.get_native_client()
-        external_client = self.get_external_client()
-        assistant_client = self.get_assistant_client()
+        collaborator_names = {}
+        try:
+            # Only used to display names, so an unavailable endpoint falls back to showing ids
+            matching_drafts = self.get_agent_directory().get_drafts_by_ids(agent_ids, tolerate_failures=True)
+        except Exception as e:
+            logger.debug(f"Failed to look up collaborators {agent_ids}: {e}")
+            matching_drafts = {}
+        # Native agents take precedence over external and assistant agents with the same id
+        for drafts in reversed(list(matching_drafts.values())):
+            collaborator_names.update({draft.get("id"): draft.get("name") for draft in drafts})
+
         collaborators = []
-        
         for agent_id in agent_ids:
-            try:
-                # First try resolving from native agents
-                collaborator = collaborator_client.get_draft_by_id(agent_id)
-                if collaborator:
-                    collaborators.append(collaborator["name"])
-                    continue
-            except Exception:
-                pass
-
-            try:
-                # If not found in native, check external agents
-                external_collaborator = external_client.get_draft_by_id(agent_id)
-                if external_collaborator:
-                    collaborators.append(external_collaborator["name"])
-                    continue
-            except Exception:
-                pass
-
-            try:
-                # If not found in native or external, check assistant agents
-                assistant_collaborator = assistant_client.get_draft_by_id(agent_id)
-                if assistant_collaborator:
-                    collaborators.append(assistant_collaborator["name"])
-                    continue
-            except Exception:
-                pass
-
-            logger.warning(f"Collaborator with ID {agent_id} not found. Returning Collaborator ID")
-            collaborators.append(agent_id)
-
+            if agent_id not in collaborator_names:
+                logger.warning(f"Collaborator with ID {agent_id} not found. Returning Collaborator ID")
+            collaborators.append(collaborator_names.get(agent_id, agent_id))
         return collaborators
 
     def get_agent_knowledge_base_names(self, knowlede_base_ids: List[str]) -> List[str]:
         """Retrieve knowledge base names for a given agent based on knowledge base IDs."""
-        client = self.get_knowledge_base_client()
+        knowledge_base_names = get_names_by_ids(self.get_knowledge_base_client().get_by_ids, knowlede_base_ids)
         knowledge_bases = []
         for id in knowlede_base_ids:
-            try:
-                kb = client.get_by_id(id)
-                knowledge_bases.append(kb["name"])
-            except Exception as e:
-                logger.warning(f"Knowledge base with ID {id} not found. Returning Tool ID")
-                knowledge_bases.append(id)
+            if id not in knowledge_base_names:
+                logger.warning(f"Knowledge base with ID {id} not found. Returning Knowledge base ID")
+            knowledge_bases.append(knowledge_base_names.get(id, id))
         return knowledge_bases
 
     def list_agents(self, kind: AgentKind=None, verbose: bool=False):
@@ -766,19 +883,24 @@ class AgentsController:
                 for column in column_args:
                     native_table.add_column(column, **column_args[column])
 
-                for agent in native_agents:
-                    tool_names = self.get_agent_tool_names(agent.tools)
-                    knowledge_base_names = self.get_agent_knowledge_base_names(agent.knowledge_base)
-                    collaborator_names = self.get_agent_collaborator_names(agent.collaborators)
+                # Resolve the ids referenced by every agent up front so each resource kind costs a few batched lookups
+                tool_ids = list(dict.fromkeys(id for agent in native_agents for id in agent.tools or []))
+                knowledge_base_ids = list(dict.fromkeys(id for agent in native_agents for id in agent.knowledge_base or []))
+                collaborator_ids = list(dict.fromkeys(id for agent in native_agents for id in agent.collaborators or []))
 
+                tool_names = dict(zip(tool_ids, self.get_agent_tool_names(tool_ids))) if tool_ids else {}
+                knowledge_base_names = dict(zip(knowledge_base_ids, self.get_agent_knowledge_base_names(knowledge_base_ids))) if knowledge_base_ids else {}
+                collaborator_names = dict(zip(collaborator_ids, self.get_agent_collaborator_names(collaborator_ids))) if collaborator_ids else {}
+
+                for agent in native_agents:
                     native_table.add_row(
                         agent.name,
                         agent.description,
                         agent.llm,
                         agent.style,
-                        ", ".join(collaborator_names),
-                        ", ".join(tool_names),
-                        ", ".join(knowledge_base_names),
+                        ", ".join(collaborator_names.get(id, id) for id in agent.collaborators or []),
+                        ", ".join(tool_names.get(id, id) for id in agent.tools or []),
+                        ", ".join(knowledge_base_names.get(id, id) for id in agent.knowledge_base or []),
                         agent.id,
                     )
                 rich.print(native_table)
@@ -826,9 +948,9 @@ class AgentsController:
                 for column in column_args:
                     external_table.add_column(column, **column_args[column])
                 
+                connections_index = get_connections_index(get_connections_client())
                 for agent in external_agents:
-                    connections_client =  get_connections_client()
-                    app_id = connections_client.get_draft_by_id(agent.connection_id)
+                    app_id = connections_index.get_app_id(agent.connection_id) or agent.connection_id or ""
 
                     external_table.add_row(
                         agent.name,
@@ -921,6 +1043,8 @@ class AgentsController:
                 draft_agent = draft_agents[0]
                 agent_id = draft_agent.get("id")
                 client.delete(agent_id=agent_id)
+                if self.agent_directory:
+                    self.agent_directory.forget(name)
 
                 logger.info(f"Successfully removed agent {name}")
             else:
@@ -952,22 +1076,48 @@ class AgentsController:
         return agent
     
     def get_agent_by_id(self, id: str) -> Agent | ExternalAgent | AssistantAgent | None:
-        native_client = self.get_native_client()
-        external_client = self.get_external_client()
-        assistant_client = self.get_assistant_client()
-
-        native_result = native_client.get_draft_by_id(id)
-        external_result = external_client.get_draft_by_id(id)
-        assistant_result = assistant_client.get_draft_by_id(id)
-
-        if native_result:
-            return Agent.model_validate(native_result)
-        if external_result:
-            return ExternalAgent.model_validate(external_result)
-        if assistant_result:
-            return AssistantAgent.model_validate(assistant_result)
+        result = self.get_agent_directory().get_draft_by_id(id)
+        if not result:
+            return None
+
+        kind, draft = result
+        match kind:
+            case AgentKind.NATIVE:
+                return Agent.model_validate(draft)
+            case AgentKind.EXTERNAL:
+                return ExternalAgent.model_validate(draft)
+            case AgentKind.ASSISTANT:
+                return AssistantAgent.model_validate(draft)
         
 
+    def get_export_spec(self, agent: Agent | ExternalAgent | AssistantAgent) -> dict:
+        agent_spec = self.get_spec_file_content(agent)
+        agent_spec.pop("hidden", None)
+        agent_spec.pop("id", None)
+        agent_spec["spec_version"] = SpecVersion.V1.value
+        return agent_spec
+
+    def get_collaborator_closure(self, agent: Agent | ExternalAgent | AssistantAgent) -> List[Agent | ExternalAgent | AssistantAgent]:
+        """
+        Returns agent followed by every agent it reaches through collaborators, each listed once
+        """
+        closure = [agent]
+        seen_ids = {agent.id}
+        for current in closure:
+            if not isinstance(current, Agent):
+                continue
+            for collaborator_id in current.collaborators or []:
+                if collaborator_id in seen_ids:
+                    continue
+                seen_ids.add(collaborator_id)
+
+                collaborator = self.get_agent_by_id(collaborator_id)
+                if not collaborator:
+                    logger.warning(f"Skipping {collaborator_id}, no agent with id {collaborator_id} found")
+                    continue
+                closure.append(collaborator)
+        return closure
+
     def export_agent(self, name: str, kind: AgentKind, output_path: str, agent_only_flag: bool=False, zip_file_out: zipfile.ZipFile | None = None) -> None:
     
         output_file = Path(output_path)
@@ -981,80 +1131,66 @@ class AgentsController:
             sys.exit(1)
         
         agent = self.get_agent(name, kind)
-        agent_spec_file_content = self.get_spec_file_content(agent)
-        
-        agent_spec_file_content.pop("hidden", None)
-        agent_spec_file_content.pop("id", None)
-        agent_spec_file_content["spec_version"] = SpecVersion.V1.value
 
         if agent_only_flag:
+            agent_spec_file_content = self.get_export_spec(agent)
             logger.info(f"Exported agent definition for '{name}' to '{output_path}'")
             with open(output_path, 'w') as outfile:
                 yaml.dump(agent_spec_file_content, outfile, sort_keys=False, default_flow_style=False)
             return
+
+        # Resolve the whole collaborator tree up front, then reference each agent's dependencies concurrently
+        agents = self.get_collaborator_closure(agent)
+        with ThreadPoolExecutor(max_workers=EXPORT_CONCURRENCY) as executor:
+            agent_specs = list(executor.map(self.get_export_spec, agents))
         
         close_file_flag = False
         if zip_file_out is None:
             close_file_flag = True
             zip_file_out = zipfile.ZipFile(output_path, "w")
 
-        logger.info(f"Exporting agent definition for '{name}'")
-        
-        agent_spec_yaml = yaml.dump(agent_spec_file_content, sort_keys=False, default_flow_style=False)
-        agent_spec_yaml_bytes = agent_spec_yaml.encode("utf-8")
-        agent_spec_yaml_file = io.BytesIO(agent_spec_yaml_bytes)
-
-        # Skip processing an agent if its already been saved
-        agent_file_path = f"{output_file_name}/agents/{agent_spec_file_content.get('kind', 'unknown')}/{agent_spec_file_content.get('name')}.yaml"
-        if check_file_in_zip(file_path=agent_file_path, zip_file=zip_file_out):
-            logger.warning(f"Skipping {agent_spec_file_content.get('name')}, agent with that name already exists in the output folder")
-            if close_file_flag:
-                zip_file_out.close()
-            return
-        
-        zip_file_out.writestr(
-            agent_file_path,
-            agent_spec_yaml_file.getvalue()
-        )
-
-        tools_contoller = ToolsController()
-        for tool_name in agent_spec_file_content.get("tools", []):
+        tool_names = []
+        export_names = [name] + [collaborator.name for collaborator in agents[1:]]
+        for export_name, agent_spec_file_content in zip(export_names, agent_specs):
+            logger.info(f"Exporting agent definition for '{export_name}'")
 
-            base_tool_file_path = f"{output_file_name}/tools/{tool_name}/"
-            if check_file_in_zip(file_path=base_tool_file_path, zip_file=zip_file_out):
+            # Skip processing an agent if its already been saved
+            agent_file_path = f"{output_file_name}/agents/{agent_spec_file_content.get('kind', 'unknown')}/{agent_spec_file_content.get('name')}.yaml"
+            if check_file_in_zip(file_path=agent_file_path, zip_file=zip_file_out):
+                logger.warning(f"Skipping {agent_spec_file_content.get('name')}, agent with that name already exists in the output folder")
                 continue
-            
+
+            agent_spec_yaml = yaml.dump(agent_spec_file_content, sort_keys=False, default_flow_style=False)
+            zip_file_out.writestr(
+                agent_file_path,
+                agent_spec_yaml.encode("utf-8")
+            )
+            tool_names.extend(agent_spec_file_content.get("tools", []))
+
+            for kb_name in agent_spec_file_content.get("knowledge_base", []):
+                logger.warning(f"Skipping {kb_name}, knowledge_bases are currently unsupported by export")
+
+        tool_names = [
+            tool_name for tool_name in dict.fromkeys(tool_names)
+            if not check_file_in_zip(file_path=f"{output_file_name}/tools/{tool_name}/", zip_file=zip_file_out)
+        ]
+        tools_controller = ToolsController()
+        tools_controller.get_client()
+
+        def download_tool(tool_name: str) -> bytes | None:
             logger.info(f"Exporting tool '{tool_name}'")
-            tool_artifact_bytes = tools_contoller.download_tool(tool_name)
-            if not tool_artifact_bytes:
-                continue
-            
-            with zipfile.ZipFile(io.BytesIO(tool_artifact_bytes), "r") as zip_file_in:
-                for item in zip_file_in.infolist():
-                    buffer = zip_file_in.read(item.filename)
-                    if (item.filename != 'bundle-format'):
-                        zip_file_out.writestr(
-                            f"{base_tool_file_path}{item.filename}",
-                            buffer
-                        )
-        
-        for kb_name in agent_spec_file_content.get("knowledge_base", []):
-            logger.warning(f"Skipping {kb_name}, knowledge_bases are currently unsupported by export")
-        
-        if kind == AgentKind.NATIVE:
-            for collaborator_id in agent.collaborators:
-                collaborator = self.get_agent_by_id(collaborator_id)
+            return tools_controller.download_tool(tool_name)
 
-                if not collaborator:
-                    logger.warning(f"Skipping {collaborator_id}, no agent with id {collaborator_id} found")
+        with ThreadPoolExecutor(max_workers=EXPORT_CONCURRENCY) as executor:
+            for tool_name, tool_artifact_bytes in zip(tool_names, executor.map(download_tool, tool_names)):
+                if not tool_artifact_bytes:
                     continue
-                
-                self.export_agent(
-                    name=collaborator.name,
-                    kind=collaborator.kind,
-                    output_path=output_path,
-                    agent_only_flag=False,
-                    zip_file_out=zip_file_out)
+
+                base_tool_file_path = f"{output_file_name}/tools/{tool_name}/"
+                with zipfile.ZipFile(io.BytesIO(tool_artifact_bytes), "r") as zip_file_in:
+                    for item in zip_file_in.infolist():
+                        if (item.filename != 'bundle-format'):
+                            copy_zip_entry(zip_file_in, item, zip_file_out, f"{base_tool_file_path}{item.filename}")
         
         if close_file_flag:
             logger.info(f"Successfully wrote agents and tools to '{output_path}'")
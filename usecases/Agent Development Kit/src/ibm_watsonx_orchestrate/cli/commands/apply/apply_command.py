@@ -0,0 +1,24 @@
+import typer
+from typing_extensions import Annotated
+from ibm_watsonx_orchestrate.cli.commands.apply.apply_controller import ApplyController, DEFAULT_APPLY_CONCURRENCY
+
+apply_app = typer.Typer(no_args_is_help=True)
+
+
+@apply_app.callback(invoke_without_command=True, help='Import every connection, model, knowledge base, tool and agent spec in a directory, in dependency order')
+def apply(
+    directory: Annotated[
+        str,
+        typer.Option("--dir", "-d", help="Directory to search (recursively) for spec files"),
+    ],
+    concurrency: Annotated[
+        int,
+        typer.Option("--concurrency", "-c", min=1, help="Number of resources deployed in parallel once their dependencies are in place"),
+    ] = DEFAULT_APPLY_CONCURRENCY,
+    dry_run: Annotated[
+        bool,
+        typer.Option("--dry-run", help="Print the deployment plan without importing anything"),
+    ] = False,
+):
+    apply_controller = ApplyController(directory=directory, concurrency=concurrency)
+    apply_controller.apply(dry_run=dry_run)
@@ -0,0 +1,362 @@
+import ast
+import json
+import logging
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from threading import Lock
+from typing import List
+
+import rich
+import rich.table
+import yaml
+
+from ibm_watsonx_orchestrate.agent_builder.agents import AgentKind
+from ibm_watsonx_orchestrate.agent_builder.knowledge_bases.types import KnowledgeBaseKind
+from ibm_watsonx_orchestrate.cli.commands.tools.tools_controller import ToolKind
+from ibm_watsonx_orchestrate.cli.commands.agents.agents_controller import AgentsController
+from ibm_watsonx_orchestrate.cli.commands.apply.types import ApplyResource, ResourceKind, ResourceRef
+from ibm_watsonx_orchestrate.cli.commands.connections.connections_controller import import_connection
+from ibm_watsonx_orchestrate.cli.commands.knowledge_bases.knowledge_bases_controller import KnowledgeBaseController
+from ibm_watsonx_orchestrate.cli.commands.models.models_controller import ModelsController, create_policy_from_spec, \
+    get_model_names_from_policy
+from ibm_watsonx_orchestrate.cli.commands.tools.tools_controller import ToolsController
+from ibm_watsonx_orchestrate.utils.utils import describe_failure
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_APPLY_CONCURRENCY = 8
+SPEC_FILE_SUFFIXES = {".yaml", ".yml", ".json", ".py"}
+MODEL_NAME_PREFIX = "virtual-model/"
+POLICY_NAME_PREFIX = "virtual-policy/"
+REQUIREMENTS_FILE = "requirements.txt"
+
+
+def _read_spec(file: Path) -> dict | None:
+    with open(file, "r") as f:
+        content = json.load(f) if file.suffix == ".json" else yaml.load(f, Loader=yaml.SafeLoader)
+    return content if isinstance(content, dict) else None
+
+def _prefixed(name: str, prefix: str) -> str:
+    return name if name.startswith(prefix) else f"{prefix}{name}"
+
+def _openapi_tool_names(content: dict) -> List[str]:
+    names = []
+    for http_path in (content.get("paths") or {}).values():
+        for operation in (http_path or {}).values():
+            if isinstance(operation, dict) and operation.get("operationId"):
+                names.append(re.sub(r'(\W|_)+', '_', operation["operationId"]))
+    return names
+
+def _flow_model_dependencies(model) -> set[ResourceRef]:
+    dependencies = set()
+    if isinstance(model, dict):
+        if model.get("kind") == "agent" and isinstance(model.get("agent"), str):
+            dependencies.add((ResourceKind.AGENT, model["agent"]))
+        elif model.get("kind") == "tool" and isinstance(model.get("tool"), str):
+            dependencies.add((ResourceKind.TOOL, model["tool"]))
+        for value in model.values():
+            dependencies |= _flow_model_dependencies(value)
+    elif isinstance(model, list):
+        for value in model:
+            dependencies |= _flow_model_dependencies(value)
+    return dependencies
+
+def _agent_dependencies(content: dict) -> set[ResourceRef]:
+    dependencies = set()
+    for tool in content.get("tools") or []:
+        dependencies.add((ResourceKind.TOOL, tool))
+    if content.get("custom_join_tool"):
+        dependencies.add((ResourceKind.TOOL, content["custom_join_tool"]))
+    for guideline in content.get("guidelines") or []:
+        if isinstance(guideline, dict) and guideline.get("tool"):
+            dependencies.add((ResourceKind.TOOL, guideline["tool"]))
+    for collaborator in content.get("collaborators") or []:
+        dependencies.add((ResourceKind.AGENT, collaborator))
+    for knowledge_base in content.get("knowledge_base") or []:
+        dependencies.add((ResourceKind.KNOWLEDGE_BASE, knowledge_base))
+
+    app_id = content.get("app_id") or (content.get("config") or {}).get("app_id")
+    if app_id:
+        dependencies.add((ResourceKind.CONNECTION, app_id))
+
+    llm = content.get("llm")
+    if isinstance(llm, str) and llm.startswith((MODEL_NAME_PREFIX, POLICY_NAME_PREFIX)):
+        dependencies.add((ResourceKind.MODEL, llm))
+    return dependencies
+
+def _parse_spec_file(file: Path) -> List[ApplyResource]:
+    content = _read_spec(file)
+    if not content:
+        return []
+
+    kind = content.get("kind")
+    # Not every spec states its openapi version, but every one has its operations under paths
+    if "openapi" in content or isinstance(content.get("paths"), dict):
+        return [ApplyResource(kind=ResourceKind.TOOL, tool_kind=ToolKind.openapi, file=str(file), names=_openapi_tool_names(content))]
+    if isinstance(content.get("spec"), dict) and content["spec"].get("kind") == "flow":
+        return [ApplyResource(kind=ResourceKind.TOOL, tool_kind=ToolKind.flow, file=str(file), names=[content["spec"].get("name")], dependencies=_flow_model_dependencies(content.get("nodes")))]
+    if kind == "connection":
+        return [ApplyResource(kind=ResourceKind.CONNECTION, file=str(file), names=[content.get("app_id")])]
+    if kind == KnowledgeBaseKind.KNOWLEDGE_BASE:
+        return [ApplyResource(kind=ResourceKind.KNOWLEDGE_BASE, file=str(file), names=[content.get("name")])]
+    if "policy" in content:
+        policy = create_policy_from_spec(spec=content)
+        dependencies = {(ResourceKind.MODEL, name) for name in get_model_names_from_policy(policy)}
+        return [ApplyResource(kind=ResourceKind.MODEL, is_policy=True, file=str(file), names=[_prefixed(content.get("name"), POLICY_NAME_PREFIX)], dependencies=dependencies)]
+    if "provider_config" in content or str(content.get("name", "")).startswith(MODEL_NAME_PREFIX):
+        return [ApplyResource(kind=ResourceKind.MODEL, file=str(file), names=[_prefixed(content.get("name"), MODEL_NAME_PREFIX)])]
+    if kind in {k.value for k in AgentKind} or (kind is None and ("instructions" in content or "llm" in content)):
+        return [ApplyResource(kind=ResourceKind.AGENT, file=str(file), names=[content.get("name")], dependencies=_agent_dependencies(content))]
+    return []
+
+def _decorator_name(decorator: ast.expr) -> str | None:
+    if isinstance(decorator, ast.Call):
+        decorator = decorator.func
+    if isinstance(decorator, ast.Name):
+        return decorator.id
+    if isinstance(decorator, ast.Attribute):
+        return decorator.attr
+    return None
+
+def _keyword_value(call: ast.expr, keyword: str, position: int = None):
+    if not isinstance(call, ast.Call):
+        return None
+    for kw in call.keywords:
+        if kw.arg == keyword:
+            return kw.value
+    if position is not None and len(call.args) > position:
+        return call.args[position]
+    return None
+
+def _string_value(node: ast.expr | None) -> str | None:
+    return node.value if isinstance(node, ast.Constant) and isinstance(node.value, str) else None
+
+def _expected_app_ids(node: ast.expr | None) -> set[str]:
+    app_ids = set()
+    for child in ast.walk(node) if node is not None else []:
+        if isinstance(child, ast.Dict):
+            for key, value in zip(child.keys, child.values):
+                if _string_value(key) == "app_id" and _string_value(value):
+                    app_ids.add(_string_value(value))
+        elif isinstance(child, ast.Call) and _string_value(_keyword_value(child, "app_id")):
+            app_ids.add(_string_value(_keyword_value(child, "app_id")))
+    return app_ids
+
+def _parse_python_file(file: Path) -> List[ApplyResource]:
+    """
+    Finds the @tool and @flow definitions in a python file without importing it. Importing tools and flows
+    talks to the server, so it is left until their dependencies have been deployed.
+    """
+    module = ast.parse(file.read_text(), filename=str(file))
+    tool_names, flow_names = [], []
+    tool_dependencies, flow_dependencies = set(), set()
+
+    for node in ast.walk(module):
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        for decorator in node.decorator_list:
+            name = _string_value(_keyword_value(decorator, "name")) or node.name
+            match _decorator_name(decorator):
+                case "tool":
+                    tool_names.append(name)
+                    tool_dependencies |= {(ResourceKind.CONNECTION, app_id) for app_id in _expected_app_ids(_keyword_value(decorator, "expected_credentials"))}
+                case "flow":
+                    flow_names.append(name)
+                    for call in ast.walk(node):
+                        if not isinstance(call, ast.Call) or not isinstance(call.func, ast.Attribute):
+                            continue
+                        if call.func.attr == "tool" and _string_value(_keyword_value(call, "tool", 0)):
+                            flow_dependencies.add((ResourceKind.TOOL, _string_value(_keyword_value(call, "tool", 0))))
+                        elif call.func.attr == "agent" and _string_value(_keyword_value(call, "agent", 1)):
+                            flow_dependencies.add((ResourceKind.AGENT, _string_value(_keyword_value(call, "agent", 1))))
+
+    resources = []
+    if tool_names:
+        resources.append(ApplyResource(kind=ResourceKind.TOOL, tool_kind=ToolKind.python, file=str(file), names=tool_names, dependencies=tool_dependencies))
+    if flow_names:
+        resources.append(ApplyResource(kind=ResourceKind.TOOL, tool_kind=ToolKind.flow, file=str(file), names=flow_names, dependencies=flow_dependencies))
+    return resources
+
+def discover_resources(directory: str) -> List[ApplyResource]:
+    """
+    Returns the connection, model, knowledge base, tool and agent specs found anywhere under directory
+    """
+    root = Path(directory)
+    if not root.is_dir():
+        logger.error(f"The provided path '{directory}' is not a directory")
+        sys.exit(1)
+
+    resources = []
+    for file in sorted(root.rglob("*")):
+        if not file.is_file() or file.suffix.lower() not in SPEC_FILE_SUFFIXES or any(part.startswith(".") for part in file.relative_to(root).parts):
+            continue
+        try:
+            found = _parse_python_file(file) if file.suffix.lower() == ".py" else _parse_spec_file(file)
+        except Exception as e:
+            logger.error(f"Failed to parse '{file}': {e}")
+            sys.exit(1)
+        if not found:
+            logger.debug(f"Skipping '{file}', it does not contain a spec supported by apply")
+        resources.extend(found)
+
+    # A flow model compiled from a python flow is an output of that flow rather than a second definition of it
+    python_flows = {name for resource in resources if resource.tool_kind == ToolKind.flow and resource.file.endswith(".py") for name in resource.names}
+    compiled_flows = [
+        resource for resource in resources
+        if resource.tool_kind == ToolKind.flow and not resource.file.endswith(".py") and set(resource.names) <= python_flows
+    ]
+    for resource in compiled_flows:
+        logger.debug(f"Skipping '{resource.file}', it is compiled from the python flow {', '.join(resource.names)}")
+    return [resource for resource in resources if resource not in compiled_flows]
+
+def plan_levels(resources: List[ApplyResource]) -> List[List[ApplyResource]]:
+    """
+    Orders resources into levels such that every resource only depends on resources in earlier levels.
+    Dependencies on resources outside of resources are assumed to already exist in the active env.
+    """
+    providers: dict[ResourceRef, int] = {}
+    for i, resource in enumerate(resources):
+        for name in resource.names:
+            ref = (resource.kind, name)
+            if ref in providers and providers[ref] != i:
+                logger.error(f"{resource.kind} '{name}' is defined in both '{resources[providers[ref]].file}' and '{resource.file}'")
+                sys.exit(1)
+            providers[ref] = i
+
+    remaining = {
+        i: {providers[ref] for ref in resource.dependencies if ref in providers and providers[ref] != i}
+        for i, resource in enumerate(resources)
+    }
+    levels = []
+    while remaining:
+        ready = sorted(i for i, dependencies in remaining.items() if not dependencies & remaining.keys())
+        if not ready:
+            cycle = ", ".join(f"{resources[i].label} ({resources[i].file})" for i in sorted(remaining))
+            logger.error(f"Circular dependency detected between: {cycle}")
+            sys.exit(1)
+        levels.append([resources[i] for i in ready])
+        for i in ready:
+            del remaining[i]
+    return levels
+
+def _find_requirements_file(file: Path, root: Path) -> str | None:
+    for directory in [file.parent, *file.parent.parents]:
+        candidate = directory / REQUIREMENTS_FILE
+        if candidate.is_file():
+            return str(candidate)
+        if directory == root:
+            break
+    return None
+
+
+class ApplyController:
+    def __init__(self, directory: str, concurrency: int = DEFAULT_APPLY_CONCURRENCY):
+        self.directory = directory
+        self.concurrency = concurrency
+        self.agents_controller = AgentsController()
+        self.knowledge_base_controller = KnowledgeBaseController()
+        self.models_controller = ModelsController()
+        self.tool_client = None
+        # Loading python tools and flows imports modules and alters sys.path
+        self._module_import_lock = Lock()
+
+    def deploy_resource(self, resource: ApplyResource) -> None:
+        match resource.kind:
+            case ResourceKind.CONNECTION:
+                import_connection(file=resource.file)
+            case ResourceKind.MODEL if resource.is_policy:
+                for policy in self.models_controller.import_model_policy(file=resource.file):
+                    self.models_controller.publish_or_update_model_policies(policy=policy)
+            case ResourceKind.MODEL:
+                for model in self.models_controller.import_model(file=resource.file, app_id=None):
+                    self.models_controller.publish_or_update_models(model=model)
+            case ResourceKind.KNOWLEDGE_BASE:
+                self.knowledge_base_controller.import_knowledge_base(file=resource.file, app_id=None)
+            case ResourceKind.TOOL:
+                self._deploy_tool(resource)
+            case ResourceKind.AGENT:
+                agents = self.agents_controller.import_agent(file=resource.file, app_id=None)
+                self.agents_controller.publish_or_update_agents(agents)
+
+    def _deploy_tool(self, resource: ApplyResource) -> None:
+        file = Path(resource.file)
+        requirements_file = _find_requirements_file(file, Path(self.directory)) if resource.tool_kind == ToolKind.python else None
+        app_ids = sorted(name for kind, name in resource.dependencies if kind == ResourceKind.CONNECTION)
+        tools_controller = ToolsController(resource.tool_kind, resource.file, requirements_file)
+        tools_controller.client = self.tool_client
+
+        with self._module_import_lock:
+            tools = list(ToolsController.import_tool(
+                kind=resource.tool_kind,
+                file=resource.file,
+                app_id=app_ids or None,
+                requirements_file=requirements_file
+            ))
+        tools_controller.publish_or_update_tools(tools)
+
+    def print_plan(self, levels: List[List[ApplyResource]]) -> None:
+        table = rich.table.Table(show_header=True, header_style="bold white", show_lines=True, title="Deployment plan")
+        for column in ["Level", "Kind", "Name", "File"]:
+            table.add_column(column)
+        for i, level in enumerate(levels, start=1):
+            for resource in level:
+                table.add_row(str(i), str(resource.kind), ", ".join(resource.names), resource.file)
+        rich.print(table)
+
+    def apply(self, dry_run: bool = False) -> None:
+        resources = discover_resources(self.directory)
+        if not resources:
+            logger.error(f"No connection, model, knowledge base, tool or agent specs found in '{self.directory}'")
+            sys.exit(1)
+
+        levels = plan_levels(resources)
+        if dry_run:
+            self.print_plan(levels)
+            return
+
+        # Create the clients up front so every worker shares the same warmed connection pools
+        kinds = {resource.kind for resource in resources}
+        if ResourceKind.TOOL in kinds:
+            self.tool_client = ToolsController().get_client()
+        if ResourceKind.AGENT in kinds:
+            self.agents_controller.get_agent_directory()
+
+        failed_refs: set[ResourceRef] = set()
+        failures: List[tuple[str, str]] = []
+        deployed = 0
+
+        with self.agents_controller, ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            for level in levels:
+                runnable = []
+                for resource in level:
+                    blocked_by = sorted(name for kind, name in resource.dependencies & failed_refs)
+                    if blocked_by:
+                        failures.append((resource.label, f"Skipped, depends on failed {', '.join(blocked_by)}"))
+                        failed_refs.update((resource.kind, name) for name in resource.names)
+                    else:
+                        runnable.append(resource)
+
+                futures = {executor.submit(self.deploy_resource, resource): resource for resource in runnable}
+                for future in as_completed(futures):
+                    resource = futures[future]
+                    try:
+                        future.result()
+                        deployed += 1
+                    except (Exception, SystemExit) as e:
+                        failures.append((resource.label, describe_failure(e)))
+                        failed_refs.update((resource.kind, name) for name in resource.names)
+
+        if failures:
+            table = rich.table.Table(show_header=True, header_style="bold white", show_lines=True, title="Failed resources")
+            for column in ["Resource", "Error"]:
+                table.add_column(column)
+            for label, error in failures:
+                table.add_row(label, error)
+            rich.print(table)
+
+            logger.error(f"Applied {deployed} of {len(resources)} resources from '{self.directory}', {len(failures)} failed")
+            sys.exit(1)
+
+        logger.info(f"Applied {deployed} resources from '{self.directory}'")
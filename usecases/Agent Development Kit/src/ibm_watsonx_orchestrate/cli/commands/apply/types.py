@@ -0,0 +1,36 @@
+from enum import Enum
+from typing import List, Optional, Set, Tuple
+
+from pydantic import BaseModel
+
+from ibm_watsonx_orchestrate.cli.commands.tools.tools_controller import ToolKind
+
+
+class ResourceKind(str, Enum):
+    CONNECTION = "connection"
+    MODEL = "model"
+    KNOWLEDGE_BASE = "knowledge_base"
+    TOOL = "tool"
+    AGENT = "agent"
+
+    def __str__(self):
+        return str(self.value)
+
+
+ResourceRef = Tuple[ResourceKind, str]
+
+
+class ApplyResource(BaseModel):
+    """
+    A spec file found by `orchestrate apply`, along with the names it defines and the resources it refers to
+    """
+    kind: ResourceKind
+    file: str
+    names: List[str]
+    dependencies: Set[ResourceRef] = set()
+    tool_kind: Optional[ToolKind] = None
+    is_policy: bool = False
+
+    @property
+    def label(self) -> str:
+        return f"{self.kind} {', '.join(self.names)}"
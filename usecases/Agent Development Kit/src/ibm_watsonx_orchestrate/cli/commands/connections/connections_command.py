@@ -6,9 +6,12 @@ from ibm_watsonx_orchestrate.cli.commands.connections.connections_controller imp
     remove_connection,
     list_connections,
     import_connection,
+    import_connections_bulk,
+    is_bulk_connection_source,
     configure_connection,
     set_credentials_connection,
-    set_identity_provider_connection
+    set_identity_provider_connection,
+    DEFAULT_IMPORT_CONCURRENCY
 )
 
 connections_app = typer.Typer(no_args_is_help=True)
@@ -57,10 +60,20 @@ def import_connection_command(
     file: Annotated[
         str, typer.Option(
             '--file', '-f',
-            help='Path to a spec file containing the connection details'
+            help='Path to a spec file containing the connection details, a yaml file with one spec per document, or a directory of spec files'
         )
-    ]
+    ],
+    concurrency: Annotated[
+        int, typer.Option(
+            '--concurrency', '-c', min=1,
+            help='Number of connections imported in parallel when --file is a directory or holds several specs'
+        )
+    ] = DEFAULT_IMPORT_CONCURRENCY
 ):
+    if is_bulk_connection_source(file):
+        import_connections_bulk(source=file, concurrency=concurrency)
+        return
+
     import_connection(file=file)
 
 @connections_app.command(name="configure")
@@ -5,7 +5,10 @@ import rich
 import yaml
 import sys
 import typer
+import rich.table
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 from typing import List
 from ibm_watsonx_orchestrate.client.utils import is_local_dev
 from ibm_watsonx_orchestrate.agent_builder.connections.types import (
@@ -31,31 +34,37 @@ from ibm_watsonx_orchestrate.agent_builder.connections.types import (
 
 )
 
-from ibm_watsonx_orchestrate.client.connections import get_connections_client, get_connection_type
+from ibm_watsonx_orchestrate.client.connections import get_connections_client, get_connection_type, invalidate_connections_index
+from ibm_watsonx_orchestrate.utils.utils import describe_failure
 
 logger = logging.getLogger(__name__)
 
-def _validate_connections_spec_content(content: dict) -> None:
+DEFAULT_IMPORT_CONCURRENCY = 8
+CONNECTION_SPEC_SUFFIXES = (".yaml", ".yml", ".json")
+
+def _get_connections_spec_error(content: dict) -> str | None:
     spec_version = content.get("spec_version")
     kind = content.get("kind")
     app_id = content.get("app_id")
     environments = content.get("environments")
 
     if not spec_version:
-        logger.error("No 'spec_version' found in provided spec file. Please ensure the spec file is in the correct format")
-        sys.exit(1)
+        return "No 'spec_version' found in provided spec file. Please ensure the spec file is in the correct format"
     if not kind:
-        logger.error("No 'kind' found in provided spec file. Please ensure the spec file is in the correct format")
-        sys.exit(1)
+        return "No 'kind' found in provided spec file. Please ensure the spec file is in the correct format"
     if not app_id:
-        logger.error("No 'app_id' found in provided spec file. Please ensure the spec file is in the correct format")
-        sys.exit(1)
+        return "No 'app_id' found in provided spec file. Please ensure the spec file is in the correct format"
     if not environments or not len(environments):
-        logger.error("No 'environments' found in provided spec file. Please ensure the spec file is in the correct format")
-        sys.exit(1)
+        return "No 'environments' found in provided spec file. Please ensure the spec file is in the correct format"
     
     if kind != "connection":
-        logger.error("Field 'kind' must have a value of 'connection'. Please ensure the spec file is a valid connection spec.")
+        return "Field 'kind' must have a value of 'connection'. Please ensure the spec file is a valid connection spec."
+    return None
+
+def _validate_connections_spec_content(content: dict) -> None:
+    error = _get_connections_spec_error(content)
+    if error:
+        logger.error(error)
         sys.exit(1)
 
 def _create_connection_from_spec(content: dict) -> None:
@@ -277,10 +286,12 @@ def add_configuration(config: ConnectionConfiguration) -> None:
                     sys.exit(1)
             
             client.update_config(app_id=app_id, env=environment, payload=config.model_dump(exclude_none=True))
+            invalidate_connections_index()
             logger.info(f"Configuration successfully updated for '{environment}' environment of connection '{app_id}'.")
         else:
             logger.info(f"Creating configuration for connection '{app_id}' in the '{environment}' environment")
             client.create_config(app_id=app_id, payload=config.model_dump())
+            invalidate_connections_index()
             logger.info(f"Configuration successfully created for '{environment}' environment of connection '{app_id}'.")
 
     except requests.HTTPError as e:
@@ -343,6 +354,7 @@ def add_connection(app_id: str) -> None:
         logger.info(f"Creating connection '{app_id}'")
         request = {"app_id": app_id}
         client.create(payload=request)
+        invalidate_connections_index()
         logger.info(f"Successfully created connection '{app_id}'")
     except requests.HTTPError as e:
         response = e.response
@@ -365,6 +377,7 @@ def remove_connection(app_id: str) -> None:
     try:
         logger.info(f"Removing connection '{app_id}'")
         client.delete(app_id=app_id)
+        invalidate_connections_index()
         logger.info(f"Connection '{app_id}' successfully removed")
     except requests.HTTPError as e:
         response = e.response
@@ -431,6 +444,127 @@ def list_connections(environment: ConnectionEnvironment | None, verbose: bool =
 def import_connection(file: str) -> None:
     _parse_file(file=file)
 
+def _load_connection_documents(file: str) -> List[dict]:
+    with open(file, 'r') as f:
+        if file.endswith(".json"):
+            content = json.load(f)
+            return content if isinstance(content, list) else [content]
+        return [doc for doc in yaml.load_all(f, Loader=yaml.SafeLoader) if doc is not None]
+
+def is_bulk_connection_source(file: str | None) -> bool:
+    """
+    Returns True when file is a directory, or a yaml file holding more than one connection spec
+    """
+    if file is None:
+        return False
+    if Path(file).is_dir():
+        return True
+    if not Path(file).is_file() or not file.endswith((".yaml", ".yml")):
+        return False
+    try:
+        return len(_load_connection_documents(file)) > 1
+    except yaml.YAMLError:
+        return False
+
+def discover_connection_files(source: str) -> List[str]:
+    """
+    Returns the spec files in the directory source, or source itself when it is a file
+    """
+    source_path = Path(source)
+    if not source_path.is_dir():
+        return [source]
+    return sorted(str(file) for file in source_path.rglob("*") if file.is_file() and file.suffix in CONNECTION_SPEC_SUFFIXES)
+
+def _get_connection_configurations(content: dict) -> List[ConnectionConfiguration]:
+    app_id = content.get("app_id")
+    configurations = []
+    for environment, config in content.get("environments").items():
+        if is_local_dev() and environment != ConnectionEnvironment.DRAFT:
+            logger.warning(f"Local development does not support any environments other than 'draft'. The provided '{environment}' environment configuration of connection '{app_id}' will be ignored.")
+            continue
+        configurations.append(ConnectionConfiguration.model_validate({**config, "environment": environment, "app_id": app_id}))
+    return configurations
+
+def _provision_connection(app_id: str, configurations: List[ConnectionConfiguration]) -> None:
+    client = get_connections_client()
+    if not client.get(app_id=app_id):
+        add_connection(app_id=app_id)
+    for config in configurations:
+        add_configuration(config)
+
+def import_connections_bulk(source: str, concurrency: int = DEFAULT_IMPORT_CONCURRENCY) -> None:
+    """
+    Imports every connection spec in the directory or multi-document file source. All specs are validated
+    before any connection is touched, then each connection is created and configured by a pool of
+    concurrency workers. Failures are collected and reported together once all connections were processed.
+    """
+    files = discover_connection_files(source)
+    if not files:
+        logger.error(f"No connection spec files found in '{source}'")
+        sys.exit(1)
+
+    failures: List[tuple[str, str]] = []
+    pending: dict[str, List[ConnectionConfiguration]] = {}
+    sources: dict[str, str] = {}
+
+    for file in files:
+        try:
+            documents = _load_connection_documents(file)
+        except Exception as e:
+            failures.append((file, describe_failure(e)))
+            continue
+
+        for i, content in enumerate(documents):
+            label = f"{file} (document {i + 1})" if len(documents) > 1 else file
+            error = _get_connections_spec_error(content) if isinstance(content, dict) else "Spec is not a mapping"
+            if error:
+                failures.append((label, error))
+                continue
+
+            app_id = content.get("app_id")
+            if app_id in sources:
+                failures.append((label, f"Connection '{app_id}' is also defined in {sources[app_id]}"))
+                continue
+            sources[app_id] = label
+
+            try:
+                pending[app_id] = _get_connection_configurations(content)
+            except Exception as e:
+                failures.append((label, describe_failure(e)))
+
+    if failures:
+        _print_import_failures(failures)
+        logger.error(f"Found {len(failures)} invalid connection specs, no connections were imported")
+        sys.exit(1)
+
+    # Create the client up front so every worker shares the same connection pool
+    get_connections_client()
+
+    processed = 0
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        futures = {executor.submit(_provision_connection, app_id, configurations): app_id for app_id, configurations in pending.items()}
+        for future in as_completed(futures):
+            try:
+                future.result()
+                processed += 1
+            except (Exception, SystemExit) as e:
+                failures.append((futures[future], describe_failure(e)))
+
+    if failures:
+        _print_import_failures(failures)
+        logger.error(f"Imported {processed} connections from {len(files)} files, {len(failures)} failed")
+        sys.exit(1)
+
+    logger.info(f"Imported {processed} connections from {len(files)} files")
+
+def _print_import_failures(failures: List[tuple[str, str]]) -> None:
+    table = rich.table.Table(show_header=True, header_style="bold white", show_lines=True, title="Failed imports")
+    for column in ["Connection / File", "Error"]:
+        table.add_column(column)
+    for source_name, error in failures:
+        table.add_row(source_name, error)
+    rich.print(table)
+
 def configure_connection(**kwargs) -> None:
     if is_local_dev() and kwargs.get("environment") != ConnectionEnvironment.DRAFT:
         logger.error(f"Cannot create configuration for environment '{kwargs.get('environment')}'. Local development does not support any environments other than 'draft'.")
@@ -151,7 +151,7 @@ def activate(name: str, apikey: str=None, username: str=None, password: str=None
     if not check_token_validity(existing_token) or is_local:
         _login(name=name, apikey=apikey, username=username, password=password)
 
-    with lock:
+    with lock, cfg.batch():
         cfg.write(CONTEXT_SECTION_HEADER, CONTEXT_ACTIVE_ENV_OPT, name)
         if registry is not None:
             cfg.write(PYTHON_REGISTRY_HEADER, PYTHON_REGISTRY_TYPE_OPT, str(registry))
@@ -178,7 +178,7 @@ def add(name: str, url: str, should_activate: bool=False, iam_url: str=None, typ
         if update_response.lower() == "n":
             logger.info(f"No changes made to environments")
             return
-    with lock:
+    with lock, cfg.batch():
         cfg.write(ENVIRONMENTS_SECTION_HEADER, name, {ENV_WXO_URL_OPT: url})
         if iam_url:
             cfg.write(ENVIRONMENTS_SECTION_HEADER, name, {ENV_IAM_URL_OPT: iam_url})
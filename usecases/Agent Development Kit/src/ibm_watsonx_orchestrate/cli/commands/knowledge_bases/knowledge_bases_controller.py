@@ -12,7 +12,7 @@ from ibm_watsonx_orchestrate.agent_builder.knowledge_bases.knowledge_base_reques
 from ibm_watsonx_orchestrate.agent_builder.knowledge_bases.knowledge_base import KnowledgeBase
 from ibm_watsonx_orchestrate.client.knowledge_bases.knowledge_base_client import KnowledgeBaseClient
 from ibm_watsonx_orchestrate.client.base_api_client import ClientAPIException
-from ibm_watsonx_orchestrate.client.connections import get_connections_client
+from ibm_watsonx_orchestrate.client.connections import get_connections_client, get_connections_index
 from ibm_watsonx_orchestrate.client.utils import instantiate_client
 
 logger = logging.getLogger(__name__)
@@ -90,15 +90,13 @@ class KnowledgeBaseController:
                     
                     
                     if app_id:
-                        connections_client = get_connections_client()
                         connection_id = None
                         if app_id is not None:
-                            connections = connections_client.get_draft_by_app_id(app_id=app_id)
-                            if not connections:
+                            connection_id = get_connections_index(get_connections_client()).get_connection_id(app_id)
+                            if not connection_id:
                                 logger.error(f"No connection exists with the app-id '{app_id}'")
                                 exit(1)
 
-                            connection_id = connections.connection_id
                             kb.conversational_search_tool.index_config[0].connection_id = connection_id
 
                     kb.prioritize_built_in_index = False
@@ -213,8 +211,8 @@ class KnowledgeBaseController:
                    and kb.conversational_search_tool.index_config is not None \
                    and len(kb.conversational_search_tool.index_config) > 0 \
                    and kb.conversational_search_tool.index_config[0].connection_id is not None:
-                    connections_client = get_connections_client()
-                    app_id = str(connections_client.get_draft_by_id(kb.conversational_search_tool.index_config[0].connection_id))
+                    connection_id = kb.conversational_search_tool.index_config[0].connection_id
+                    app_id = str(get_connections_index(get_connections_client()).get_app_id(connection_id) or connection_id)
 
                 table.add_row(
                     kb.name,
@@ -7,13 +7,15 @@ import logging
 import sys
 import re
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from ibm_watsonx_orchestrate.client.toolkit.toolkit_client import ToolKitClient
 from ibm_watsonx_orchestrate.client.tools.tool_client import ToolClient
 from ibm_watsonx_orchestrate.agent_builder.toolkits.base_toolkit import BaseToolkit, ToolkitSpec
 from ibm_watsonx_orchestrate.agent_builder.toolkits.types import ToolkitKind, Language, ToolkitSource
 from ibm_watsonx_orchestrate.client.utils import instantiate_client
 from ibm_watsonx_orchestrate.utils.utils import sanatize_app_id
-from ibm_watsonx_orchestrate.client.connections import get_connections_client
+from ibm_watsonx_orchestrate.client.connections import get_connections_client, get_connections_index
+from ibm_watsonx_orchestrate.client.connections.connections_client import CONNECTION_LOOKUP_CONCURRENCY
 import typer
 import json
 from rich.console import Console
@@ -37,13 +39,22 @@ def get_connection_id(app_id: str) -> str:
             exit(1)
     connection_id = None
     if app_id is not None:
-        connection = connections_client.get(app_id=app_id)
-        if  not connection:
+        connection_id = get_connections_index(connections_client).get_connection_id(app_id)
+        if not connection_id:
             logger.error(f"No connection exists with the app-id '{app_id}'")
             exit(1)
-        connection_id = connection.connection_id
     return connection_id
 
+def get_connection_ids(app_ids: List[str]) -> dict[str, str]:
+    """
+    Returns the connection id of each app id, checking the configurations of the connections concurrently
+    """
+    unique_app_ids = list(dict.fromkeys(app_ids))
+    if not unique_app_ids:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(CONNECTION_LOOKUP_CONCURRENCY, len(unique_app_ids))) as executor:
+        return dict(zip(unique_app_ids, executor.map(get_connection_id, unique_app_ids)))
+
 def validate_params(kind: str):
     if kind != ToolkitKind.MCP:
         raise ValueError(f"Unsupported toolkit kind: {kind}")
@@ -190,7 +201,7 @@ class ToolkitController:
         return zipfile
 
     def _remap_connections(self, app_ids: List[str]):
-        app_id_dict = {}
+        remapped_ids = []
         for app_id in app_ids:        
             split_pattern = re.compile(r"(?<!\\)=")
             split_id = re.split(split_pattern, app_id)
@@ -206,10 +217,11 @@ class ToolkitController:
             if not len(runtime_id.strip()) or not len(local_id.strip()):
                 raise typer.BadParameter(f"The provided --app-id '{app_id}' is not valid. --app-id cannot be empty or whitespace")
 
-            runtime_id = sanatize_app_id(runtime_id)
-            app_id_dict[runtime_id] = get_connection_id(local_id)
+            remapped_ids.append((sanatize_app_id(runtime_id), local_id))
 
-        return app_id_dict
+        # Every --app-id is validated before any connection is looked up
+        connection_ids = get_connection_ids([local_id for _, local_id in remapped_ids])
+        return {runtime_id: connection_ids[local_id] for runtime_id, local_id in remapped_ids}
 
     
     def remove_toolkit(self, name: str):
@@ -249,10 +261,7 @@ class ToolkitController:
 
             tools_client = instantiate_client(ToolClient)
 
-            connections_client = get_connections_client()
-            connections = connections_client.list()
-
-            connections_dict = {conn.connection_id: conn for conn in connections}
+            connections_index = get_connections_index(get_connections_client())
 
             for toolkit in toolkits:
                 tool_ids = toolkit.__toolkit_spec__.tools or []
@@ -268,7 +277,7 @@ class ToolkitController:
                 connection_ids = toolkit.__toolkit_spec__.mcp.connections.values()
 
                 for connection_id in connection_ids:
-                    connection = connections_dict.get(connection_id)
+                    connection = connections_index.get_by_connection_id(connection_id)
                     if connection:
                         app_id = str(connection.app_id or connection.connection_id)
                     elif connection_id:
@@ -1,7 +1,9 @@
 import typer
 from typing import List
 from typing_extensions import Annotated
-from ibm_watsonx_orchestrate.cli.commands.tools.tools_controller import ToolsController, ToolKind
+from ibm_watsonx_orchestrate.agent_builder.tools import OpenApiOperationFilter
+from ibm_watsonx_orchestrate.cli.commands.tools.tools_controller import ToolsController, ToolKind, is_bulk_tool_source, \
+    DEFAULT_IMPORT_CONCURRENCY
 tools_app= typer.Typer(no_args_is_help=True)
 
 @tools_app.command(name="import", help='Import a tool into the active environment')
@@ -15,7 +17,7 @@ def tool_import(
         typer.Option(
             "--file",
             "-f",
-            help="Path to Python, OpenAPI spec YAML file or flow JSON or python file. Required for kind openapi, python and flow",
+            help="Path to Python, OpenAPI spec YAML file or flow JSON or python file. Required for kind openapi, python and flow. A directory or glob (quoted, e.g. 'tools/**/*.py') imports every matching tool file",
         ),
     ] = None,
     # skillset_id: Annotated[
@@ -49,8 +51,58 @@ included in this folder will be included within the uploaded package. Local depe
 relative to this package root folder or imported using relative imports from the --file. This only applies when the 
 --kind=python. If not specified it is assumed only a single python file is being uploaded."""),
     ] = None,
+    concurrency: Annotated[
+        int,
+        typer.Option("--concurrency", "-c", min=1, help="Number of tools published in parallel when --file is a directory or glob"),
+    ] = DEFAULT_IMPORT_CONCURRENCY,
+    include_tag: Annotated[
+        List[str],
+        typer.Option("--include-tag", help="Only import the operations with this tag. Only applies when --kind=openapi"),
+    ] = None,
+    exclude_tag: Annotated[
+        List[str],
+        typer.Option("--exclude-tag", help="Skip the operations with this tag. Only applies when --kind=openapi"),
+    ] = None,
+    include_operation_id: Annotated[
+        List[str],
+        typer.Option("--include-operation-id", help="Only import the operation with this operationId. Only applies when --kind=openapi"),
+    ] = None,
+    exclude_operation_id: Annotated[
+        List[str],
+        typer.Option("--exclude-operation-id", help="Skip the operation with this operationId. Only applies when --kind=openapi"),
+    ] = None,
+    include_path: Annotated[
+        List[str],
+        typer.Option("--include-path", help="Only import the operations whose path matches this glob (e.g. '/accounts/*'). Only applies when --kind=openapi"),
+    ] = None,
+    exclude_path: Annotated[
+        List[str],
+        typer.Option("--exclude-path", help="Skip the operations whose path matches this glob. Only applies when --kind=openapi"),
+    ] = None,
 ):
+    operation_filter = None
+    if any([include_tag, exclude_tag, include_operation_id, exclude_operation_id, include_path, exclude_path]):
+        operation_filter = OpenApiOperationFilter(
+            include_tags=include_tag or [],
+            exclude_tags=exclude_tag or [],
+            include_operation_ids=include_operation_id or [],
+            exclude_operation_ids=exclude_operation_id or [],
+            include_paths=include_path or [],
+            exclude_paths=exclude_path or []
+        )
+
     tools_controller = ToolsController(kind, file, requirements_file)
+    if is_bulk_tool_source(file):
+        tools_controller.import_tools_bulk(
+            source=file,
+            app_id=app_id,
+            requirements_file=requirements_file,
+            package_root=package_root,
+            concurrency=concurrency,
+            operation_filter=operation_filter
+        )
+        return
+
     tools = tools_controller.import_tool(
         kind=kind,
         file=file,
@@ -59,7 +111,8 @@ relative to this package root folder or imported using relative imports from the
         # skill_operation_path=skill_operation_path,
         app_id=app_id,
         requirements_file=requirements_file,
-        package_root=package_root
+        package_root=package_root,
+        operation_filter=operation_filter
     )
     
     tools_controller.publish_or_update_tools(tools, package_root=package_root)
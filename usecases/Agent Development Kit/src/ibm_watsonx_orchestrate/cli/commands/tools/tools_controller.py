@@ -1,21 +1,28 @@
 import logging
 import asyncio
+import hashlib
 import importlib
+import importlib.util
 import inspect
 import sys
 import io
 import re
+import stat
 import tempfile
 import requests
 import zipfile
 from enum import Enum
 from os import path
 from pathlib import Path
+from types import ModuleType
 from typing import Iterable, List
 import rich
 import json
 from rich.json import JSON
 import glob
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from threading import Lock
 
 import rich.table
 import typer
@@ -23,7 +30,7 @@ import typer
 from rich.console import Console
 from rich.panel import Panel
 
-from ibm_watsonx_orchestrate.agent_builder.tools import BaseTool, ToolSpec
+from ibm_watsonx_orchestrate.agent_builder.tools import BaseTool, ToolSpec, OpenApiOperationFilter
 from ibm_watsonx_orchestrate.agent_builder.tools.openapi_tool import create_openapi_json_tools_from_uri,create_openapi_json_tools_from_content
 from ibm_watsonx_orchestrate.cli.commands.models.models_controller import ModelHighlighter
 from ibm_watsonx_orchestrate.cli.commands.tools.types import RegistryType
@@ -31,14 +38,15 @@ from ibm_watsonx_orchestrate.cli.commands.connections.connections_controller imp
 from ibm_watsonx_orchestrate.agent_builder.connections.types import  ConnectionType, ConnectionEnvironment, ConnectionPreference
 from ibm_watsonx_orchestrate.cli.config import Config, CONTEXT_SECTION_HEADER, CONTEXT_ACTIVE_ENV_OPT, \
     PYTHON_REGISTRY_HEADER, PYTHON_REGISTRY_TYPE_OPT, PYTHON_REGISTRY_TEST_PACKAGE_VERSION_OVERRIDE_OPT, \
-    DEFAULT_CONFIG_FILE_CONTENT
+    DEFAULT_CONFIG_FILE_CONTENT, PUBLISHED_HASHES_CONFIG_FILE_FOLDER, PUBLISHED_HASHES_CONFIG_FILE, \
+    PUBLISHED_TOOLS_SECTION_HEADER
 from ibm_watsonx_orchestrate.agent_builder.connections import ConnectionSecurityScheme, ExpectedCredentials
 from ibm_watsonx_orchestrate.flow_builder.flows.decorators import FlowWrapper
 from ibm_watsonx_orchestrate.client.tools.tool_client import ToolClient
 from ibm_watsonx_orchestrate.client.toolkit.toolkit_client import ToolKitClient
-from ibm_watsonx_orchestrate.client.connections import get_connections_client, get_connection_type
+from ibm_watsonx_orchestrate.client.connections import get_connections_client, get_connection_type, get_connections_index
 from ibm_watsonx_orchestrate.client.utils import instantiate_client, is_local_dev
-from ibm_watsonx_orchestrate.utils.utils import sanatize_app_id
+from ibm_watsonx_orchestrate.utils.utils import sanatize_app_id, copy_zip_entry, describe_failure
 from ibm_watsonx_orchestrate.client.utils import is_local_dev
 from ibm_watsonx_orchestrate.client.tools.tempus_client import TempusClient
 from ibm_watsonx_orchestrate.flow_builder.utils import import_flow_model
@@ -49,6 +57,10 @@ logger = logging.getLogger(__name__)
 
 __supported_characters_pattern = re.compile("^(\\w|_)+$")
 
+# Fixed entry metadata so that identical sources always produce byte-identical artifacts
+ARTIFACT_ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+ARTIFACT_ZIP_FILE_MODE = 0o644
+
 
 class ToolKind(str, Enum):
     openapi = "openapi"
@@ -57,6 +69,16 @@ class ToolKind(str, Enum):
     flow = "flow"
     # skill = "skill"
 
+DEFAULT_IMPORT_CONCURRENCY = 8
+# Keeps the names=... query string of a single lookup well within URL length limits
+TOOL_NAME_LOOKUP_BATCH_SIZE = 50
+TOOL_FILE_PATTERNS = {
+    ToolKind.python: ["**/*.py"],
+    ToolKind.openapi: ["**/*.yaml", "**/*.yml", "**/*.json"],
+    ToolKind.flow: ["**/*.py", "**/*.json"],
+}
+__glob_pattern = re.compile(r"[*?\[]")
+
 def validate_app_ids(kind: ToolKind, **args) -> None:
     app_ids = args.get("app_id")
     if not app_ids:
@@ -68,10 +90,7 @@ def validate_app_ids(kind: ToolKind, **args) -> None:
                 "Kind 'openapi' can only take one app-id"
             )
 
-    connections_client = get_connections_client()
-
-    imported_connections_list = connections_client.list()
-    imported_connections = {conn.app_id:conn for conn in imported_connections_list}
+    connections_index = get_connections_index(get_connections_client())
 
     for app_id in app_ids:
         if kind == ToolKind.python:
@@ -86,10 +105,11 @@ def validate_app_ids(kind: ToolKind, **args) -> None:
             else:
                 raise typer.BadParameter(f"The provided --app-id '{app_id}' is not valid. This is likely caused by having mutliple equal signs, please use '\\=' to represent a literal '=' character")
 
-        if app_id not in imported_connections:
+        imported_connections = connections_index.get_by_app_id(app_id)
+        if not imported_connections:
             logger.warning(f"No connection found for provided app-id '{app_id}'. Please create the connection using `orchestrate connections add`")
         else:
-            if kind == ToolKind.openapi and imported_connections.get(app_id).security_scheme == ConnectionSecurityScheme.KEY_VALUE:
+            if kind == ToolKind.openapi and imported_connections[0].security_scheme == ConnectionSecurityScheme.KEY_VALUE:
                 logger.error(f"Key value application connections can not be bound to an openapi tool")
                 exit(1)
 
@@ -98,6 +118,10 @@ def validate_params(kind: ToolKind, **args) -> None:
         raise typer.BadParameter(
             "--file (-f) is required when kind is set to either python or openapi"
         )
+    elif kind != "openapi" and args.get("operation_filter") is not None:
+        raise typer.BadParameter(
+            "Operation filters (--include-*, --exclude-*) can only be used when kind is set to openapi"
+        )
     elif kind == "skill":
         missing_params = []
         if args["skillset_id"] is None:
@@ -114,14 +138,12 @@ def validate_params(kind: ToolKind, **args) -> None:
     validate_app_ids(kind=kind, **args)
 
 def get_connection_id(app_id: str) -> str:
-    connections_client = get_connections_client()
     connection_id = None
     if app_id is not None:
-        connection = connections_client.get(app_id=app_id)
-        if  not connection:
+        connection_id = get_connections_index(get_connections_client()).get_connection_id(app_id)
+        if not connection_id:
             logger.error(f"No connection exists with the app-id '{app_id}'")
             exit(1)
-        connection_id = connection.connection_id
     return connection_id
 
 
@@ -152,12 +174,10 @@ def validate_python_connections(tool: BaseTool):
     if not tool.expected_credentials:
         return
 
-    connections_client = get_connections_client()
+    connections_index = get_connections_index(get_connections_client())
     connections = tool.__tool_spec__.binding.python.connections
 
     provided_connections = list(connections.keys()) if connections else []
-    imported_connections_list = connections_client.list()
-    imported_connections = {conn.connection_id:conn for conn in imported_connections_list}
 
     validation_failed = False
 
@@ -185,7 +205,7 @@ def validate_python_connections(tool: BaseTool):
             continue
             
         connection_id = connections.get(sanatized_expected_tool_app_id)
-        imported_connection = imported_connections.get(connection_id)
+        imported_connection = connections_index.get_by_connection_id(connection_id)
         imported_connection_auth_type = get_connection_type(security_scheme=imported_connection.security_scheme, auth_type=imported_connection.auth_type)
 
         if connection_id and not imported_connection:
@@ -234,6 +254,24 @@ def get_requirement_lines (requirements_file, remove_trailing_newlines=True):
 
     return requirements
 
+def load_tool_module(file_path: Path) -> ModuleType:
+    """
+    Loads a single file tool as a module named after its full path, so tool files in different folders
+    that share a name are each loaded from their own file without touching each other's sys.modules entry
+    """
+    if not file_path.is_file():
+        raise ModuleNotFoundError(f"No module named '{file_path.stem}'", name=file_path.stem)
+    module_name = f"{file_path.stem}_{hashlib.sha256(str(file_path).encode('utf-8')).hexdigest()[:16]}"
+    spec = importlib.util.spec_from_file_location(module_name, file_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(module_name, None)
+        raise
+    return module
+
 def import_python_tool(file: str, requirements_file: str = None, app_id: List[str] = None, package_root: str = None) -> List[BaseTool]:
     try:
         file_path = Path(file).absolute()
@@ -272,7 +310,10 @@ def import_python_tool(file: str, requirements_file: str = None, app_id: List[st
             package = file_path.stem
             sys.path.append(str(package_folder))
 
-        module = importlib.import_module(package, package=package_folder)
+        if resolved_package_root:
+            module = importlib.import_module(package, package=package_folder)
+        else:
+            module = load_tool_module(file_path)
         if resolved_package_root:
             del sys.path[-1]
         del sys.path[-1]
@@ -425,8 +466,8 @@ The [bold]flow tool[/bold] is being imported from [green]`{file}`[/green].
     return await import_flow_model(model)
 
 
-async def import_openapi_tool(file: str, connection_id: str) -> List[BaseTool]:
-    tools = await create_openapi_json_tools_from_uri(file, connection_id)
+async def import_openapi_tool(file: str, connection_id: str, operation_filter: OpenApiOperationFilter = None) -> List[BaseTool]:
+    tools = await create_openapi_json_tools_from_uri(file, connection_id, operation_filter=operation_filter)
     return tools
 
 def _get_kind_from_spec(spec: dict) -> ToolKind:
@@ -445,6 +486,44 @@ def _get_kind_from_spec(spec: dict) -> ToolKind:
         logger.error(f"Could not determine 'kind' of tool '{name}'")
         sys.exit(1) 
 
+def is_bulk_tool_source(file: str | None) -> bool:
+    return file is not None and (path.isdir(file) or __glob_pattern.search(file) is not None)
+
+def discover_tool_files(kind: ToolKind, source: str) -> List[str]:
+    """
+    Returns the tool files of the given kind in the directory source, or matching the glob source
+    """
+    if path.isdir(source):
+        candidates = [x for pattern in TOOL_FILE_PATTERNS.get(kind, []) for x in glob.iglob(path.join(source, pattern), recursive=True)]
+    else:
+        candidates = glob.glob(source, recursive=True)
+
+    return sorted(set([
+        x for x in candidates
+        if path.isfile(x) and "__pycache__" not in Path(x).parts and Path(x).name != "__init__.py"
+    ]))
+
+def write_zip_entry(zip_file: zipfile.ZipFile, arcname: str, data: bytes | str) -> None:
+    """
+    Writes data to zip_file under arcname with a fixed timestamp and permissions
+    """
+    zip_info = zipfile.ZipInfo(arcname, date_time=ARTIFACT_ZIP_DATE_TIME)
+    zip_info.compress_type = zipfile.ZIP_DEFLATED
+    zip_info.external_attr = (stat.S_IFREG | ARTIFACT_ZIP_FILE_MODE) << 16
+    zip_file.writestr(zip_info, data)
+
+def get_tool_content_hash(tool: BaseTool, tool_artifact: str = None) -> str:
+    """
+    Returns a sha256 over the tool spec and its artifact, used to detect tools that have not changed since they were last published
+    """
+    tool_spec = tool.__tool_spec__.model_dump(mode='json', exclude_unset=True, exclude_none=True, by_alias=True)
+    content_hash = hashlib.sha256(json.dumps(tool_spec, sort_keys=True).encode("utf-8"))
+    if tool_artifact is not None:
+        with open(tool_artifact, "rb") as fp:
+            content_hash.update(fp.read())
+    return content_hash.hexdigest()
+
+@lru_cache(maxsize=None)
 def get_whl_in_registry(registry_url: str, version: str) -> str| None:
     orchestrate_links = requests.get(registry_url).text
     wheel_files = [x.group(1) for x in re.finditer( r'href="(.*\.whl).*"', orchestrate_links)]
@@ -457,6 +536,9 @@ class ToolsController:
         self.tool_kind = tool_kind
         self.file = file
         self.requirements_file = requirements_file
+        # Package zips and requirements keyed by the source they were built from, shared by the controllers of a bulk import
+        self._artifact_sources: dict[tuple[str, str | None], tuple[bytes, str]] = {}
+        self._artifact_sources_lock = Lock()
 
     def get_client(self) -> ToolClient:
         if not self.client:
@@ -481,14 +563,11 @@ class ToolsController:
                 )
 
             case "openapi":
-                connections_client = get_connections_client()
                 app_id = args.get('app_id', None)
                 connection_id = None
                 if app_id is not None:
-                    app_id = app_id[0]
-                    connection = connections_client.get_draft_by_app_id(app_id=app_id)
-                    connection_id = connection.connection_id
-                tools = asyncio.run(import_openapi_tool(file=args["file"], connection_id=connection_id))
+                    connection_id = get_connection_id(app_id[0])
+                tools = asyncio.run(import_openapi_tool(file=args["file"], connection_id=connection_id, operation_filter=args.get("operation_filter")))
             case "flow":
                 tools = asyncio.run(import_flow_tool(file=args["file"]))
             case "skill":
@@ -518,10 +597,7 @@ class ToolsController:
             for column in columns:
                 table.add_column(column)
 
-            connections_client = get_connections_client()
-            connections = connections_client.list()
-
-            connections_dict = {conn.connection_id: conn for conn in connections}
+            connections_index = get_connections_index(get_connections_client())
 
             for tool in tools:
                 tool_binding = tool.__tool_spec__.binding
@@ -543,7 +619,7 @@ class ToolsController:
 
                 app_ids = []
                 for connection_id in connection_ids:
-                    connection = connections_dict.get(connection_id)
+                    connection = connections_index.get_by_connection_id(connection_id)
                     if connection:
                         app_id = str(connection.app_id or connection.connection_id)
                     elif connection_id:
@@ -586,106 +662,288 @@ class ToolsController:
     def get_all_tools(self) -> dict:
         return {entry["name"]: entry["id"] for entry in self.get_client().get()}
 
+    def _build_python_package_artifact(self, resolved_package_root: str | None) -> bytes:
+        """
+        Zips the tool's source files. The result only depends on the import, not on the tool,
+        so it is built once and shared by every tool found in the file or package.
+        """
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zip_package_artifacts:
+            if resolved_package_root is None:
+                # single file.
+                file_path = Path(self.file)
+                write_zip_entry(zip_package_artifacts, f"{file_path.stem}.py", file_path.read_bytes())
+
+            else:
+                # multi-file.
+                path_strs = sorted(set([x for x in glob.iglob(path.join(resolved_package_root, '**/**'), include_hidden=True, recursive=True)]))
+                for path_str in path_strs:
+                    path_obj = Path(path_str)
+
+                    if not path_obj.is_file() or "/__pycache__/" in path_str or path_obj.name.lower() == "requirements.txt":
+                        continue
+
+                    if path_obj.is_symlink():
+                        raise typer.BadParameter(f"Symbolic links in packages are not supported. - {path_str}")
+
+                    try:
+                        write_zip_entry(zip_package_artifacts, Path(path_str).relative_to(Path(resolved_package_root)).as_posix(), path_obj.read_bytes())
+
+                    except Exception as ex:
+                        logger.error(f"Could not write file {path_str} to artifact. {ex}")
+                        raise ex
+
+        return buffer.getvalue()
+
+    def _build_python_requirements(self, resolved_requirements_file: str | None) -> str:
+        """
+        Resolves the contents of the tool's requirements.txt, including the ibm-watsonx-orchestrate wheel for the active registry
+        """
+        requirements = []
+        if resolved_requirements_file is not None:
+            requirements = get_requirement_lines(requirements_file=resolved_requirements_file, remove_trailing_newlines=False)
+
+        # Ensure there is a newline at the end of the file
+        if len(requirements) > 0 and not requirements[-1].endswith("\n"):
+            requirements[-1] = requirements[-1]+"\n"
+
+        cfg = Config()
+        registry_type = cfg.read(PYTHON_REGISTRY_HEADER, PYTHON_REGISTRY_TYPE_OPT) or DEFAULT_CONFIG_FILE_CONTENT[PYTHON_REGISTRY_HEADER][PYTHON_REGISTRY_TYPE_OPT]
+
+        version = __version__
+        if registry_type == RegistryType.LOCAL:
+            requirements.append(f"/packages/ibm_watsonx_orchestrate-0.6.0-py3-none-any.whl\n")
+        elif registry_type == RegistryType.PYPI:
+            wheel_file = get_whl_in_registry(registry_url='https://pypi.org/simple/ibm-watsonx-orchestrate', version=version)
+            if not wheel_file:
+                logger.error(f"Could not find ibm-watsonx-orchestrate@{version} on https://pypi.org/project/ibm-watsonx-orchestrate")
+                exit(1)
+            requirements.append(f"ibm-watsonx-orchestrate=={version}\n")
+        elif registry_type == RegistryType.TESTPYPI:
+            override_version = cfg.get(PYTHON_REGISTRY_HEADER, PYTHON_REGISTRY_TEST_PACKAGE_VERSION_OVERRIDE_OPT) or version
+            wheel_file = get_whl_in_registry(registry_url='https://test.pypi.org/simple/ibm-watsonx-orchestrate', version=override_version)
+            if not wheel_file:
+                logger.error(f"Could not find ibm-watsonx-orchestrate@{override_version} on https://test.pypi.org/project/ibm-watsonx-orchestrate")
+                exit(1)
+            requirements.append(f"ibm-watsonx-orchestrate @ {wheel_file}\n")
+        else:
+            logger.error(f"Unrecognized registry type provided to orchestrate env activate local --registry <registry>")
+            exit(1)
+
+        requirements = list(dict.fromkeys(requirements))
+
+        return "".join(requirements)
+
+    def _build_python_tool_artifact(self, tool: BaseTool, tmpdir: str, resolved_package_root: str | None) -> str:
+        """
+        Writes the artifact zip for tool into its own folder under tmpdir and returns its path.
+        The package zip and requirements are only built for the first tool of each package and requirements file.
+        """
+        resolved_requirements_file = get_resolved_py_tool_reqs_file(tool_file=self.file,
+                                                                    requirements_file=self.requirements_file,
+                                                                    package_root=resolved_package_root)
+        # A single file tool's zip only holds that file, a package's zip is the same for every file in it
+        source_key = (resolved_package_root or str(Path(self.file).absolute()), resolved_requirements_file)
+        with self._artifact_sources_lock:
+            if source_key not in self._artifact_sources:
+                self._artifact_sources[source_key] = (
+                    self._build_python_package_artifact(resolved_package_root),
+                    self._build_python_requirements(resolved_requirements_file)
+                )
+            package_artifact, requirements = self._artifact_sources[source_key]
+
+        # Start from the shared package zip and only append the per tool entries
+        tool_artifact = path.join(tempfile.mkdtemp(dir=tmpdir), "artifacts.zip")
+        with open(tool_artifact, "wb") as fp:
+            fp.write(package_artifact)
+
+        with zipfile.ZipFile(tool_artifact, "a", zipfile.ZIP_DEFLATED) as zip_tool_artifacts:
+            if resolved_package_root is not None:
+                write_zip_entry(zip_tool_artifacts, "tool-spec.json", tool.dumps_spec())
+
+            write_zip_entry(zip_tool_artifacts, "requirements.txt", requirements)
+
+            write_zip_entry(zip_tool_artifacts, "bundle-format", "2.0.0\n")
+
+        return tool_artifact
+
     def publish_or_update_tools(self, tools: Iterable[BaseTool], package_root: str = None) -> None:
         resolved_package_root = get_package_root(package_root)
 
         # Zip the tool's supporting artifacts for python tools
         with tempfile.TemporaryDirectory() as tmpdir:
-            for tool in tools:
-                exist = False
-                tool_id = None
-
-                existing_tools = self.get_client().get_draft_by_name(tool.__tool_spec__.name)
-                if len(existing_tools) > 1:
-                    logger.error(f"Multiple existing tools found with name '{tool.__tool_spec__.name}'. Failed to update tool")
-                    sys.exit(1)
-
-                if len(existing_tools) > 0:
-                    existing_tool = existing_tools[0]
-                    exist = True
-                    tool_id = existing_tool.get("id")
-
-                tool_artifact = None
-                if self.tool_kind == ToolKind.python:
-                    tool_artifact = path.join(tmpdir, "artifacts.zip")
-                    with zipfile.ZipFile(tool_artifact, "w", zipfile.ZIP_DEFLATED) as zip_tool_artifacts:
-                        resolved_requirements_file = get_resolved_py_tool_reqs_file(tool_file=self.file,
-                                                                                    requirements_file=self.requirements_file,
-                                                                                    package_root=resolved_package_root)
-
-                        if resolved_package_root is None:
-                            # single file.
-                            file_path = Path(self.file)
-                            zip_tool_artifacts.write(file_path, arcname=f"{file_path.stem}.py")
+            published_hashes = self._get_published_hashes()
+            new_hashes = {}
+            try:
+                for tool in tools:
+                    tool_id = None
+
+                    existing_tools = self.get_client().get_draft_by_name(tool.__tool_spec__.name)
+                    if len(existing_tools) > 1:
+                        logger.error(f"Multiple existing tools found with name '{tool.__tool_spec__.name}'. Failed to update tool")
+                        sys.exit(1)
+
+                    if len(existing_tools) > 0:
+                        existing_tool = existing_tools[0]
+                        tool_id = existing_tool.get("id")
+
+                    published = self.publish_or_update_tool(tool, tool_id=tool_id, tmpdir=tmpdir, resolved_package_root=resolved_package_root, published_hashes=published_hashes)
+                    if published:
+                        new_hashes.update([published])
+            finally:
+                # Keep the hashes of the tools published before any failure
+                self._save_published_hashes(new_hashes)
+
+    def publish_or_update_tool(self, tool: BaseTool, tool_id: str | None, tmpdir: str, resolved_package_root: str | None = None, published_hashes: dict[str, str] = None) -> tuple[str, str] | None:
+        """
+        Creates the tool, or updates the existing tool with id tool_id, unless its content hash matches published_hashes.
+        Returns the id and content hash of the published tool for _save_published_hashes, or None if it was skipped
+        """
+        tool_artifact = None
+        if self.tool_kind == ToolKind.python:
+            tool_artifact = self._build_python_tool_artifact(tool, tmpdir, resolved_package_root)
+
+        content_hash = get_tool_content_hash(tool, tool_artifact)
+        if tool_id is not None and (published_hashes or {}).get(str(tool_id)) == content_hash:
+            logger.info(f"Tool '{tool.__tool_spec__.name}' is unchanged, skipping")
+            return None
+
+        if tool_id is not None:
+            self.update_tool(tool_id=tool_id, tool=tool, tool_artifact=tool_artifact)
+        else:
+            tool_id = self.publish_tool(tool, tool_artifact=tool_artifact)
+
+        return (str(tool_id), content_hash) if tool_id is not None else None
+
+    def _get_published_hashes(self) -> dict[str, str]:
+        """
+        Content hashes of the tools last published from this machine to the active env, keyed by tool id
+        """
+        active_env = Config().read(CONTEXT_SECTION_HEADER, CONTEXT_ACTIVE_ENV_OPT)
+        if active_env is None:
+            return {}
+        hashes_cfg = Config(PUBLISHED_HASHES_CONFIG_FILE_FOLDER, PUBLISHED_HASHES_CONFIG_FILE)
+        return hashes_cfg.read(PUBLISHED_TOOLS_SECTION_HEADER, active_env) or {}
+
+    def _save_published_hashes(self, new_hashes: dict[str, str]) -> None:
+        """
+        Records the content hashes of the tools just published, keyed by tool id, in a single config write
+        """
+        active_env = Config().read(CONTEXT_SECTION_HEADER, CONTEXT_ACTIVE_ENV_OPT)
+        if not new_hashes or active_env is None:
+            return
+        hashes_cfg = Config(PUBLISHED_HASHES_CONFIG_FILE_FOLDER, PUBLISHED_HASHES_CONFIG_FILE)
+        with hashes_cfg.batch():
+            hashes = hashes_cfg.read(PUBLISHED_TOOLS_SECTION_HEADER, active_env) or {}
+            hashes.update(new_hashes)
+            hashes_cfg.write(PUBLISHED_TOOLS_SECTION_HEADER, active_env, hashes)
+
+    def get_existing_tools_by_names(self, tool_names: List[str]) -> dict[str, List[dict]]:
+        """
+        Looks up the drafts for tool_names in batches, returning them grouped by name
+        """
+        existing_tools = {}
+        for i in range(0, len(tool_names), TOOL_NAME_LOOKUP_BATCH_SIZE):
+            for draft in self.get_client().get_drafts_by_names(tool_names[i:i + TOOL_NAME_LOOKUP_BATCH_SIZE]):
+                existing_tools.setdefault(draft.get("name"), []).append(draft)
+        return existing_tools
+
+    def import_tools_bulk(self, source: str, app_id: List[str] = None, requirements_file: str = None, package_root: str = None, concurrency: int = DEFAULT_IMPORT_CONCURRENCY, operation_filter: OpenApiOperationFilter = None) -> None:
+        """
+        Imports every tool file in the directory or glob source, publishing the tools through a pool of
+        concurrency workers. Failures are collected and reported together once all tools were processed.
+        """
+        files = discover_tool_files(self.tool_kind, source)
+        if not files:
+            logger.error(f"No {self.tool_kind.value} tool files found in '{source}'")
+            sys.exit(1)
 
-                        else:
-                            # multi-file.
-                            path_strs = sorted(set([x for x in glob.iglob(path.join(resolved_package_root, '**/**'), include_hidden=True, recursive=True)]))
-                            for path_str in path_strs:
-                                path_obj = Path(path_str)
-
-                                if not path_obj.is_file() or "/__pycache__/" in path_str or path_obj.name.lower() == "requirements.txt":
-                                    continue
-
-                                if path_obj.is_symlink():
-                                    raise typer.BadParameter(f"Symbolic links in packages are not supported. - {path_str}")
-
-                                try:
-                                    zip_tool_artifacts.write(path_str, arcname=str(Path(path_str).relative_to(Path(resolved_package_root))))
-
-                                except Exception as ex:
-                                    logger.error(f"Could not write file {path_str} to artifact. {ex}")
-                                    raise ex
-
-                            zip_tool_artifacts.writestr("tool-spec.json", tool.dumps_spec())
-
-                        requirements = []
-                        if resolved_requirements_file is not None:
-                            requirements = get_requirement_lines(requirements_file=resolved_requirements_file, remove_trailing_newlines=False)
-
-                        # Ensure there is a newline at the end of the file
-                        if len(requirements) > 0 and not requirements[-1].endswith("\n"):
-                            requirements[-1] = requirements[-1]+"\n"
-
-                        cfg = Config()
-                        registry_type = cfg.read(PYTHON_REGISTRY_HEADER, PYTHON_REGISTRY_TYPE_OPT) or DEFAULT_CONFIG_FILE_CONTENT[PYTHON_REGISTRY_HEADER][PYTHON_REGISTRY_TYPE_OPT]
-
-                        version = __version__
-                        if registry_type == RegistryType.LOCAL:
-                            requirements.append(f"/packages/ibm_watsonx_orchestrate-0.6.0-py3-none-any.whl\n")
-                        elif registry_type == RegistryType.PYPI:
-                            wheel_file = get_whl_in_registry(registry_url='https://pypi.org/simple/ibm-watsonx-orchestrate', version=version)
-                            if not wheel_file:
-                                logger.error(f"Could not find ibm-watsonx-orchestrate@{version} on https://pypi.org/project/ibm-watsonx-orchestrate")
-                                exit(1)
-                            requirements.append(f"ibm-watsonx-orchestrate=={version}\n")
-                        elif registry_type == RegistryType.TESTPYPI:
-                            override_version = cfg.get(PYTHON_REGISTRY_HEADER, PYTHON_REGISTRY_TEST_PACKAGE_VERSION_OVERRIDE_OPT) or version
-                            wheel_file = get_whl_in_registry(registry_url='https://test.pypi.org/simple/ibm-watsonx-orchestrate', version=override_version)
-                            if not wheel_file:
-                                logger.error(f"Could not find ibm-watsonx-orchestrate@{override_version} on https://test.pypi.org/project/ibm-watsonx-orchestrate")
-                                exit(1)
-                            requirements.append(f"ibm-watsonx-orchestrate @ {wheel_file}\n")
-                        else:
-                            logger.error(f"Unrecognized registry type provided to orchestrate env activate local --registry <registry>")
-                            exit(1)
-                        requirements_file = path.join(tmpdir, 'requirements.txt')
+        resolved_package_root = get_package_root(package_root)
+        failures: List[tuple[str, str]] = []
+        pending: List[tuple[ToolsController, BaseTool]] = []
+
+        # Loading tools imports modules and alters sys.path, so it is kept serial
+        for file in files:
+            controller = ToolsController(self.tool_kind, file, requirements_file)
+            controller.client = self.get_client()
+            # Files of the same package share its zip and requirements, which are built once for the whole import
+            controller._artifact_sources = self._artifact_sources
+            controller._artifact_sources_lock = self._artifact_sources_lock
+
+            try:
+                tools = list(ToolsController.import_tool(
+                    kind=self.tool_kind,
+                    file=file,
+                    app_id=app_id,
+                    requirements_file=requirements_file,
+                    package_root=package_root,
+                    operation_filter=operation_filter
+                ))
+            except (Exception, SystemExit) as e:
+                failures.append((file, describe_failure(e)))
+                continue
+
+            pending.extend((controller, tool) for tool in tools)
+
+        tool_names = list(dict.fromkeys(tool.__tool_spec__.name for _, tool in pending))
+        existing_tools = self.get_existing_tools_by_names(tool_names) if tool_names else {}
+        published_hashes = self._get_published_hashes()
+
+        processed = 0
+        # The workers only return their hashes, which are saved once every tool has been processed
+        new_hashes = {}
+        with tempfile.TemporaryDirectory() as tmpdir, ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            futures = {}
+            seen_names = set()
+            for controller, tool in pending:
+                name = tool.__tool_spec__.name
+                if name in seen_names:
+                    failures.append((name, f"Multiple tool files define a tool named '{name}'"))
+                    continue
+                seen_names.add(name)
 
-                        requirements = list(dict.fromkeys(requirements))
+                drafts = existing_tools.get(name, [])
+                if len(drafts) > 1:
+                    failures.append((name, f"Multiple existing tools found with name '{name}'"))
+                    continue
+                tool_id = drafts[0].get("id") if drafts else None
+
+                future = executor.submit(
+                    controller.publish_or_update_tool,
+                    tool,
+                    tool_id=tool_id,
+                    tmpdir=tmpdir,
+                    resolved_package_root=resolved_package_root,
+                    published_hashes=published_hashes
+                )
+                futures[future] = name
+
+            for future in as_completed(futures):
+                try:
+                    published = future.result()
+                    processed += 1
+                except (Exception, SystemExit) as e:
+                    failures.append((futures[future], describe_failure(e)))
+                    continue
+                if published:
+                    new_hashes.update([published])
+
+        self._save_published_hashes(new_hashes)
 
-                        with open(requirements_file, 'w') as fp:
-                            fp.writelines(requirements)
-                        requirements_file_path = Path(requirements_file)
-                        zip_tool_artifacts.write(requirements_file_path, arcname='requirements.txt')
+        if failures:
+            table = rich.table.Table(show_header=True, header_style="bold white", show_lines=True, title="Failed imports")
+            for column in ["Tool / File", "Error"]:
+                table.add_column(column)
+            for source_name, error in failures:
+                table.add_row(source_name, error)
+            rich.print(table)
 
-                        zip_tool_artifacts.writestr("bundle-format", "2.0.0\n")
+            logger.error(f"Imported {processed} tools from {len(files)} files, {len(failures)} failed")
+            sys.exit(1)
 
-                if exist:
-                    self.update_tool(tool_id=tool_id, tool=tool, tool_artifact=tool_artifact)
-                else:
-                    self.publish_tool(tool, tool_artifact=tool_artifact)
+        logger.info(f"Imported {processed} tools from {len(files)} files")
 
-    def publish_tool(self, tool: BaseTool, tool_artifact: str) -> None:
+    def publish_tool(self, tool: BaseTool, tool_artifact: str) -> str:
         tool_spec = tool.__tool_spec__.model_dump(mode='json', exclude_unset=True, exclude_none=True, by_alias=True)
 
         response = self.get_client().create(tool_spec)
@@ -695,6 +953,7 @@ class ToolsController:
             self.get_client().upload_tools_artifact(tool_id=tool_id, file_path=tool_artifact)
 
         logger.info(f"Tool '{tool.__tool_spec__.name}' imported successfully")
+        return tool_id
 
     def update_tool(self, tool_id: str, tool: BaseTool, tool_artifact: str) -> None:
         tool_spec = tool.__tool_spec__.model_dump(mode='json', exclude_unset=True, exclude_none=True, by_alias=True)
@@ -768,8 +1027,7 @@ class ToolsController:
             zipfile.ZipFile(output_path, 'w') as zip_file_out:
             
             for item in zip_file_in.infolist():
-                buffer = zip_file_in.read(item.filename)
                 if (item.filename != 'bundle-format'):
-                    zip_file_out.writestr(item, buffer)
+                    copy_zip_entry(zip_file_in, item, zip_file_out, item.filename)
         
         logger.info(f"Successfully exported tool definition for '{name}' to '{output_path}'")
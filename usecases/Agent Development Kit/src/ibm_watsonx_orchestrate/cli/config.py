@@ -1,7 +1,11 @@
 import os
 import logging
+import tempfile
+import shutil
 import yaml
+from contextlib import contextmanager
 from copy import deepcopy
+from threading import RLock
 
 from ibm_watsonx_orchestrate.cli.commands.tools.types import RegistryType
 from ibm_watsonx_orchestrate.utils.utils import yaml_safe_load
@@ -57,8 +61,18 @@ AUTH_CONFIG_FILE_CONTENT = {
     }
 }
 
+PUBLISHED_HASHES_CONFIG_FILE_FOLDER = AUTH_CONFIG_FILE_FOLDER
+PUBLISHED_HASHES_CONFIG_FILE = "published_hashes.yaml"
+PUBLISHED_TOOLS_SECTION_HEADER = "tools"
+
 logger = logging.getLogger(__name__)
 
+# Parsed config files shared by every Config instance in the process, keyed by path.
+# Each entry holds the stat signature the data was parsed from so edits made by other
+# processes (or by hand) are picked up on the next access.
+_CONFIG_CACHE: dict[str, tuple[tuple[int, int, int], dict]] = {}
+_CONFIG_CACHE_LOCK = RLock()
+
 
 def merge_configs(source: dict, destination: dict) -> dict:
     if source:
@@ -75,6 +89,63 @@ def merge_configs(source: dict, destination: dict) -> dict:
     return merged_object
 
 
+def _file_signature(path: str) -> tuple[int, int, int] | None:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_ino, stat.st_size)
+
+
+def _load_config_data(path: str) -> dict:
+    """
+    Returns the parsed contents of the config file at path, only re-parsing it when the
+    file changed since it was last read. The returned dict is shared and must not be mutated.
+    """
+    with _CONFIG_CACHE_LOCK:
+        signature = _file_signature(path)
+        if signature is None:
+            _CONFIG_CACHE.pop(path, None)
+            return {}
+
+        cached = _CONFIG_CACHE.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        with open(path, 'r') as conf_file:
+            config_data = yaml_safe_load(conf_file) or {}
+        _CONFIG_CACHE[path] = (signature, config_data)
+        return config_data
+
+
+def _write_config_data(path: str, config_data: dict) -> None:
+    """
+    Writes config_data to a temp file next to path and renames it into place, so readers
+    in other processes only ever see the old or the new file and never a partial write.
+    """
+    with _CONFIG_CACHE_LOCK:
+        folder = os.path.dirname(path) or "."
+        fd, temp_path = tempfile.mkstemp(dir=folder, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as temp_file:
+                yaml.dump(config_data, temp_file, allow_unicode=True)
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+            if os.path.exists(path):
+                shutil.copymode(path, temp_path)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        _CONFIG_CACHE[path] = (_file_signature(path), config_data)
+
+
+def clear_config_cache() -> None:
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE.clear()
+
+
 def _check_if_default_config_file(folder, file):
     return folder == DEFAULT_CONFIG_FILE_FOLDER and file == DEFAULT_CONFIG_FILE
 
@@ -110,13 +181,17 @@ class Config:
         elif _check_if_auth_config_file(folder=self.config_file_folder, file=self.config_file):
             self.file_type = ConfigFileTypes.AUTH
 
+        # Multi-key updates made inside batch() are applied here and written once on exit
+        self._pending_data = None
+        self._batch_depth = 0
+
         # Check if config file already exists
         if not os.path.exists(self.config_file_path):
             self.create_config_file()
 
         # Check if file has defaults
-        with open(self.config_file_path, 'r') as conf_file:
-            config_data = yaml_safe_load(conf_file) or {}
+        config_data = self._data()
+        with self.batch():
             if self.file_type == ConfigFileTypes.CONFIG:
                 if not config_data.get(ENVIRONMENTS_SECTION_HEADER, {}).get(PROTECTED_ENV_NAME, False):
                     logger.debug("Setting default config data")
@@ -147,13 +222,42 @@ class Config:
     def get_active_env_config(self, option):
         return self.read(ENVIRONMENTS_SECTION_HEADER, self.get_active_env()).get(option)
 
+    def _data(self) -> dict:
+        if self._pending_data is not None:
+            return self._pending_data
+        return _load_config_data(self.config_file_path)
+
+    def _commit(self, config_data: dict) -> None:
+        if self._pending_data is not None:
+            self._pending_data = config_data
+        else:
+            _write_config_data(self.config_file_path, config_data)
+
+    @contextmanager
+    def batch(self):
+        """
+        Groups several write(), save() and delete() calls into a single file write.
+        Reads made inside the block see the pending changes. Nothing is written if the block
+        raises or leaves the config unchanged.
+        """
+        with _CONFIG_CACHE_LOCK:
+            outermost = self._batch_depth == 0
+            if outermost:
+                original_data = _load_config_data(self.config_file_path)
+                self._pending_data = deepcopy(original_data)
+            self._batch_depth += 1
+            try:
+                yield self
+                if outermost and self._pending_data != original_data:
+                    _write_config_data(self.config_file_path, self._pending_data)
+            finally:
+                self._batch_depth -= 1
+                if outermost:
+                    self._pending_data = None
+
     def read(self, section: str, option: str) -> any:
         try:
-            with open(self.config_file_path, "r") as conf_file:
-                config_data = yaml.load(conf_file, Loader=yaml.SafeLoader)
-                if config_data is None:
-                    return None
-                return config_data[section][option]
+            return deepcopy(self._data()[section][option])
         except KeyError:
             return None
 
@@ -164,17 +268,8 @@ class Config:
         self.save(obj)
 
     def save(self, object: dict) -> None:
-        config_data = {}
-        try:
-            with open(self.config_file_path, 'r') as conf_file:
-                config_data = yaml_safe_load(conf_file) or {}
-        except FileNotFoundError:
-            pass
-
-        config_data = merge_configs(config_data, object)
-
-        with open(self.config_file_path, 'w') as conf_file:
-            yaml.dump(config_data, conf_file, allow_unicode=True)
+        with _CONFIG_CACHE_LOCK:
+            self._commit(merge_configs(self._data(), object))
 
     def get(self, *args):
         """
@@ -183,22 +278,17 @@ class Config:
         as keys to access deeper sections of the config and then returning the last specified key.
         """
 
-        config_data = {}
-        try:
-            with open(self.config_file_path, 'r') as conf_file:
-                config_data = yaml_safe_load(conf_file) or {}
-        except FileNotFoundError:
-            pass
+        config_data = self._data()
 
         if len(args) < 1:
-            return config_data
+            return deepcopy(config_data)
 
         try:
             nested_dict = config_data
             for key in args[:-1]:
                 nested_dict = nested_dict[key]
 
-            return nested_dict[args[-1]]
+            return deepcopy(nested_dict[args[-1]])
         except KeyError as e:
             raise KeyError(f"Failed to get data from config. Key {e} not in {list(nested_dict.keys())}")
 
@@ -211,22 +301,15 @@ class Config:
         if len(args) < 1:
             raise ValueError("Config.delete() requires at least one positional argument")
 
-        config_data = {}
-        try:
-            with open(self.config_file_path, 'r') as conf_file:
-                config_data = yaml_safe_load(conf_file) or {}
-        except FileNotFoundError:
-            pass
+        with _CONFIG_CACHE_LOCK:
+            try:
+                deletion_data = deepcopy(self._data())
+                nested_dict = deletion_data
+                for key in args[:-1]:
+                    nested_dict = nested_dict[key]
 
-        try:
-            deletion_data = deepcopy(config_data)
-            nested_dict = deletion_data
-            for key in args[:-1]:
-                nested_dict = nested_dict[key]
-
-            del (nested_dict[args[-1]])
-        except KeyError as e:
-            raise KeyError(f"Failed to delete from config. Key {e} not in {list(nested_dict.keys())}")
+                del (nested_dict[args[-1]])
+            except KeyError as e:
+                raise KeyError(f"Failed to delete from config. Key {e} not in {list(nested_dict.keys())}")
 
-        with open(self.config_file_path, 'w') as conf_file:
-            yaml.dump(deletion_data, conf_file, allow_unicode=True)
+            self._commit(deletion_data)
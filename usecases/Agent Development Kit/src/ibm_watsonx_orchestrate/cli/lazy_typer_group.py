@@ -0,0 +1,54 @@
+import importlib
+from typing import Any, List
+
+import click
+import typer
+from typer.core import TyperGroup
+
+
+class LazySubcommand(TyperGroup):
+    """
+    Placeholder for a sub-app that is only imported when it is invoked.
+
+    Help listings and command suggestions only need the name and help text, so the
+    module behind the placeholder is left untouched until click builds a context for it.
+    """
+
+    def __init__(self, name: str, import_path: str, app_name: str, help: str | None = None):
+        super().__init__(name=name, help=help)
+        self.import_path = import_path
+        self.app_name = app_name
+        self._command = None
+
+    def load(self) -> click.Command:
+        if self._command is None:
+            module = importlib.import_module(self.import_path)
+            command = typer.main.get_group(getattr(module, self.app_name))
+            command.name = self.name
+            command.help = command.help or self.help
+            self._command = command
+        return self._command
+
+    def make_context(self, info_name: str | None, args: List[str], parent: click.Context | None = None, **extra: Any) -> click.Context:
+        return self.load().make_context(info_name, args, parent=parent, **extra)
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        return self.load().get_command(ctx, cmd_name)
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return self.load().list_commands(ctx)
+
+
+class LazyTyperGroup(TyperGroup):
+    """
+    TyperGroup that registers sub-apps by name and imports them on first use.
+
+    Subclasses declare lazy_subcommands as a mapping of
+    command name -> (module import path, Typer app attribute, help text).
+    """
+    lazy_subcommands: dict[str, tuple[str, str, str]] = {}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        for name, (import_path, app_name, help) in self.lazy_subcommands.items():
+            self.add_command(LazySubcommand(name=name, import_path=import_path, app_name=app_name, help=help))
@@ -0,0 +1,155 @@
+import asyncio
+import weakref
+from abc import abstractmethod
+from threading import Lock
+from typing import Callable
+
+import httpx
+from ibm_cloud_sdk_core.authenticators import MCSPAuthenticator
+
+from ibm_watsonx_orchestrate.client.base_api_client import (
+    ClientAPIException,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_MAX_RETRIES,
+)
+
+DEFAULT_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+# httpx.AsyncClient pools are bound to the event loop they were first used on,
+# so shared clients are tracked per loop and dropped with it
+_ASYNC_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict]" = weakref.WeakKeyDictionary()
+_ASYNC_CLIENTS_LOCK = Lock()
+
+
+def create_async_client(
+    verify: bool | str = True,
+    max_keepalive_connections: int = DEFAULT_POOL_CONNECTIONS,
+    max_connections: int = DEFAULT_POOL_MAXSIZE,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+) -> httpx.AsyncClient:
+    """
+    Build a keep-alive httpx.AsyncClient with a sized connection pool and connect retries
+    """
+    limits = httpx.Limits(max_keepalive_connections=max_keepalive_connections, max_connections=max_connections)
+    transport = httpx.AsyncHTTPTransport(verify=verify, limits=limits, retries=max_retries)
+    return httpx.AsyncClient(transport=transport, timeout=DEFAULT_TIMEOUT)
+
+
+def get_shared_async_client(key: str, verify: bool | str = True, **kwargs) -> httpx.AsyncClient:
+    """
+    Return the httpx.AsyncClient shared under key on the running event loop, creating it on first use
+    """
+    loop = asyncio.get_running_loop()
+    with _ASYNC_CLIENTS_LOCK:
+        clients = _ASYNC_CLIENTS.setdefault(loop, {})
+        client = clients.get((key, verify))
+        if client is None or client.is_closed:
+            client = create_async_client(verify=verify, **kwargs)
+            clients[(key, verify)] = client
+        return client
+
+
+async def aclose_shared_async_clients() -> None:
+    loop = asyncio.get_running_loop()
+    with _ASYNC_CLIENTS_LOCK:
+        clients = _ASYNC_CLIENTS.pop(loop, {})
+    for client in clients.values():
+        await client.aclose()
+
+
+class AsyncBaseAPIClient:
+    """
+    asyncio counterpart of BaseAPIClient, sending requests through a shared httpx.AsyncClient
+    """
+    def __init__(self, base_url: str, api_key: str = None, is_local: bool = False, verify: str = None, authenticator: MCSPAuthenticator = None, http_client: httpx.AsyncClient = None, shared_key: str = None, token_provider: Callable[[], str] = None):
+        self.base_url = base_url.rstrip("/")  # remove trailing slash
+        self.api_key = api_key
+        self.authenticator = authenticator
+        # Returns the current token for each request, taking precedence over api_key
+        self.token_provider = token_provider
+        self._http_client = http_client
+        self.shared_key = shared_key if shared_key is not None else self.base_url
+
+        self.is_local = is_local
+        self.verify = verify
+
+        if not self.is_local:
+            self.base_url = f"{self.base_url}/v1/orchestrate"
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        if self._http_client is not None:
+            return self._http_client
+        verify = True if self.verify is None else self.verify
+        return get_shared_async_client(self.shared_key, verify=verify)
+
+    def _get_headers(self) -> dict:
+        headers = {}
+        if self.token_provider:
+            headers["Authorization"] = f"Bearer {self.token_provider()}"
+        elif self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        elif self.authenticator:
+            headers["Authorization"] = f"Bearer {self.authenticator.token_manager.get_token()}"
+        return headers
+
+    async def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        url = f"{self.base_url}{path}"
+        response = await self.http_client.request(method, url, headers=self._get_headers(), **kwargs)
+        self._check_response(response)
+        return response
+
+    async def _get(self, path: str, params: dict = None, data=None, return_raw=False) -> dict:
+        response = await self._request("GET", path, params=params, data=data)
+        if not return_raw:
+            return response.json()
+        else:
+            return response
+
+    async def _post(self, path: str, data: dict = None, files: dict = None) -> dict:
+        response = await self._request("POST", path, json=data, files=files)
+        return response.json() if response.text else {}
+
+    async def _post_form_data(self, path: str, data: dict = None, files: dict = None) -> dict:
+        # Use data argument instead of json so data is encoded as application/x-www-form-urlencoded
+        response = await self._request("POST", path, data=data, files=files)
+        return response.json() if response.text else {}
+
+    async def _put(self, path: str, data: dict = None) -> dict:
+        response = await self._request("PUT", path, json=data)
+        return response.json() if response.text else {}
+
+    async def _patch(self, path: str, data: dict = None) -> dict:
+        response = await self._request("PATCH", path, json=data)
+        return response.json() if response.text else {}
+
+    async def _patch_form_data(self, path: str, data: dict = None, files = None) -> dict:
+        response = await self._request("PATCH", path, data=data, files=files)
+        return response.json() if response.text else {}
+
+    async def _delete(self, path: str, data=None) -> dict:
+        response = await self._request("DELETE", path, json=data)
+        return response.json() if response.text else {}
+
+    def _check_response(self, response: httpx.Response):
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            raise ClientAPIException(request=e.request, response=e.response)
+
+    @abstractmethod
+    async def create(self, *args, **kwargs):
+        raise NotImplementedError("create method of the client must be implemented")
+
+    @abstractmethod
+    async def delete(self, *args, **kwargs):
+        raise NotImplementedError("delete method of the client must be implemented")
+
+    @abstractmethod
+    async def update(self, *args, **kwargs):
+        raise NotImplementedError("update method of the client must be implemented")
+
+    @abstractmethod
+    async def get(self, *args, **kwargs):
+        raise NotImplementedError("get method of the client must be implemented")
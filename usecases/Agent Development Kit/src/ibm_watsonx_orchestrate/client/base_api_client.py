@@ -1,9 +1,71 @@
 import json
+import os
+from threading import Lock
+from typing import Callable
 
 import requests
 from abc import ABC, abstractmethod
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from ibm_cloud_sdk_core.authenticators import MCSPAuthenticator
 
+# Connection pool tuning, overridable through the environment for bulk jobs
+DEFAULT_POOL_CONNECTIONS = int(os.environ.get("WXO_HTTP_POOL_CONNECTIONS", 10))
+DEFAULT_POOL_MAXSIZE = int(os.environ.get("WXO_HTTP_POOL_MAXSIZE", 20))
+DEFAULT_MAX_RETRIES = int(os.environ.get("WXO_HTTP_MAX_RETRIES", 3))
+DEFAULT_RETRY_BACKOFF_FACTOR = 0.5
+RETRY_STATUS_CODES = (429, 502, 503, 504)
+# Only idempotent verbs are retried on read errors and retryable statuses
+RETRY_ALLOWED_METHODS = frozenset(["HEAD", "GET", "PUT", "DELETE", "OPTIONS"])
+
+_SESSIONS: dict[str, requests.Session] = {}
+_SESSIONS_LOCK = Lock()
+
+
+def create_session(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+) -> requests.Session:
+    """
+    Build a keep-alive session with a sized connection pool and retries for idempotent verbs
+    """
+    retry = Retry(
+        total=max_retries,
+        connect=max_retries,
+        read=max_retries,
+        status=max_retries,
+        backoff_factor=DEFAULT_RETRY_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=RETRY_ALLOWED_METHODS,
+        raise_on_status=False,
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_shared_session(key: str, **kwargs) -> requests.Session:
+    """
+    Return the process-wide session registered under key (typically the environment name), creating it on first use
+    """
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(key)
+        if session is None:
+            session = create_session(**kwargs)
+            _SESSIONS[key] = session
+        return session
+
+
+def close_shared_sessions() -> None:
+    with _SESSIONS_LOCK:
+        for session in _SESSIONS.values():
+            session.close()
+        _SESSIONS.clear()
+
 
 class ClientAPIException(requests.HTTPError):
 
@@ -24,10 +86,14 @@ class ClientAPIException(requests.HTTPError):
 
 
 class BaseAPIClient:
-    def __init__(self, base_url: str, api_key: str = None, is_local: bool = False, verify: str = None, authenticator: MCSPAuthenticator = None):
+    def __init__(self, base_url: str, api_key: str = None, is_local: bool = False, verify: str = None, authenticator: MCSPAuthenticator = None, session: requests.Session = None, token_provider: Callable[[], str] = None):
         self.base_url = base_url.rstrip("/")  # remove trailing slash
         self.api_key = api_key
         self.authenticator = authenticator
+        # Returns the current token for each request, taking precedence over api_key
+        self.token_provider = token_provider
+        # Clients without an explicit session share one per base url so connections are reused
+        self.session = session if session is not None else get_shared_session(self.base_url)
 
         # api path can be re-written by api proxy when deployed
         # TO-DO: re-visit this when shipping to production
@@ -39,7 +105,9 @@ class BaseAPIClient:
 
     def _get_headers(self) -> dict:
         headers = {}
-        if self.api_key:
+        if self.token_provider:
+            headers["Authorization"] = f"Bearer {self.token_provider()}"
+        elif self.api_key:
             headers["Authorization"] = f"Bearer {self.api_key}"
         elif self.authenticator:
             headers["Authorization"] = f"Bearer {self.authenticator.token_manager.get_token()}"
@@ -48,7 +116,7 @@ class BaseAPIClient:
     def _get(self, path: str, params: dict = None, data=None, return_raw=False) -> dict:
 
         url = f"{self.base_url}{path}"
-        response = requests.get(url, headers=self._get_headers(), params=params, data=data, verify=self.verify)
+        response = self.session.get(url, headers=self._get_headers(), params=params, data=data, verify=self.verify)
         self._check_response(response)
         if not return_raw:
             return response.json()
@@ -57,39 +125,39 @@ class BaseAPIClient:
 
     def _post(self, path: str, data: dict = None, files: dict = None) -> dict:
         url = f"{self.base_url}{path}"
-        response = requests.post(url, headers=self._get_headers(), json=data, files=files, verify=self.verify)
+        response = self.session.post(url, headers=self._get_headers(), json=data, files=files, verify=self.verify)
         self._check_response(response)
         return response.json() if response.text else {}
     
     def _post_form_data(self, path: str, data: dict = None, files: dict = None) -> dict:
         url = f"{self.base_url}{path}"
         # Use data argument instead of json so data is encoded as application/x-www-form-urlencoded
-        response = requests.post(url, headers=self._get_headers(), data=data, files=files, verify=self.verify)
+        response = self.session.post(url, headers=self._get_headers(), data=data, files=files, verify=self.verify)
         self._check_response(response)
         return response.json() if response.text else {}
 
     def _put(self, path: str, data: dict = None) -> dict:
 
         url = f"{self.base_url}{path}"
-        response = requests.put(url, headers=self._get_headers(), json=data, verify=self.verify)
+        response = self.session.put(url, headers=self._get_headers(), json=data, verify=self.verify)
         self._check_response(response)
         return response.json() if response.text else {}
 
     def _patch(self, path: str, data: dict = None) -> dict:
         url = f"{self.base_url}{path}"
-        response = requests.patch(url, headers=self._get_headers(), json=data, verify=self.verify)
+        response = self.session.patch(url, headers=self._get_headers(), json=data, verify=self.verify)
         self._check_response(response)
         return response.json() if response.text else {}
     
     def _patch_form_data(self, path: str, data: dict = None, files = None) -> dict:
         url = f"{self.base_url}{path}"
-        response = requests.patch(url, headers=self._get_headers(), data=data, files=files, verify=self.verify)
+        response = self.session.patch(url, headers=self._get_headers(), data=data, files=files, verify=self.verify)
         self._check_response(response)
         return response.json() if response.text else {}
 
     def _delete(self, path: str, data=None) -> dict:
         url = f"{self.base_url}{path}"
-        response = requests.delete(url, headers=self._get_headers(), json=data, verify=self.verify)
+        response = self.session.delete(url, headers=self._get_headers(), json=data, verify=self.verify)
         self._check_response(response)
         return response.json() if response.text else {}
 
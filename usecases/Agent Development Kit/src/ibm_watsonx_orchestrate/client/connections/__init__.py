@@ -4,6 +4,12 @@ from .connections_client import (
     ConnectionType
 )
 
+from .connections_index import (
+    ConnectionsIndex,
+    get_connections_index,
+    invalidate_connections_index
+)
+
 from .utils import (
     get_connections_client,
     get_connection_type,
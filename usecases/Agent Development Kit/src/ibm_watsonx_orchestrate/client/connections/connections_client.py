@@ -1,15 +1,21 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
 from pydantic import BaseModel, ValidationError
 from typing import Optional
 
 from ibm_watsonx_orchestrate.client.base_api_client import BaseAPIClient, ClientAPIException
+from ibm_watsonx_orchestrate.client.async_base_api_client import AsyncBaseAPIClient
 from ibm_watsonx_orchestrate.agent_builder.connections.types import ConnectionEnvironment, ConnectionPreference, ConnectionAuthType, ConnectionSecurityScheme, IdpConfigData, AppConfigData, ConnectionType
 from ibm_watsonx_orchestrate.client.utils import is_cpd_env
 
 import logging
 logger = logging.getLogger(__name__)
 
+# Upper bound on the lookups in flight at once when resolving several connections
+CONNECTION_LOOKUP_CONCURRENCY = 8
+
 
 class ListConfigsResponse(BaseModel):
     connection_id: str = None,
@@ -155,13 +161,17 @@ class ConnectionsClient(BaseAPIClient):
     def get_draft_by_app_id(self, app_id: str) -> GetConnectionResponse:
         return self.get(app_id=app_id)
 
-    def get_draft_by_app_ids(self, app_ids: List[str]) -> List[GetConnectionResponse]:
-        connections = []
-        for app_id in app_ids:
-            connection = self.get_draft_by_app_id(app_id)
-            if connection:
-                connections += connection
-        return connections
+    def get_draft_by_app_ids(self, app_ids: List[str]) -> dict[str, GetConnectionResponse]:
+        """
+        Returns the connections found for app_ids, keyed by app id.
+        The applications endpoint only filters on a single app id, so the lookups are sent concurrently.
+        """
+        unique_app_ids = list(dict.fromkeys(app_ids))
+        if not unique_app_ids:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(CONNECTION_LOOKUP_CONCURRENCY, len(unique_app_ids))) as executor:
+            connections = executor.map(self.get_draft_by_app_id, unique_app_ids)
+            return {app_id: connection for app_id, connection in zip(unique_app_ids, connections) if connection}
 
     def get_draft_by_id(self, conn_id) -> str:
         """Retrieve the app ID for a given connection ID."""
@@ -180,3 +190,150 @@ class ConnectionsClient(BaseAPIClient):
                 logger.warning(f"Connections not found. Returning connection ID: {conn_id}")
                 return conn_id
             raise e
+
+
+
+class AsyncConnectionsClient(AsyncBaseAPIClient):
+    """
+    asyncio client to handle CRUD operations for Connections endpoint
+    """
+    # POST api/v1/connections/applications
+    async def create(self, payload: dict) -> None:
+        await self._post("/connections/applications", data=payload)
+
+    # DELETE api/v1/connections/applications/{app_id}
+    async def delete(self, app_id: str) -> dict:
+        return await self._delete(f"/connections/applications/{app_id}")
+
+    # GET /api/v1/connections/applications/{app_id}
+    async def get(self, app_id: str) -> GetConnectionResponse | None:
+        try:
+            path = (
+                f"/connections/applications/{app_id}"
+                if is_cpd_env(self.base_url)
+                else f"/connections/applications?app_id={app_id}"
+            )
+            return GetConnectionResponse.model_validate(await self._get(path))
+        except ClientAPIException as e:
+            if e.response.status_code == 404:
+                return None
+            raise e
+
+    # GET api/v1/connections/applications
+    async def list(self) -> List[ListConfigsResponse]:
+        try:
+            path = (
+                f"/connections/applications"
+                if is_cpd_env(self.base_url)
+                else f"/connections/applications?include_details=true"
+            )
+            res = await self._get(path)
+            return [ListConfigsResponse.model_validate(conn) for conn in res.get("applications", [])]
+        except ValidationError as e:
+            logger.error("Recieved unexpected response from server")
+            raise e
+        except ClientAPIException as e:
+            if e.response.status_code == 404:
+                return []
+            raise e
+
+    # POST /api/v1/connections/applications/{app_id}/configurations
+    async def create_config(self, app_id: str, payload: dict) -> None:
+        await self._post(f"/connections/applications/{app_id}/configurations", data=payload)
+
+    # PATCH /api/v1/connections/applications/{app_id}/configurations/{env}
+    async def update_config(self, app_id: str, env: ConnectionEnvironment, payload: dict) -> None:
+        await self._patch(f"/connections/applications/{app_id}/configurations/{env}", data=payload)
+
+    # `GET /api/v1/connections/applications/{app_id}/configurations/{env}'
+    async def get_config(self, app_id: str, env: ConnectionEnvironment) -> GetConfigResponse:
+        try:
+            res = await self._get(f"/connections/applications/{app_id}/configurations/{env}")
+            return GetConfigResponse.model_validate(res)
+        except ClientAPIException as e:
+            if e.response.status_code == 404:
+                return None
+            raise e
+
+    # POST /api/v1/connections/applications/{app_id}/configs/{env}/credentials
+    # POST /api/v1/connections/applications/{app_id}/configs/{env}/runtime_credentials
+    async def create_credentials(self, app_id: str, env: ConnectionEnvironment, payload: dict, use_sso: bool) -> None:
+        if use_sso:
+            await self._post(f"/connections/applications/{app_id}/configs/{env}/credentials", data=payload)
+        else:
+            await self._post(f"/connections/applications/{app_id}/configs/{env}/runtime_credentials", data=payload)
+
+    # PATCH /api/v1/connections/applications/{app_id}/configs/{env}/credentials
+    # PATCH /api/v1/connections/applications/{app_id}/configs/{env}/runtime_credentials
+    async def update_credentials(self, app_id: str, env: ConnectionEnvironment, payload: dict, use_sso: bool) -> None:
+        if use_sso:
+            await self._patch(f"/connections/applications/{app_id}/configs/{env}/credentials", data=payload)
+        else:
+            await self._patch(f"/connections/applications/{app_id}/configs/{env}/runtime_credentials", data=payload)
+
+    # GET /api/v1/connections/applications/{app_id}/configs/credentials?env={env}
+    # GET /api/v1/connections/applications/{app_id}/configs/runtime_credentials?env={env}
+    async def get_credentials(self, app_id: str, env: ConnectionEnvironment, use_sso: bool) -> dict:
+        try:
+            if use_sso:
+                path = (
+                    f"/connections/applications/{app_id}/credentials?env={env}"
+                    if is_cpd_env(self.base_url)
+                    else f"/connections/applications/{app_id}/credentials/{env}"
+                )
+                return await self._get(path)
+            else:
+                path = (
+                    f"/connections/applications/{app_id}/configs/runtime_credentials?env={env}"
+                    if is_cpd_env(self.base_url)
+                    else f"/connections/applications/runtime_credentials?app_id={app_id}&env={env}"
+                )
+                return await self._get(path)
+        except ClientAPIException as e:
+            if e.response.status_code == 404:
+                return None
+            raise e
+
+    # DELETE /api/v1/connections/applications/{app_id}/configs/{env}/credentials
+    # DELETE /api/v1/connections/applications/{app_id}/configs/{env}/runtime_credentials
+    async def delete_credentials(self, app_id: str, env: ConnectionEnvironment, use_sso: bool) -> None:
+        if use_sso:
+            await self._delete(f"/connections/applications/{app_id}/configs/{env}/credentials")
+        else:
+            await self._delete(f"/connections/applications/{app_id}/configs/{env}/runtime_credentials")
+
+    async def get_draft_by_app_id(self, app_id: str) -> GetConnectionResponse:
+        return await self.get(app_id=app_id)
+
+    async def get_draft_by_app_ids(self, app_ids: List[str]) -> dict[str, GetConnectionResponse]:
+        """
+        Returns the connections found for app_ids, keyed by app id.
+        The applications endpoint only filters on a single app id, so the lookups are sent concurrently.
+        """
+        unique_app_ids = list(dict.fromkeys(app_ids))
+        semaphore = asyncio.Semaphore(CONNECTION_LOOKUP_CONCURRENCY)
+
+        async def get_draft(app_id: str) -> GetConnectionResponse | None:
+            async with semaphore:
+                return await self.get_draft_by_app_id(app_id)
+
+        connections = await asyncio.gather(*(get_draft(app_id) for app_id in unique_app_ids))
+        return {app_id: connection for app_id, connection in zip(unique_app_ids, connections) if connection}
+
+    async def get_draft_by_id(self, conn_id) -> str:
+        """Retrieve the app ID for a given connection ID."""
+        if conn_id is None:
+            return ""
+        try:
+            path = (
+                f"/connections/applications/id/{conn_id}"
+                if is_cpd_env(self.base_url)
+                else f"/connections/applications?connection_id={conn_id}"
+            )
+            app_details = await self._get(path)
+            return app_details.get("app_id")
+        except ClientAPIException as e:
+            if e.response.status_code == 404:
+                logger.warning(f"Connections not found. Returning connection ID: {conn_id}")
+                return conn_id
+            raise e
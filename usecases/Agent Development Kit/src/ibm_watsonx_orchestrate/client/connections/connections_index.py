@@ -0,0 +1,95 @@
+from threading import Lock
+from typing import List
+from weakref import WeakKeyDictionary
+
+from ibm_watsonx_orchestrate.agent_builder.connections.types import ConnectionEnvironment
+from ibm_watsonx_orchestrate.client.connections.connections_client import ConnectionsClient, ListConfigsResponse
+
+# Order in which a connection's configurations are preferred when only one is needed
+ENVIRONMENT_PREFERENCE = (ConnectionEnvironment.DRAFT, ConnectionEnvironment.LIVE, None)
+
+
+class ConnectionsIndex:
+    """
+    The connections of an env, fetched with a single list call and indexed by app_id and by connection_id.
+
+    The list holds one entry per configured environment of each connection, plus one entry without an
+    environment for connections that have not been configured yet.
+    """
+
+    def __init__(self, client: ConnectionsClient):
+        self.client = client
+        self._lock = Lock()
+        self._connections: List[ListConfigsResponse] | None = None
+        self._by_app_id: dict[str, List[ListConfigsResponse]] = {}
+        self._by_connection_id: dict[str, List[ListConfigsResponse]] = {}
+
+    def _load(self) -> None:
+        with self._lock:
+            if self._connections is not None:
+                return
+            connections = list(self.client.list() or [])
+            rank = lambda conn: ENVIRONMENT_PREFERENCE.index(conn.environment) if conn.environment in ENVIRONMENT_PREFERENCE else len(ENVIRONMENT_PREFERENCE)
+            by_app_id, by_connection_id = {}, {}
+            for conn in sorted(connections, key=rank):
+                by_app_id.setdefault(conn.app_id, []).append(conn)
+                by_connection_id.setdefault(conn.connection_id, []).append(conn)
+            self._by_app_id, self._by_connection_id = by_app_id, by_connection_id
+            self._connections = connections
+
+    def list(self) -> List[ListConfigsResponse]:
+        self._load()
+        return list(self._connections)
+
+    def get_by_app_id(self, app_id: str) -> List[ListConfigsResponse]:
+        """
+        Returns every environment's entry for the connection app_id, draft first
+        """
+        self._load()
+        return list(self._by_app_id.get(app_id, []))
+
+    def get_by_connection_id(self, connection_id: str) -> ListConfigsResponse | None:
+        """
+        Returns the entry for the connection with connection_id, preferring its draft configuration
+        """
+        self._load()
+        entries = self._by_connection_id.get(connection_id)
+        return entries[0] if entries else None
+
+    def get_connection_id(self, app_id: str) -> str | None:
+        entries = self.get_by_app_id(app_id)
+        return entries[0].connection_id if entries else None
+
+    def get_app_id(self, connection_id: str) -> str | None:
+        entry = self.get_by_connection_id(connection_id)
+        return entry.app_id if entry else None
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._connections = None
+            self._by_app_id, self._by_connection_id = {}, {}
+
+
+# Clients are reused for as long as their token is valid, so each one gets its own index
+_connections_indexes: WeakKeyDictionary = WeakKeyDictionary()
+_connections_indexes_lock = Lock()
+
+def get_connections_index(client: ConnectionsClient) -> ConnectionsIndex:
+    """
+    Returns the shared index of the connections reachable through client
+    """
+    with _connections_indexes_lock:
+        index = _connections_indexes.get(client)
+        if index is None:
+            index = ConnectionsIndex(client)
+            _connections_indexes[client] = index
+        return index
+
+def invalidate_connections_index() -> None:
+    """
+    Drops every indexed connection, call after creating, configuring or removing a connection
+    """
+    with _connections_indexes_lock:
+        indexes = list(_connections_indexes.values())
+    for index in indexes:
+        index.invalidate()
@@ -1,6 +1,7 @@
 import logging
 from ibm_watsonx_orchestrate.client.utils import instantiate_client, is_local_dev
 from ibm_watsonx_orchestrate.client.connections.connections_client import ConnectionsClient
+from ibm_watsonx_orchestrate.client.connections.connections_index import get_connections_index
 from ibm_watsonx_orchestrate.cli.config import Config, ENVIRONMENTS_SECTION_HEADER, CONTEXT_SECTION_HEADER, CONTEXT_ACTIVE_ENV_OPT, ENV_WXO_URL_OPT
 from ibm_watsonx_orchestrate.agent_builder.connections.types import ConnectionType, ConnectionAuthType, ConnectionSecurityScheme
 
@@ -37,11 +38,10 @@ def get_connection_id(app_id: str, supported_schemas: set | None = None) -> str:
 
     connection_id = None
     if app_id is not None:
-        connection = connections_client.get(app_id=app_id)
-        if  not connection:
+        connection_id = get_connections_index(connections_client).get_connection_id(app_id)
+        if not connection_id:
             logger.error(f"No connection exists with the app-id '{app_id}'")
             exit(1)
-        connection_id = connection.connection_id
     
     existing_draft_configuration = None
     existing_live_configuration = None
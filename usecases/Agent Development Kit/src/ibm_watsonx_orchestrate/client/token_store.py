@@ -0,0 +1,119 @@
+import logging
+import time
+from threading import Lock, Thread
+from typing import Callable
+
+import jwt
+
+logger = logging.getLogger(__name__)
+
+# Matches the buffer check_token_validity keeps before a token's expiry
+TOKEN_EXPIRY_BUFFER_SECONDS = 600
+# Tokens are refreshed in the background once they are this close to expiry, ahead of the validity buffer
+TOKEN_REFRESH_AHEAD_SECONDS = 900
+
+TokenRefresher = Callable[[], str]
+TokenPersister = Callable[[str, str, int | None], None]
+
+
+def get_token_expiry(token: str) -> int | None:
+    token_claimset = jwt.decode(token, options={"verify_signature": False})
+    return token_claimset.get('exp')
+
+def is_expiry_valid(expiry: int | None, buffer_seconds: int = TOKEN_EXPIRY_BUFFER_SECONDS) -> bool:
+    # Tokens without an expiry (local dev) never expire
+    return not expiry or int(time.time()) < expiry - buffer_seconds
+
+
+class TokenStore:
+    """
+    The access token of each env, served from memory so requests never decode or fetch a token.
+
+    Envs registered with a refresher get a new token in the background once theirs is within
+    refresh_ahead_seconds of expiry, and synchronously only once it is no longer valid. Refreshed tokens
+    are handed to persist so later CLI invocations start from them.
+    """
+
+    def __init__(self, persist: TokenPersister | None = None, refresh_ahead_seconds: int = TOKEN_REFRESH_AHEAD_SECONDS):
+        self.persist = persist
+        self.refresh_ahead_seconds = refresh_ahead_seconds
+        self._lock = Lock()
+        # env -> (token, expiry)
+        self._tokens: dict[str, tuple[str, int | None]] = {}
+        # env -> the token last read from the credentials file, so a token is only replaced when that file changes
+        self._loaded: dict[str, str | None] = {}
+        self._refreshers: dict[str, TokenRefresher] = {}
+        self._refreshing: dict[str, Thread] = {}
+
+    def load(self, env: str, token: str | None, refresher: TokenRefresher | None = None) -> None:
+        """
+        Records the persisted token of env, keeping the one in memory unless the persisted token changed since it was last loaded
+        """
+        with self._lock:
+            if refresher is not None:
+                self._refreshers[env] = refresher
+            else:
+                self._refreshers.pop(env, None)
+
+            if env in self._loaded and self._loaded[env] == token:
+                return
+            self._loaded[env] = token
+            self._tokens.pop(env, None)
+            if not token:
+                return
+            try:
+                self._tokens[env] = (token, get_token_expiry(token))
+            except jwt.PyJWTError:
+                logger.debug(f"Ignoring malformed token for environment '{env}'")
+
+    def get_token(self, env: str) -> str | None:
+        """
+        Returns a valid token for env, or None when there is none and it cannot be refreshed
+        """
+        with self._lock:
+            token, expiry = self._tokens.get(env, (None, None))
+            refresher = self._refreshers.get(env)
+
+        if token and is_expiry_valid(expiry):
+            if refresher and expiry and not is_expiry_valid(expiry, self.refresh_ahead_seconds):
+                self._start_refresh(env, refresher)
+            return token
+
+        if refresher is None:
+            return None
+        self._start_refresh(env, refresher).join()
+
+        with self._lock:
+            token, expiry = self._tokens.get(env, (None, None))
+        return token if token and is_expiry_valid(expiry) else None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tokens.clear()
+            self._loaded.clear()
+            self._refreshers.clear()
+
+    def _start_refresh(self, env: str, refresher: TokenRefresher) -> Thread:
+        # Concurrent callers share the refresh already in progress for env
+        with self._lock:
+            thread = self._refreshing.get(env)
+            if thread is None:
+                thread = Thread(target=self._refresh, args=(env, refresher), name=f"token-refresh-{env}", daemon=True)
+                self._refreshing[env] = thread
+                thread.start()
+            return thread
+
+    def _refresh(self, env: str, refresher: TokenRefresher) -> None:
+        try:
+            token = refresher()
+            expiry = get_token_expiry(token)
+            with self._lock:
+                self._tokens[env] = (token, expiry)
+            if self.persist is not None:
+                self.persist(env, token, expiry)
+            logger.debug(f"Refreshed the token for environment '{env}'")
+        except Exception as e:
+            logger.warning(f"Unable to refresh the token for environment '{env}': {e}")
+        finally:
+            with self._lock:
+                self._refreshing.pop(env, None)
@@ -1,4 +1,5 @@
 from ibm_watsonx_orchestrate.client.base_api_client import BaseAPIClient, ClientAPIException
+from ibm_watsonx_orchestrate.client.async_base_api_client import AsyncBaseAPIClient
 from ibm_watsonx_orchestrate.client.utils import is_local_dev
 from typing_extensions import List
 import os
@@ -93,3 +94,78 @@ class ToolKitClient(BaseAPIClient):
                     return ""
                 raise(e)
 
+
+class AsyncToolKitClient(AsyncBaseAPIClient):
+
+    async def get(self) -> dict:
+        return await self._get("/toolkits")
+
+    # POST /toolkits/prepare/list-tools
+    async def list_tools(self, zip_file_path: str, command: str, args: List[str]) -> List[str]:
+        """
+        List the available tools inside the MCP server
+        """
+
+        filename = os.path.basename(zip_file_path)
+
+        list_toolkit_obj = {
+            "source": "files",
+            "command": command,
+            "args": args,
+        }
+
+        with open(zip_file_path, "rb") as f:
+            content = f.read()
+
+        files = {
+            "list_toolkit_obj": (None, json.dumps(list_toolkit_obj), "application/json"),
+            "file": (filename, content, "application/zip"),
+        }
+
+        response = await self._post("/toolkits/prepare/list-tools", files=files)
+
+        return response.get("tools", [])
+
+    # POST /api/v1/orchestrate/toolkits
+    async def create_toolkit(self, payload) -> dict:
+        """
+        Creates new toolkit metadata
+        """
+        return await self._post("/toolkits", data=payload)
+
+    # POST /toolkits/{toolkit-id}/upload
+    async def upload(self, toolkit_id: str, zip_file_path: str) -> dict:
+        """
+        Upload zip file to the toolkit.
+        """
+        filename = os.path.basename(zip_file_path)
+        with open(zip_file_path, "rb") as f:
+            content = f.read()
+        files = {
+            "file": (filename, content, "application/zip", {"Expires": "0"})
+        }
+        return await self._post(f"/toolkits/{toolkit_id}/upload", files=files)
+
+    # DELETE /toolkits/{toolkit-id}
+    async def delete(self, toolkit_id: str) -> dict:
+        return await self._delete(f"/toolkits/{toolkit_id}")
+
+    async def get_draft_by_name(self, toolkit_name: str) -> List[dict]:
+        return await self.get_drafts_by_names([toolkit_name])
+
+    async def get_drafts_by_names(self, toolkit_names: List[str]) -> List[dict]:
+        formatted_toolkit_names = [f"names={x}" for x in toolkit_names]
+
+        return await self._get(f"/toolkits?{'&'.join(formatted_toolkit_names)}")
+
+    async def get_draft_by_id(self, toolkit_id: str) -> dict:
+        if toolkit_id is None:
+            return ""
+        else:
+            try:
+                toolkit = await self._get(f"/toolkits/{toolkit_id}")
+                return toolkit
+            except ClientAPIException as e:
+                if e.response.status_code == 404 and "not found with the given name" in e.response.text:
+                    return ""
+                raise(e)
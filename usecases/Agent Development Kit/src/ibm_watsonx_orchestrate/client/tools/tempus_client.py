@@ -1,10 +1,22 @@
 from ibm_watsonx_orchestrate.client.base_api_client import BaseAPIClient, ClientAPIException
-from typing_extensions import List
+from ibm_watsonx_orchestrate.client.async_base_api_client import AsyncBaseAPIClient
+from typing_extensions import Callable, List
 from urllib.parse import urlparse, urlunparse
 from ibm_cloud_sdk_core.authenticators import MCSPAuthenticator
+from requests import Session
+import httpx
 
 DEFAULT_TEMPUS_PORT= 9044
 
+def _get_tempus_url(base_url: str) -> str:
+    parsed_url = urlparse(base_url)
+
+    # Reconstruct netloc with new port - use default above - eventually we need to open up a way through the wxo-server API
+    new_netloc = f"{parsed_url.hostname}:{DEFAULT_TEMPUS_PORT}"
+
+    # Replace netloc and rebuild the URL
+    return urlunparse(parsed_url._replace(netloc=new_netloc))
+
 class TempusClient(BaseAPIClient):
     """
     Client to handle CRUD operations for Tempus endpoint
@@ -12,21 +24,15 @@ class TempusClient(BaseAPIClient):
     This may be temporary and may want to create a proxy API in wxo-server 
     to redirect to the internal tempus runtime, and add a new operation in the ToolClient instead
     """
-    def __init__(self, base_url: str, api_key: str = None, is_local: bool = False, authenticator: MCSPAuthenticator = None):
-        parsed_url = urlparse(base_url)
-       
-        # Reconstruct netloc with new port - use default above - eventually we need to open up a way through the wxo-server API
-        new_netloc = f"{parsed_url.hostname}:{DEFAULT_TEMPUS_PORT}"
-
-        # Replace netloc and rebuild the URL
-        new_url = urlunparse(parsed_url._replace(netloc=new_netloc))
-        # remove trailing slash
-
+    def __init__(self, base_url: str, api_key: str = None, is_local: bool = False, verify: str = None, authenticator: MCSPAuthenticator = None, session: Session = None, token_provider: Callable[[], str] = None):
         super().__init__(
-            base_url=new_url,
+            base_url=_get_tempus_url(base_url),
             api_key=api_key,
             is_local=is_local,
-            authenticator=authenticator
+            verify=verify,
+            authenticator=authenticator,
+            session=session,
+            token_provider=token_provider
         )
         
     def create_update_flow_model(self, flow_id: str, model: dict) -> dict:
@@ -38,3 +44,28 @@ class TempusClient(BaseAPIClient):
     def arun_flow(self, flow_id: str, input: dict) -> dict:
         return self._post(f"/v1/flows/{flow_id}/versions/TIP/run/async", data=input)
 
+
+class AsyncTempusClient(AsyncBaseAPIClient):
+    """
+    asyncio client to handle CRUD operations for Tempus endpoint
+    """
+    def __init__(self, base_url: str, api_key: str = None, is_local: bool = False, verify: str = None, authenticator: MCSPAuthenticator = None, http_client: httpx.AsyncClient = None, shared_key: str = None, token_provider: Callable[[], str] = None):
+        super().__init__(
+            base_url=_get_tempus_url(base_url),
+            api_key=api_key,
+            is_local=is_local,
+            verify=verify,
+            authenticator=authenticator,
+            http_client=http_client,
+            shared_key=shared_key,
+            token_provider=token_provider
+        )
+
+    async def create_update_flow_model(self, flow_id: str, model: dict) -> dict:
+        return await self._post(f"/v1/flow-models/{flow_id}", data=model)
+
+    async def run_flow(self, flow_id: str, input: dict) -> dict:
+        return await self._post(f"/v1/flows/{flow_id}/versions/TIP/run", data=input)
+
+    async def arun_flow(self, flow_id: str, input: dict) -> dict:
+        return await self._post(f"/v1/flows/{flow_id}/versions/TIP/run/async", data=input)
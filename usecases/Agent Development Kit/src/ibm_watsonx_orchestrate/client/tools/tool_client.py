@@ -1,5 +1,6 @@
 from typing import Literal
 from ibm_watsonx_orchestrate.client.base_api_client import BaseAPIClient, ClientAPIException
+from ibm_watsonx_orchestrate.client.async_base_api_client import AsyncBaseAPIClient
 from typing_extensions import List
 
 class ToolClient(BaseAPIClient):
@@ -48,3 +49,53 @@ class ToolClient(BaseAPIClient):
     def get_drafts_by_ids(self, tool_ids: List[str]) -> List[dict]:
         formatted_tool_ids = [f"ids={x}" for x in tool_ids]
         return self._get(f"/tools?{'&'.join(formatted_tool_ids)}")
+
+
+class AsyncToolClient(AsyncBaseAPIClient):
+    """
+    asyncio client to handle CRUD operations for Tool endpoint
+    """
+
+    async def create(self, payload: dict) -> dict:
+        return await self._post("/tools", data=payload)
+
+    async def get(self) -> dict:
+        return await self._get("/tools")
+
+    async def update(self, agent_id: str, data: dict) -> dict:
+        return await self._put(f"/tools/{agent_id}", data=data)
+
+    async def delete(self, tool_id: str) -> dict:
+        return await self._delete(f"/tools/{tool_id}")
+
+    async def upload_tools_artifact(self, tool_id: str, file_path: str) -> dict:
+        with open(file_path, "rb") as f:
+            content = f.read()
+        return await self._post(f"/tools/{tool_id}/upload", files={"file": (f"{tool_id}.zip", content, "application/zip", {"Expires": "0"})})
+
+    async def download_tools_artifact(self, tool_id: str) -> bytes:
+        response = await self._get(f"/tools/{tool_id}/download", return_raw=True)
+        return response.content
+
+    async def get_draft_by_name(self, tool_name: str) -> List[dict]:
+        return await self.get_drafts_by_names([tool_name])
+
+    async def get_drafts_by_names(self, tool_names: List[str]) -> List[dict]:
+        formatted_tool_names = [f"names={x}" for x in tool_names]
+        return await self._get(f"/tools?{'&'.join(formatted_tool_names)}")
+
+    async def get_draft_by_id(self, tool_id: str) -> dict | Literal[""]:
+        if tool_id is None:
+            return ""
+        else:
+            try:
+                tool = await self._get(f"/tools/{tool_id}")
+                return tool
+            except ClientAPIException as e:
+                if e.response.status_code == 404 and "not found with the given name" in e.response.text:
+                    return ""
+                raise(e)
+
+    async def get_drafts_by_ids(self, tool_ids: List[str]) -> List[dict]:
+        formatted_tool_ids = [f"ids={x}" for x in tool_ids]
+        return await self._get(f"/tools?{'&'.join(formatted_tool_ids)}")
@@ -6,25 +6,35 @@ from ibm_watsonx_orchestrate.cli.config import (
     AUTH_CONFIG_FILE,
     AUTH_SECTION_HEADER,
     AUTH_MCSP_TOKEN_OPT,
+    AUTH_MCSP_TOKEN_EXPIRY_OPT,
     CONTEXT_SECTION_HEADER,
     CONTEXT_ACTIVE_ENV_OPT,
     ENVIRONMENTS_SECTION_HEADER,
     ENV_WXO_URL_OPT,
+    ENV_IAM_URL_OPT,
+    ENV_AUTH_TYPE,
     BYPASS_SSL,
-    VERIFY
+    VERIFY,
+    Config,
+    clear_config_cache,
+    _load_config_data
 )
 from threading import Lock
-from ibm_watsonx_orchestrate.client.base_api_client import BaseAPIClient
-from ibm_watsonx_orchestrate.utils.utils import yaml_safe_load
+from ibm_watsonx_orchestrate.client.base_api_client import BaseAPIClient, get_shared_session
+from ibm_watsonx_orchestrate.client.async_base_api_client import AsyncBaseAPIClient
+from ibm_watsonx_orchestrate.client.token_store import (
+    TokenStore,
+    TokenRefresher,
+    get_token_expiry,
+    is_expiry_valid as _is_expiry_valid
+)
 import logging
-from typing import TypeVar
+from typing import Callable, TypeVar
 import os
-import jwt
-import time
 
 logger = logging.getLogger(__name__)
 LOCK = Lock()
-T = TypeVar("T", bound=BaseAPIClient)
+T = TypeVar("T", bound=BaseAPIClient | AsyncBaseAPIClient)
 
 
 def is_local_dev(url: str | None = None) -> bool:
@@ -52,26 +62,100 @@ def is_cpd_env(url: str) -> bool:
         return True
     return False
 
+# API key used to refresh the active env's token once it gets close to expiry
+WO_API_KEY_ENV_VAR = "WO_API_KEY"
+WO_USERNAME_ENV_VAR = "WO_USERNAME"
+
+# Clients built from the parsed config and credentials held in _CLIENT_CACHE_SOURCES
+_CLIENT_CACHE: dict = {}
+_CLIENT_CACHE_SOURCES: tuple[dict, dict] | None = None
+
+
 def check_token_validity(token: str) -> bool:
     try:
-        token_claimset = jwt.decode(token, options={"verify_signature": False})
-        expiry = token_claimset.get('exp')
-
-        current_timestamp = int(time.time())
-        # Check if the token is not expired (or will not be expired in 10 minutes)
-        if not expiry or current_timestamp < expiry - 600:
-            return True
-        return False
+        expiry = get_token_expiry(token)
+        return _is_expiry_valid(expiry)
     except:
         return False
 
+def _persist_token(env: str, token: str, expiry: int | None) -> None:
+    auth_cfg = Config(AUTH_CONFIG_FILE_FOLDER, AUTH_CONFIG_FILE)
+    auth_cfg.save({AUTH_SECTION_HEADER: {env: {AUTH_MCSP_TOKEN_OPT: token, AUTH_MCSP_TOKEN_EXPIRY_OPT: expiry}}})
+
+_TOKEN_STORE = TokenStore(persist=_persist_token)
+
+def get_token_store() -> TokenStore:
+    return _TOKEN_STORE
+
+def _get_token_refresher(env_config: dict) -> TokenRefresher | None:
+    """
+    Returns a function fetching a new token for the env, when an API key is available to fetch one with
+    """
+    url = env_config.get(ENV_WXO_URL_OPT)
+    api_key = os.environ.get(WO_API_KEY_ENV_VAR)
+    if not api_key or not url or is_local_dev(url):
+        return None
+
+    def refresh() -> str:
+        # Imported here as the client module depends on this one
+        from ibm_watsonx_orchestrate.client.client import Client
+        from ibm_watsonx_orchestrate.client.credentials import Credentials
+
+        credentials = Credentials(
+            url=url,
+            api_key=api_key,
+            username=os.environ.get(WO_USERNAME_ENV_VAR),
+            iam_url=env_config.get(ENV_IAM_URL_OPT),
+            auth_type=env_config.get(ENV_AUTH_TYPE)
+        )
+        return Client(credentials).token
+    return refresh
+
+def _get_token_provider(env: str, fallback: str) -> Callable[[], str]:
+    return lambda: _TOKEN_STORE.get_token(env) or fallback
+
+def clear_client_cache() -> None:
+    global _CLIENT_CACHE_SOURCES
+    with LOCK:
+        clear_config_cache()
+        _CLIENT_CACHE.clear()
+        _CLIENT_CACHE_SOURCES = None
+        _TOKEN_STORE.clear()
+
+def _load_config_files() -> tuple[dict, dict]:
+    """
+    Return the parsed config and credentials files from the config cache shared with Config
+    """
+    global _CLIENT_CACHE_SOURCES
+    config_path = os.path.join(DEFAULT_CONFIG_FILE_FOLDER, DEFAULT_CONFIG_FILE)
+    auth_path = os.path.join(AUTH_CONFIG_FILE_FOLDER, AUTH_CONFIG_FILE)
+    for config_file_path in (config_path, auth_path):
+        if not os.path.exists(config_file_path):
+            raise FileNotFoundError(config_file_path)
+
+    # The config cache hands out the same dicts until a file changes on disk
+    config, auth_config = _load_config_data(config_path), _load_config_data(auth_path)
+    if _CLIENT_CACHE_SOURCES is None or _CLIENT_CACHE_SOURCES[0] is not config or _CLIENT_CACHE_SOURCES[1] is not auth_config:
+        # Clients built from the previous file contents may carry a stale url or token
+        _CLIENT_CACHE.clear()
+        _CLIENT_CACHE_SOURCES = (config, auth_config)
+    return config, auth_config
+
 
 def instantiate_client(client: type[T] , url: str | None=None) -> T:
     try:
         with LOCK:
-            with open(os.path.join(DEFAULT_CONFIG_FILE_FOLDER, DEFAULT_CONFIG_FILE), "r") as f:
-                config = yaml_safe_load(f)
+            config, auth_config = _load_config_files()
             active_env = config.get(CONTEXT_SECTION_HEADER, {}).get(CONTEXT_ACTIVE_ENV_OPT)
+
+            cache_key = (active_env, url, client)
+            cached = _CLIENT_CACHE.get(cache_key)
+            if cached:
+                client_instance, expiry = cached
+                if _is_expiry_valid(expiry):
+                    return client_instance
+                del _CLIENT_CACHE[cache_key]
+
             bypass_ssl = (
                 config.get(ENVIRONMENTS_SECTION_HEADER, {})
                     .get(active_env, {})
@@ -84,11 +168,10 @@ def instantiate_client(client: type[T] , url: str | None=None) -> T:
                     .get(VERIFY, None)
             )
 
+            env_config = config.get(ENVIRONMENTS_SECTION_HEADER, {}).get(active_env, {})
             if not url:
-                url = config.get(ENVIRONMENTS_SECTION_HEADER, {}).get(active_env, {}).get(ENV_WXO_URL_OPT)
+                url = env_config.get(ENV_WXO_URL_OPT)
 
-            with open(os.path.join(AUTH_CONFIG_FILE_FOLDER, AUTH_CONFIG_FILE), "r") as f:
-                auth_config = yaml_safe_load(f)
             auth_settings = auth_config.get(AUTH_SECTION_HEADER, {}).get(active_env, {})
 
             if not active_env:
@@ -100,18 +183,31 @@ def instantiate_client(client: type[T] , url: str | None=None) -> T:
             if not auth_settings:
                 logger.error(f"No credentials found for active env '{active_env}'. Use `orchestrate env activate {active_env}` to refresh your credentials")
                 exit(1)
-            token = auth_settings.get(AUTH_MCSP_TOKEN_OPT)
-            if not check_token_validity(token):
+            refresher = _get_token_refresher(env_config)
+            _TOKEN_STORE.load(active_env, auth_settings.get(AUTH_MCSP_TOKEN_OPT), refresher)
+            token = _TOKEN_STORE.get_token(active_env)
+            if not token:
                 logger.error(f"The token found for environment '{active_env}' is missing or expired. Use `orchestrate env activate {active_env}` to fetch a new one")
                 exit(1)
+
+            # All clients for the same environment reuse one pooled keep-alive session
+            if issubclass(client, AsyncBaseAPIClient):
+                connection_kwargs = {"shared_key": active_env}
+            else:
+                connection_kwargs = {"session": get_shared_session(active_env)}
+            if refresher is not None:
+                # Every request takes the current token from the store, so clients outlive the token they were built with
+                connection_kwargs["token_provider"] = _get_token_provider(active_env, token)
             is_cpd = is_cpd_env(url)
             if is_cpd:
                 if bypass_ssl is True:
-                    client_instance = client(base_url=url, api_key=token, is_local=is_local_dev(url), verify=False)
+                    client_instance = client(base_url=url, api_key=token, is_local=is_local_dev(url), verify=False, **connection_kwargs)
                 elif verify is not None:
-                    client_instance = client(base_url=url, api_key=token, is_local=is_local_dev(url), verify=verify)
+                    client_instance = client(base_url=url, api_key=token, is_local=is_local_dev(url), verify=verify, **connection_kwargs)
             else:
-                client_instance = client(base_url=url, api_key=token, is_local=is_local_dev(url))
+                client_instance = client(base_url=url, api_key=token, is_local=is_local_dev(url), **connection_kwargs)
+
+            _CLIENT_CACHE[cache_key] = (client_instance, None if refresher is not None else get_token_expiry(token))
 
         return client_instance
     except FileNotFoundError as e:
@@ -13,7 +13,9 @@ class DataMap(BaseModel):
         model_spec = {}
         if self.maps and len(self.maps) > 0:
             model_spec["maps"] = [assignment.model_dump() for assignment in self.maps]
+        return model_spec
 
     def add(self, line: Assignment) -> Self:
         self.maps.append(line)
+        return self
 
@@ -1,8 +1,9 @@
 from .constants import START, END, RESERVED
 from ..types import FlowContext, TaskData, TaskEventType
 from ..node import UserNode, AgentNode, StartNode, EndNode, PromptNode, ToolNode
-from .flow import Flow, CompiledFlow, FlowRun, FlowEvent, FlowEventType, FlowFactory, MatchPolicy, WaitPolicy, ForeachPolicy, Branch, Foreach, Loop
+from .flow import Flow, CompiledFlow, FlowRun, FlowBatchStats, FlowEvent, FlowEventType, FlowFactory, MatchPolicy, WaitPolicy, ForeachPolicy, Branch, Foreach, Loop
 from .decorators import flow
+from .executor import LocalFlowExecutor, FlowExecutionError
 from ..data_map import Assignment, DataMap
 
 
@@ -27,6 +28,7 @@ __all__ = [
     "Flow",    
     "CompiledFlow",
     "FlowRun",
+    "FlowBatchStats",
     "FlowEvent",
     "FlowEventType",
     "FlowFactory",
@@ -36,6 +38,8 @@ __all__ = [
     "Branch",
     "Foreach",
     "Loop",
+    "LocalFlowExecutor",
+    "FlowExecutionError",
 
     "user",
     "flow_spec",
@@ -1,8 +1,13 @@
-import redis
-import time
+import asyncio
 import json
-from dotenv import load_dotenv
+import logging
 import os
+import weakref
+
+import redis
+import redis.asyncio as aioredis
+from dotenv import load_dotenv
+from pydantic import ValidationError
 
 from typing import (
     AsyncIterator, Union
@@ -12,37 +17,240 @@ from ..types import (
     FlowEventType, TaskEventType, FlowEvent, FlowContext
 )
 
+logger = logging.getLogger(__name__)
+
+# How long a single XREAD blocks server side waiting for new events
+STREAM_BLOCK_MS = 5000
+STREAM_READ_COUNT = 10
+RECONNECT_INITIAL_BACKOFF_SECONDS = 0.5
+RECONNECT_MAX_BACKOFF_SECONDS = 30
+# How long the event hub keeps its connections open once no flow run is being consumed
+EVENT_HUB_IDLE_TIMEOUT_SECONDS = 30
+# CLIENT UNBLOCK is retried when it reaches the server before the XREAD it is meant to wake
+WAKE_RETRY_SECONDS = 0.01
+WAKE_ATTEMPTS = 10
+
+def get_stream_name(instance_id: str) -> str:
+    return f"tempus:{instance_id}"
+
+def get_redis_client() -> aioredis.Redis:
+    load_dotenv()
+    redis_host = os.getenv("REDIS_HOST", "localhost")
+    redis_port = os.getenv("REDIS_PORT", 6379)
+    redis_db = os.getenv("REDIS_DB", 0)
+    return aioredis.Redis(host=redis_host, port=redis_port, db=redis_db)
+
 class StreamConsumer:
-    def __init__(self, instance_id: str):
-        
-        load_dotenv()
-        self.redis_host = os.getenv("REDIS_HOST", "localhost")
-        self.redis_port = os.getenv("REDIS_PORT", 6379)
-        self.redis_db = os.getenv("REDIS_DB", 0)
-        self.redis = redis.Redis(host=self.redis_host, port=self.redis_port, db=self.redis_db)
+    """
+    Reads the events of a flow instance from its redis stream without blocking the event loop.
+
+    Events are yielded as soon as XREAD returns them; connection errors are retried with exponential backoff,
+    resuming after the last event that was read. The connection is closed once consume() finishes, or on close().
+    """
+
+    def __init__(self, instance_id: str, redis_client: aioredis.Redis | None = None):
         self.instance_id = instance_id
-        self.stream_name = f"tempus:{self.instance_id}"
+        self.stream_name = get_stream_name(self.instance_id)
         self.last_processed_id = 0
-        
+        self.redis = redis_client if redis_client is not None else get_redis_client()
 
     async def consume(self) -> AsyncIterator[FlowEvent]:
-        
-        while True:
-            try:
-                # XREAD command: Read new messages from the stream
-                messages = self.redis.xread({self.stream_name: self.last_processed_id}, block=5000, count=10)
+        backoff = RECONNECT_INITIAL_BACKOFF_SECONDS
+        try:
+            while True:
+                try:
+                    # XREAD command: Wait server side for new messages on the stream
+                    messages = await self.redis.xread({self.stream_name: self.last_processed_id}, block=STREAM_BLOCK_MS, count=STREAM_READ_COUNT)
+                except redis.RedisError as e:
+                    logger.warning(f"Error reading events of flow instance '{self.instance_id}', retrying in {backoff}s: {e}")
+                    await asyncio.sleep(backoff)
+                    backoff = min(backoff * 2, RECONNECT_MAX_BACKOFF_SECONDS)
+                    continue
+                backoff = RECONNECT_INITIAL_BACKOFF_SECONDS
 
-                for stream, events in messages:
+                for stream, events in messages or []:
                     for event_id, event_data in events:
                         self.last_processed_id = event_id  # Update the last read event ID
-                        flow_event = deserialize_flow_event(event_data)
+                        try:
+                            flow_event = deserialize_flow_event(event_data)
+                        except (ValueError, KeyError, ValidationError) as e:
+                            logger.warning(f"Skipping malformed event {event_id!r} of flow instance '{self.instance_id}': {e}")
+                            continue
                         yield flow_event
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        await self.redis.aclose()
+
+class _Subscription:
+    def __init__(self):
+        self.last_processed_id = 0
+        self.queue: asyncio.Queue[FlowEvent | Exception] = asyncio.Queue()
+
+class StreamEventHub:
+    """
+    Watches the streams of many flow instances with a single multi-key XREAD on one redis connection.
+
+    Each consume() call adds its instance's stream to the XREAD and receives the events routed to its own queue;
+    the stream is dropped from the next XREAD once that consumer is closed. The XREAD runs on a dedicated connection,
+    which is woken with CLIENT UNBLOCK as soon as streams are added, so new runs are picked up without waiting out
+    the block timeout or reconnecting. Once no run has been consumed for EVENT_HUB_IDLE_TIMEOUT_SECONDS the
+    connections are closed, and they are opened again by the next consume() call.
+    """
+
+    def __init__(self, redis_client: aioredis.Redis | None = None):
+        self.redis = redis_client if redis_client is not None else get_redis_client()
+        # stream name -> subscription, for every instance being consumed
+        self._subscriptions: dict[str, _Subscription] = {}
+        self._streams_added = asyncio.Event()
+        self._reader: asyncio.Task | None = None
+        # Single connection client for the blocking XREAD, and its server side id for CLIENT UNBLOCK
+        self._reader_client: aioredis.Redis | None = None
+        self._reader_client_id: int | None = None
+        # Counts the XREADs issued, set while one is blocked so it is only woken once
+        self._reads = 0
+        self._blocked_read: int | None = None
+        self._woken_read: int | None = None
+
+    async def consume(self, instance_id: str) -> AsyncIterator[FlowEvent]:
+        stream_name = get_stream_name(instance_id)
+        if stream_name in self._subscriptions:
+            raise ValueError(f"Events of flow instance '{instance_id}' are already being consumed")
+
+        subscription = _Subscription()
+        self._subscriptions[stream_name] = subscription
+        self._streams_added.set()
+        if self._reader is None or self._reader.done():
+            self._reader = asyncio.create_task(self._read(), name="flow-event-hub")
+
+        try:
+            if self._blocked_read is not None:
+                await self._wake_reader()
+            while True:
+                event = await subscription.queue.get()
+                if isinstance(event, Exception):
+                    raise event
+                yield event
+        finally:
+            self._subscriptions.pop(stream_name, None)
+
+    async def close(self) -> None:
+        if self._reader is not None:
+            self._reader.cancel()
+            await asyncio.wait({self._reader})
+            self._reader = None
+        await self._close_connections()
+
+    async def _close_connections(self) -> None:
+        if self._reader_client is not None:
+            await self._reader_client.aclose()
+            self._reader_client = None
+            self._reader_client_id = None
+        await self.redis.aclose()
+
+    async def _wake_reader(self) -> None:
+        read = self._blocked_read
+        if read == self._woken_read:
+            # Already being woken, the streams added since are part of the next XREAD
+            return
+        self._woken_read = read
+        try:
+            for _ in range(WAKE_ATTEMPTS):
+                if await self.redis.client_unblock(self._reader_client_id):
+                    return
+                if self._blocked_read != read:
+                    # The XREAD returned by itself
+                    return
+                await asyncio.sleep(WAKE_RETRY_SECONDS)
+        except redis.RedisError as e:
+            logger.warning(f"Failed to wake the flow event reader, new runs are picked up after {STREAM_BLOCK_MS}ms: {e}")
+
+    async def _read(self) -> None:
+        backoff = RECONNECT_INITIAL_BACKOFF_SECONDS
+        try:
+            while True:
+                if not self._subscriptions:
+                    # Nothing to watch until the next consume() call
+                    self._streams_added.clear()
+                    try:
+                        await asyncio.wait_for(self._streams_added.wait(), timeout=EVENT_HUB_IDLE_TIMEOUT_SECONDS)
+                    except asyncio.TimeoutError:
+                        if not self._subscriptions:
+                            await self._close_connections()
+                            # consume() only starts a reader once this one is done, so it keeps reading
+                            # for the runs that started while the connections were being closed
+                            if not self._subscriptions:
+                                return
+                    continue
+
+                self._streams_added.clear()
+                streams = {name: subscription.last_processed_id for name, subscription in self._subscriptions.items()}
+                try:
+                    if self._reader_client_id is None:
+                        self._reader_client = self._reader_client or self.redis.client()
+                        self._reader_client_id = await self._reader_client.client_id()
+                    self._reads += 1
+                    self._blocked_read = self._reads
+                    try:
+                        messages = await self._reader_client.xread(streams, block=STREAM_BLOCK_MS, count=STREAM_READ_COUNT)
+                    finally:
+                        self._blocked_read = None
+                except redis.RedisError as e:
+                    # The connection gets a new id when it reconnects
+                    self._reader_client_id = None
+                    logger.warning(f"Error reading flow events, retrying in {backoff}s: {e}")
+                    await asyncio.sleep(backoff)
+                    backoff = min(backoff * 2, RECONNECT_MAX_BACKOFF_SECONDS)
+                    continue
+                backoff = RECONNECT_INITIAL_BACKOFF_SECONDS
+
+                self._dispatch(messages or [])
+        except Exception as e:
+            # Fail every consumer rather than leave them waiting on a reader that has stopped
+            for subscription in self._subscriptions.values():
+                subscription.queue.put_nowait(e)
+
+    def _dispatch(self, messages: list) -> None:
+        for stream, events in messages:
+            stream_name = stream.decode("utf-8") if isinstance(stream, bytes) else stream
+            subscription = self._subscriptions.get(stream_name)
+            if subscription is None:
+                # Its consumer was closed while the XREAD was in flight
+                continue
+            for event_id, event_data in events:
+                subscription.last_processed_id = event_id
+                try:
+                    flow_event = deserialize_flow_event(event_data)
+                except (ValueError, KeyError, ValidationError) as e:
+                    logger.warning(f"Skipping malformed event {event_id!r} of stream '{stream_name}': {e}")
+                    continue
+                subscription.queue.put_nowait(flow_event)
+
+_EVENT_HUBS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, StreamEventHub]" = weakref.WeakKeyDictionary()
+
+def get_event_hub() -> StreamEventHub:
+    """
+    Return the StreamEventHub shared by every flow run on the running event loop, creating it on first use
+    """
+    loop = asyncio.get_running_loop()
+    hub = _EVENT_HUBS.get(loop)
+    if hub is None:
+        hub = StreamEventHub()
+        _EVENT_HUBS[loop] = hub
+    return hub
 
-            except Exception as e:
-                print(f"Error occurred: {e}")
-                time.sleep(5)  # Wait for 5 seconds before retrying
+async def aclose_event_hub() -> None:
+    """
+    Close the StreamEventHub of the running event loop and its redis connections.
 
-            time.sleep(1)  # Sleep for 1 second before checking for new messages
+    The hub closes its connections by itself once it has been idle for EVENT_HUB_IDLE_TIMEOUT_SECONDS, so this
+    only needs to be called by code that closes its event loop while runs may have ended recently, such as a
+    script driving CompiledFlow.invoke() or invoke_many() from asyncio.run().
+    """
+    hub = _EVENT_HUBS.pop(asyncio.get_running_loop(), None)
+    if hub is not None:
+        await hub.close()
 
 def deserialize_flow_event(byte_data: bytes) -> FlowEvent:
     """Deserialize byte data into a FlowEvent object."""
@@ -0,0 +1,430 @@
+"""
+Runs flow models in process, without deploying them to the flow engine.
+
+The executor walks the nodes and edges of Flow.to_json(), running python tools in a thread pool (or on the event
+loop when they are coroutines), evaluating branch and loop expressions, and running foreach and loop bodies, with
+the items of a PARALLEL foreach run concurrently. Nodes whose predecessors have all finished are started together,
+so independent branches run concurrently. It emits the same FlowEvent and TaskEvent types as a deployed flow.
+
+Data is mapped between nodes the way the flow engine does for the simple cases: a node receives the fields of its
+input schema from the flow input and the outputs of the nodes that ran before it, or the whole output of its
+predecessor when the field is an object or array it does not otherwise find. Anything else needs an input_map.
+"""
+
+import asyncio
+import inspect
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, AsyncIterator, Callable
+
+from pydantic import BaseModel
+
+from ..types import FlowContext, FlowData, FlowEvent, FlowEventType, TaskEventType
+from .constants import START, END
+
+# Guards against loops whose evaluator never becomes false
+MAX_LOOP_ITERATIONS = 1000
+
+_EXPRESSION_BUILTINS = {
+    "abs": abs, "all": all, "any": any, "bool": bool, "dict": dict, "float": float, "int": int, "len": len,
+    "list": list, "max": max, "min": min, "round": round, "sorted": sorted, "str": str, "sum": sum,
+    "True": True, "False": False, "None": None,
+}
+
+NodeHandler = Callable[[dict], Any]
+
+
+class FlowExecutionError(Exception):
+    def __init__(self, node: str, message: str):
+        super().__init__(f"Node '{node}' failed: {message}")
+        self.node = node
+        self.message = message
+
+
+class _Namespace(dict):
+    '''A dict whose keys can also be read as attributes, so expressions can use flow.input.name'''
+
+    def __getattribute__(self, name: str) -> Any:
+        if dict.__contains__(self, name):
+            return _wrap(dict.__getitem__(self, name))
+        return super().__getattribute__(name)
+
+    def __getattr__(self, name: str) -> Any:
+        raise AttributeError(f"'{name}' is not set")
+
+
+def _wrap(value: Any) -> Any:
+    if isinstance(value, dict) and not isinstance(value, _Namespace):
+        return _Namespace(value)
+    if isinstance(value, list):
+        return [_wrap(item) for item in value]
+    return value
+
+def _unwrap(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _unwrap(item) for key, item in dict.items(value)}
+    if isinstance(value, list):
+        return [_unwrap(item) for item in value]
+    return value
+
+def _to_data(value: Any) -> Any:
+    # Tools return pydantic models, the flow passes their JSON form along
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, (list, tuple)):
+        return [_to_data(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _to_data(item) for key, item in value.items()}
+    return value
+
+def _as_flow_data(value: Any) -> dict:
+    if value is None:
+        return {}
+    return value if isinstance(value, dict) else {"value": value}
+
+def evaluate_expression(expression: str, namespace: dict) -> Any:
+    # Assignments mark python expressions with a leading '=', paths such as flow.input.name are expressions too
+    expression = expression.strip()
+    if expression.startswith("="):
+        expression = expression[1:]
+    return _unwrap(eval(expression, {"__builtins__": _EXPRESSION_BUILTINS}, {key: _wrap(value) for key, value in namespace.items()}))
+
+
+class _Scope:
+    '''The state of one run of a flow, or of a foreach or loop body'''
+
+    def __init__(self, model: dict, flow_input: Any, parent: "_Scope | None" = None):
+        self.model = model
+        self.name = model["spec"]["name"]
+        self.input = flow_input
+        self.parent = parent
+        # node name -> {"input": ..., "output": ...} for every node that has run
+        self.nodes: dict[str, dict] = {}
+        # the flow input, updated with each dict output in the order nodes finish
+        self.data: dict = dict(flow_input) if isinstance(flow_input, dict) else {}
+
+    def flow_namespace(self) -> dict:
+        return {**self.nodes, "input": self.input}
+
+    def namespace(self, node: dict | None = None) -> dict:
+        namespace = {"flow": self.flow_namespace()}
+        if self.parent is not None:
+            namespace["parent"] = self.parent.flow_namespace()
+        if node is not None:
+            namespace["node"] = node
+        return namespace
+
+    def record(self, name: str, input_data: Any, output: Any) -> None:
+        self.nodes[name] = {"input": input_data, "output": output}
+        if isinstance(output, dict):
+            self.data.update(output)
+
+
+class LocalFlowExecutor:
+    """
+    Runs a Flow, or the model returned by Flow.to_json(), in process.
+
+    Tool nodes run the python tools they were created from; tools referred to by name, and any other node, can be
+    supplied through tools (by tool name) or handlers (by node name), which take precedence. Agent, prompt and user
+    nodes need a handler, since they have no local implementation.
+    """
+
+    def __init__(self, flow: Any, tools: dict[str, Callable] | None = None, handlers: dict[str, NodeHandler] | None = None, max_workers: int | None = None):
+        if isinstance(flow, dict):
+            self.model = flow
+            self.tools = {}
+        else:
+            self.model = flow.to_json()
+            self.tools = _get_python_tools(flow)
+        self.tools.update(tools or {})
+        self.handlers = handlers or {}
+        self.max_workers = max_workers
+        self.schemas = self.model.get("schemas", {})
+
+    async def run(self, input_data: dict | None = None) -> Any:
+        '''Runs the flow and returns its output, raising FlowExecutionError when a node fails'''
+        async for event in self.run_events(input_data):
+            if event.kind == FlowEventType.ON_FLOW_END:
+                return event.context.data.output
+            if event.kind == FlowEventType.ON_FLOW_ERROR:
+                raise FlowExecutionError(event.error["node"], event.error["message"])
+
+    async def run_events(self, input_data: dict | None = None, instance_id: str | None = None) -> AsyncIterator[FlowEvent]:
+        '''Runs the flow, yielding its events as they happen'''
+        run = _FlowRun(self, instance_id or uuid.uuid4().hex)
+        task = asyncio.create_task(run.run(input_data or {}))
+        try:
+            while (event := await run.events.get()) is not None:
+                yield event
+        finally:
+            if not task.done():
+                task.cancel()
+            await asyncio.wait({task})
+
+        # Node failures end the flow with ON_FLOW_ERROR, anything else is a problem with the model itself
+        if task.exception() is not None:
+            raise task.exception()
+
+
+class _FlowRun:
+    def __init__(self, executor: LocalFlowExecutor, instance_id: str):
+        self.executor = executor
+        self.instance_id = instance_id
+        self.events: asyncio.Queue[FlowEvent | None] = asyncio.Queue()
+        self.pool: ThreadPoolExecutor | None = None
+
+    def emit(self, kind: FlowEventType | TaskEventType, scope: _Scope, name: str | None = None, input_data: Any = None, output: Any = None, error: dict | None = None) -> None:
+        context = FlowContext(
+            name=name or scope.name,
+            task_id=name,
+            flow_id=scope.name,
+            instance_id=self.instance_id,
+            data=FlowData(input=_as_flow_data(input_data), output=_as_flow_data(output)),
+        )
+        self.events.put_nowait(FlowEvent(kind=kind, context=context, error=error))
+
+    async def run(self, input_data: dict) -> None:
+        model = self.executor.model
+        root = _Scope(model, input_data)
+        self.pool = ThreadPoolExecutor(max_workers=self.executor.max_workers, thread_name_prefix="flow-node")
+        try:
+            self.emit(FlowEventType.ON_FLOW_START, root, input_data=input_data)
+            output = await self.run_graph(model, root)
+            self.emit(FlowEventType.ON_FLOW_END, root, input_data=input_data, output=output)
+        except FlowExecutionError as e:
+            self.emit(FlowEventType.ON_FLOW_ERROR, root, input_data=input_data, error={"node": e.node, "message": e.message})
+        finally:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.events.put_nowait(None)
+
+    async def run_graph(self, model: dict, scope: _Scope) -> Any:
+        nodes = model.get("nodes", {})
+        if START not in nodes:
+            raise FlowExecutionError(scope.name, "the flow has no start node")
+
+        incoming: dict[str, int] = {name: 0 for name in nodes}
+        outgoing: dict[str, list[str]] = {name: [] for name in nodes}
+        for edge in model.get("edges", []):
+            outgoing[edge["start"]].append(edge["end"])
+            incoming[edge["end"]] += 1
+        # Dead path elimination: a node runs once every incoming edge is resolved, if at least one of them was taken
+        remaining = dict(incoming)
+        taken: dict[str, list[str]] = {name: [] for name in nodes}
+        results: dict[str, Any] = {}
+
+        async def visit(name: str, tasks: asyncio.TaskGroup) -> None:
+            run_node = name == START or bool(taken[name])
+            selected = None
+            if run_node:
+                predecessor_outputs = [results[predecessor] for predecessor in taken[name]]
+                results[name], selected = await self.run_node(name, nodes[name], scope, predecessor_outputs)
+
+            for successor in outgoing[name]:
+                remaining[successor] -= 1
+                if run_node and (selected is None or successor in selected):
+                    taken[successor].append(name)
+                if remaining[successor] == 0:
+                    tasks.create_task(visit(successor, tasks))
+
+        try:
+            async with asyncio.TaskGroup() as tasks:
+                tasks.create_task(visit(START, tasks))
+        except BaseExceptionGroup as group:
+            # Report the node that failed first, the TaskGroup cancelled the rest
+            raise next(iter(_flatten(group))) from None
+
+        return results.get(END, {})
+
+    async def run_node(self, name: str, node: dict, scope: _Scope, predecessor_outputs: list) -> tuple[Any, list[str] | None]:
+        '''Runs a node, returning its output and, for branches, the successors to take'''
+        spec = node["spec"]
+        kind = spec.get("kind")
+
+        if kind == "start":
+            return scope.input, None
+        if kind == "end":
+            output = self.get_flow_output(scope, predecessor_outputs)
+            return output, None
+
+        if kind == "branch":
+            return self.select_cases(name, spec, scope, predecessor_outputs)
+
+        input_data = self.get_node_input(node, scope, predecessor_outputs)
+
+        self.emit(TaskEventType.ON_TASK_START, scope, name, input_data)
+        try:
+            output = _to_data(await self.execute(name, node, scope, input_data))
+        except FlowExecutionError as e:
+            self.emit(TaskEventType.ON_TASK_ERROR, scope, name, input_data, error={"node": e.node, "message": e.message})
+            raise
+        except Exception as e:
+            self.emit(TaskEventType.ON_TASK_ERROR, scope, name, input_data, error={"node": name, "message": str(e)})
+            raise FlowExecutionError(name, str(e)) from e
+
+        scope.record(name, input_data, output)
+        self.emit(TaskEventType.ON_TASK_END, scope, name, input_data, output)
+        return output, None
+
+    async def execute(self, name: str, node: dict, scope: _Scope, input_data: Any) -> Any:
+        spec = node["spec"]
+        kind = spec.get("kind")
+
+        handler = self.executor.handlers.get(name)
+        if handler is not None:
+            return await self.call(handler, input_data)
+
+        if kind == "tool":
+            tool_name = spec["tool"]["name"] if isinstance(spec.get("tool"), dict) else spec.get("tool")
+            tool = self.executor.tools.get(tool_name)
+            if tool is None:
+                raise FlowExecutionError(name, f"tool '{tool_name}' is not available locally, pass it in tools")
+            return await self.call(partial(tool, **input_data))
+        if kind == "foreach":
+            return await self.run_foreach(name, node, scope, input_data)
+        if kind == "loop":
+            return await self.run_loop(name, node, scope, input_data)
+        if kind == "flow":
+            return await self.run_graph(node, _Scope(node, input_data, scope))
+
+        raise FlowExecutionError(name, f"nodes of kind '{kind}' cannot run locally, pass a handler for it")
+
+    async def call(self, fn: Callable, *args) -> Any:
+        target = fn.func if isinstance(fn, partial) else fn
+        target = getattr(target, "fn", target)
+        if inspect.iscoroutinefunction(target):
+            return await fn(*args)
+        return await asyncio.get_running_loop().run_in_executor(self.pool, partial(fn, *args))
+
+    async def run_foreach(self, name: str, node: dict, scope: _Scope, input_data: dict) -> list:
+        items = input_data.get("items")
+        if not isinstance(items, list):
+            raise FlowExecutionError(name, "foreach input has no list of items")
+
+        if node["spec"].get("foreach_policy") != "PARALLEL":
+            outputs = []
+            for item in items:
+                outputs.append(await self.run_graph(node, _Scope(node, item, scope)))
+            return outputs
+
+        # Outputs keep the order of the items, whatever order their bodies end in
+        outputs = [None] * len(items)
+        limit = asyncio.Semaphore(node["spec"].get("max_concurrency") or max(len(items), 1))
+
+        async def run_item(index: int, item: Any) -> None:
+            async with limit:
+                outputs[index] = await self.run_graph(node, _Scope(node, item, scope))
+
+        try:
+            async with asyncio.TaskGroup() as tasks:
+                for index, item in enumerate(items):
+                    tasks.create_task(run_item(index, item))
+        except BaseExceptionGroup as group:
+            raise next(iter(_flatten(group))) from None
+        return outputs
+
+    async def run_loop(self, name: str, node: dict, scope: _Scope, input_data: dict) -> dict:
+        # Each iteration sees the loop input updated with the output of the iterations before it
+        state = dict(input_data)
+        expression = node["spec"]["evaluator"]["expression"]
+        for _ in range(MAX_LOOP_ITERATIONS):
+            if not self.evaluate(name, expression, _Scope(node, state, scope).namespace()):
+                return state
+            output = await self.run_graph(node, _Scope(node, dict(state), scope))
+            if isinstance(output, dict):
+                state.update(output)
+        raise FlowExecutionError(name, f"loop did not end after {MAX_LOOP_ITERATIONS} iterations")
+
+    def select_cases(self, name: str, spec: dict, scope: _Scope, predecessor_outputs: list) -> tuple[Any, list[str]]:
+        result = self.evaluate(name, spec["evaluator"]["expression"], scope.namespace())
+        labels = result if isinstance(result, list) else [result]
+        cases = spec.get("cases", {})
+
+        def target(case: Any) -> str:
+            return case["node"] if isinstance(case, dict) else case
+
+        for label in labels:
+            for case_label, case in cases.items():
+                # Boolean labels become strings once the model has been through JSON
+                if case_label == label or str(case_label).lower() == str(label).lower():
+                    return _merge_outputs(predecessor_outputs), [target(case)]
+        if "__default__" in cases:
+            return _merge_outputs(predecessor_outputs), [target(cases["__default__"])]
+        raise FlowExecutionError(name, f"no case matches '{result}'")
+
+    def evaluate(self, name: str, expression: str, namespace: dict) -> Any:
+        try:
+            return evaluate_expression(expression, namespace)
+        except Exception as e:
+            raise FlowExecutionError(name, f"unable to evaluate '{expression}': {e}") from e
+
+    def get_node_input(self, node: dict, scope: _Scope, predecessor_outputs: list) -> Any:
+        previous = _merge_outputs(predecessor_outputs)
+        properties = self.get_properties(node["spec"].get("input_schema"))
+
+        if properties is None:
+            input_data = dict(scope.data)
+        else:
+            input_data = {}
+            for field, schema in properties.items():
+                if field in scope.data:
+                    input_data[field] = scope.data[field]
+                elif _is_array(schema) and isinstance(previous, list):
+                    input_data[field] = previous
+                elif _is_object(schema) and isinstance(previous, dict) and len(properties) == 1:
+                    input_data[field] = previous
+
+        for assignment in (node.get("input_map") or {}).get("maps", []):
+            input_data[assignment["target"]] = self.evaluate(node["spec"]["name"], assignment["source"], scope.namespace({"input": input_data}))
+        return input_data
+
+    def get_flow_output(self, scope: _Scope, predecessor_outputs: list) -> Any:
+        properties = self.get_properties(scope.model["spec"].get("output_schema"))
+        if properties:
+            return {field: scope.data[field] for field in properties if field in scope.data}
+        return _merge_outputs(predecessor_outputs)
+
+    def get_properties(self, schema: dict | None) -> dict | None:
+        schema = self.resolve(schema)
+        if not schema or schema.get("type") not in (None, "object"):
+            return None
+        return schema.get("properties")
+
+    def resolve(self, schema: dict | None) -> dict | None:
+        if schema and "$ref" in schema:
+            return self.executor.schemas.get(schema["$ref"].split("/")[-1])
+        return schema
+
+
+def _is_array(schema: dict) -> bool:
+    return schema.get("type") == "array"
+
+def _is_object(schema: dict) -> bool:
+    return "$ref" in schema or schema.get("type") == "object"
+
+def _merge_outputs(outputs: list) -> Any:
+    if len(outputs) == 1:
+        return outputs[0]
+    if outputs and all(isinstance(output, dict) for output in outputs):
+        merged = {}
+        for output in outputs:
+            merged.update(output)
+        return merged
+    return {}
+
+def _flatten(group: BaseExceptionGroup):
+    for exception in group.exceptions:
+        if isinstance(exception, BaseExceptionGroup):
+            yield from _flatten(exception)
+        else:
+            yield exception
+
+def _get_python_tools(flow: Any) -> dict[str, Callable]:
+    tools = {}
+    for node in getattr(flow, "nodes", {}).values():
+        python_tool = getattr(node, "_python_tool", None)
+        if python_tool is not None:
+            tools[node.spec.tool] = python_tool
+        # foreach and loop bodies are flows of their own
+        tools.update(_get_python_tools(node))
+    return tools
@@ -4,14 +4,18 @@ the Flow model.
 """
 
 import asyncio
+from contextlib import aclosing
 from datetime import datetime
 from enum import Enum
 import inspect
+import itertools
 from typing import (
-    Any, AsyncIterator, Callable, cast, List, Sequence, Union, Tuple
+    Any, AsyncIterator, Callable, cast, Iterable, List, Sequence, Union, Tuple
 )
 import json
 import logging
+import math
+import time
 import copy
 import uuid
 import pytz
@@ -21,7 +25,7 @@ from pydantic import BaseModel, Field, SerializeAsAny
 import yaml
 from ibm_watsonx_orchestrate.agent_builder.tools.python_tool import PythonTool
 from ibm_watsonx_orchestrate.client.tools.tool_client import ToolClient
-from ibm_watsonx_orchestrate.client.tools.tempus_client import TempusClient
+from ibm_watsonx_orchestrate.client.tools.tempus_client import AsyncTempusClient
 from ibm_watsonx_orchestrate.client.utils import instantiate_client
 from ..types import (
     EndNodeSpec, Expression, ForeachPolicy, ForeachSpec, LoopSpec, BranchNodeSpec, MatchPolicy, PromptLLMParameters, PromptNodeSpec, 
@@ -39,10 +43,13 @@ from ..types import (
 from ..data_map import DataMap
 from ..utils import _get_json_schema_obj, get_valid_name, import_flow_model, _get_tool_request_body, _get_tool_response_body
 
-from .events import StreamConsumer
+from .events import get_event_hub
+from .executor import LocalFlowExecutor
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_INVOKE_CONCURRENCY = 10
+
 # Mapping each event to its type
 EVENT_TYPE_MAP = {
     FlowEventType.ON_FLOW_START: "informational",
@@ -79,8 +86,11 @@ class Flow(Node):
         # extract data schemas
         self._refactor_node_to_schemaref(self)
 
-        # get Tool Client
-        self._tool_client = instantiate_client(ToolClient)
+    def _get_tool_client(self) -> ToolClient:
+        # Only looking up tools by name needs the client, so flows can be built and run locally without an environment
+        if self._tool_client is None:
+            self._tool_client = instantiate_client(ToolClient)
+        return self._tool_client
 
     def _find_topmost_flow(self) -> Self:
         if self.parent:
@@ -271,7 +281,9 @@ class Flow(Node):
                                      output_schema_object = spec.output_schema_object,
                                      tool = tool_spec.name)
 
-        return ToolNode(spec=toolnode_spec)
+        node = ToolNode(spec=toolnode_spec)
+        node._python_tool = tool
+        return node
 
     def tool(
         self,
@@ -293,7 +305,7 @@ class Flow(Node):
 
             if input_schema is None and output_schema is None:
                 # try to retrieve the schema from server
-                tool_specs: List[dict] = self._tool_client.get_draft_by_name(name)
+                tool_specs: List[dict] = self._get_tool_client().get_draft_by_name(name)
                 if (tool_specs is None) or (len(tool_specs) == 0):
                     raise ValueError(f"tool '{name}' not found")
 
@@ -742,38 +754,46 @@ class FlowRun(BaseModel):
     output: Any = None
     error: Any = None
     
+    # seconds from starting the run until it ended or failed
+    duration: float | None = None
+
     debug: bool = False
-    on_flow_end_handler: Callable = None
-    on_flow_error_handler: Callable = None
+    on_flow_end_handler: Callable | None = None
+    on_flow_error_handler: Callable | None = None
 
     model_config = {
         "arbitrary_types_allowed": True
     }           
 
-    async def _arun_events(self, input_data:dict=None, filters: Sequence[Union[FlowEventType, TaskEventType]]=None) -> AsyncIterator[FlowEvent]:
+    async def _arun_events(self, input_data:dict=None, filters: Sequence[Union[FlowEventType, TaskEventType]]=None, executor: LocalFlowExecutor=None) -> AsyncIterator[FlowEvent]:
         
         if self.status is not FlowRunStatus.NOT_STARTED:
             raise ValueError("Flow has already been started")
 
-        # Start the flow
-        client:TempusClient = instantiate_client(client=TempusClient)
-        ack = client.arun_flow(self.flow.spec.name,input_data)
-        self.id=ack["instance_id"]
+        if executor is None:
+            # Start the flow
+            client:AsyncTempusClient = instantiate_client(client=AsyncTempusClient)
+            ack = await client.arun_flow(self.flow.spec.name,input_data)
+            self.id=ack["instance_id"]
+            # Listen for events, sharing one redis connection with every other run on this event loop
+            flow_events = get_event_hub().consume(self.id)
+        else:
+            # Run the flow in process
+            self.id = uuid.uuid4().hex
+            flow_events = executor.run_events(input_data, instance_id=self.id)
         self.name = f"{self.flow.spec.name}:{self.id}"
         self.status = FlowRunStatus.IN_PROGRESS
 
-        # Listen for events
-        consumer = StreamConsumer(self.id)
+        async with aclosing(flow_events) as events:
+            async for event in events:
+                if not event or (filters and event.kind not in filters):
+                    continue
+                if self.debug:
+                    logger.debug(f"Flow instance `{self.name}` event: `{event.kind}`")
 
-        async for event in consumer.consume():
-            if not event or (filters and event.kind not in filters):
-                continue
-            if self.debug:
-                logger.debug(f"Flow instance `{self.name}` event: `{event.kind}`")
-            
-            self._update_status(event)
+                self._update_status(event)
 
-            yield event
+                yield event
     
     def _update_status(self, event:FlowEvent):
         
@@ -788,23 +808,29 @@ class FlowRun(BaseModel):
         if self.debug:
             logger.debug(f"Flow instance `{self.name}` status change: `{self.status}`")
 
-    async def _arun(self, input_data: dict=None, **kwargs):
+    async def _arun(self, input_data: dict=None, executor: LocalFlowExecutor=None, **kwargs):
         
         if self.status is not FlowRunStatus.NOT_STARTED:
             raise ValueError("Flow has already been started")
         
-        async for event in self._arun_events(input_data):
-            if not event:
-                continue
-            
-            if event.kind == FlowEventType.ON_FLOW_END:
-                # result should come back on the event
-                self._on_flow_end(event)
-                break
-            elif event.kind == FlowEventType.ON_FLOW_ERROR:
-                # error should come back on the event
-                self._on_flow_error(event)
-                break   
+        start = time.perf_counter()
+        try:
+            # Closing the events as soon as the flow ends releases the redis connection straight away
+            async with aclosing(self._arun_events(input_data, executor=executor)) as events:
+                async for event in events:
+                    if not event:
+                        continue
+
+                    if event.kind == FlowEventType.ON_FLOW_END:
+                        # result should come back on the event
+                        self._on_flow_end(event)
+                        break
+                    elif event.kind == FlowEventType.ON_FLOW_ERROR:
+                        # error should come back on the event
+                        self._on_flow_error(event)
+                        break
+        finally:
+            self.duration = time.perf_counter() - start
 
     def update_state(self, task_id: str, data: dict) -> Self:
         '''Not Implemented Yet'''
@@ -835,6 +861,46 @@ class FlowRun(BaseModel):
             self.on_flow_error_handler(self.error)
        
 
+def _percentile(sorted_values: list[float], percent: float) -> float | None:
+    # Nearest-rank percentile
+    if not sorted_values:
+        return None
+    rank = math.ceil(percent / 100 * len(sorted_values))
+    return sorted_values[max(rank - 1, 0)]
+
+class FlowBatchStats(BaseModel):
+    '''Throughput and latency of a batch of flow runs started by CompiledFlow.invoke_many(). Times are in seconds.'''
+    total: int = 0
+    completed: int = 0
+    failed: int = 0
+    elapsed: float = 0
+    throughput: float = 0
+    latency_p50: float | None = None
+    latency_p90: float | None = None
+    latency_p99: float | None = None
+
+    @classmethod
+    def from_runs(cls, runs: Sequence[FlowRun], elapsed: float) -> "FlowBatchStats":
+        latencies = sorted(run.duration for run in runs if run.duration is not None)
+        return cls(
+            total=len(runs),
+            completed=sum(1 for run in runs if run.status == FlowRunStatus.COMPLETED),
+            failed=sum(1 for run in runs if run.status == FlowRunStatus.FAILED),
+            elapsed=elapsed,
+            throughput=len(runs) / elapsed if elapsed > 0 else 0,
+            latency_p50=_percentile(latencies, 50),
+            latency_p90=_percentile(latencies, 90),
+            latency_p99=_percentile(latencies, 99),
+        )
+
+    def __str__(self) -> str:
+        def fmt(latency: float | None) -> str:
+            return "n/a" if latency is None else f"{latency:.2f}s"
+        return (
+            f"{self.total} runs ({self.completed} completed, {self.failed} failed) in {self.elapsed:.2f}s, "
+            f"{self.throughput:.2f} runs/s, latency p50 {fmt(self.latency_p50)}, p90 {fmt(self.latency_p90)}, p99 {fmt(self.latency_p99)}"
+        )
+
 class CompiledFlow(BaseModel):
     '''A compiled version of the flow'''
     flow: Flow
@@ -864,6 +930,30 @@ class CompiledFlow(BaseModel):
         asyncio.create_task(flow_run._arun(input_data=input_data, **kwargs))
         return flow_run
     
+    async def invoke_local(self, input_data:dict=None, tools: dict[str, Callable]=None, handlers: dict[str, Callable]=None, on_flow_end_handler: Callable=None, on_flow_error_handler: Callable=None, debug:bool=False) -> FlowRun:
+        """
+        Runs the flow in process and returns the FlowRun once it has ended. The flow does not need to be deployed, and no services are used.
+
+        Args:
+            input_data (dict, optional): Input data to be passed to the flow. Defaults to None.
+            tools (dict[str, Callable], optional): Implementations of tool nodes by tool name, for tools that were
+                added to the flow by name. Tools added as python functions are run as they are. Defaults to None.
+            handlers (dict[str, Callable], optional): Implementations of nodes by node name, such as agent and prompt
+                nodes which cannot run locally. Each takes the node input and returns its output. Defaults to None.
+            on_flow_end_handler (callable, optional): A callback function to be executed 
+                when the flow completes successfully. Defaults to None. Takes the flow output as an argument.
+            on_flow_error_handler (callable, optional): A callback function to be executed 
+                when an error occurs during the flow execution. Defaults to None.
+            debug (bool, optional): If True, enables debug mode for the flow run. Defaults to False.
+
+        Returns:
+            FlowRun: The ended run, with its status and its output or error.
+        """
+
+        flow_run = FlowRun(flow=self.flow, on_flow_end_handler=on_flow_end_handler, on_flow_error_handler=on_flow_error_handler, debug=debug)
+        await flow_run._arun(input_data=input_data, executor=LocalFlowExecutor(self.flow, tools=tools, handlers=handlers))
+        return flow_run
+
     async def invoke_events(self, input_data:dict=None, filters: Sequence[Union[FlowEventType, TaskEventType]]=None, debug:bool=False) -> AsyncIterator[Tuple[FlowEvent,FlowRun]]:
         """
         Asynchronously runs the flow and yields events received from the flow for the client to handle. This only works for CompiledFlow instances that have been deployed.
@@ -886,6 +976,65 @@ class CompiledFlow(BaseModel):
         async for event in flow_run._arun_events(input_data=input_data, filters=filters):
             yield (event, flow_run)
     
+    async def invoke_many(self, inputs: Iterable[dict], max_concurrency: int = DEFAULT_INVOKE_CONCURRENCY, on_batch_end_handler: Callable[[FlowBatchStats], None]=None, debug:bool=False) -> AsyncIterator[Tuple[dict, FlowRun]]:
+        """
+        Asynchronously runs the flow once per input, keeping at most max_concurrency runs in flight, and yields each run as it ends. This only works for CompiledFlow instances that have been deployed.
+
+        Runs are yielded in the order they end, not in the order of inputs. A run that could not be started is yielded as failed rather than stopping the batch.
+
+        Args:
+            inputs (Iterable[dict]): Input data for each run. It is consumed lazily, so it can be a generator over a large number of records.
+            max_concurrency (int, optional): The maximum number of runs in flight at once. Defaults to 10.
+            on_batch_end_handler (callable, optional): A callback function to be executed once every run has ended.
+                Takes the FlowBatchStats of the batch as an argument. Defaults to None.
+            debug (bool, optional): If True, enables debug mode for the flow runs. Defaults to False.
+
+        Yields:
+            Tuple[dict, FlowRun]: The input of each run together with the run, once it has completed or failed.
+        """
+
+        if self.deployed is False:
+            raise ValueError("Flow has not been deployed yet. Please deploy the flow before invoking it by using the Flow.compile_deploy() function.")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        inputs = iter(inputs)
+        runs: list[FlowRun] = []
+        pending: dict[asyncio.Task, Tuple[dict, FlowRun]] = {}
+
+        def start_runs():
+            for input_data in itertools.islice(inputs, max_concurrency - len(pending)):
+                flow_run = FlowRun(flow=self.flow, debug=debug)
+                pending[asyncio.create_task(flow_run._arun(input_data=input_data))] = (input_data, flow_run)
+
+        start = time.perf_counter()
+        start_runs()
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                ended = [pending.pop(task) + (task.exception(),) for task in done]
+                # Refill before yielding so a slow consumer does not hold back the runs in flight
+                start_runs()
+
+                for input_data, flow_run, error in ended:
+                    if error is not None:
+                        logger.warning(f"Flow run of `{self.flow.spec.name}` failed: {error}")
+                        flow_run.status = FlowRunStatus.FAILED
+                        flow_run.error = flow_run.error or str(error)
+                    runs.append(flow_run)
+                    yield (input_data, flow_run)
+        finally:
+            # Stop listening to the runs still in flight when the caller stops early
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.wait(pending)
+
+        stats = FlowBatchStats.from_runs(runs, time.perf_counter() - start)
+        logger.info(f"Flow `{self.flow.spec.name}` batch: {stats}")
+        if on_batch_end_handler:
+            on_batch_end_handler(stats)
+
     def dump_spec(self, file: str) -> None:
         dumped = self.flow.to_json()
         with open(file, 'w') as f:
@@ -1113,17 +1262,26 @@ class Foreach(Flow):
         if (self.spec.item_schema.type == "object"):
             self.spec.item_schema = self._add_schema_ref(self.spec.item_schema, self.spec.item_schema.title)
 
-    def policy(self, kind: ForeachPolicy) -> Self:
+    def policy(self, kind: ForeachPolicy, max_concurrency: int | None = None) -> Self:
         '''
         Sets the policy for the foreach flow.
 
         Args:
             kind (ForeachPolicy): The policy to set.
+            max_concurrency (int, optional): The maximum number of items run at once with the PARALLEL policy.
+                Defaults to None, which runs every item at once.
 
         Returns:
             Self: The current instance of the flow.
         '''
+        if max_concurrency is not None:
+            if kind != ForeachPolicy.PARALLEL:
+                raise ValueError("max_concurrency can only be set with the PARALLEL policy.")
+            if max_concurrency < 1:
+                raise ValueError("max_concurrency must be at least 1.")
+
         self.spec.foreach_policy = kind
+        self.spec.max_concurrency = max_concurrency
         return self
 
     def to_json(self) -> dict[str, Any]:
@@ -1,5 +1,5 @@
 import json
-from typing import Any, cast
+from typing import Any, Callable, cast
 import uuid
 
 import yaml
@@ -57,6 +57,9 @@ class EndNode(Node):
         return cast(EndNodeSpec, self.spec)
     
 class ToolNode(Node):
+    # The python tool the node was created from, so the flow can be run in process
+    _python_tool: Callable | None = None
+
     def __repr__(self):
         return f"ToolNode(name='{self.spec.name}', description='{self.spec.description}')"
 
@@ -601,13 +601,13 @@ class UserFlowSpec(FlowSpec):
 class ForeachPolicy(Enum):
  
     SEQUENTIAL = 1
-    # support only SEQUENTIAL for now
-    # PARALLEL = 2
+    PARALLEL = 2
 
 class ForeachSpec(FlowSpec):
  
     item_schema: JsonSchemaObject | SchemaRef = Field(description="The schema of the items in the list")
     foreach_policy: ForeachPolicy = Field(default=ForeachPolicy.SEQUENTIAL, description="The type of foreach loop")
+    max_concurrency: int | None = Field(default=None, description="The maximum number of items run at once by a PARALLEL foreach, all of them when not set")
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -622,6 +622,8 @@ class ForeachSpec(FlowSpec):
             my_dict["item_schema"] = self.item_schema.model_dump(exclude_defaults=True, exclude_none=True, exclude_unset=True)
 
         my_dict["foreach_policy"] = self.foreach_policy.name
+        if self.foreach_policy == ForeachPolicy.PARALLEL and self.max_concurrency is not None:
+            my_dict["max_concurrency"] = self.max_concurrency
         return my_dict
 
 class TaskData(NamedTuple):
@@ -17,7 +17,7 @@ from ibm_watsonx_orchestrate.agent_builder.tools.openapi_tool import create_open
 from ibm_watsonx_orchestrate.agent_builder.tools.types import JsonSchemaObject, ToolRequestBody, ToolResponseBody
 from ibm_watsonx_orchestrate.cli.commands.connections.connections_controller import add_connection, configure_connection, set_credentials_connection
 from ibm_watsonx_orchestrate.client.connections.utils import get_connections_client
-from ibm_watsonx_orchestrate.client.tools.tempus_client import TempusClient
+from ibm_watsonx_orchestrate.client.tools.tempus_client import AsyncTempusClient
 from ibm_watsonx_orchestrate.client.utils import instantiate_client, is_local_dev
 
 logger = logging.getLogger(__name__)
@@ -138,9 +138,9 @@ async def import_flow_model(model):
     
     flow_id = model["spec"]["name"]
 
-    tempus_client: TempusClient =  instantiate_client(TempusClient)
+    tempus_client: AsyncTempusClient =  instantiate_client(AsyncTempusClient)
 
-    flow_open_api = tempus_client.create_update_flow_model(flow_id=flow_id, model=model)
+    flow_open_api = await tempus_client.create_update_flow_model(flow_id=flow_id, model=model)
 
     logger.info(f"Flow model `{flow_id}` deployed successfully.")
 
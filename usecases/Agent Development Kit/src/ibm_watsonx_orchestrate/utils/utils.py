@@ -2,6 +2,7 @@ import re
 import zipfile
 import yaml
 from typing import BinaryIO
+from weakref import WeakKeyDictionary
 
 # disables the automatic conversion of date-time objects to datetime objects and leaves them as strings
 yaml.constructor.SafeConstructor.yaml_constructors[u'tag:yaml.org,2002:timestamp'] = \
@@ -10,9 +11,41 @@ yaml.constructor.SafeConstructor.yaml_constructors[u'tag:yaml.org,2002:timestamp
 def yaml_safe_load(file : BinaryIO) -> dict:
     return yaml.safe_load(file)
 
+def describe_failure(e: BaseException) -> str:
+    """
+    Returns a one line description of an error raised by a worker, including the sys.exit() of a failed CLI call
+    """
+    if isinstance(e, SystemExit):
+        return f"Exited with status {e.code}"
+    return str(e) or e.__class__.__name__
+
+_SANATIZE_PATTERN = re.compile(r"[^a-zA-Z0-9]+")
+
 def sanatize_app_id(app_id: str) -> str:
-    sanatize_pattern = re.compile(r"[^a-zA-Z0-9]+")
-    return re.sub(sanatize_pattern,'_', app_id)
+    return _SANATIZE_PATTERN.sub('_', app_id)
+
+# Directory prefixes of the entries indexed so far for each open zip file, along with how many entries that covers
+_zip_directories: WeakKeyDictionary = WeakKeyDictionary()
 
 def check_file_in_zip(file_path: str, zip_file: zipfile.ZipFile) -> bool:
-    return any(x.startswith("%s/" % file_path.rstrip("/")) for x in zip_file.namelist())
\ No newline at end of file
+    """
+    Returns True if zip_file has an entry under the directory file_path. Only entries added since the
+    last check are scanned, so repeated checks while writing a zip stay cheap
+    """
+    indexed, directories = _zip_directories.get(zip_file, (0, set()))
+    entries = zip_file.infolist()
+    for entry in entries[indexed:]:
+        parts = entry.filename.split("/")
+        directories.update("/".join(parts[:i]) + "/" for i in range(1, len(parts)))
+    _zip_directories[zip_file] = (len(entries), directories)
+    return "%s/" % file_path.rstrip("/") in directories
+
+def copy_zip_entry(zip_file_in: zipfile.ZipFile, item: zipfile.ZipInfo, zip_file_out: zipfile.ZipFile, arcname: str) -> None:
+    """
+    Copies item from zip_file_in to zip_file_out as arcname, keeping its compression, timestamp and permissions
+    """
+    zip_info = zipfile.ZipInfo(arcname, date_time=item.date_time)
+    zip_info.compress_type = item.compress_type
+    zip_info.external_attr = item.external_attr
+    zip_info.create_system = item.create_system
+    zip_file_out.writestr(zip_info, zip_file_in.read(item))
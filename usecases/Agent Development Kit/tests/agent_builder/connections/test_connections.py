@@ -1,4 +1,4 @@
-from ibm_watsonx_orchestrate.agent_builder.connections.connections import _clean_env_vars, _build_credentials_model, _validate_schema_type, _get_credentials_model, get_application_connection_credentials, get_connection_type
+from ibm_watsonx_orchestrate.agent_builder.connections.connections import _clean_env_vars, _build_credentials_model, _validate_schema_type, _get_credentials_model, get_application_connection_credentials, get_connection_type, connection_type_requirements_mapping, CredentialResolver
 from unittest.mock import patch
 import os
 import pytest
@@ -278,4 +278,93 @@ class TestGetApplicationConnectionCredentials:
             message = f"The requested type '{type(expected_connection).__name__}' does not match the type '{conn_type.value}' for the connection '{app_id}'"
             captured = caplog.text
             assert message in str(e)
-            assert message in captured
\ No newline at end of file
+            assert message in captured
+
+class CountingEnviron(dict):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.scans = 0
+
+    def items(self):
+        self.scans += 1
+        return super().items()
+
+def get_resolver_environ(connection_env_vars):
+    environ = CountingEnviron(connection_env_vars)
+    environ[f"WXO_SECURITY_SCHEMA_{TEST_APP_ID}"] = ConnectionType.BASIC_AUTH.value
+    environ[f"WXO_SECURITY_SCHEMA_{TEST_APP_ID}_kv"] = ConnectionType.KEY_VALUE.value
+    return environ
+
+class TestCredentialResolver:
+    def test_building_credentials_leaves_requirements_untouched(self, connection_env_vars):
+        requirements = {credentials_type: list(reqs) if reqs else reqs for credentials_type, reqs in connection_type_requirements_mapping.items()}
+        resolver = CredentialResolver(get_resolver_environ(connection_env_vars))
+
+        for _ in range(3):
+            _build_credentials_model(BasicAuthCredentials, connection_env_vars, TEST_VAR_PREFIX)
+            resolver.get_credentials(ConnectionType.BASIC_AUTH, TEST_APP_ID)
+            resolver.refresh()
+
+        assert connection_type_requirements_mapping == requirements
+
+    def test_get_credentials(self, connection_env_vars):
+        resolver = CredentialResolver(get_resolver_environ(connection_env_vars))
+
+        assert resolver.get_connection_type(TEST_APP_ID) == ConnectionType.BASIC_AUTH
+        assert resolver.get_credentials(ConnectionType.BASIC_AUTH, TEST_APP_ID) == BasicAuthCredentials(username="Test Username", password="Test Password", url="Test URL")
+        assert resolver.get_credentials(ConnectionType.KEY_VALUE, f"{TEST_APP_ID}_kv") == KeyValueConnectionCredentials({"Foo": "Test Foo", "bar": "Test bar"})
+
+    def test_environment_is_indexed_once(self, connection_env_vars):
+        environ = get_resolver_environ(connection_env_vars)
+        resolver = CredentialResolver(environ)
+
+        for _ in range(10):
+            resolver.get_credentials(ConnectionType.BASIC_AUTH, TEST_APP_ID)
+            resolver.get_credentials(ConnectionType.KEY_VALUE, f"{TEST_APP_ID}_kv")
+
+        assert environ.scans == 1
+
+    def test_returned_credentials_are_copies(self, connection_env_vars):
+        resolver = CredentialResolver(get_resolver_environ(connection_env_vars))
+
+        credentials = resolver.get_credentials(ConnectionType.KEY_VALUE, f"{TEST_APP_ID}_kv")
+        credentials.pop("Foo")
+
+        assert resolver.get_credentials(ConnectionType.KEY_VALUE, f"{TEST_APP_ID}_kv") == KeyValueConnectionCredentials({"Foo": "Test Foo", "bar": "Test bar"})
+
+    def test_refresh(self, connection_env_vars):
+        environ = get_resolver_environ(connection_env_vars)
+        resolver = CredentialResolver(environ)
+        assert resolver.get_credentials(ConnectionType.BASIC_AUTH, TEST_APP_ID).password == "Test Password"
+
+        environ[f"{TEST_VAR_PREFIX}password"] = "New Password"
+        assert resolver.get_credentials(ConnectionType.BASIC_AUTH, TEST_APP_ID).password == "Test Password"
+
+        resolver.refresh()
+
+        assert resolver.get_credentials(ConnectionType.BASIC_AUTH, TEST_APP_ID).password == "New Password"
+
+    def test_failures_are_not_cached(self, connection_env_vars):
+        environ = get_resolver_environ(connection_env_vars)
+        resolver = CredentialResolver(environ)
+
+        with pytest.raises(ValueError):
+            resolver.get_credentials(ConnectionType.BEARER_TOKEN, TEST_APP_ID)
+
+        environ[f"WXO_SECURITY_SCHEMA_{TEST_APP_ID}"] = ConnectionType.BEARER_TOKEN.value
+        resolver.refresh()
+
+        assert resolver.get_credentials(ConnectionType.BEARER_TOKEN, TEST_APP_ID) == BearerTokenAuthCredentials(token="Test Token", url="Test URL")
+
+    def test_credentials_are_built_once(self, connection_env_vars):
+        # A tool that looks its credentials up on every invocation, in a process with a typical environment
+        environ = get_resolver_environ(connection_env_vars)
+        environ.update({f"UNRELATED_VARIABLE_{i}": "value" for i in range(200)})
+        resolver = CredentialResolver(environ)
+
+        with patch("ibm_watsonx_orchestrate.agent_builder.connections.connections.get_application_connection_credentials", wraps=get_application_connection_credentials) as mock_build:
+            for _ in range(2000):
+                assert resolver.get_credentials(ConnectionType.BASIC_AUTH, app_id=TEST_APP_ID).password == "Test Password"
+
+        assert mock_build.call_count == 1
+        assert environ.scans == 1
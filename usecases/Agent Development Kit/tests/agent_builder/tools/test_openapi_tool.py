@@ -844,3 +844,188 @@ async def test_async_spec_with_callback(mocker, snapshot, openapi_async_callback
         assert False, 'should have thrown'
     except RuntimeError as e:
         assert 'only available when deployed' in str(e), 'should show runtime message if called'
+
+
+##################################################################
+##  $ref resolution
+##################################################################
+def make_synthetic_spec(operations: int) -> dict:
+    schemas = {
+        f"Item{i}": {
+            "type": "object",
+            "properties": {"id": {"type": "string"}, "child": {"$ref": f"#/components/schemas/Child{i % 20}"}}
+        }
+        for i in range(operations)
+    }
+    schemas.update({f"Child{i}": {"type": "object", "properties": {"name": {"type": "string"}}} for i in range(20)})
+    paths = {
+        f"/items{i}/{{id}}": {
+            "get": {
+                "operationId": f"get_item_{i}",
+                "description": f"Get item {i}",
+                "parameters": [{"$ref": "#/components/parameters/Id"}],
+                "responses": {"200": {"description": "ok", "content": {"application/json": {"schema": {"$ref": f"#/components/schemas/Item{i}"}}}}}
+            }
+        }
+        for i in range(operations)
+    }
+    return {
+        "openapi": "3.0.3",
+        "info": {},
+        "servers": [{"url": "https://example.com"}],
+        "paths": paths,
+        "components": {
+            "schemas": schemas,
+            "parameters": {"Id": {"name": "id", "in": "path", "required": True, "schema": {"type": "string"}}}
+        }
+    }
+
+
+def test_resolve_openapi_refs_shares_targets():
+    from ibm_watsonx_orchestrate.agent_builder.tools.openapi_tool import resolve_openapi_refs
+
+    resolved = resolve_openapi_refs(make_synthetic_spec(2))
+
+    first = resolved["paths"]["/items0/{id}"]["get"]
+    second = resolved["paths"]["/items1/{id}"]["get"]
+    assert first["parameters"][0] is second["parameters"][0]
+    assert first["responses"]["200"]["content"]["application/json"]["schema"]["properties"]["child"] == \
+        {"type": "object", "properties": {"name": {"type": "string"}}}
+
+
+def test_resolve_openapi_refs_handles_circular_refs():
+    from ibm_watsonx_orchestrate.agent_builder.tools.openapi_tool import resolve_openapi_refs
+
+    spec = {
+        "components": {
+            "schemas": {
+                "Node": {
+                    "type": "object",
+                    "description": "A tree node",
+                    "properties": {"children": {"type": "array", "items": {"$ref": "#/components/schemas/Node"}}}
+                }
+            }
+        },
+        "schema": {"$ref": "#/components/schemas/Node"}
+    }
+
+    resolved = resolve_openapi_refs(spec)
+
+    assert resolved["schema"]["properties"]["children"]["items"] == {"type": "object", "description": "A tree node"}
+
+
+def test_resolve_openapi_refs_invalid_ref():
+    from ibm_watsonx_orchestrate.agent_builder.tools.openapi_tool import resolve_openapi_refs
+
+    with pytest.raises(ValueError) as e:
+        resolve_openapi_refs({"schema": {"$ref": "#/components/schemas/Missing"}})
+    assert "#/components/schemas/Missing" in str(e.value)
+
+
+@pytest.mark.asyncio
+async def test_tools_from_content_with_circular_refs():
+    from ibm_watsonx_orchestrate.agent_builder.tools.openapi_tool import create_openapi_json_tools_from_content
+
+    spec = make_synthetic_spec(1)
+    spec["components"]["schemas"]["Child0"]["properties"]["parent"] = {"$ref": "#/components/schemas/Item0"}
+
+    tools = await create_openapi_json_tools_from_content(spec)
+
+    output_schema = json.loads(tools[0].dumps_spec())["output_schema"]
+    assert output_schema["properties"]["child"]["properties"]["parent"] == {"type": "object"}
+
+
+@pytest.mark.asyncio
+async def test_tools_from_content_do_not_leak_changes_between_operations():
+    from ibm_watsonx_orchestrate.agent_builder.tools.openapi_tool import create_openapi_json_tools_from_content
+
+    spec = make_synthetic_spec(2)
+    spec["components"]["schemas"]["Shared"] = {"type": "string"}
+    for i, name in enumerate(["first", "second"]):
+        spec["paths"][f"/items{i}/{{id}}"]["get"]["parameters"].append({"in": "query", "name": name, "schema": {"$ref": "#/components/schemas/Shared"}})
+
+    tools = await create_openapi_json_tools_from_content(spec)
+
+    assert json.loads(tools[0].dumps_spec())["input_schema"]["properties"]["query_first"]["title"] == "first"
+    assert json.loads(tools[1].dumps_spec())["input_schema"]["properties"]["query_second"]["title"] == "second"
+    assert spec["components"]["schemas"]["Shared"] == {"type": "string"}
+
+
+@pytest.mark.asyncio
+async def test_tools_from_content_resolves_refs_once(mocker):
+    from ibm_watsonx_orchestrate.agent_builder.tools import openapi_tool
+
+    resolve = mocker.spy(openapi_tool, "resolve_openapi_refs")
+
+    # resolving every $ref per operation took around two minutes for a spec this size
+    tools = await openapi_tool.create_openapi_json_tools_from_content(make_synthetic_spec(1000))
+
+    assert len(tools) == 1000
+    assert resolve.call_count == 1
+
+
+def test_operation_filter_matches():
+    from ibm_watsonx_orchestrate.agent_builder.tools import OpenApiOperationFilter
+
+    operation = {"operationId": "get_account", "tags": ["accounts"]}
+
+    assert OpenApiOperationFilter().matches("/accounts/{id}", operation)
+    assert OpenApiOperationFilter(include_tags=["accounts"]).matches("/accounts/{id}", operation)
+    assert OpenApiOperationFilter(include_operation_ids=["get_account"]).matches("/accounts/{id}", operation)
+    assert OpenApiOperationFilter(include_paths=["/accounts/*"]).matches("/accounts/{id}", operation)
+    assert not OpenApiOperationFilter(include_tags=["payments"]).matches("/accounts/{id}", operation)
+    assert not OpenApiOperationFilter(include_paths=["/payments/*"]).matches("/accounts/{id}", operation)
+    assert not OpenApiOperationFilter(include_tags=["accounts"], exclude_operation_ids=["get_account"]).matches("/accounts/{id}", operation)
+    assert not OpenApiOperationFilter(exclude_paths=["/accounts/*"]).matches("/accounts/{id}", operation)
+    assert OpenApiOperationFilter(exclude_tags=["payments"]).matches("/accounts/{id}", {"operationId": "get_account"})
+
+
+@pytest.mark.asyncio
+async def test_tools_from_content_with_operation_filter():
+    from ibm_watsonx_orchestrate.agent_builder.tools import OpenApiOperationFilter
+    from ibm_watsonx_orchestrate.agent_builder.tools.openapi_tool import create_openapi_json_tools_from_content
+
+    spec = make_synthetic_spec(100)
+    for i, http_path in enumerate(spec["paths"].values()):
+        http_path["get"]["tags"] = ["even" if i % 2 == 0 else "odd"]
+
+    operation_filter = OpenApiOperationFilter(
+        include_tags=["even"],
+        include_paths=["/items1/*"],
+        exclude_operation_ids=[f"get_item_{i}" for i in range(30, 100)]
+    )
+    tools = await create_openapi_json_tools_from_content(spec, operation_filter=operation_filter)
+
+    assert [tool.__tool_spec__.name for tool in tools] == ["get_item_0", "get_item_1"] + [f"get_item_{i}" for i in range(2, 30, 2)]
+
+
+@pytest.mark.asyncio
+async def test_tools_from_content_only_resolves_kept_operations(mocker):
+    from ibm_watsonx_orchestrate.agent_builder.tools import OpenApiOperationFilter
+    from ibm_watsonx_orchestrate.agent_builder.tools import openapi_tool
+
+    resolve_ref = mocker.spy(openapi_tool._OpenAPIRefResolver, "_resolve_ref")
+
+    tools = await openapi_tool.create_openapi_json_tools_from_content(
+        make_synthetic_spec(100),
+        operation_filter=OpenApiOperationFilter(include_operation_ids=["get_item_7"])
+    )
+
+    assert [tool.__tool_spec__.name for tool in tools] == ["get_item_7"]
+    assert {call.args[2] for call in resolve_ref.call_args_list} == {
+        "#/components/parameters/Id", "#/components/schemas/Item7", "#/components/schemas/Child7"
+    }
+
+
+def test_resolve_openapi_refs_selected_operations():
+    from ibm_watsonx_orchestrate.agent_builder.tools.openapi_tool import resolve_openapi_refs
+
+    spec = make_synthetic_spec(3)
+    spec["components"]["securitySchemes"] = {"basic": {"type": "http", "scheme": "basic"}}
+
+    resolved = resolve_openapi_refs(spec, operations=[("/items1/{id}", "get")])
+
+    assert list(resolved["paths"]) == ["/items1/{id}"]
+    assert resolved["components"] == {"securitySchemes": {"basic": {"type": "http", "scheme": "basic"}}}
+    assert resolved["servers"] == spec["servers"]
+    assert resolved["paths"]["/items1/{id}"]["get"]["parameters"][0]["name"] == "id"
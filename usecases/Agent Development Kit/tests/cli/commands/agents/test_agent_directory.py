@@ -0,0 +1,146 @@
+import threading
+
+import pytest
+
+from ibm_watsonx_orchestrate.agent_builder.agents import AgentKind
+from ibm_watsonx_orchestrate.cli.commands.agents.agent_directory import AgentDirectory
+
+
+class MockDirectoryClient:
+    def __init__(self, drafts=None, barrier=None):
+        self.drafts = drafts or []
+        self.barrier = barrier
+        self.calls = []
+        self.error = None
+
+    def _record(self, method, arg):
+        self.calls.append((method, arg))
+        if self.error:
+            raise self.error
+        if self.barrier:
+            # Only passes when all three endpoints are queried at the same time
+            self.barrier.wait()
+
+    def get_draft_by_name(self, name):
+        self._record("get_draft_by_name", name)
+        return [draft for draft in self.drafts if draft["name"] == name]
+
+    def get_drafts_by_names(self, names):
+        self._record("get_drafts_by_names", names)
+        return [draft for draft in self.drafts if draft["name"] in names]
+
+    def get_draft_by_id(self, id):
+        self._record("get_draft_by_id", id)
+        return next((draft for draft in self.drafts if draft["id"] == id), "")
+
+    def get_drafts_by_ids(self, ids):
+        self._record("get_drafts_by_ids", ids)
+        return [draft for draft in self.drafts if draft["id"] in ids]
+
+
+def get_directory(barrier=None):
+    native = MockDirectoryClient([{"id": "1", "name": "native_agent"}, {"id": "shared", "name": "native_shared"}], barrier)
+    external = MockDirectoryClient([{"id": "2", "name": "external_agent"}, {"id": "shared", "name": "external_shared"}], barrier)
+    assistant = MockDirectoryClient([{"id": "3", "name": "assistant_agent"}], barrier)
+    return AgentDirectory(native, external, assistant), native, external, assistant
+
+
+class TestAgentDirectory:
+    def test_lookups_fan_out_concurrently(self):
+        directory, native, external, assistant = get_directory(barrier=threading.Barrier(3, timeout=5))
+
+        drafts = directory.get_drafts_by_names(["native_agent", "external_agent", "assistant_agent"])
+
+        assert drafts == {
+            AgentKind.NATIVE: [{"id": "1", "name": "native_agent"}],
+            AgentKind.EXTERNAL: [{"id": "2", "name": "external_agent"}],
+            AgentKind.ASSISTANT: [{"id": "3", "name": "assistant_agent"}],
+        }
+
+    def test_lookups_are_memoised(self):
+        directory, native, external, assistant = get_directory()
+
+        directory.get_drafts_by_ids(["1", "2"])
+        drafts = directory.get_drafts_by_ids(["2", "3"])
+
+        assert drafts[AgentKind.EXTERNAL] == [{"id": "2", "name": "external_agent"}]
+        assert drafts[AgentKind.ASSISTANT] == [{"id": "3", "name": "assistant_agent"}]
+        for client in (native, external, assistant):
+            assert client.calls == [("get_drafts_by_ids", ["1", "2"]), ("get_drafts_by_ids", ["3"])]
+
+        directory.get_drafts_by_name("native_agent")
+        directory.get_drafts_by_name("native_agent")
+        assert native.calls[-1] == ("get_draft_by_name", "native_agent")
+        assert len(native.calls) == 3
+
+    def test_lookups_are_batched(self):
+        directory, native, _, _ = get_directory()
+
+        directory.get_drafts_by_names([f"agent_{i}" for i in range(120)])
+
+        assert [len(names) for _, names in native.calls] == [50, 50, 20]
+
+    def test_get_draft_by_id_prefers_native(self):
+        directory, _, _, _ = get_directory()
+
+        assert directory.get_draft_by_id("shared") == (AgentKind.NATIVE, {"id": "shared", "name": "native_shared"})
+        assert directory.get_draft_by_id("3") == (AgentKind.ASSISTANT, {"id": "3", "name": "assistant_agent"})
+        assert directory.get_draft_by_id("missing") is None
+
+    def test_forget(self):
+        directory, native, _, _ = get_directory()
+
+        assert directory.get_drafts_by_name("new_agent")[AgentKind.NATIVE] == []
+        native.drafts.append({"id": "4", "name": "new_agent"})
+        assert directory.get_drafts_by_name("new_agent")[AgentKind.NATIVE] == []
+
+        directory.forget("new_agent")
+
+        assert directory.get_drafts_by_name("new_agent")[AgentKind.NATIVE] == [{"id": "4", "name": "new_agent"}]
+
+    def test_failed_endpoint_fails_lookup(self):
+        directory, native, external, _ = get_directory()
+        external.error = ConnectionError("external endpoint unavailable")
+
+        with pytest.raises(ConnectionError, match="external endpoint unavailable"):
+            directory.get_drafts_by_name("external_agent")
+        with pytest.raises(ConnectionError, match="external endpoint unavailable"):
+            directory.get_drafts_by_names(["external_agent"])
+
+        # The failed lookups are not memoised, so they are tried again once the endpoint recovers
+        external.error = None
+        assert directory.get_drafts_by_name("external_agent")[AgentKind.EXTERNAL] == [{"id": "2", "name": "external_agent"}]
+        assert directory.get_drafts_by_names(["external_agent"])[AgentKind.EXTERNAL] == [{"id": "2", "name": "external_agent"}]
+        assert len(native.calls) == 4
+
+    def test_failed_endpoint_is_tolerated_when_asked(self, caplog):
+        directory, native, external, _ = get_directory()
+        external.error = ConnectionError("external endpoint unavailable")
+
+        drafts = directory.get_drafts_by_ids(["1", "2"], tolerate_failures=True)
+
+        assert drafts[AgentKind.NATIVE] == [{"id": "1", "name": "native_agent"}]
+        assert drafts[AgentKind.EXTERNAL] == []
+        assert "Failed to look up external agents: external endpoint unavailable" in caplog.text
+
+        external.error = None
+        assert directory.get_drafts_by_ids(["2"])[AgentKind.EXTERNAL] == [{"id": "2", "name": "external_agent"}]
+        assert [ids for _, ids in native.calls] == [["1", "2"], ["2"]]
+
+    def test_executor_is_shared_between_lookups(self):
+        directory, _, _, _ = get_directory()
+
+        directory.get_drafts_by_name("native_agent")
+        executor = directory._executor
+        directory.get_drafts_by_ids(["1"])
+
+        assert directory._executor is executor
+        assert not executor._shutdown
+
+    def test_close_shuts_down_executor(self):
+        directory, _, _, _ = get_directory()
+
+        with directory:
+            directory.get_drafts_by_name("native_agent")
+
+        assert directory._executor._shutdown
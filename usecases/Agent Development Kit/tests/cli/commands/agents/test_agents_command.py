@@ -13,6 +13,12 @@ class TestAgentImport:
             )
             publish_mock.assert_called_once()
     
+    def test_agent_import_plan(self):
+        with patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.AgentsController.import_agent") as import_mock, \
+             patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.AgentsController.publish_or_update_agents") as publish_mock:
+            agents_command.agent_import(file="test.yaml", plan=True)
+            publish_mock.assert_called_once_with(import_mock.return_value, plan=True)
+
     def test_agent_import_no_file(self):
         with patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.AgentsController.import_agent") as import_mock, \
              patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.AgentsController.publish_or_update_agents") as publish_mock:
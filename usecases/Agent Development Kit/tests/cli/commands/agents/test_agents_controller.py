@@ -1,4 +1,6 @@
+import io
 import json
+import zipfile
 from unittest.mock import patch, mock_open, MagicMock
 import pytest
 import uuid
@@ -15,10 +17,12 @@ from ibm_watsonx_orchestrate.cli.commands.agents.agents_controller import (
     parse_create_assistant_args,
     get_conn_id_from_app_id,
     get_app_id_from_conn_id,
-    get_agent_details
+    get_agent_details,
+    diff_agent_specs,
+    format_agent_change
     )
 from ibm_watsonx_orchestrate.agent_builder.agents import AgentKind, AgentStyle, SpecVersion, Agent, ExternalAgent, AssistantAgent, AgentProvider, ExternalAgentAuthScheme
-from ibm_watsonx_orchestrate.client.connections.connections_client import GetConnectionResponse
+from ibm_watsonx_orchestrate.client.connections.connections_client import GetConnectionResponse, ListConfigsResponse
 from ibm_watsonx_orchestrate.agent_builder.agents.types import ExternalAgentConfig, AssistantAgentConfig
 from ibm_watsonx_orchestrate.client.agents.agent_client import AgentClient, AgentUpsertResponse
 from ibm_watsonx_orchestrate.client.agents.external_agent_client import ExternalAgentClient
@@ -454,9 +458,7 @@ class TestGetConnIdFromAppId:
 
     def test_get_conn_id_from_app_id(self):
         mock_connection_client = MockConnectionClient(
-            get_draft_by_app_id_reponse=GetConnectionResponse(
-                connection_id=self.mock_conn_id
-            )
+            list_response=[ListConfigsResponse(app_id=self.mock_app_id, connection_id=self.mock_conn_id)]
         )
         with patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.get_connections_client") as mock_get_connection_client:
             mock_get_connection_client.return_value = mock_connection_client
@@ -484,7 +486,7 @@ class TestGetAppIdFromConnId:
 
     def test_get_app_id_from_conn_id(self):
         mock_connection_client = MockConnectionClient(
-            get_draft_by_id_response=self.mock_app_id
+            list_response=[ListConfigsResponse(app_id=self.mock_app_id, connection_id=self.mock_conn_id)]
         )
         with patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.get_connections_client") as mock_get_connection_client:
             mock_get_connection_client.return_value = mock_connection_client
@@ -610,9 +612,7 @@ class TestAgentsControllerGenerateAgentSpec:
         mock_conn_id = "mock_conn_id"
 
         mock_connection_client = MockConnectionClient(
-            get_draft_by_app_id_reponse=GetConnectionResponse(
-                connection_id=mock_conn_id
-            )
+            list_response=[ListConfigsResponse(app_id=mock_app_id, connection_id=mock_conn_id)]
         )
         with patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.get_connections_client") as mock_get_connection_client:
             mock_get_connection_client.return_value = mock_connection_client
@@ -855,6 +855,131 @@ class TestAgentsControllerPublishOrUpdateAgents:
             update_mock.assert_called_once()
             sys_exit_mock.assert_not_called()
 
+    def test_publish_or_update_failed_lookup_does_not_publish(self, assistant_agent_content):
+        with patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.AgentsController.get_native_client") as native_client_mock, \
+             patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.AgentsController.get_assistant_client") as assistant_client_mock, \
+             patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.AgentsController.get_external_client") as external_client_mock, \
+             patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.AgentsController.publish_agent") as publish_mock, \
+             patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.AgentsController.update_agent") as update_mock:
+
+            native_client_mock.return_value = MagicMock(get_draft_by_name=MagicMock(return_value=[]))
+            external_client_mock.return_value = MagicMock(get_draft_by_name=MagicMock(return_value=[]))
+            assistant_client_mock.return_value = MagicMock(get_draft_by_name=MagicMock(side_effect=requests.HTTPError("503 Server Error")))
+
+            agent = AssistantAgent(**assistant_agent_content)
+
+            # Not being able to tell whether the agent exists must not be taken to mean it does not
+            with AgentsController() as controller, pytest.raises(requests.HTTPError):
+                controller.publish_or_update_agents([agent])
+
+            publish_mock.assert_not_called()
+            update_mock.assert_not_called()
+
+
+class TestAgentsControllerPlanAgents:
+    EXISTING_ID = "52101bd5-3395-47c8-adc8-506f4bd383ea"
+
+    @staticmethod
+    def mock_client(drafts):
+        return MagicMock(return_value=MagicMock(get_draft_by_name=MagicMock(side_effect=lambda name: [d for d in drafts if d["name"] == name])))
+
+    def mock_clients(self, external_drafts):
+        return patch.multiple(
+            "ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.AgentsController",
+            get_native_client=self.mock_client([]),
+            get_external_client=self.mock_client(external_drafts),
+            get_assistant_client=self.mock_client([]),
+            update_agent=MagicMock(),
+            publish_agent=MagicMock(),
+        )
+
+    @patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.get_conn_id_from_app_id")
+    def test_unchanged_agent_is_not_updated(self, mock_get_conn_id, external_agent_content, caplog):
+        mock_get_conn_id.return_value = "mock-connection-id"
+        existing = {**ExternalAgent(**external_agent_content).model_dump(mode="json", exclude_none=True), "id": self.EXISTING_ID, "connection_id": "mock-connection-id"}
+        del existing["app_id"]
+
+        with self.mock_clients(external_drafts=[existing]):
+            controller = AgentsController()
+            controller.publish_or_update_agents([ExternalAgent(**external_agent_content)])
+
+            controller.update_agent.assert_not_called()
+            controller.publish_agent.assert_not_called()
+        assert "Agent 'test_external_agent' is unchanged, skipping" in caplog.text
+
+    @patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.get_conn_id_from_app_id")
+    def test_changed_agent_is_updated(self, mock_get_conn_id, external_agent_content):
+        mock_get_conn_id.return_value = "mock-connection-id"
+        existing = {**external_agent_content, "id": self.EXISTING_ID, "connection_id": "mock-connection-id", "description": "Old description"}
+
+        with self.mock_clients(external_drafts=[existing]):
+            controller = AgentsController()
+            controller.publish_or_update_agents([ExternalAgent(**external_agent_content)])
+
+            controller.update_agent.assert_called_once()
+
+    @patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.get_conn_id_from_app_id")
+    def test_plan_makes_no_changes(self, mock_get_conn_id, external_agent_content, assistant_agent_content, capsys):
+        mock_get_conn_id.return_value = "mock-connection-id"
+        existing = {**external_agent_content, "id": self.EXISTING_ID, "connection_id": "old-connection-id", "tags": ["tag1", "tag3"]}
+
+        with self.mock_clients(external_drafts=[existing]):
+            controller = AgentsController()
+            controller.publish_or_update_agents([ExternalAgent(**external_agent_content), AssistantAgent(**assistant_agent_content)], plan=True)
+
+            controller.update_agent.assert_not_called()
+            controller.publish_agent.assert_not_called()
+
+        output = capsys.readouterr().out
+        assert "Plan: 1 to create, 1 to update, 0 unchanged" in output
+        assert "~ external agent 'test_external_agent'" in output
+        assert "tags: +tag2, -tag3" in output
+        assert "connection_id: old-connection-id -> 123" in output
+        assert "+ assistant agent 'test_assistant_agent'" in output
+
+    def test_plan_resolves_collaborators_planned_earlier(self, capsys):
+        agents = [
+            Agent(name="helper_agent", description="Helps", llm="watsonx/ibm/granite-3-8b-instruct"),
+            Agent(name="lead_agent", description="Leads", llm="watsonx/ibm/granite-3-8b-instruct", collaborators=["helper_agent"]),
+        ]
+
+        with self.mock_clients(external_drafts=[]), \
+            patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.sys.exit") as sys_exit_mock:
+            controller = AgentsController()
+            controller.publish_or_update_agents(agents, plan=True)
+
+            sys_exit_mock.assert_not_called()
+            controller.publish_agent.assert_not_called()
+
+        output = capsys.readouterr().out
+        assert "Plan: 2 to create, 0 to update, 0 unchanged" in output
+        assert "+ native agent 'lead_agent'" in output
+
+
+class TestDiffAgentSpecs:
+    def test_diff_agent_specs(self):
+        existing = {"description": "old", "config": {"hidden": False, "enable_cot": False}, "tools": ["1", "2"], "display_name": "Shown"}
+        desired = {"description": "new", "config": {"hidden": False, "enable_cot": True}, "tools": ["1", "2"]}
+
+        assert diff_agent_specs(existing, desired) == [
+            ("description", "old", "new"),
+            ("config.enable_cot", False, True),
+        ]
+
+    def test_diff_agent_specs_reports_removed_nested_keys(self):
+        existing = {"description": "same", "config": {"hidden": False, "starter_prompts": {"prompts": []}}, "display_name": "Shown"}
+        desired = {"description": "same", "config": {"hidden": False}}
+
+        assert diff_agent_specs(existing, desired) == [
+            ("config.starter_prompts", {"prompts": []}, None),
+        ]
+
+    def test_format_agent_change(self):
+        assert format_agent_change("tools", ["1", "2"], ["2", "3"], names={"3": "new_tool"}) == "tools: +new_tool, -1"
+        assert format_agent_change("tools", ["1", "2"], ["2", "1"]) == "tools: reordered"
+        assert format_agent_change("hidden", None, True) == "hidden: <unset> -> true"
+        assert format_agent_change("instructions", "short", "x" * 100) == f"instructions: short -> {'x' * 57}..."
+
 
 class TestAgentsControllerPublishAgent:
     def test_publish_native_agent(self, native_agent_content, caplog):
@@ -939,10 +1064,11 @@ class TestAgentsControllerUpdateAgent:
             assert f"Assistant Agent '{agent.name}' updated successfully" in captured
 
 class MockConnectionClient:
-    def __init__(self, get_response=[], get_draft_by_id_response=None, get_draft_by_app_id_reponse=None):
+    def __init__(self, get_response=[], get_draft_by_id_response=None, get_draft_by_app_id_reponse=None, list_response=[]):
         self.get_response = get_response
         self.get_draft_by_id_response = get_draft_by_id_response
         self.get_draft_by_app_id_reponse = get_draft_by_app_id_reponse
+        self.list_response = list_response
     
     def get(self):
         return self.get_response
@@ -953,6 +1079,9 @@ class MockConnectionClient:
     def get_draft_by_app_id(self, app_id):
         return self.get_draft_by_app_id_reponse
 
+    def list(self):
+        return self.list_response
+
 class TestListAgents:
     @mock.patch('ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.AgentsController.get_tool_client')
     @mock.patch('ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.AgentsController.get_knowledge_base_client')
@@ -1018,6 +1147,63 @@ class TestListAgents:
         assert mock_get_agent_tool_names.return_value == ['Test Tool'], "Tool names list should be mocked correctly"
         assert get_agent_knowledge_base_names.return_value == ['Test Knowledge Base'], "Knowledge Base names list should be mocked correctly"
 
+    def test_list_agents_resolves_names_in_batches(self):
+        class MockDraftsClient:
+            def __init__(self, drafts):
+                self.drafts = {draft["id"]: draft for draft in drafts}
+                self.calls = []
+
+            def get_drafts_by_ids(self, ids):
+                self.calls.append(ids)
+                return [self.drafts[id] for id in ids if id in self.drafts]
+
+            get_by_ids = get_drafts_by_ids
+
+        agents = [
+            {
+                "id": f"agent_{i}",
+                "name": f"agent_{i}",
+                "description": "test agent",
+                "tools": [f"tool_{(i * 10 + j) % 120}" for j in range(10)],
+                "knowledge_base": [f"kb_{i % 5}"],
+                "collaborators": [f"external_{i % 3}", f"assistant_{i % 2}", "missing_agent"],
+            }
+            for i in range(80)
+        ]
+        native_client = MockDraftsClient([])
+        native_client.get = lambda: agents
+        external_client = MockDraftsClient([{"id": f"external_{i}", "name": f"External {i}"} for i in range(3)])
+        assistant_client = MockDraftsClient([{"id": f"assistant_{i}", "name": f"Assistant {i}"} for i in range(2)])
+        tool_client = MockDraftsClient([{"id": f"tool_{i}", "name": f"Tool {i}"} for i in range(120)])
+        knowledge_base_client = MockDraftsClient([{"id": f"kb_{i}", "name": f"KB {i}"} for i in range(5)])
+
+        ac = AgentsController()
+        ac.native_client = native_client
+        ac.external_client = external_client
+        ac.assistant_client = assistant_client
+        ac.tool_client = tool_client
+        ac.knowledge_base_client = knowledge_base_client
+
+        with patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.rich.print") as print_mock:
+            ac.list_agents(kind=AgentKind.NATIVE)
+
+        assert [len(ids) for ids in tool_client.calls] == [50, 50, 20]
+        assert len(knowledge_base_client.calls) == 1
+        collaborator_ids = ["external_0", "assistant_0", "missing_agent", "external_1", "assistant_1", "external_2"]
+        assert native_client.calls == external_client.calls == assistant_client.calls == [collaborator_ids]
+
+        table = print_mock.call_args[0][0]
+        assert list(table.columns[4].cells)[0] == "External 0, Assistant 0, missing_agent"
+        assert list(table.columns[5].cells)[1] == ", ".join(f"Tool {10 + j}" for j in range(10))
+        assert list(table.columns[6].cells)[7] == "KB 2"
+
+    def test_get_agent_tool_names_falls_back_to_ids(self, caplog):
+        ac = AgentsController()
+        ac.tool_client = MockAgent(return_get_drafts_by_ids=False)
+
+        assert ac.get_agent_tool_names(["tool_1"]) == ["tool_1"]
+        assert "Tool with ID tool_1 not found. Returning Tool ID" in caplog.text
+
 
 class TestRemoveAgent:
     def test_remove_native_agent(self, caplog):
@@ -1217,6 +1403,7 @@ class TestAgentsControllerExportAgent:
 
         with patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.ToolsController") as mock_tools_controller, \
             patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.zipfile.ZipFile") as mock_zipfile, \
+            patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.copy_zip_entry") as mock_copy_zip_entry, \
             patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.get_connections_client") as mock_get_connection_client:
             
             mock_get_connection_client.return_value = mock_connection_client
@@ -1232,6 +1419,9 @@ class TestAgentsControllerExportAgent:
                 kind = kind,
                 output_path = self.mock_zip_file_path
             )
+
+            if kind == AgentKind.NATIVE:
+                mock_copy_zip_entry.assert_called()
         
         captured = caplog.text
 
@@ -1239,6 +1429,46 @@ class TestAgentsControllerExportAgent:
         assert f"Successfully wrote agents and tools to '{self.mock_zip_file_path}'" in captured
         assert f"Skipping {self.mock_kb_name}, knowledge_bases are currently unsupported by export"
 
+    def test_export_agent_into_given_zip_file(self, caplog, native_agent_content):
+        ac = AgentsController()
+        ac.native_client = MockAgent(get_draft_by_name_response=[native_agent_content], return_get_drafts_by_ids=False)
+        ac.external_client = MockAgent(return_get_drafts_by_ids=False)
+        ac.assistant_client = MockAgent()
+        ac.tool_client = MockAgent()
+        ac.knowledge_base_client = MockAgent(fake_agent={"name": self.mock_kb_name})
+
+        mock_connection_client = MockConnectionClient(
+            get_draft_by_id_response="testing"
+        )
+        zip_file_out = MagicMock()
+
+        with patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.ToolsController") as mock_tools_controller, \
+            patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.zipfile.ZipFile") as mock_zipfile, \
+            patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.copy_zip_entry"), \
+            patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.check_file_in_zip", return_value=False), \
+            patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.get_connections_client") as mock_get_connection_client:
+
+            mock_get_connection_client.return_value = mock_connection_client
+            mock_tools_controller.return_value = MagicMock(
+                download_tool=MagicMock(return_value=b"abc")
+                )
+            mock_zipfile().__enter__().infolist.return_value = [MagicMock()]
+
+            ac.export_agent(
+                name = self.mock_agent_name,
+                kind = AgentKind.NATIVE,
+                output_path = self.mock_zip_file_path,
+                zip_file_out = zip_file_out
+            )
+
+            downloaded = [call.args[0] for call in mock_tools_controller.return_value.download_tool.call_args_list]
+
+        # The caller owns the zip file and each tool is only downloaded once
+        zip_file_out.close.assert_not_called()
+        zip_file_out.writestr.assert_called_once()
+        assert len(downloaded) == len(set(downloaded))
+        assert "Successfully wrote agents and tools" not in caplog.text
+
     @pytest.mark.parametrize(
             "kind",
             [
@@ -1393,6 +1623,7 @@ class TestAgentsControllerExportAgent:
         with patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.ToolsController") as mock_tools_controller, \
             patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.zipfile.ZipFile") as mock_zipfile, \
             patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.AgentsController.get_agent_by_id") as mock_get_agent, \
+            patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.copy_zip_entry"), \
             patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.get_connections_client") as mock_get_connection_client:
             
             mock_get_connection_client.return_value = mock_connection_client
@@ -1417,6 +1648,35 @@ class TestAgentsControllerExportAgent:
         assert f"Skipping {self.mock_kb_name}, knowledge_bases are currently unsupported by export"
         assert f"Skipping {native_agent_content.get('collaborators')[0]}, no agent with id {native_agent_content.get('collaborators')[0]} found" in captured
 
+    def test_export_agent_collaborator_closure(self, tmp_path):
+        agent_a = Agent(id="id_a", name="agent_a", description="a", collaborators=["id_b"], tools=["shared_tool", "tool_a"])
+        agent_b = Agent(id="id_b", name="agent_b", description="b", collaborators=["id_a"], tools=["shared_tool"])
+        artifact = io.BytesIO()
+        with zipfile.ZipFile(artifact, "w", zipfile.ZIP_DEFLATED) as artifact_zip:
+            artifact_zip.writestr("tool.py", "def tool(): pass\n")
+            artifact_zip.writestr("bundle-format", "2.0.0\n")
+        output_path = tmp_path / "export.zip"
+
+        ac = AgentsController()
+        with patch.object(AgentsController, "get_agent", return_value=agent_a), \
+            patch.object(AgentsController, "get_agent_by_id", side_effect={"id_a": agent_a, "id_b": agent_b}.get) as mock_get_agent_by_id, \
+            patch.object(AgentsController, "get_spec_file_content", side_effect=lambda agent: agent.model_dump(mode="json", exclude_none=True)), \
+            patch("ibm_watsonx_orchestrate.cli.commands.agents.agents_controller.ToolsController") as mock_tools_controller:
+            mock_tools_controller.return_value.download_tool.return_value = artifact.getvalue()
+
+            ac.export_agent(name="agent_a", kind=AgentKind.NATIVE, output_path=str(output_path))
+
+        mock_get_agent_by_id.assert_called_once_with("id_b")
+        assert sorted(call.args[0] for call in mock_tools_controller.return_value.download_tool.call_args_list) == ["shared_tool", "tool_a"]
+        with zipfile.ZipFile(output_path) as zip_file:
+            assert zip_file.namelist() == [
+                "export/agents/native/agent_a.yaml",
+                "export/agents/native/agent_b.yaml",
+                "export/tools/shared_tool/tool.py",
+                "export/tools/tool_a/tool.py",
+            ]
+            assert zip_file.read("export/tools/tool_a/tool.py") == b"def tool(): pass\n"
+
     def test_export_agent_bad_file_type(self, caplog):
         ac = AgentsController()
 
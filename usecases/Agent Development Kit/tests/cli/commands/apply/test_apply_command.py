@@ -0,0 +1,18 @@
+from unittest.mock import patch
+
+from ibm_watsonx_orchestrate.cli.commands.apply import apply_command
+
+
+def test_apply_call():
+    with patch("ibm_watsonx_orchestrate.cli.commands.apply.apply_command.ApplyController") as mock:
+        apply_command.apply(directory="specs", concurrency=4, dry_run=False)
+
+        mock.assert_called_once_with(directory="specs", concurrency=4)
+        mock.return_value.apply.assert_called_once_with(dry_run=False)
+
+
+def test_apply_call_dry_run():
+    with patch("ibm_watsonx_orchestrate.cli.commands.apply.apply_command.ApplyController") as mock:
+        apply_command.apply(directory="specs", concurrency=8, dry_run=True)
+
+        mock.return_value.apply.assert_called_once_with(dry_run=True)
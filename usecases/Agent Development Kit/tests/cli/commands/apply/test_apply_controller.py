@@ -0,0 +1,273 @@
+import json
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from ibm_watsonx_orchestrate.cli.commands.apply.apply_controller import ApplyController, discover_resources, \
+    plan_levels
+from ibm_watsonx_orchestrate.cli.commands.apply.types import ApplyResource, ResourceKind
+from ibm_watsonx_orchestrate.cli.commands.tools.tools_controller import ToolKind
+
+PYTHON_TOOL = '''
+from ibm_watsonx_orchestrate.agent_builder.tools import tool
+from ibm_watsonx_orchestrate.agent_builder.connections import ExpectedCredentials, ConnectionType
+
+@tool(expected_credentials=[ExpectedCredentials(app_id="crm", type=ConnectionType.API_KEY_AUTH)])
+def lookup_customer(id: str) -> str:
+    return id
+
+@tool(name="renamed_tool")
+def other_tool() -> str:
+    return ""
+'''
+
+PYTHON_FLOW = '''
+from ibm_watsonx_orchestrate.flow_builder.flows import Flow, flow
+
+@flow(name="customer_flow")
+def build_flow(aflow: Flow) -> Flow:
+    lookup = aflow.tool("lookup_customer")
+    review = aflow.agent(name="review", agent="reviewer_agent")
+    return aflow.sequence(lookup, review)
+'''
+
+
+def write_yaml(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(yaml.dump(content))
+
+
+@pytest.fixture
+def spec_directory(tmp_path):
+    write_yaml(tmp_path / "connections" / "crm.yaml", {"spec_version": "v1", "kind": "connection", "app_id": "crm"})
+    (tmp_path / "tools").mkdir()
+    (tmp_path / "tools" / "customer_tools.py").write_text(PYTHON_TOOL)
+    (tmp_path / "tools" / "customer_flow.py").write_text(PYTHON_FLOW)
+    (tmp_path / "tools" / "helpers.py").write_text("def helper():\n    pass\n")
+    (tmp_path / "tools" / "openapi.json").write_text(json.dumps({
+        "openapi": "3.0.0",
+        "paths": {"/orders": {"get": {"operationId": "listOrders"}}},
+    }))
+    write_yaml(tmp_path / "knowledge_bases" / "faq.yaml", {"spec_version": "v1", "kind": "knowledge_base", "name": "faq"})
+    write_yaml(tmp_path / "models" / "model.yaml", {"spec_version": "v1", "name": "virtual-model/openai/gpt-4o", "provider_config": {}})
+    write_yaml(tmp_path / "agents" / "reviewer.yaml", {
+        "spec_version": "v1", "kind": "native", "name": "reviewer_agent", "instructions": "",
+        "llm": "virtual-model/openai/gpt-4o", "knowledge_base": ["faq"],
+    })
+    write_yaml(tmp_path / "agents" / "customer.yaml", {
+        "spec_version": "v1", "kind": "native", "name": "customer_agent", "instructions": "",
+        "tools": ["lookup_customer", "customer_flow", "existing_tool"], "collaborators": ["reviewer_agent"],
+    })
+    write_yaml(tmp_path / ".hidden" / "ignored.yaml", {"spec_version": "v1", "kind": "native", "name": "ignored"})
+    return tmp_path
+
+
+def get_plan(levels):
+    return [sorted((str(resource.kind), name) for resource in level for name in resource.names) for level in levels]
+
+
+class TestDiscoverResources:
+    def test_discover_resources(self, spec_directory):
+        resources = {(resource.kind, tuple(resource.names)): resource for resource in discover_resources(str(spec_directory))}
+
+        assert set(resources) == {
+            (ResourceKind.CONNECTION, ("crm",)),
+            (ResourceKind.TOOL, ("lookup_customer", "renamed_tool")),
+            (ResourceKind.TOOL, ("customer_flow",)),
+            (ResourceKind.TOOL, ("listOrders",)),
+            (ResourceKind.KNOWLEDGE_BASE, ("faq",)),
+            (ResourceKind.MODEL, ("virtual-model/openai/gpt-4o",)),
+            (ResourceKind.AGENT, ("reviewer_agent",)),
+            (ResourceKind.AGENT, ("customer_agent",)),
+        }
+
+        python_tools = resources[(ResourceKind.TOOL, ("lookup_customer", "renamed_tool"))]
+        assert python_tools.tool_kind == ToolKind.python
+        assert python_tools.dependencies == {(ResourceKind.CONNECTION, "crm")}
+
+        flow = resources[(ResourceKind.TOOL, ("customer_flow",))]
+        assert flow.tool_kind == ToolKind.flow
+        assert flow.dependencies == {(ResourceKind.TOOL, "lookup_customer"), (ResourceKind.AGENT, "reviewer_agent")}
+
+        assert resources[(ResourceKind.AGENT, ("reviewer_agent",))].dependencies == {
+            (ResourceKind.MODEL, "virtual-model/openai/gpt-4o"),
+            (ResourceKind.KNOWLEDGE_BASE, "faq"),
+        }
+
+    def test_discover_resources_not_a_directory(self, tmp_path, caplog):
+        with pytest.raises(SystemExit):
+            discover_resources(str(tmp_path / "missing"))
+
+        assert "is not a directory" in caplog.text
+
+    def test_discover_resources_invalid_file(self, tmp_path, caplog):
+        (tmp_path / "broken.py").write_text("def broken(:\n")
+
+        with pytest.raises(SystemExit):
+            discover_resources(str(tmp_path))
+
+        assert "Failed to parse" in caplog.text
+
+
+    def test_compiled_flow_model_is_not_a_second_definition(self, spec_directory):
+        (spec_directory / "generated").mkdir()
+        (spec_directory / "generated" / "customer_flow.json").write_text(json.dumps({
+            "spec": {"kind": "flow", "name": "customer_flow"},
+            "nodes": {"lookup_customer": {"spec": {"kind": "tool", "name": "lookup_customer"}}},
+        }))
+
+        flows = [resource for resource in discover_resources(str(spec_directory)) if resource.tool_kind == ToolKind.flow]
+
+        assert [(resource.names, resource.file) for resource in flows] == [(["customer_flow"], str(spec_directory / "tools" / "customer_flow.py"))]
+
+    def test_openapi_spec_without_version(self, tmp_path):
+        write_yaml(tmp_path / "facts.openapi.yml", {
+            "servers": [{"url": "https://example.com"}],
+            "paths": {"/facts": {"get": {"operationId": "getFact"}}},
+        })
+
+        [resource] = discover_resources(str(tmp_path))
+
+        assert (resource.kind, resource.tool_kind, resource.names) == (ResourceKind.TOOL, ToolKind.openapi, ["getFact"])
+
+
+class TestPlanLevels:
+    def test_plan_levels(self, spec_directory):
+        levels = plan_levels(discover_resources(str(spec_directory)))
+
+        assert get_plan(levels) == [
+            [("connection", "crm"), ("knowledge_base", "faq"), ("model", "virtual-model/openai/gpt-4o"), ("tool", "listOrders")],
+            [("agent", "reviewer_agent"), ("tool", "lookup_customer"), ("tool", "renamed_tool")],
+            [("tool", "customer_flow")],
+            [("agent", "customer_agent")],
+        ]
+
+    def test_plan_levels_duplicate_name(self, caplog):
+        resources = [
+            ApplyResource(kind=ResourceKind.AGENT, file="a.yaml", names=["agent"]),
+            ApplyResource(kind=ResourceKind.AGENT, file="b.yaml", names=["agent"]),
+        ]
+
+        with pytest.raises(SystemExit):
+            plan_levels(resources)
+
+        assert "agent 'agent' is defined in both 'a.yaml' and 'b.yaml'" in caplog.text
+
+    def test_plan_levels_same_name_different_kind(self):
+        resources = [
+            ApplyResource(kind=ResourceKind.AGENT, file="a.yaml", names=["shared"], dependencies={(ResourceKind.TOOL, "shared")}),
+            ApplyResource(kind=ResourceKind.TOOL, file="b.py", names=["shared"]),
+        ]
+
+        assert get_plan(plan_levels(resources)) == [[("tool", "shared")], [("agent", "shared")]]
+
+    def test_plan_levels_cycle(self, caplog):
+        resources = [
+            ApplyResource(kind=ResourceKind.AGENT, file="a.yaml", names=["a"], dependencies={(ResourceKind.AGENT, "b")}),
+            ApplyResource(kind=ResourceKind.AGENT, file="b.yaml", names=["b"], dependencies={(ResourceKind.AGENT, "a")}),
+            ApplyResource(kind=ResourceKind.AGENT, file="c.yaml", names=["c"]),
+        ]
+
+        with pytest.raises(SystemExit):
+            plan_levels(resources)
+
+        assert "Circular dependency detected between: agent a (a.yaml), agent b (b.yaml)" in caplog.text
+
+
+EXAMPLES_DIRECTORY = Path("examples/flow_builder")
+
+
+class TestShippedExamples:
+    @pytest.mark.parametrize("example", sorted(path.name for path in EXAMPLES_DIRECTORY.iterdir() if path.is_dir()))
+    def test_plan_shipped_examples(self, example):
+        resources = discover_resources(str(EXAMPLES_DIRECTORY / example))
+        levels = plan_levels(resources)
+
+        assert sum(len(level) for level in levels) == len(resources)
+        assert not any("/generated/" in resource.file for resource in resources)
+
+    def test_plan_shipped_openapi_example(self):
+        resources = discover_resources(str(EXAMPLES_DIRECTORY / "get_pet_facts"))
+
+        assert sorted(name for resource in resources if resource.tool_kind == ToolKind.openapi for name in resource.names) == ["getCatFact", "getDogFact"]
+        assert get_plan(plan_levels(resources)) == [
+            [("tool", "getCatFact"), ("tool", "getDogFact")],
+            [("tool", "get_pet_facts")],
+            [("agent", "pet_agent")],
+        ]
+
+
+class TestApply:
+    @pytest.fixture(autouse=True)
+    def mock_clients(self):
+        with patch("ibm_watsonx_orchestrate.cli.commands.apply.apply_controller.ToolsController.get_client"), \
+             patch("ibm_watsonx_orchestrate.cli.commands.apply.apply_controller.AgentsController.get_agent_directory"):
+            yield
+
+    def test_apply_deploys_levels_in_order(self, spec_directory):
+        deployed = []
+        lock = threading.Lock()
+
+        def deploy(resource):
+            with lock:
+                deployed.append((str(resource.kind), resource.names[0]))
+
+        controller = ApplyController(directory=str(spec_directory), concurrency=4)
+        with patch.object(controller, "deploy_resource", side_effect=deploy):
+            controller.apply()
+
+        position = {ref: i for i, ref in enumerate(deployed)}
+        assert len(deployed) == 8
+        assert position[("connection", "crm")] < position[("tool", "lookup_customer")]
+        assert position[("tool", "lookup_customer")] < position[("tool", "customer_flow")]
+        assert position[("agent", "reviewer_agent")] < position[("tool", "customer_flow")]
+        assert position[("tool", "customer_flow")] < position[("agent", "customer_agent")]
+
+    def test_apply_runs_each_level_concurrently(self, tmp_path):
+        for name in ["a", "b", "c"]:
+            write_yaml(tmp_path / f"{name}.yaml", {"spec_version": "v1", "kind": "knowledge_base", "name": name})
+        barrier = threading.Barrier(3, timeout=5)
+
+        controller = ApplyController(directory=str(tmp_path), concurrency=3)
+        with patch.object(controller, "deploy_resource", side_effect=lambda resource: barrier.wait()):
+            controller.apply()
+
+    def test_apply_skips_dependents_of_failures(self, spec_directory, capsys, caplog):
+        deployed = []
+
+        def deploy(resource):
+            if resource.names[0] == "reviewer_agent":
+                raise ValueError("Bad agent")
+            deployed.append(resource.names[0])
+
+        controller = ApplyController(directory=str(spec_directory), concurrency=1)
+        with patch.object(controller, "deploy_resource", side_effect=deploy):
+            with pytest.raises(SystemExit):
+                controller.apply()
+
+        assert "customer_flow" not in deployed
+        assert "customer_agent" not in deployed
+        assert "lookup_customer" in deployed
+
+        output = capsys.readouterr().out
+        assert "Bad agent" in output
+        assert "Skipped, depends on failed reviewer_agent" in output
+        assert "Skipped, depends on failed customer_flow" in output
+        assert "Applied 5 of 8 resources" in caplog.text
+
+    def test_apply_dry_run(self, spec_directory, capsys):
+        controller = ApplyController(directory=str(spec_directory))
+        with patch.object(controller, "deploy_resource") as mock_deploy:
+            controller.apply(dry_run=True)
+
+        mock_deploy.assert_not_called()
+        assert "Deployment plan" in capsys.readouterr().out
+
+    def test_apply_empty_directory(self, tmp_path, caplog):
+        with pytest.raises(SystemExit):
+            ApplyController(directory=str(tmp_path)).apply()
+
+        assert "No connection, model, knowledge base, tool or agent specs found" in caplog.text
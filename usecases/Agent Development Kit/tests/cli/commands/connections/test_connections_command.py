@@ -93,6 +93,13 @@ class TestConnectionsImport:
         with patch("ibm_watsonx_orchestrate.cli.commands.connections.connections_command.import_connection") as mock:
             connections_command.import_connection_command(**self.base_params)
             mock.assert_called_once_with(**self.base_params)
+
+    def test_import_connection_command_bulk(self, tmp_path):
+        with patch("ibm_watsonx_orchestrate.cli.commands.connections.connections_command.import_connections_bulk") as mock_bulk, \
+            patch("ibm_watsonx_orchestrate.cli.commands.connections.connections_command.import_connection") as mock:
+            connections_command.import_connection_command(file=str(tmp_path), concurrency=4)
+            mock_bulk.assert_called_once_with(source=str(tmp_path), concurrency=4)
+            mock.assert_not_called()
     
     @pytest.mark.parametrize(
         "missing_param",
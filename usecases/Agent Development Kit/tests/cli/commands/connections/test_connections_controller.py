@@ -1,4 +1,7 @@
+import json
+import threading
 import pytest
+import yaml
 from typer import BadParameter
 import requests
 from unittest.mock import patch, mock_open
@@ -17,6 +20,8 @@ from ibm_watsonx_orchestrate.cli.commands.connections.connections_controller imp
     remove_connection,
     list_connections,
     import_connection,
+    import_connections_bulk,
+    is_bulk_connection_source,
     configure_connection,
     set_credentials_connection,
     set_identity_provider_connection
@@ -754,7 +759,8 @@ class TestAddConnection:
         mock_connection_client = MockConnectionClient(
             expected_application_write={"app_id": app_id}
         )
-        with patch('ibm_watsonx_orchestrate.cli.commands.connections.connections_controller.get_connections_client') as mock_client:
+        with patch('ibm_watsonx_orchestrate.cli.commands.connections.connections_controller.get_connections_client') as mock_client, \
+             patch('ibm_watsonx_orchestrate.cli.commands.connections.connections_controller.invalidate_connections_index') as mock_invalidate:
             mock_client.return_value = mock_connection_client
 
             add_connection(app_id=app_id)
@@ -763,6 +769,7 @@ class TestAddConnection:
 
             assert f"Creating connection '{app_id}'" in captured
             assert f"Successfully created connection '{app_id}'" in captured
+            mock_invalidate.assert_called_once()
     
     def test_add_connetion_http_error(self, connections_spec_content, caplog):
         app_id = connections_spec_content.get("app_id")
@@ -826,7 +833,8 @@ class TestRemoveConnection:
     def test_remove_connetion(self, connections_spec_content, caplog):
         app_id = connections_spec_content.get("app_id")
         mock_connection_client = MockConnectionClient()
-        with patch('ibm_watsonx_orchestrate.cli.commands.connections.connections_controller.get_connections_client') as mock_client:
+        with patch('ibm_watsonx_orchestrate.cli.commands.connections.connections_controller.get_connections_client') as mock_client, \
+             patch('ibm_watsonx_orchestrate.cli.commands.connections.connections_controller.invalidate_connections_index') as mock_invalidate:
             mock_client.return_value = mock_connection_client
 
             remove_connection(app_id=app_id)
@@ -835,6 +843,7 @@ class TestRemoveConnection:
 
             assert f"Removing connection '{app_id}'" in captured
             assert f"Connection '{app_id}' successfully removed" in captured
+            mock_invalidate.assert_called_once()
     
     def test_remove_connetion_http_error(self, connections_spec_content, caplog):
         app_id = connections_spec_content.get("app_id")
@@ -960,6 +969,115 @@ class TestImportConnection:
             mock_file.assert_called_once_with("test.json", "r")
             mock_loader.assert_called_once()
 
+def get_connection_spec(app_id: str) -> dict:
+    return {
+        "spec_version": "v1",
+        "kind": "connection",
+        "app_id": app_id,
+        "environments": {
+            "draft": {"preference": "member", "security_scheme": "basic_auth"},
+            "live": {"preference": "team", "security_scheme": "api_key_auth"}
+        }
+    }
+
+class RecordingConnectionClient(MockConnectionClient):
+    def __init__(self, existing_app_ids=(), barrier=None):
+        super().__init__()
+        self.existing_app_ids = set(existing_app_ids)
+        self.barrier = barrier
+        self.lock = threading.Lock()
+        self.created = []
+        self.configured = []
+
+    def get(self, app_id):
+        if self.barrier:
+            # Only passes when the connections are provisioned at the same time
+            self.barrier.wait()
+        return {"app_id": app_id} if app_id in self.existing_app_ids else None
+
+    def create(self, payload):
+        with self.lock:
+            self.created.append(payload["app_id"])
+
+    def create_config(self, app_id, payload):
+        with self.lock:
+            self.configured.append((app_id, payload["environment"]))
+
+class TestImportConnectionsBulk:
+    @pytest.fixture
+    def spec_dir(self, tmp_path):
+        (tmp_path / "nested").mkdir()
+        with open(tmp_path / "bank.yaml", "w") as f:
+            yaml.safe_dump_all([get_connection_spec("bank_a"), get_connection_spec("bank_b")], f)
+        with open(tmp_path / "nested" / "bank_c.json", "w") as f:
+            json.dump(get_connection_spec("bank_c"), f)
+        (tmp_path / "notes.txt").write_text("not a spec")
+        return tmp_path
+
+    def test_is_bulk_connection_source(self, spec_dir, tmp_path):
+        single = tmp_path / "nested" / "single.yaml"
+        single.write_text(yaml.safe_dump(get_connection_spec("single")))
+
+        assert is_bulk_connection_source(str(spec_dir))
+        assert is_bulk_connection_source(str(spec_dir / "bank.yaml"))
+        assert not is_bulk_connection_source(str(single))
+        assert not is_bulk_connection_source(str(spec_dir / "nested" / "bank_c.json"))
+        assert not is_bulk_connection_source("missing.yaml")
+
+    def test_import_connections_bulk(self, spec_dir, caplog):
+        client = RecordingConnectionClient(existing_app_ids={"bank_b"}, barrier=threading.Barrier(3, timeout=5))
+        with patch('ibm_watsonx_orchestrate.cli.commands.connections.connections_controller.get_connections_client') as mock_client, \
+            patch('ibm_watsonx_orchestrate.cli.commands.connections.connections_controller.is_local_dev') as mock_is_local_dev:
+            mock_client.return_value = client
+            mock_is_local_dev.return_value = False
+
+            import_connections_bulk(str(spec_dir), concurrency=3)
+
+        assert sorted(client.created) == ["bank_a", "bank_c"]
+        assert sorted(client.configured) == [(app_id, env) for app_id in ["bank_a", "bank_b", "bank_c"] for env in ["draft", "live"]]
+        assert "Imported 3 connections from 2 files" in caplog.text
+
+    def test_import_connections_bulk_validates_before_importing(self, spec_dir, caplog):
+        invalid = get_connection_spec("bank_d")
+        invalid.pop("kind")
+        with open(spec_dir / "invalid.yaml", "w") as f:
+            yaml.safe_dump_all([invalid, get_connection_spec("bank_a")], f)
+
+        client = RecordingConnectionClient()
+        with patch('ibm_watsonx_orchestrate.cli.commands.connections.connections_controller.get_connections_client') as mock_client, \
+            patch('ibm_watsonx_orchestrate.cli.commands.connections.connections_controller.is_local_dev') as mock_is_local_dev:
+            mock_client.return_value = client
+            mock_is_local_dev.return_value = False
+
+            with pytest.raises(SystemExit):
+                import_connections_bulk(str(spec_dir))
+
+        assert client.created == []
+        assert client.configured == []
+        assert "Found 2 invalid connection specs, no connections were imported" in caplog.text
+
+    def test_import_connections_bulk_reports_failures(self, spec_dir, caplog):
+        client = RecordingConnectionClient()
+        mock_response = requests.models.Response()
+        mock_response._content = str.encode("Expected Message")
+        failing_create_config = client.create_config
+        def create_config(app_id, payload):
+            if app_id == "bank_b":
+                raise requests.HTTPError(response=mock_response)
+            failing_create_config(app_id, payload)
+        client.create_config = create_config
+
+        with patch('ibm_watsonx_orchestrate.cli.commands.connections.connections_controller.get_connections_client') as mock_client, \
+            patch('ibm_watsonx_orchestrate.cli.commands.connections.connections_controller.is_local_dev') as mock_is_local_dev:
+            mock_client.return_value = client
+            mock_is_local_dev.return_value = False
+
+            with pytest.raises(SystemExit):
+                import_connections_bulk(str(spec_dir))
+
+        assert sorted(client.configured) == [(app_id, env) for app_id in ["bank_a", "bank_c"] for env in ["draft", "live"]]
+        assert "Imported 2 connections from 2 files, 1 failed" in caplog.text
+
 class TestConfigureConnection:
     mock_configure_args = {
         "app_id": "Test App ID",
@@ -1,4 +1,5 @@
 from unittest.mock import patch, MagicMock
+from contextlib import contextmanager
 import re
 import pytest
 from requests import Response
@@ -43,6 +44,10 @@ class MockConfig():
     def delete(self, *args, **kwargs):
         pass
 
+    @contextmanager
+    def batch(self):
+        yield self
+
 class MockConfig2():
     def __init__(self):
         self.config = {}
@@ -67,6 +72,10 @@ class MockConfig2():
     def delete(self, *args, **kwargs):
         pass
 
+    @contextmanager
+    def batch(self):
+        yield self
+
 class MockClient:
     def __init__(self, credentials):
         self.token = tokens["valid_token_w_expiry"]
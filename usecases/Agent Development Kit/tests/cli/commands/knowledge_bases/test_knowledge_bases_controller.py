@@ -2,6 +2,7 @@ from ibm_watsonx_orchestrate.cli.commands.knowledge_bases.knowledge_bases_contro
 from ibm_watsonx_orchestrate.agent_builder.agents import SpecVersion
 from ibm_watsonx_orchestrate.agent_builder.knowledge_bases.knowledge_base import KnowledgeBase
 from ibm_watsonx_orchestrate.agent_builder.knowledge_bases.knowledge_base_requests import KnowledgeBaseUpdateRequest
+from ibm_watsonx_orchestrate.client.connections.connections_client import ListConfigsResponse
 import json
 from unittest.mock import patch, mock_open, Mock
 import pytest
@@ -95,10 +96,11 @@ class MockClient:
             return {"name": name, "id": self.mock_id}
         return []
 class MockConnectionClient:
-    def __init__(self, get_response=[], get_by_id_response=[], get_conn_by_id_response=[]):
+    def __init__(self, get_response=[], get_by_id_response=[], get_conn_by_id_response=[], list_response=[]):
         self.get_by_id_response = get_by_id_response
         self.get_response = get_response
         self.get_conn_by_id_response = get_conn_by_id_response
+        self.list_response = list_response
 
     def get_draft_by_app_id(self, app_id: str):
         return self.get_by_id_response
@@ -109,6 +111,9 @@ class MockConnectionClient:
     def get_draft_by_id(self, conn_id: str):
         return self.get_conn_by_id_response
 
+    def list(self):
+        return self.list_response
+
 class MockConnection:
     def __init__(self, appid, connection_type):
         self.appid = appid
@@ -186,8 +191,8 @@ class TestImportKnowledgeBase:
              patch('ibm_watsonx_orchestrate.cli.commands.knowledge_bases.knowledge_bases_controller.get_connections_client') as conn_client_mock,  \
              patch("ibm_watsonx_orchestrate.agent_builder.knowledge_bases.knowledge_base.KnowledgeBase.from_spec") as from_spec_mock:
             
-            mock_response = MockListConnectionResponse(connection_id="12345")
-            conn_client_mock.return_value = MockConnectionClient(get_by_id_response=mock_response)
+            mock_response = ListConfigsResponse(app_id="my-app-id", connection_id="12345")
+            conn_client_mock.return_value = MockConnectionClient(list_response=[mock_response])
                         
             knowledge_Base = KnowledgeBase(**external_knowledge_base_content)
             from_spec_mock.return_value = knowledge_Base
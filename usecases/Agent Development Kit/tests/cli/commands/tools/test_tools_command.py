@@ -1,6 +1,7 @@
 from ibm_watsonx_orchestrate.cli.commands.tools import tools_command
 from unittest.mock import patch
 
+from ibm_watsonx_orchestrate.agent_builder.tools import OpenApiOperationFilter
 from ibm_watsonx_orchestrate.cli.commands.tools.tools_controller import ToolKind
 
 
@@ -12,7 +13,8 @@ def test_tool_import_call_no_params():
             file=None,
             app_id=None,
             requirements_file=None,
-            package_root=None
+            package_root=None,
+            operation_filter=None
         )
 
 
@@ -24,7 +26,8 @@ def test_tool_import_call_python():
             file="test_file",
             app_id=None,
             requirements_file="tests/cli/resources/python_samples/requirements.txt",
-            package_root=None
+            package_root=None,
+            operation_filter=None
         )
 
 def test_tool_import_call_openapi():
@@ -35,7 +38,8 @@ def test_tool_import_call_openapi():
             file="test_file",
             app_id=None,
             requirements_file=None,
-            package_root=None
+            package_root=None,
+            operation_filter=None
         )
 
 def test_tool_import_call_flow():
@@ -46,7 +50,8 @@ def test_tool_import_call_flow():
             file="test_file",
             app_id=None,
             requirements_file=None,
-            package_root=None
+            package_root=None,
+            operation_filter=None
         )
 
 # def test_tool_import_call_skill():
@@ -110,7 +115,8 @@ def test_tool_import_call_python_with_package_root():
             file="test_file",
             app_id=None,
             requirements_file="tests/cli/resources/python_samples/requirements.txt",
-            package_root="tests/cli/resources/python_samples"
+            package_root="tests/cli/resources/python_samples",
+            operation_filter=None
         )
 
 def test_tool_import_call_python_with_package_root_as_empty_string():
@@ -124,7 +130,8 @@ def test_tool_import_call_python_with_package_root_as_empty_string():
             file="test_file",
             app_id=None,
             requirements_file="tests/cli/resources/python_samples/requirements.txt",
-            package_root=""
+            package_root="",
+            operation_filter=None
         )
 
 def test_tool_import_call_python_with_package_root_as_whitespace():
@@ -138,7 +145,8 @@ def test_tool_import_call_python_with_package_root_as_whitespace():
             file="test_file",
             app_id=None,
             requirements_file="tests/cli/resources/python_samples/requirements.txt",
-            package_root="    "
+            package_root="    ",
+            operation_filter=None
         )
 
 def test_tool_import_call_python_with_package_root_includes_whitespace_at_start_and_end():
@@ -152,7 +160,36 @@ def test_tool_import_call_python_with_package_root_includes_whitespace_at_start_
             file="test_file",
             app_id=None,
             requirements_file="tests/cli/resources/python_samples/requirements.txt",
-            package_root="  tests/cli/resources/python_samples  "
+            package_root="  tests/cli/resources/python_samples  ",
+            operation_filter=None
+        )
+
+def test_tool_import_call_directory():
+    with patch("ibm_watsonx_orchestrate.cli.commands.tools.tools_command.ToolsController.import_tools_bulk") as mock_bulk, \
+            patch("ibm_watsonx_orchestrate.cli.commands.tools.tools_command.ToolsController.import_tool") as mock_import:
+        tools_command.tool_import(kind=ToolKind.python, file="tests/cli/resources/python_samples", concurrency=4)
+
+        mock_import.assert_not_called()
+        mock_bulk.assert_called_once_with(
+            source="tests/cli/resources/python_samples",
+            app_id=None,
+            requirements_file=None,
+            package_root=None,
+            concurrency=4,
+            operation_filter=None
+        )
+
+def test_tool_import_call_glob():
+    with patch("ibm_watsonx_orchestrate.cli.commands.tools.tools_command.ToolsController.import_tools_bulk") as mock_bulk:
+        tools_command.tool_import(kind=ToolKind.openapi, file="tools/*.yaml")
+
+        mock_bulk.assert_called_once_with(
+            source="tools/*.yaml",
+            app_id=None,
+            requirements_file=None,
+            package_root=None,
+            concurrency=8,
+            operation_filter=None
         )
 
 def test_tool_export_call():
@@ -167,4 +204,16 @@ def test_tool_export_call():
         mock.assert_called_once_with(
             name=mock_tool_name,
             output_path=mock_output_file
-        )
\ No newline at end of file
+        )
+
+def test_tool_import_call_openapi_with_operation_filter():
+    with patch("ibm_watsonx_orchestrate.cli.commands.tools.tools_command.ToolsController.import_tool") as mock:
+        tools_command.tool_import(kind="openapi", file="test_file", include_tag=["accounts"], exclude_path=["/internal/*"])
+        mock.assert_called_once_with(
+            kind="openapi",
+            file="test_file",
+            app_id=None,
+            requirements_file=None,
+            package_root=None,
+            operation_filter=OpenApiOperationFilter(include_tags=["accounts"], exclude_paths=["/internal/*"])
+        )
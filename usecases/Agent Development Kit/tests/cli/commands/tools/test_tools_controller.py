@@ -1,15 +1,17 @@
+import io
 import re
+from contextlib import contextmanager
 from typing import Literal
 from unittest import mock
 from unittest.mock import call
 
 from ibm_watsonx_orchestrate.agent_builder.tools.python_tool import PythonTool
 from ibm_watsonx_orchestrate.cli.commands.tools.tools_controller import ToolsController, ToolKind, _get_kind_from_spec
-from ibm_watsonx_orchestrate.agent_builder.tools.types import ToolPermission, ToolSpec
+from ibm_watsonx_orchestrate.agent_builder.tools.types import ToolPermission, ToolSpec, OpenApiOperationFilter
 from ibm_watsonx_orchestrate.agent_builder.tools.openapi_tool import OpenAPITool
 from ibm_watsonx_orchestrate.cli.commands.tools.types import RegistryType
 from ibm_watsonx_orchestrate.cli.config import DEFAULT_CONFIG_FILE_CONTENT, PYTHON_REGISTRY_HEADER, \
-    PYTHON_REGISTRY_TYPE_OPT
+    PYTHON_REGISTRY_TYPE_OPT, CONTEXT_SECTION_HEADER, CONTEXT_ACTIVE_ENV_OPT, PUBLISHED_TOOLS_SECTION_HEADER
 from ibm_watsonx_orchestrate.client.tools.tool_client import ToolClient
 from ibm_watsonx_orchestrate.client.connections.connections_client import ListConfigsResponse
 from typer import BadParameter
@@ -18,6 +20,7 @@ import pytest
 import uuid
 import tempfile
 import os
+import zipfile
 import sys
 from pathlib import Path
 
@@ -41,6 +44,13 @@ def get_file_lines(file_path: str):
     return lines
 
 
+def assert_zip_entries_written(mock_zipfile, arcnames: list[str]):
+    writestr_calls = mock_zipfile.return_value.__enter__.return_value.writestr.call_args_list
+    written = [c.args[0].filename if isinstance(c.args[0], zipfile.ZipInfo) else c.args[0] for c in writestr_calls]
+    for arcname in arcnames:
+        assert arcname in written
+
+
 class MockConfig2():
     def __init__(self):
         self.config = {}
@@ -65,6 +75,10 @@ class MockConfig2():
     def delete(self, *args, **kwargs):
         pass
 
+    @contextmanager
+    def batch(self):
+        yield self
+
 
 class MockSDKResponse:
     def __init__(self, response_obj):
@@ -182,7 +196,7 @@ def test_openapi_params_valid():
 
     client = MockConnectionClient(
         get_by_id_response=MockListConnectionResponse(connection_id='connectionId'),
-        list_conn_response=[]
+        list_conn_response=[ListConfigsResponse(app_id='appId', connection_id='connectionId')]
         )
     with mock.patch(
         'ibm_watsonx_orchestrate.cli.commands.tools.tools_controller.create_openapi_json_tools_from_uri',
@@ -202,7 +216,7 @@ def test_openapi_params_valid():
         assert calls == [
             (
                 ('../resources/yaml_samples/tool.yaml', 'connectionId'),
-                {}
+                {'operation_filter': None}
             )
         ]
 
@@ -279,7 +293,7 @@ def test_openapi_no_app_id():
         assert calls == [
             (
                 ('tests/cli/resources/yaml_samples/tool.yaml', None),
-                {}
+                {'operation_filter': None}
             )
         ]
 
@@ -318,6 +332,11 @@ def test_openapi_no_file():
         tools = tools_controller.import_tool(ToolKind.openapi, file=None)
         list(tools)
 
+def test_operation_filter_requires_openapi():
+    with pytest.raises(BadParameter):
+        tools_controller = ToolsController()
+        list(tools_controller.import_tool(ToolKind.python, file="tests/cli/resources/python_samples/base_tool.py", operation_filter=OpenApiOperationFilter(include_tags=["accounts"])))
+
 def test_python_file_is_dir():
     with pytest.raises(BadParameter) as ex:
         tools_controller = ToolsController()
@@ -647,7 +666,8 @@ def test_python_params_valid_with_app_ids():
         mock_response = MockListConnectionResponse(connection_id="12345")
         mock_client.return_value = MockConnectionClient(
             get_by_id_response=mock_response,
-            get_response=mock_response
+            get_response=mock_response,
+            list_conn_response=[ListConfigsResponse(app_id="test", connection_id="12345")]
         )
 
         tools_controller = ToolsController()
@@ -671,7 +691,8 @@ def test_python_params_valid_with_split_app_id():
         mock_response = MockListConnectionResponse(connection_id="12345")
         mock_client.return_value = MockConnectionClient(
             get_by_id_response=mock_response,
-            get_response=mock_response
+            get_response=mock_response,
+            list_conn_response=[ListConfigsResponse(app_id="test=123", connection_id="12345")]
             )
 
         tools_controller = ToolsController()
@@ -850,7 +871,7 @@ def test_publish_python():
             file_path="artifacts.zip"
         )
 
-        tools_controller = ToolsController(ToolKind.python, "test_tool.py",
+        tools_controller = ToolsController(ToolKind.python, "tests/cli/resources/python_samples/base_tool.py",
                                            'tests/cli/resources/python_samples/requirements.txt')
         tools_controller.publish_or_update_tools(tools)
 
@@ -1015,22 +1036,262 @@ def test_single_publish_python_with_package_root_and_reqs_file():
         mock_zipfile.assert_called
         mock_zipfile.write.assert_called
 
-        published_artifact_dir = Path(mock_instantiate_client.return_value.published_file_path).parent
-
-        mock_zipfile.return_value.__enter__.return_value.write.assert_has_calls(
+        assert_zip_entries_written(
+            mock_zipfile,
             [
-                call(Path(tool_file), arcname=tool_filename),
-                call(published_artifact_dir.joinpath("requirements.txt"), arcname="requirements.txt")
-            ],
-            any_order=True
+            "requirements.txt",
+            "bundle-format"
+            ]
         )
 
-        mock_zipfile.return_value.__enter__.return_value.writestr.assert_has_calls(
-            [
-                call("bundle-format", "2.0.0\n")
-            ],
-            any_order=True
-        )
+def test_publish_python_package_builds_artifact_once():
+    package_root = "tests/cli/resources/python_multi_file_samples"
+    tool_file = "tests/cli/resources/python_multi_file_samples/testtool2_single_file/testtool2.py"
+    tool_names = ["tool_a", "tool_b", "tool_c"]
+
+    class RecordingToolClient(MockToolClient):
+        def __init__(self):
+            super().__init__(expected={}, file_path="artifacts.zip")
+            self.artifacts = {}
+
+        def upload_tools_artifact(self, tool_id: str, file_path: str):
+            with zipfile.ZipFile(file_path, "r") as zip_file:
+                self.artifacts[tool_id] = {name: zip_file.read(name) for name in zip_file.namelist()}
+
+    client = RecordingToolClient()
+    tools = [
+        PythonTool(fn=f"testtool2_single_file.testtool2:{name}", spec=ToolSpec(
+            name=name,
+            description=name,
+            permission=ToolPermission.READ_ONLY,
+            binding={"python": {"function": f"testtool2_single_file.testtool2:{name}"}}
+        ))
+        for name in tool_names
+    ]
+
+    with mock.patch("ibm_watsonx_orchestrate.cli.commands.tools.tools_controller.instantiate_client", return_value=client), \
+            mock.patch("ibm_watsonx_orchestrate.cli.commands.tools.tools_controller.Config") as mock_cfg, \
+            mock.patch("ibm_watsonx_orchestrate.cli.commands.tools.tools_controller.get_whl_in_registry", return_value="ibm_watsonx_orchestrate.whl") as mock_get_whl, \
+            mock.patch.object(ToolsController, "_build_python_package_artifact", autospec=True, side_effect=ToolsController._build_python_package_artifact) as mock_build:
+        cfg = MockConfig2()
+        cfg.save(DEFAULT_CONFIG_FILE_CONTENT)
+        cfg.write(PYTHON_REGISTRY_HEADER, PYTHON_REGISTRY_TYPE_OPT, RegistryType.PYPI)
+        mock_cfg.return_value = cfg
+
+        tools_controller = ToolsController(ToolKind.python, file=tool_file)
+        with mock.patch.object(client, "create", side_effect=[{"id": name} for name in tool_names]):
+            tools_controller.publish_or_update_tools(tools, package_root=package_root)
+
+    mock_build.assert_called_once()
+    mock_get_whl.assert_called_once()
+    assert sorted(client.artifacts) == tool_names
+    for name, artifact in client.artifacts.items():
+        assert json.loads(artifact["tool-spec.json"])["name"] == name
+        assert "testtool2_single_file/testtool2.py" in artifact
+        assert artifact["bundle-format"] == b"2.0.0\n"
+        assert b"ibm-watsonx-orchestrate==" in artifact["requirements.txt"]
+
+def test_python_package_artifact_is_deterministic(tmp_path):
+    package_root = tmp_path / "my_package"
+    (package_root / "lib").mkdir(parents=True)
+    (package_root / "my_tool.py").write_text("print('tool')\n")
+    (package_root / "lib" / "helper.py").write_text("print('helper')\n")
+
+    tools_controller = ToolsController(ToolKind.python, file=str(package_root / "my_tool.py"))
+    first = tools_controller._build_python_package_artifact(str(package_root))
+
+    os.utime(package_root / "lib" / "helper.py", (0, 0))
+    os.chmod(package_root / "my_tool.py", 0o755)
+    second = tools_controller._build_python_package_artifact(str(package_root))
+
+    assert first == second
+    with zipfile.ZipFile(io.BytesIO(first)) as zip_file:
+        assert zip_file.namelist() == ["lib/helper.py", "my_tool.py"]
+
+    (package_root / "my_tool.py").write_text("print('changed')\n")
+    assert tools_controller._build_python_package_artifact(str(package_root)) != first
+
+
+def test_publish_skips_unchanged_tools():
+    tool_file = "tests/cli/resources/python_multi_file_samples/testtool2_single_file/testtool2.py"
+
+    def get_tool(description):
+        return PythonTool(fn="testtool2:my_tool", spec=ToolSpec(
+            name="testtool2",
+            description=description,
+            permission=ToolPermission.READ_ONLY,
+            binding={"python": {"function": "testtool2:my_tool"}}
+        ))
+
+    client = MockToolClient(expected={}, file_path="artifacts.zip", get_draft_by_name_response=[{"name": "testtool2", "id": "123"}])
+
+    with mock.patch("ibm_watsonx_orchestrate.cli.commands.tools.tools_controller.instantiate_client", return_value=client), \
+            mock.patch("ibm_watsonx_orchestrate.cli.commands.tools.tools_controller.Config") as mock_cfg, \
+            mock.patch.object(client, "update", wraps=client.update) as mock_update, \
+            mock.patch.object(client, "upload_tools_artifact", wraps=client.upload_tools_artifact) as mock_upload:
+        cfg = MockConfig2()
+        cfg.save(DEFAULT_CONFIG_FILE_CONTENT)
+        cfg.write(PYTHON_REGISTRY_HEADER, PYTHON_REGISTRY_TYPE_OPT, RegistryType.LOCAL)
+        cfg.write(CONTEXT_SECTION_HEADER, CONTEXT_ACTIVE_ENV_OPT, "test_env")
+        mock_cfg.return_value = cfg
+
+        ToolsController(ToolKind.python, file=tool_file).publish_or_update_tools([get_tool("first")])
+        ToolsController(ToolKind.python, file=tool_file).publish_or_update_tools([get_tool("first")])
+
+        assert mock_update.call_count == 1
+        assert mock_upload.call_count == 1
+
+        ToolsController(ToolKind.python, file=tool_file).publish_or_update_tools([get_tool("second")])
+
+        assert mock_update.call_count == 2
+        assert mock_upload.call_count == 2
+
+def write_bulk_tool_file(folder: Path, name: str, tool_names: list[str]) -> Path:
+    folder.mkdir(parents=True, exist_ok=True)
+    lines = ["from ibm_watsonx_orchestrate.agent_builder.tools import tool\n"]
+    for tool_name in tool_names:
+        lines.append(f"@tool(name='{tool_name}', description='{tool_name}')\ndef {tool_name}(input: str) -> str:\n    return input\n")
+    file = folder / f"{name}.py"
+    file.write_text("\n".join(lines))
+    return file
+
+
+def test_discover_tool_files(tmp_path):
+    write_bulk_tool_file(tmp_path, "tool_a", ["tool_a"])
+    write_bulk_tool_file(tmp_path / "nested", "tool_b", ["tool_b"])
+    (tmp_path / "__init__.py").write_text("")
+    (tmp_path / "spec.yaml").write_text("")
+
+    from ibm_watsonx_orchestrate.cli.commands.tools.tools_controller import discover_tool_files, is_bulk_tool_source
+
+    assert discover_tool_files(ToolKind.python, str(tmp_path)) == [str(tmp_path / "nested" / "tool_b.py"), str(tmp_path / "tool_a.py")]
+    assert discover_tool_files(ToolKind.openapi, str(tmp_path)) == [str(tmp_path / "spec.yaml")]
+    assert discover_tool_files(ToolKind.python, str(tmp_path / "*.py")) == [str(tmp_path / "tool_a.py")]
+    assert is_bulk_tool_source(str(tmp_path))
+    assert is_bulk_tool_source("tools/**/*.py")
+    assert not is_bulk_tool_source(str(tmp_path / "tool_a.py"))
+
+
+def test_import_tools_bulk(tmp_path):
+    write_bulk_tool_file(tmp_path / "first", "bulk_tools", ["bulk_tool_a", "bulk_tool_b"])
+    write_bulk_tool_file(tmp_path / "second", "bulk_tools", ["bulk_tool_c"])
+    (tmp_path / "broken.py").write_text("raise RuntimeError('broken module')\n")
+
+    class BulkToolClient(MockToolClient):
+        def __init__(self):
+            super().__init__(expected={}, file_path="artifacts.zip")
+            self.lookups = []
+            self.created = []
+            self.updated = []
+
+        def get_drafts_by_names(self, tool_names):
+            self.lookups.append(list(tool_names))
+            return [{"name": "bulk_tool_b", "id": "existing_b"}]
+
+        def create(self, spec):
+            self.created.append(spec["name"])
+            return {"id": spec["name"]}
+
+        def update(self, tool_id, spec):
+            self.updated.append(tool_id)
+
+    client = BulkToolClient()
+
+    with mock.patch("ibm_watsonx_orchestrate.cli.commands.tools.tools_controller.instantiate_client", return_value=client), \
+            mock.patch("ibm_watsonx_orchestrate.cli.commands.tools.tools_controller.Config") as mock_cfg, \
+            mock.patch("ibm_watsonx_orchestrate.cli.commands.tools.tools_controller.rich.print") as mock_print:
+        cfg = MockConfig2()
+        cfg.save(DEFAULT_CONFIG_FILE_CONTENT)
+        cfg.write(PYTHON_REGISTRY_HEADER, PYTHON_REGISTRY_TYPE_OPT, RegistryType.LOCAL)
+        cfg.write(CONTEXT_SECTION_HEADER, CONTEXT_ACTIVE_ENV_OPT, "test_env")
+        mock_cfg.return_value = cfg
+
+        with mock.patch.object(cfg, "write", wraps=cfg.write) as mock_write, pytest.raises(SystemExit):
+            ToolsController(ToolKind.python).import_tools_bulk(str(tmp_path), concurrency=2)
+
+    assert client.lookups == [["bulk_tool_a", "bulk_tool_b", "bulk_tool_c"]]
+    assert sorted(client.created) == ["bulk_tool_a", "bulk_tool_c"]
+    assert client.updated == ["existing_b"]
+    # The hashes of every published tool are saved together once the workers are done
+    mock_write.assert_called_once()
+    assert sorted(cfg.read(PUBLISHED_TOOLS_SECTION_HEADER, "test_env")) == ["bulk_tool_a", "bulk_tool_c", "existing_b"]
+
+    failures_table = mock_print.call_args.args[0]
+    assert failures_table.row_count == 1
+    assert list(failures_table.columns[0].cells) == [str(tmp_path / "broken.py")]
+    assert "broken module" in list(failures_table.columns[1].cells)[0]
+
+
+def test_import_tools_bulk_with_package_root_builds_artifact_once(tmp_path):
+    package_root = tmp_path / "bulk_package"
+    for name in ["bulk_pkg_tool_a", "bulk_pkg_tool_b", "bulk_pkg_tool_c"]:
+        write_bulk_tool_file(package_root, name, [name])
+
+    class RecordingToolClient(MockToolClient):
+        def __init__(self):
+            super().__init__(expected={}, file_path="artifacts.zip")
+            self.artifacts = {}
+
+        def get_drafts_by_names(self, tool_names):
+            return []
+
+        def create(self, spec):
+            return {"id": spec["name"]}
+
+        def upload_tools_artifact(self, tool_id: str, file_path: str):
+            with zipfile.ZipFile(file_path, "r") as zip_file:
+                self.artifacts[tool_id] = zip_file.namelist()
+
+    client = RecordingToolClient()
+
+    with mock.patch("ibm_watsonx_orchestrate.cli.commands.tools.tools_controller.instantiate_client", return_value=client), \
+            mock.patch("ibm_watsonx_orchestrate.cli.commands.tools.tools_controller.Config") as mock_cfg, \
+            mock.patch.object(ToolsController, "_build_python_package_artifact", autospec=True, side_effect=ToolsController._build_python_package_artifact) as mock_build, \
+            mock.patch.object(ToolsController, "_build_python_requirements", autospec=True, side_effect=ToolsController._build_python_requirements) as mock_requirements:
+        cfg = MockConfig2()
+        cfg.save(DEFAULT_CONFIG_FILE_CONTENT)
+        cfg.write(PYTHON_REGISTRY_HEADER, PYTHON_REGISTRY_TYPE_OPT, RegistryType.LOCAL)
+        mock_cfg.return_value = cfg
+
+        ToolsController(ToolKind.python).import_tools_bulk(str(package_root), package_root=str(package_root), concurrency=3)
+
+    for name in ["bulk_pkg_tool_a", "bulk_pkg_tool_b", "bulk_pkg_tool_c"]:
+        drop_module(f"bulk_package.{name}")
+
+    # Every file of the package shares the same zip and requirements
+    mock_build.assert_called_once()
+    mock_requirements.assert_called_once()
+    assert sorted(client.artifacts) == ["bulk_pkg_tool_a", "bulk_pkg_tool_b", "bulk_pkg_tool_c"]
+    for entries in client.artifacts.values():
+        assert {"bulk_pkg_tool_a.py", "bulk_pkg_tool_b.py", "bulk_pkg_tool_c.py", "tool-spec.json"} <= set(entries)
+
+
+def test_load_tool_module_keeps_same_named_files_apart(tmp_path):
+    first = write_bulk_tool_file(tmp_path / "first", "same_name_tools", ["same_name_tool_a"])
+    second = write_bulk_tool_file(tmp_path / "second", "same_name_tools", ["same_name_tool_b"])
+
+    from ibm_watsonx_orchestrate.cli.commands.tools.tools_controller import load_tool_module
+
+    with mock.patch.dict(sys.modules, {"same_name_tools": "unrelated module"}):
+        first_module = load_tool_module(first)
+        second_module = load_tool_module(second)
+
+        assert sys.modules["same_name_tools"] == "unrelated module"
+        assert first_module.__name__ != second_module.__name__
+        assert hasattr(first_module, "same_name_tool_a") and not hasattr(first_module, "same_name_tool_b")
+        assert hasattr(second_module, "same_name_tool_b") and not hasattr(second_module, "same_name_tool_a")
+        assert load_tool_module(first).__name__ == first_module.__name__
+
+
+def test_get_existing_tools_by_names_batches_lookups():
+    client = MockToolClient()
+    with mock.patch.object(client, "get_drafts_by_names", side_effect=lambda names: [{"name": name, "id": name} for name in names]) as mock_lookup:
+        tools_controller = ToolsController()
+        tools_controller.client = client
+        existing = tools_controller.get_existing_tools_by_names([f"tool_{i}" for i in range(120)])
+
+    assert mock_lookup.call_count == 3
+    assert existing["tool_119"] == [{"name": "tool_119", "id": "tool_119"}]
 
 def test_single_publish_python_with_reqs_file_no_package_root():
     package_root = None
@@ -1079,21 +1340,12 @@ def test_single_publish_python_with_reqs_file_no_package_root():
         mock_zipfile.assert_called
         mock_zipfile.write.assert_called
 
-        published_artifact_dir = Path(mock_instantiate_client.return_value.published_file_path).parent
-
-        mock_zipfile.return_value.__enter__.return_value.write.assert_has_calls(
-            [
-                call(Path(tool_file), arcname=tool_filename),
-                call(published_artifact_dir.joinpath("requirements.txt"), arcname="requirements.txt")
-            ],
-            any_order=True
-        )
-
-        mock_zipfile.return_value.__enter__.return_value.writestr.assert_has_calls(
+        assert_zip_entries_written(
+            mock_zipfile,
             [
-                call("bundle-format", "2.0.0\n")
-            ],
-            any_order=True
+            "requirements.txt",
+            "bundle-format"
+            ]
         )
 
 def test_single_publish_python_with_no_reqs_file_no_package_root():
@@ -1143,21 +1395,12 @@ def test_single_publish_python_with_no_reqs_file_no_package_root():
         mock_zipfile.assert_called
         mock_zipfile.write.assert_called
 
-        published_artifact_dir = Path(mock_instantiate_client.return_value.published_file_path).parent
-
-        mock_zipfile.return_value.__enter__.return_value.write.assert_has_calls(
+        assert_zip_entries_written(
+            mock_zipfile,
             [
-                call(Path(tool_file), arcname=tool_filename),
-                call(published_artifact_dir.joinpath("requirements.txt"), arcname="requirements.txt")
-            ],
-            any_order=True
-        )
-
-        mock_zipfile.return_value.__enter__.return_value.writestr.assert_has_calls(
-            [
-                call("bundle-format", "2.0.0\n")
-            ],
-            any_order=True
+            "requirements.txt",
+            "bundle-format"
+            ]
         )
 
 def test_single_publish_python_with_package_root_and_no_reqs_file():
@@ -1207,21 +1450,13 @@ def test_single_publish_python_with_package_root_and_no_reqs_file():
         mock_zipfile.assert_called
         mock_zipfile.write.assert_called
 
-        published_artifact_dir = Path(mock_instantiate_client.return_value.published_file_path).parent
-
-        mock_zipfile.return_value.__enter__.return_value.write.assert_has_calls(
-            [
-                call(tool_file, arcname="testtool2_single_file/testtool2.py"),
-                call(published_artifact_dir.joinpath("requirements.txt"), arcname="requirements.txt")
-            ],
-            any_order=True
-        )
-
-        mock_zipfile.return_value.__enter__.return_value.writestr.assert_has_calls(
+        assert_zip_entries_written(
+            mock_zipfile,
             [
-                call("bundle-format", "2.0.0\n")
-            ],
-            any_order=True
+            "testtool2_single_file/testtool2.py",
+            "requirements.txt",
+            "bundle-format"
+            ]
         )
 
 def test_single_publish_python_with_package_root_and_reqs_file():
@@ -1271,21 +1506,13 @@ def test_single_publish_python_with_package_root_and_reqs_file():
         mock_zipfile.assert_called
         mock_zipfile.write.assert_called
 
-        published_artifact_dir = Path(mock_instantiate_client.return_value.published_file_path).parent
-
-        mock_zipfile.return_value.__enter__.return_value.write.assert_has_calls(
+        assert_zip_entries_written(
+            mock_zipfile,
             [
-                call(tool_file, arcname="testtool2_single_file/testtool2.py"),
-                call(published_artifact_dir.joinpath("requirements.txt"), arcname="requirements.txt")
-            ],
-            any_order=True
-        )
-
-        mock_zipfile.return_value.__enter__.return_value.writestr.assert_has_calls(
-            [
-                call("bundle-format", "2.0.0\n")
-            ],
-            any_order=True
+            "testtool2_single_file/testtool2.py",
+            "requirements.txt",
+            "bundle-format"
+            ]
         )
 
 def test_multifile_publish_python_with_package_root_and_reqs_file():
@@ -1336,23 +1563,15 @@ def test_multifile_publish_python_with_package_root_and_reqs_file():
         mock_zipfile.assert_called
         mock_zipfile.write.assert_called
 
-        published_artifact_dir = Path(mock_instantiate_client.return_value.published_file_path).parent
-
-        mock_zipfile.return_value.__enter__.return_value.write.assert_has_calls(
+        assert_zip_entries_written(
+            mock_zipfile,
             [
-                call(tool_file, arcname="testtool1/testtool1.py"),
-                call(os.path.join(tool_file_dir, "libref/sidemod.py"), arcname="testtool1/libref/sidemod.py"),
-                call(os.path.join(tool_file_dir, "__init__.py"), arcname="testtool1/__init__.py"),
-                call(published_artifact_dir.joinpath("requirements.txt"), arcname="requirements.txt")
-            ],
-            any_order=True
-        )
-
-        mock_zipfile.return_value.__enter__.return_value.writestr.assert_has_calls(
-            [
-                call("bundle-format", "2.0.0\n")
-            ],
-            any_order=True
+            "testtool1/testtool1.py",
+            "testtool1/libref/sidemod.py",
+            "testtool1/__init__.py",
+            "requirements.txt",
+            "bundle-format"
+            ]
         )
 
 def test_multifile_publish_python_with_no_package_root_and_reqs_file():
@@ -1403,21 +1622,13 @@ def test_multifile_publish_python_with_no_package_root_and_reqs_file():
         mock_zipfile.assert_called
         mock_zipfile.write.assert_called
 
-        published_artifact_dir = Path(mock_instantiate_client.return_value.published_file_path).parent
-
-        mock_zipfile.return_value.__enter__.return_value.write.assert_has_calls(
-            [
-                call(Path(tool_file), arcname="testtool1.py"),
-                call(published_artifact_dir.joinpath("requirements.txt"), arcname="requirements.txt")
-            ],
-            any_order=True
-        )
-
-        mock_zipfile.return_value.__enter__.return_value.writestr.assert_has_calls(
+        assert_zip_entries_written(
+            mock_zipfile,
             [
-                call("bundle-format", "2.0.0\n")
-            ],
-            any_order=True
+            "testtool1.py",
+            "requirements.txt",
+            "bundle-format"
+            ]
         )
 
 def test_multifile_publish_python_with_package_root_and_reqs_file2():
@@ -1468,23 +1679,15 @@ def test_multifile_publish_python_with_package_root_and_reqs_file2():
         mock_zipfile.assert_called
         mock_zipfile.write.assert_called
 
-        published_artifact_dir = Path(mock_instantiate_client.return_value.published_file_path).parent
-
-        mock_zipfile.return_value.__enter__.return_value.write.assert_has_calls(
-            [
-                call(tool_file, arcname="testtool1.py"),
-                call(os.path.join(tool_file_dir, "libref/sidemod.py"), arcname="libref/sidemod.py"),
-                call(os.path.join(tool_file_dir, "__init__.py"), arcname="__init__.py"),
-                call(published_artifact_dir.joinpath("requirements.txt"), arcname="requirements.txt")
-            ],
-            any_order=True
-        )
-
-        mock_zipfile.return_value.__enter__.return_value.writestr.assert_has_calls(
+        assert_zip_entries_written(
+            mock_zipfile,
             [
-                call("bundle-format", "2.0.0\n")
-            ],
-            any_order=True
+            "testtool1.py",
+            "libref/sidemod.py",
+            "__init__.py",
+            "requirements.txt",
+            "bundle-format"
+            ]
         )
 
 def test_get_kind_from_spec_python():
@@ -1617,12 +1820,16 @@ def test_export_tool(caplog):
     download_tools_artifact_response=mock_download_reponse
     )
 
-    with mock.patch("ibm_watsonx_orchestrate.cli.commands.tools.tools_controller.zipfile.ZipFile") as mock_zipfile:
+    with mock.patch("ibm_watsonx_orchestrate.cli.commands.tools.tools_controller.zipfile.ZipFile") as mock_zipfile, \
+        mock.patch("ibm_watsonx_orchestrate.cli.commands.tools.tools_controller.copy_zip_entry") as mock_copy_zip_entry:
 
-        mock_zipfile().__enter__().infolist.return_value = [mock.MagicMock()]
+        mock_item = mock.MagicMock(filename="test_tool.py")
+        mock_zipfile().__enter__().infolist.return_value = [mock_item]
 
         tc.export_tool(name=mock_tool_name, output_path=mock_output_file)
 
+        mock_copy_zip_entry.assert_called_once_with(mock_zipfile().__enter__(), mock_item, mock_zipfile().__enter__(), "test_tool.py")
+
     captured = caplog.text
 
     assert f"Exporting tool definition for '{mock_tool_name}' to '{mock_output_file}'" in captured
@@ -1,7 +1,10 @@
+from ibm_watsonx_orchestrate.cli import config
 from ibm_watsonx_orchestrate.cli.config import Config
 import os
 import shutil
+import threading
 import pytest
+from unittest.mock import patch
 
 TEST_CONFIG_FILE_FOLDER = os.path.join(os.path.dirname(__file__), "./resources/configs/temp")
 TEST_CONFIG_FILE_NAME = "test_config.yaml"
@@ -170,3 +173,93 @@ def test_config_save_existing_section(get_test_config):
     ]
     assert cfg.read("test_save_section2", "test_save_option_dict") == {"key": "value"}
     assert cfg.read("test_save_section2", "test_save_option_bool") == False
+
+
+def test_config_reads_are_served_from_cache(get_test_config):
+    cfg = get_test_config
+    cfg.write("test_section", "test_option", "test_value")
+
+    with patch("ibm_watsonx_orchestrate.cli.config.yaml_safe_load") as mock_load:
+        assert cfg.read("test_section", "test_option") == "test_value"
+        assert cfg.get("test_section") == {"test_option": "test_value"}
+        assert Config(config_file_folder=TEST_CONFIG_FILE_FOLDER, config_file=TEST_CONFIG_FILE_NAME).read("test_section", "test_option") == "test_value"
+        mock_load.assert_not_called()
+
+
+def test_config_picks_up_external_changes(get_test_config):
+    cfg = get_test_config
+    cfg.write("test_section", "test_option", "test_value")
+
+    with open(TEST_FILE_PATH, "w") as f:
+        f.write("test_section:\n  test_option: changed_elsewhere\n")
+
+    assert cfg.read("test_section", "test_option") == "changed_elsewhere"
+
+
+def test_config_returned_values_do_not_alias_cache(get_test_config):
+    cfg = get_test_config
+    cfg.write("test_section", "test_option", {"key": "value"})
+
+    cfg.get("test_section", "test_option")["key"] = "mutated"
+
+    assert cfg.read("test_section", "test_option") == {"key": "value"}
+
+
+def test_config_write_is_atomic(get_test_config):
+    cfg = get_test_config
+    inode_before = os.stat(TEST_FILE_PATH).st_ino
+
+    cfg.write("test_section", "test_option", "test_value")
+
+    assert os.stat(TEST_FILE_PATH).st_ino != inode_before
+    assert os.listdir(TEST_CONFIG_FILE_FOLDER) == [TEST_CONFIG_FILE_NAME]
+
+
+def test_config_failed_write_keeps_file(get_test_config):
+    cfg = get_test_config
+    cfg.write("test_section", "test_option", "test_value")
+
+    with patch("ibm_watsonx_orchestrate.cli.config.yaml.dump", side_effect=RuntimeError("disk full")):
+        with pytest.raises(RuntimeError):
+            cfg.write("test_section", "test_option", "new_value")
+
+    assert cfg.read("test_section", "test_option") == "test_value"
+    assert os.listdir(TEST_CONFIG_FILE_FOLDER) == [TEST_CONFIG_FILE_NAME]
+
+
+def test_config_batch_writes_once(get_test_config):
+    cfg = get_test_config
+
+    with patch("ibm_watsonx_orchestrate.cli.config._write_config_data", wraps=config._write_config_data) as mock_write:
+        with cfg.batch():
+            cfg.write("test_section", "test_option", "test_value")
+            cfg.write("test_section", "test_option2", "test_value2")
+            cfg.delete("test_section", "test_option")
+            assert cfg.read("test_section", "test_option2") == "test_value2"
+        mock_write.assert_called_once()
+
+    assert cfg.get("test_section") == {"test_option2": "test_value2"}
+
+
+def test_config_batch_discarded_on_error(get_test_config):
+    cfg = get_test_config
+
+    with pytest.raises(RuntimeError):
+        with cfg.batch():
+            cfg.write("test_section", "test_option", "test_value")
+            raise RuntimeError()
+
+    assert cfg.read("test_section", "test_option") is None
+
+
+def test_config_concurrent_writes_are_not_lost(get_test_config):
+    def write(i):
+        Config(config_file_folder=TEST_CONFIG_FILE_FOLDER, config_file=TEST_CONFIG_FILE_NAME).write("test_section", f"option_{i}", i)
+
+    threads = [threading.Thread(target=write, args=(i,)) for i in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert get_test_config.get("test_section") == {f"option_{i}": i for i in range(20)}
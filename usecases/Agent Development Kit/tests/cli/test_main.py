@@ -0,0 +1,108 @@
+import json
+import subprocess
+import sys
+
+import pytest
+from typer.testing import CliRunner
+
+from ibm_watsonx_orchestrate.cli.main import app, OrchestrateGroup
+from ibm_watsonx_orchestrate.cli.lazy_typer_group import LazySubcommand
+
+# Modules that only specific subcommands need, and that dominate startup time when imported eagerly
+HEAVY_MODULES = [
+    "wxo_agentic_evaluation",
+    "langchain_core",
+    "redis",
+    "jwt",
+    "ibm_cloud_sdk_core",
+    "ibm_watsonx_orchestrate.cli.commands.agents.agents_command",
+    "ibm_watsonx_orchestrate.cli.commands.tools.tools_command",
+    "ibm_watsonx_orchestrate.cli.commands.evaluations.evaluations_command",
+]
+
+
+def _run_in_subprocess(code: str) -> dict:
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+class TestLazySubcommands:
+    @pytest.fixture(autouse=True)
+    def fresh_command_modules(self, monkeypatch):
+        # Other command tests import sub-apps while typer.Typer is mocked, so load them anew here
+        for name in list(sys.modules):
+            if name.startswith("ibm_watsonx_orchestrate.cli.commands.") and name.endswith("_command"):
+                monkeypatch.delitem(sys.modules, name)
+
+    def test_all_sub_apps_are_registered(self):
+        assert list(OrchestrateGroup.lazy_subcommands.keys()) == [
+            "env", "agents", "tools", "toolkits", "knowledge-bases", "connections",
+            "server", "chat", "models", "channels", "evaluations", "settings", "apply",
+        ]
+
+    @pytest.mark.parametrize("name", list(OrchestrateGroup.lazy_subcommands.keys()))
+    def test_sub_app_loads(self, name):
+        import_path, app_name, help = OrchestrateGroup.lazy_subcommands[name]
+        command = LazySubcommand(name=name, import_path=import_path, app_name=app_name, help=help).load()
+        assert command.name == name
+        assert command.help
+
+    def test_help_lists_sub_apps(self):
+        runner = CliRunner()
+        result = runner.invoke(app, ["--help"])
+        assert result.exit_code == 0
+        for name in OrchestrateGroup.lazy_subcommands:
+            assert name in result.output
+
+    def test_sub_app_help_is_forwarded(self):
+        runner = CliRunner()
+        result = runner.invoke(app, ["settings", "observability", "--help"])
+        assert result.exit_code == 0
+        assert "langfuse" in result.output
+
+
+class TestStartupTime:
+    def test_import_does_not_load_sub_apps(self):
+        loaded = _run_in_subprocess(
+            "import json, sys\n"
+            "import ibm_watsonx_orchestrate.cli.main\n"
+            f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+        )
+        assert loaded == []
+
+    def test_help_does_not_load_sub_apps(self):
+        loaded = _run_in_subprocess(
+            "import json, sys\n"
+            "from typer.testing import CliRunner\n"
+            "from ibm_watsonx_orchestrate.cli.main import app\n"
+            "result = CliRunner().invoke(app, ['--help'])\n"
+            "assert result.exit_code == 0, result.output\n"
+            f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+        )
+        assert loaded == []
+
+    def test_invoking_sub_app_loads_only_that_sub_app(self):
+        loaded = _run_in_subprocess(
+            "import json, sys\n"
+            "from typer.testing import CliRunner\n"
+            "from ibm_watsonx_orchestrate.cli.main import app\n"
+            "result = CliRunner().invoke(app, ['agents', '--help'])\n"
+            "assert result.exit_code == 0, result.output\n"
+            "print(json.dumps([m for m in sys.modules if m.startswith('ibm_watsonx_orchestrate.cli.commands.') and m.endswith('_command')]))"
+        )
+        assert "ibm_watsonx_orchestrate.cli.commands.agents.agents_command" in loaded
+        assert "ibm_watsonx_orchestrate.cli.commands.tools.tools_command" not in loaded
+        assert "ibm_watsonx_orchestrate.cli.commands.evaluations.evaluations_command" not in loaded
+
+    def test_help_entry_point_does_not_load_sub_apps(self):
+        # Checks what `orchestrate --help` imports, which is what its startup time comes down to
+        loaded = _run_in_subprocess(
+            "import json, sys\n"
+            "from ibm_watsonx_orchestrate.cli.main import app\n"
+            "try:\n"
+            "    app(['--help'])\n"
+            "except SystemExit as e:\n"
+            "    assert not e.code, e.code\n"
+            f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+        )
+        assert loaded == []
@@ -0,0 +1,224 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from ibm_watsonx_orchestrate.client import utils
+from ibm_watsonx_orchestrate.client.async_base_api_client import (
+    AsyncBaseAPIClient,
+    get_shared_async_client,
+    aclose_shared_async_clients,
+)
+from ibm_watsonx_orchestrate.client.base_api_client import ClientAPIException
+from ibm_watsonx_orchestrate.client.utils import instantiate_client
+from ibm_watsonx_orchestrate.client.tools.tool_client import AsyncToolClient
+from ibm_watsonx_orchestrate.client.agents.agent_client import AsyncAgentClient, AgentUpsertResponse
+from ibm_watsonx_orchestrate.client.connections.connections_client import AsyncConnectionsClient
+from ibm_watsonx_orchestrate.client.knowledge_bases.knowledge_base_client import AsyncKnowledgeBaseClient
+from ibm_watsonx_orchestrate.client.toolkit.toolkit_client import AsyncToolKitClient
+from ibm_watsonx_orchestrate.client.tools.tempus_client import AsyncTempusClient
+
+
+def get_mock_http_client(handler):
+    requests = []
+
+    def record(request: httpx.Request):
+        requests.append(request)
+        return handler(request)
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(record)), requests
+
+
+def ok_handler(request: httpx.Request):
+    return httpx.Response(200, json={"id": "123", "path": request.url.path})
+
+
+class TestAsyncBaseAPIClient:
+    @pytest.mark.asyncio
+    async def test_get_sends_auth_header(self):
+        http_client, requests = get_mock_http_client(ok_handler)
+        client = AsyncToolClient(base_url="http://localhost:4321", api_key="token", is_local=True, http_client=http_client)
+
+        result = await client.get()
+
+        assert result == {"id": "123", "path": "/tools"}
+        assert requests[0].headers["Authorization"] == "Bearer token"
+
+    @pytest.mark.asyncio
+    async def test_remote_url_gets_orchestrate_prefix(self):
+        http_client, requests = get_mock_http_client(ok_handler)
+        client = AsyncToolClient(base_url="https://example.com/", api_key="token", http_client=http_client)
+
+        await client.get_draft_by_name("my_tool")
+
+        assert str(requests[0].url) == "https://example.com/v1/orchestrate/tools?names=my_tool"
+
+    @pytest.mark.asyncio
+    async def test_post_sends_json(self):
+        http_client, requests = get_mock_http_client(ok_handler)
+        client = AsyncToolClient(base_url="http://localhost:4321", is_local=True, http_client=http_client)
+
+        await client.create({"name": "my_tool"})
+
+        assert requests[0].method == "POST"
+        assert json.loads(requests[0].content) == {"name": "my_tool"}
+
+    @pytest.mark.asyncio
+    async def test_error_raises_client_api_exception(self):
+        http_client, _ = get_mock_http_client(lambda request: httpx.Response(500, text="boom"))
+        client = AsyncToolClient(base_url="http://localhost:4321", is_local=True, http_client=http_client)
+
+        with pytest.raises(ClientAPIException) as e:
+            await client.get()
+        assert e.value.response.status_code == 500
+        assert e.value.response.text == "boom"
+
+    @pytest.mark.asyncio
+    async def test_not_found_draft_returns_empty(self):
+        http_client, _ = get_mock_http_client(lambda request: httpx.Response(404, text="Tool not found with the given name"))
+        client = AsyncToolClient(base_url="http://localhost:4321", is_local=True, http_client=http_client)
+
+        assert await client.get_draft_by_id("123") == ""
+
+    @pytest.mark.asyncio
+    async def test_upload_sends_multipart(self, tmp_path):
+        artifact = tmp_path / "artifact.zip"
+        artifact.write_bytes(b"zip-bytes")
+        http_client, requests = get_mock_http_client(ok_handler)
+        client = AsyncToolClient(base_url="http://localhost:4321", is_local=True, http_client=http_client)
+
+        await client.upload_tools_artifact("123", str(artifact))
+
+        assert requests[0].url.path == "/tools/123/upload"
+        assert b"zip-bytes" in requests[0].content
+
+    @pytest.mark.asyncio
+    async def test_requests_run_concurrently(self):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def handler(request: httpx.Request):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json=[])
+
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client = AsyncToolClient(base_url="http://localhost:4321", is_local=True, http_client=http_client)
+
+        await asyncio.gather(*(client.get_draft_by_name(f"tool_{i}") for i in range(10)))
+
+        assert max_in_flight == 10
+
+
+class TestSharedAsyncClient:
+    @pytest.mark.asyncio
+    async def test_shared_client_is_reused_per_key(self):
+        try:
+            assert get_shared_async_client("env_a") is get_shared_async_client("env_a")
+            assert get_shared_async_client("env_a") is not get_shared_async_client("env_b")
+            assert get_shared_async_client("env_a") is not get_shared_async_client("env_a", verify=False)
+
+            a = AsyncToolClient(base_url="http://localhost:4321", is_local=True, shared_key="env_a")
+            b = AsyncAgentClient(base_url="http://localhost:4321", is_local=True, shared_key="env_a")
+            assert a.http_client is b.http_client
+        finally:
+            await aclose_shared_async_clients()
+
+    @pytest.mark.asyncio
+    async def test_closed_client_is_replaced(self):
+        client = get_shared_async_client("env_a")
+        await aclose_shared_async_clients()
+        assert client.is_closed
+        assert get_shared_async_client("env_a") is not client
+        await aclose_shared_async_clients()
+
+
+class TestAsyncResourceClients:
+    @pytest.mark.asyncio
+    async def test_agent_client_update(self):
+        http_client, requests = get_mock_http_client(ok_handler)
+        client = AsyncAgentClient(base_url="http://localhost:4321", is_local=True, http_client=http_client)
+
+        response = await client.update("123", {"name": "agent"})
+
+        assert isinstance(response, AgentUpsertResponse)
+        assert requests[0].method == "PATCH"
+        assert requests[0].url.path == "/orchestrate/agents/123"
+
+    @pytest.mark.asyncio
+    async def test_knowledge_base_client_create_sends_form(self):
+        http_client, requests = get_mock_http_client(ok_handler)
+        client = AsyncKnowledgeBaseClient(base_url="http://localhost:4321", is_local=True, http_client=http_client)
+
+        await client.create({"name": "kb"})
+
+        assert requests[0].url.path == "/orchestrate/knowledge-bases/documents"
+        assert requests[0].headers["Content-Type"] == "application/x-www-form-urlencoded"
+
+    @pytest.mark.asyncio
+    async def test_connections_client_get_missing_returns_none(self):
+        http_client, _ = get_mock_http_client(lambda request: httpx.Response(404))
+        client = AsyncConnectionsClient(base_url="http://localhost:4321", is_local=True, http_client=http_client)
+
+        assert await client.get("app") is None
+
+    @pytest.mark.asyncio
+    async def test_connections_client_get_draft_by_app_ids(self):
+        def handler(request: httpx.Request):
+            app_id = request.url.params["app_id"]
+            if app_id == "missing":
+                return httpx.Response(404)
+            return httpx.Response(200, json={"app_id": app_id, "connection_id": f"conn_{app_id}"})
+
+        http_client, _ = get_mock_http_client(handler)
+        client = AsyncConnectionsClient(base_url="http://localhost:4321", is_local=True, http_client=http_client)
+
+        connections = await client.get_draft_by_app_ids(["a", "missing", "b"])
+
+        assert {app_id: c.connection_id for app_id, c in connections.items()} == {"a": "conn_a", "b": "conn_b"}
+
+    @pytest.mark.asyncio
+    async def test_toolkit_client_get(self):
+        http_client, requests = get_mock_http_client(ok_handler)
+        client = AsyncToolKitClient(base_url="http://localhost:4321", is_local=True, http_client=http_client)
+
+        await client.get_draft_by_name("kit")
+
+        assert str(requests[0].url) == "http://localhost:4321/toolkits?names=kit"
+
+    @pytest.mark.asyncio
+    async def test_tempus_client_uses_tempus_port(self):
+        http_client, requests = get_mock_http_client(lambda request: httpx.Response(200, json={"instance_id": "1"}))
+        client = AsyncTempusClient(base_url="http://localhost:4321", is_local=True, http_client=http_client)
+
+        ack = await client.arun_flow("my_flow", {"a": 1})
+
+        assert ack == {"instance_id": "1"}
+        assert str(requests[0].url) == "http://localhost:9044/v1/flows/my_flow/versions/TIP/run/async"
+
+
+class TestInstantiateAsyncClient:
+    utils.DEFAULT_CONFIG_FILE_FOLDER = "tests/client/resources/"
+    utils.DEFAULT_CONFIG_FILE = "config.yaml"
+    utils.AUTH_CONFIG_FILE_FOLDER = "tests/client/resources/"
+    utils.AUTH_CONFIG_FILE = "credentials.yaml"
+
+    @pytest.mark.parametrize(
+        "client",
+        [
+            AsyncToolClient,
+            AsyncAgentClient,
+            AsyncConnectionsClient,
+            AsyncKnowledgeBaseClient,
+            AsyncToolKitClient,
+            AsyncTempusClient,
+        ],
+    )
+    def test_instantiate_async_clients(self, client):
+        instantiated_client = instantiate_client(client)
+        assert isinstance(instantiated_client, AsyncBaseAPIClient)
+        assert instantiated_client.shared_key == "testing"
@@ -0,0 +1,165 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from ibm_watsonx_orchestrate.client import base_api_client
+from ibm_watsonx_orchestrate.client.base_api_client import (
+    BaseAPIClient,
+    ClientAPIException,
+    create_session,
+    get_shared_session,
+    close_shared_sessions,
+)
+
+
+class StandInClient(BaseAPIClient):
+    def create(self, *args, **kwargs):
+        pass
+
+    def delete(self, *args, **kwargs):
+        pass
+
+    def update(self, *args, **kwargs):
+        pass
+
+    def get(self):
+        return self._get("/ping")
+
+
+class StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StandInHandler)
+        self.connections = 0
+        self.requests = 0
+        self.failures_remaining = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # headers and body are written separately, avoid delayed-ACK stalls on kept-alive sockets
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def _respond(self):
+        length = int(self.headers.get("Content-Length", 0))
+        if length:
+            self.rfile.read(length)
+        with self.server.lock:
+            self.server.requests += 1
+            fail = self.server.failures_remaining > 0
+            if fail:
+                self.server.failures_remaining -= 1
+        status = 503 if fail else 200
+        body = json.dumps({"ok": not fail}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = _respond
+    do_POST = _respond
+    do_PUT = _respond
+    do_PATCH = _respond
+    do_DELETE = _respond
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = StandInServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def reset_sessions():
+    yield
+    close_shared_sessions()
+
+
+class TestSharedSession:
+    def test_shared_session_is_reused_per_key(self):
+        assert get_shared_session("env_a") is get_shared_session("env_a")
+        assert get_shared_session("env_a") is not get_shared_session("env_b")
+
+    def test_clients_default_to_session_per_base_url(self):
+        a = StandInClient(base_url="http://localhost:4321", is_local=True)
+        b = StandInClient(base_url="http://localhost:4321/", is_local=True)
+        assert a.session is b.session
+
+    def test_explicit_session_is_used(self):
+        session = create_session()
+        client = StandInClient(base_url="http://localhost:4321", is_local=True, session=session)
+        assert client.session is session
+
+    def test_pool_size_is_configurable(self):
+        session = create_session(pool_connections=2, pool_maxsize=7, max_retries=1)
+        adapter = session.get_adapter("https://example.com")
+        assert adapter._pool_maxsize == 7
+        assert adapter.max_retries.total == 1
+        assert "POST" not in adapter.max_retries.allowed_methods
+
+
+class TestConnectionReuse:
+    calls = 50
+
+    def test_pooled_client_reuses_connection(self, server):
+        client = StandInClient(base_url=server.url, is_local=True, session=create_session())
+        for _ in range(self.calls):
+            assert client.get() == {"ok": True}
+        for _ in range(self.calls):
+            client._post("/ping", data={"a": 1})
+
+        assert server.requests == 2 * self.calls
+        assert server.connections == 1
+
+    def test_pooled_client_opens_fewer_connections_than_unpooled(self, server):
+        for _ in range(self.calls):
+            requests.get(f"{server.url}/ping").close()
+        unpooled_connections = server.connections
+
+        server.connections = 0
+        client = StandInClient(base_url=server.url, is_local=True, session=create_session())
+        for _ in range(self.calls):
+            client.get()
+
+        assert unpooled_connections == self.calls
+        assert server.connections == 1
+
+
+class TestRetries:
+    def test_idempotent_verbs_are_retried(self, server, monkeypatch):
+        monkeypatch.setattr(base_api_client, "DEFAULT_RETRY_BACKOFF_FACTOR", 0)
+        client = StandInClient(base_url=server.url, is_local=True, session=create_session(max_retries=2))
+        server.failures_remaining = 2
+        assert client.get() == {"ok": True}
+        assert server.requests == 3
+
+    def test_post_is_not_retried(self, server, monkeypatch):
+        monkeypatch.setattr(base_api_client, "DEFAULT_RETRY_BACKOFF_FACTOR", 0)
+        client = StandInClient(base_url=server.url, is_local=True, session=create_session(max_retries=2))
+        server.failures_remaining = 1
+        with pytest.raises(ClientAPIException) as e:
+            client._post("/ping", data={})
+        assert e.value.response.status_code == 503
+        assert server.requests == 1
@@ -0,0 +1,40 @@
+import threading
+from unittest.mock import patch
+
+from ibm_watsonx_orchestrate.client.connections.connections_client import ConnectionsClient, GetConnectionResponse
+
+
+class TestGetDraftByAppIds:
+    def get_client(self):
+        return ConnectionsClient(base_url="http://localhost:4321", is_local=True)
+
+    def test_returns_connections_by_app_id(self):
+        calls = []
+
+        def get(app_id):
+            calls.append(app_id)
+            return None if app_id == "missing" else GetConnectionResponse(app_id=app_id, connection_id=f"conn_{app_id}")
+
+        with patch.object(ConnectionsClient, "get", side_effect=get):
+            connections = self.get_client().get_draft_by_app_ids(["a", "missing", "b", "a"])
+
+        assert {app_id: conn.connection_id for app_id, conn in connections.items()} == {"a": "conn_a", "b": "conn_b"}
+        assert sorted(calls) == ["a", "b", "missing"]
+
+    def test_lookups_are_concurrent(self):
+        # Only passes when all three lookups are in flight at the same time
+        barrier = threading.Barrier(3, timeout=5)
+
+        def get(app_id):
+            barrier.wait()
+            return GetConnectionResponse(app_id=app_id, connection_id=f"conn_{app_id}")
+
+        with patch.object(ConnectionsClient, "get", side_effect=get):
+            connections = self.get_client().get_draft_by_app_ids(["a", "b", "c"])
+
+        assert list(connections) == ["a", "b", "c"]
+
+    def test_no_app_ids(self):
+        with patch.object(ConnectionsClient, "get") as mock_get:
+            assert self.get_client().get_draft_by_app_ids([]) == {}
+            mock_get.assert_not_called()
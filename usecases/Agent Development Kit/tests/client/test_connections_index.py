@@ -0,0 +1,62 @@
+from ibm_watsonx_orchestrate.agent_builder.connections.types import ConnectionEnvironment
+from ibm_watsonx_orchestrate.client.connections.connections_client import ListConfigsResponse
+from ibm_watsonx_orchestrate.client.connections.connections_index import get_connections_index, invalidate_connections_index
+
+
+class MockConnectionClient:
+    def __init__(self, connections=None):
+        self.connections = connections or []
+        self.list_calls = 0
+
+    def list(self):
+        self.list_calls += 1
+        return list(self.connections)
+
+
+def get_client():
+    return MockConnectionClient([
+        ListConfigsResponse(app_id="app_1", connection_id="conn_1", environment=ConnectionEnvironment.LIVE),
+        ListConfigsResponse(app_id="app_1", connection_id="conn_1", environment=ConnectionEnvironment.DRAFT),
+        ListConfigsResponse(app_id="app_2", connection_id="conn_2"),
+    ])
+
+
+class TestConnectionsIndex:
+    def test_lookups_share_one_list_call(self):
+        client = get_client()
+        index = get_connections_index(client)
+
+        assert index.get_connection_id("app_1") == "conn_1"
+        assert index.get_connection_id("app_2") == "conn_2"
+        assert index.get_app_id("conn_2") == "app_2"
+        assert index.get_connection_id("missing") is None
+        assert index.get_app_id("missing") is None
+        assert len(index.list()) == 3
+
+        assert get_connections_index(client) is index
+        assert client.list_calls == 1
+
+    def test_prefers_draft_configuration(self):
+        index = get_connections_index(get_client())
+
+        assert [conn.environment for conn in index.get_by_app_id("app_1")] == [ConnectionEnvironment.DRAFT, ConnectionEnvironment.LIVE]
+        assert index.get_by_connection_id("conn_1").environment == ConnectionEnvironment.DRAFT
+
+    def test_each_client_has_its_own_index(self):
+        client, other_client = get_client(), MockConnectionClient()
+
+        assert get_connections_index(client).get_connection_id("app_1") == "conn_1"
+        assert get_connections_index(other_client).get_connection_id("app_1") is None
+
+    def test_invalidate(self):
+        client = get_client()
+        index = get_connections_index(client)
+        assert index.get_connection_id("app_3") is None
+
+        client.connections.append(ListConfigsResponse(app_id="app_3", connection_id="conn_3"))
+        assert index.get_connection_id("app_3") is None
+
+        invalidate_connections_index()
+
+        assert index.get_connection_id("app_3") == "conn_3"
+        assert client.list_calls == 2
@@ -0,0 +1,127 @@
+import threading
+import time
+
+import jwt
+
+from ibm_watsonx_orchestrate.client.token_store import TokenStore
+
+
+TOKEN_SECRET = "test-secret-that-is-at-least-32-bytes"
+
+def make_token(expires_in: int, subject: str = "user") -> str:
+    return jwt.encode({"sub": subject, "exp": int(time.time()) + expires_in}, TOKEN_SECRET, algorithm="HS256")
+
+
+class RecordingRefresher:
+    def __init__(self, expires_in: int = 3600, block: threading.Event = None, fail: bool = False):
+        self.expires_in = expires_in
+        self.block = block
+        self.fail = fail
+        self.calls = 0
+        self.tokens = []
+
+    def __call__(self) -> str:
+        self.calls += 1
+        if self.block:
+            self.block.wait(timeout=5)
+        if self.fail:
+            raise RuntimeError("IAM unavailable")
+        token = make_token(self.expires_in, subject=f"refreshed_{self.calls}")
+        self.tokens.append(token)
+        return token
+
+
+class TestTokenStore:
+    def test_valid_token_is_served_from_memory(self):
+        token = make_token(3600)
+        refresher = RecordingRefresher()
+        store = TokenStore()
+        store.load("env", token, refresher)
+
+        assert all(store.get_token("env") == token for _ in range(100))
+        assert refresher.calls == 0
+
+    def test_missing_or_expired_token_without_refresher(self):
+        store = TokenStore()
+        store.load("missing", None)
+        store.load("expired", make_token(-10))
+        store.load("malformed", "not a token")
+
+        assert store.get_token("missing") is None
+        assert store.get_token("expired") is None
+        assert store.get_token("malformed") is None
+        assert store.get_token("unknown") is None
+
+    def test_expired_token_is_refreshed_and_persisted(self):
+        persisted = []
+        refresher = RecordingRefresher()
+        store = TokenStore(persist=lambda env, token, expiry: persisted.append((env, token, expiry)))
+        store.load("env", make_token(60), refresher)
+
+        token = store.get_token("env")
+
+        assert token == refresher.tokens[0]
+        assert persisted == [("env", token, jwt.decode(token, options={"verify_signature": False})["exp"])]
+
+    def test_token_close_to_expiry_is_refreshed_in_the_background(self):
+        current = make_token(700)
+        release = threading.Event()
+        refresher = RecordingRefresher(block=release)
+        store = TokenStore()
+        store.load("env", current, refresher)
+
+        # The refresh is blocked on release, so the current token must be served without waiting for it
+        assert store.get_token("env") == current
+        assert store.get_token("env") == current
+
+        release.set()
+        deadline = time.time() + 5
+        while store.get_token("env") == current and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert store.get_token("env") == refresher.tokens[0]
+        assert refresher.calls == 1
+
+    def test_concurrent_callers_share_one_refresh(self):
+        release = threading.Event()
+        refresher = RecordingRefresher(block=release)
+        store = TokenStore()
+        store.load("env", make_token(-10), refresher)
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(store.get_token("env"))) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert refresher.calls == 1
+        assert results == [refresher.tokens[0]] * 5
+
+    def test_failed_refresh(self):
+        current = make_token(700)
+        store = TokenStore()
+        store.load("env", current, RecordingRefresher(fail=True))
+        assert store.get_token("env") == current
+
+        store.load("expired", make_token(-10), RecordingRefresher(fail=True))
+        assert store.get_token("expired") is None
+
+    def test_load_keeps_refreshed_token_until_the_persisted_one_changes(self):
+        persisted_token = make_token(60)
+        refresher = RecordingRefresher()
+        store = TokenStore()
+        store.load("env", persisted_token, refresher)
+        refreshed = store.get_token("env")
+        assert refreshed != persisted_token
+
+        # Reading the same credentials file again keeps the refreshed token
+        store.load("env", persisted_token, refresher)
+        assert store.get_token("env") == refreshed
+
+        # A token written by `orchestrate env activate` replaces it
+        activated = make_token(3600, subject="activated")
+        store.load("env", activated, refresher)
+        assert store.get_token("env") == activated
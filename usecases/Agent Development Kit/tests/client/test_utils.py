@@ -1,12 +1,27 @@
+import os
+import shutil
+import time
+import jwt
 import pytest
+import yaml
 from unittest.mock import patch
+from ibm_watsonx_orchestrate.cli import config as cli_config
 from ibm_watsonx_orchestrate.client import utils
-from ibm_watsonx_orchestrate.client.utils import is_local_dev, check_token_validity, instantiate_client
-from ibm_watsonx_orchestrate.client.agents.agent_client import AgentClient
-# from ibm_watsonx_orchestrate.client.agents.external_agent_client import ExternalAgentClient
-# from ibm_watsonx_orchestrate.client.agents.assistant_agent_client import AssistantAgentClient
-from ibm_watsonx_orchestrate.client.tools.tool_client import ToolClient
-from ibm_watsonx_orchestrate.client.connections.connections_client import ConnectionsClient
+from ibm_watsonx_orchestrate.utils.utils import yaml_safe_load
+from ibm_watsonx_orchestrate.client.utils import is_local_dev, check_token_validity, instantiate_client, clear_client_cache
+from ibm_watsonx_orchestrate.client.agents.agent_client import AgentClient, AsyncAgentClient
+from ibm_watsonx_orchestrate.client.agents.external_agent_client import ExternalAgentClient
+from ibm_watsonx_orchestrate.client.agents.assistant_agent_client import AssistantAgentClient
+from ibm_watsonx_orchestrate.client.analytics.llm.analytics_llm_client import AnalyticsLLMClient
+from ibm_watsonx_orchestrate.client.knowledge_bases.knowledge_base_client import KnowledgeBaseClient, AsyncKnowledgeBaseClient
+from ibm_watsonx_orchestrate.client.model_policies.model_policies_client import ModelPoliciesClient
+from ibm_watsonx_orchestrate.client.models.models_client import ModelsClient
+from ibm_watsonx_orchestrate.client.toolkit.toolkit_client import ToolKitClient, AsyncToolKitClient
+from ibm_watsonx_orchestrate.client.tools.tool_client import ToolClient, AsyncToolClient
+from ibm_watsonx_orchestrate.client.tools.tempus_client import TempusClient, AsyncTempusClient
+from ibm_watsonx_orchestrate.client.connections.connections_client import ConnectionsClient, AsyncConnectionsClient
+
+TOKEN_SECRET = "test-secret-that-is-at-least-32-bytes"
 
 class TestIsLocalDev:
     @pytest.mark.parametrize(
@@ -63,6 +78,12 @@ class TestCheckTokenValidity:
 
 class TestInstantiateClient:
 
+    @pytest.fixture(autouse=True)
+    def reset_client_cache(self):
+        clear_client_cache()
+        yield
+        clear_client_cache()
+
     def mock_yaml_safe_loader_no_active_env(self, file):
         return {}
     
@@ -135,7 +156,7 @@ class TestInstantiateClient:
         ],
     )
     def test_no_active_environment(self, client, caplog):
-        with patch("ibm_watsonx_orchestrate.client.utils.yaml_safe_load") as mock:
+        with patch("ibm_watsonx_orchestrate.cli.config.yaml_safe_load") as mock:
             mock.side_effect = self.mock_yaml_safe_loader_no_active_env
             with pytest.raises(SystemExit) as e:
                 instantiate_client(client)
@@ -156,7 +177,7 @@ class TestInstantiateClient:
         ],
     )
     def test_no_url_in_environment(self, client, caplog):
-        with patch("ibm_watsonx_orchestrate.client.utils.yaml_safe_load") as mock:
+        with patch("ibm_watsonx_orchestrate.cli.config.yaml_safe_load") as mock:
             mock.side_effect = self.mock_yaml_safe_loader_no_url
             with pytest.raises(SystemExit) as e:
                 instantiate_client(client)
@@ -178,7 +199,7 @@ class TestInstantiateClient:
         ],
     )
     def test_missing_token(self, client, caplog):
-        with patch("ibm_watsonx_orchestrate.client.utils.yaml_safe_load") as mock:
+        with patch("ibm_watsonx_orchestrate.cli.config.yaml_safe_load") as mock:
             mock.side_effect = self.mock_yaml_safe_loader_missing_token
             with pytest.raises(SystemExit) as e:
                 instantiate_client(client)
@@ -199,7 +220,7 @@ class TestInstantiateClient:
         ],
     )
     def test_invalid_token(self, client, caplog):
-        with patch("ibm_watsonx_orchestrate.client.utils.yaml_safe_load") as mock:
+        with patch("ibm_watsonx_orchestrate.cli.config.yaml_safe_load") as mock:
             mock.side_effect = self.mock_yaml_safe_loader_invalid_token
             with pytest.raises(SystemExit) as e:
                 instantiate_client(client)
@@ -208,3 +229,95 @@ class TestInstantiateClient:
 
             captured = caplog.text
             assert "The token found for environment 'testing' is missing or expired" in captured
+
+
+class TestInstantiateClientCache:
+
+    @pytest.fixture(autouse=True)
+    def config_dir(self, tmp_path, monkeypatch):
+        shutil.copy("tests/client/resources/config.yaml", tmp_path / "config.yaml")
+        shutil.copy("tests/client/resources/credentials.yaml", tmp_path / "credentials.yaml")
+        monkeypatch.setattr(utils, "DEFAULT_CONFIG_FILE_FOLDER", str(tmp_path))
+        monkeypatch.setattr(utils, "DEFAULT_CONFIG_FILE", "config.yaml")
+        monkeypatch.setattr(utils, "AUTH_CONFIG_FILE_FOLDER", str(tmp_path))
+        monkeypatch.setattr(utils, "AUTH_CONFIG_FILE", "credentials.yaml")
+        clear_client_cache()
+        yield tmp_path
+        clear_client_cache()
+
+    def test_repeated_calls_skip_yaml_parsing(self):
+        with patch("ibm_watsonx_orchestrate.cli.config.yaml_safe_load", wraps=yaml_safe_load) as mock:
+            first = instantiate_client(ToolClient)
+            for _ in range(10):
+                assert instantiate_client(ToolClient) is first
+            assert mock.call_count == 2
+
+    def test_reads_config_through_config_cache(self, config_dir):
+        cli_config._load_config_data(str(config_dir / "config.yaml"))
+        cli_config._load_config_data(str(config_dir / "credentials.yaml"))
+
+        with patch("ibm_watsonx_orchestrate.cli.config.yaml_safe_load", wraps=yaml_safe_load) as mock:
+            instantiate_client(ToolClient)
+            mock.assert_not_called()
+
+    def test_cache_is_keyed_by_client_and_url(self):
+        assert instantiate_client(ToolClient) is not instantiate_client(AgentClient)
+        assert instantiate_client(ToolClient) is not instantiate_client(ToolClient, url="http://localhost:4321")
+        assert instantiate_client(ToolClient, url="http://localhost:4321") is instantiate_client(ToolClient, url="http://localhost:4321")
+
+    def test_config_change_invalidates_cache(self, config_dir):
+        first = instantiate_client(ToolClient)
+
+        config_file = config_dir / "config.yaml"
+        config_file.write_text(config_file.read_text().replace("http://localhost:1234/testing", "http://localhost:5678/testing"))
+        stat = os.stat(config_file)
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        second = instantiate_client(ToolClient)
+        assert second is not first
+        assert second.base_url == "http://localhost:5678/testing"
+
+    def test_expired_token_is_refreshed_when_api_key_is_available(self, config_dir):
+        expired_token = jwt.encode({"sub": "user", "exp": int(time.time()) - 60}, TOKEN_SECRET, algorithm="HS256")
+        refreshed_token = jwt.encode({"sub": "user", "exp": int(time.time()) + 3600}, TOKEN_SECRET, algorithm="HS256")
+        credentials_file = config_dir / "credentials.yaml"
+        credentials_file.write_text(yaml.safe_dump({"auth": {"testing": {"wxo_mcsp_token": expired_token}}}))
+
+        with patch("ibm_watsonx_orchestrate.client.utils._get_token_refresher") as mock_refresher:
+            mock_refresher.return_value = lambda: refreshed_token
+            client = instantiate_client(ToolClient)
+
+        assert client._get_headers() == {"Authorization": f"Bearer {refreshed_token}"}
+        assert yaml.safe_load(credentials_file.read_text())["auth"]["testing"]["wxo_mcsp_token"] == refreshed_token
+
+    @pytest.mark.parametrize("client_class", [
+        AgentClient, AsyncAgentClient, AssistantAgentClient, ExternalAgentClient,
+        KnowledgeBaseClient, AsyncKnowledgeBaseClient, ToolKitClient, AsyncToolKitClient,
+        ConnectionsClient, AsyncConnectionsClient, ModelsClient, ModelPoliciesClient,
+        ToolClient, AsyncToolClient, TempusClient, AsyncTempusClient, AnalyticsLLMClient
+    ])
+    def test_every_client_accepts_token_provider(self, client_class):
+        token = jwt.encode({"sub": "user", "exp": int(time.time()) + 3600}, TOKEN_SECRET, algorithm="HS256")
+
+        with patch("ibm_watsonx_orchestrate.client.utils._get_token_refresher") as mock_refresher:
+            mock_refresher.return_value = lambda: token
+            client = instantiate_client(client_class)
+
+        assert isinstance(client, client_class)
+        assert client.token_provider is not None
+
+    def test_expired_token_without_api_key(self, config_dir, monkeypatch):
+        monkeypatch.delenv(utils.WO_API_KEY_ENV_VAR, raising=False)
+        expired_token = jwt.encode({"sub": "user", "exp": int(time.time()) - 60}, TOKEN_SECRET, algorithm="HS256")
+        (config_dir / "credentials.yaml").write_text(yaml.safe_dump({"auth": {"testing": {"wxo_mcsp_token": expired_token}}}))
+
+        with pytest.raises(SystemExit):
+            instantiate_client(ToolClient)
+
+    def test_expired_token_invalidates_cache(self):
+        first = instantiate_client(ToolClient)
+        key = next(iter(utils._CLIENT_CACHE))
+        utils._CLIENT_CACHE[key] = (first, 1000000000)
+
+        second = instantiate_client(ToolClient)
+        assert second is not first
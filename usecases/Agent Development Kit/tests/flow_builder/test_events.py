@@ -0,0 +1,325 @@
+import asyncio
+import json
+from contextlib import aclosing
+
+import pytest
+import redis
+
+from ibm_watsonx_orchestrate.flow_builder.flows import events
+from ibm_watsonx_orchestrate.flow_builder.flows.events import StreamConsumer, StreamEventHub
+from ibm_watsonx_orchestrate.flow_builder.types import FlowEventType
+
+
+class MockAsyncRedis:
+    """
+    In memory stand-in for redis.asyncio.Redis streams, where XREAD blocks until an event is added
+    """
+
+    def __init__(self, failures=0):
+        self.streams = {}
+        self.failures = failures
+        self.reads = []
+        self.closed = False
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.cancelled_reads = 0
+        self.unblocks = 0
+        self._unblocked = False
+        self._added = asyncio.Condition()
+
+    def client(self):
+        return self
+
+    async def client_id(self):
+        return 1
+
+    async def client_unblock(self, client_id):
+        async with self._added:
+            if not self.in_flight:
+                return False
+            self.unblocks += 1
+            self._unblocked = True
+            self._added.notify_all()
+            return True
+
+    async def xadd(self, stream, fields):
+        async with self._added:
+            entries = self.streams.setdefault(stream, [])
+            event_id = f"{len(entries) + 1}-0".encode()
+            entries.append((event_id, fields))
+            self._added.notify_all()
+            return event_id
+
+    def _entries_after(self, stream, last_id, count):
+        entries = self.streams.get(stream, [])
+        after = int(str(last_id.decode() if isinstance(last_id, bytes) else last_id).split("-")[0])
+        return entries[after:after + count]
+
+    def _read_entries(self, streams, count):
+        return [
+            [stream.encode(), entries]
+            for stream, last_id in streams.items()
+            if (entries := self._entries_after(stream, last_id, count))
+        ]
+
+    async def xread(self, streams, block=None, count=None):
+        self.reads.append(dict(streams))
+        if self.failures:
+            self.failures -= 1
+            raise redis.ConnectionError("Connection refused")
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            async with self._added:
+                try:
+                    await asyncio.wait_for(
+                        self._added.wait_for(lambda: self._unblocked or self._read_entries(streams, count)),
+                        timeout=block / 1000,
+                    )
+                except asyncio.TimeoutError:
+                    return []
+                if self._unblocked:
+                    # CLIENT UNBLOCK makes XREAD return as if it timed out
+                    self._unblocked = False
+                    return None
+                return self._read_entries(streams, count)
+        except asyncio.CancelledError:
+            self.cancelled_reads += 1
+            raise
+        finally:
+            self.in_flight -= 1
+
+    async def aclose(self):
+        self.closed = True
+
+
+def get_event_data(kind: FlowEventType):
+    return {b"data": json.dumps({"kind": kind.value}).encode()}
+
+
+class TestStreamConsumer:
+    @pytest.mark.asyncio
+    async def test_events_are_delivered_without_polling_delay(self, monkeypatch):
+        client = MockAsyncRedis()
+        consumer = StreamConsumer("instance", redis_client=client)
+        stream = consumer.consume()
+
+        sleeps = []
+        real_sleep = asyncio.sleep
+
+        async def record_sleep(seconds, *args, **kwargs):
+            sleeps.append(seconds)
+            return await real_sleep(seconds, *args, **kwargs)
+
+        monkeypatch.setattr(events.asyncio, "sleep", record_sleep)
+        for kind in (FlowEventType.ON_FLOW_START, FlowEventType.ON_FLOW_END):
+            next_event = asyncio.ensure_future(anext(stream))
+            await real_sleep(0.05)
+            # The consumer waits inside a blocking XREAD, which returns as soon as the event is added
+            assert client.in_flight == 1
+            await client.xadd("tempus:instance", get_event_data(kind))
+            event = await next_event
+            assert event.kind == kind
+
+        # The previous consumer slept a second between every read
+        assert sleeps == []
+        assert client.reads == [{"tempus:instance": 0}, {"tempus:instance": b"1-0"}]
+
+        await stream.aclose()
+        assert client.closed
+
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_responsive_while_waiting(self):
+        client = MockAsyncRedis()
+        consumer = StreamConsumer("instance", redis_client=client)
+        stream = consumer.consume()
+        next_event = asyncio.ensure_future(anext(stream))
+
+        ticks = 0
+        for _ in range(20):
+            await asyncio.sleep(0.01)
+            ticks += 1
+        assert ticks == 20
+        assert not next_event.done()
+
+        await client.xadd("tempus:instance", get_event_data(FlowEventType.ON_FLOW_END))
+        assert (await next_event).kind == FlowEventType.ON_FLOW_END
+        await stream.aclose()
+
+    @pytest.mark.asyncio
+    async def test_reconnects_with_backoff(self, monkeypatch):
+        monkeypatch.setattr(events, "RECONNECT_INITIAL_BACKOFF_SECONDS", 0.01)
+        client = MockAsyncRedis(failures=3)
+        await client.xadd("tempus:instance", get_event_data(FlowEventType.ON_FLOW_START))
+        consumer = StreamConsumer("instance", redis_client=client)
+        stream = consumer.consume()
+
+        sleeps = []
+        real_sleep = asyncio.sleep
+
+        async def record_sleep(seconds):
+            sleeps.append(seconds)
+            await real_sleep(0)
+
+        monkeypatch.setattr(events.asyncio, "sleep", record_sleep)
+        event = await asyncio.wait_for(anext(stream), timeout=1)
+
+        assert event.kind == FlowEventType.ON_FLOW_START
+        assert sleeps == [0.01, 0.02, 0.04]
+        assert client.reads == [{"tempus:instance": 0}] * 4
+        await stream.aclose()
+
+    @pytest.mark.asyncio
+    async def test_malformed_events_are_skipped(self):
+        client = MockAsyncRedis()
+        await client.xadd("tempus:instance", {b"other": b"field"})
+        await client.xadd("tempus:instance", get_event_data(FlowEventType.ON_FLOW_END))
+        consumer = StreamConsumer("instance", redis_client=client)
+        stream = consumer.consume()
+
+        event = await asyncio.wait_for(anext(stream), timeout=1)
+
+        assert event.kind == FlowEventType.ON_FLOW_END
+        assert consumer.last_processed_id == b"2-0"
+        await stream.aclose()
+
+
+async def consume_until_end(hub, instance_id):
+    kinds = []
+    async with aclosing(hub.consume(instance_id)) as events:
+        async for event in events:
+            kinds.append(event.kind)
+            if event.kind == FlowEventType.ON_FLOW_END:
+                break
+    return kinds
+
+
+class TestStreamEventHub:
+    @pytest.mark.asyncio
+    async def test_one_connection_drives_many_runs(self):
+        client = MockAsyncRedis()
+        hub = StreamEventHub(redis_client=client)
+        instance_ids = [f"instance_{i}" for i in range(300)]
+        runs = [asyncio.ensure_future(consume_until_end(hub, instance_id)) for instance_id in instance_ids]
+        await asyncio.sleep(0.01)
+
+        for kind in (FlowEventType.ON_FLOW_START, FlowEventType.ON_FLOW_END):
+            for instance_id in instance_ids:
+                await client.xadd(f"tempus:{instance_id}", get_event_data(kind))
+        results = await asyncio.wait_for(asyncio.gather(*runs), timeout=5)
+
+        assert results == [[FlowEventType.ON_FLOW_START, FlowEventType.ON_FLOW_END]] * len(runs)
+        # A single XREAD is in flight at a time, each one serving many runs rather than one per run and event
+        assert client.max_in_flight == 1
+        assert len(client.reads) < len(runs)
+        assert max(len(streams) for streams in client.reads) == len(runs)
+
+        await hub.close()
+        assert client.closed
+
+    @pytest.mark.asyncio
+    async def test_streams_added_while_reading_are_picked_up(self):
+        client = MockAsyncRedis()
+        hub = StreamEventHub(redis_client=client)
+        first = asyncio.ensure_future(consume_until_end(hub, "first"))
+        await asyncio.sleep(0.01)
+        assert client.in_flight == 1
+
+        second = asyncio.ensure_future(consume_until_end(hub, "second"))
+        await asyncio.sleep(0.01)
+        await client.xadd("tempus:second", get_event_data(FlowEventType.ON_FLOW_END))
+
+        # The blocked XREAD on the first stream alone would only return after five seconds
+        assert await asyncio.wait_for(second, timeout=1) == [FlowEventType.ON_FLOW_END]
+        assert {"tempus:first": 0, "tempus:second": 0} in client.reads
+        # The XREAD is woken rather than cancelled, which would drop its connection
+        assert client.unblocks == 1
+        assert client.cancelled_reads == 0
+
+        await client.xadd("tempus:first", get_event_data(FlowEventType.ON_FLOW_END))
+        assert await asyncio.wait_for(first, timeout=1) == [FlowEventType.ON_FLOW_END]
+        await hub.close()
+
+    @pytest.mark.asyncio
+    async def test_closed_runs_are_no_longer_read(self):
+        client = MockAsyncRedis()
+        hub = StreamEventHub(redis_client=client)
+        await client.xadd("tempus:done", get_event_data(FlowEventType.ON_FLOW_END))
+        assert await asyncio.wait_for(consume_until_end(hub, "done"), timeout=1) == [FlowEventType.ON_FLOW_END]
+
+        running = asyncio.ensure_future(consume_until_end(hub, "running"))
+        await asyncio.sleep(0.01)
+        await client.xadd("tempus:running", get_event_data(FlowEventType.ON_FLOW_END))
+        await asyncio.wait_for(running, timeout=1)
+
+        assert client.reads[-1] == {"tempus:running": b"1-0"}
+        await hub.close()
+
+    @pytest.mark.asyncio
+    async def test_connections_are_closed_when_idle(self, monkeypatch):
+        monkeypatch.setattr(events, "EVENT_HUB_IDLE_TIMEOUT_SECONDS", 0.05)
+        monkeypatch.setattr(events, "STREAM_BLOCK_MS", 50)
+        client = MockAsyncRedis()
+        hub = StreamEventHub(redis_client=client)
+        await client.xadd("tempus:first", get_event_data(FlowEventType.ON_FLOW_END))
+        assert await asyncio.wait_for(consume_until_end(hub, "first"), timeout=1) == [FlowEventType.ON_FLOW_END]
+
+        await asyncio.wait_for(hub._reader, timeout=1)
+        assert client.closed
+
+        client.closed = False
+        await client.xadd("tempus:second", get_event_data(FlowEventType.ON_FLOW_END))
+        assert await asyncio.wait_for(consume_until_end(hub, "second"), timeout=1) == [FlowEventType.ON_FLOW_END]
+        await hub.close()
+
+    @pytest.mark.asyncio
+    async def test_run_started_while_idle_connections_close(self, monkeypatch):
+        monkeypatch.setattr(events, "EVENT_HUB_IDLE_TIMEOUT_SECONDS", 0.05)
+        monkeypatch.setattr(events, "STREAM_BLOCK_MS", 50)
+        client = MockAsyncRedis()
+        closing = asyncio.Event()
+        aclose = client.aclose
+
+        async def slow_aclose():
+            closing.set()
+            await asyncio.sleep(0.05)
+            await aclose()
+        client.aclose = slow_aclose
+
+        hub = StreamEventHub(redis_client=client)
+        await client.xadd("tempus:first", get_event_data(FlowEventType.ON_FLOW_END))
+        assert await asyncio.wait_for(consume_until_end(hub, "first"), timeout=1) == [FlowEventType.ON_FLOW_END]
+
+        await asyncio.wait_for(closing.wait(), timeout=1)
+        second = asyncio.ensure_future(consume_until_end(hub, "second"))
+        await asyncio.sleep(0)
+        assert not hub._reader.done()
+
+        await client.xadd("tempus:second", get_event_data(FlowEventType.ON_FLOW_END))
+        assert await asyncio.wait_for(second, timeout=1) == [FlowEventType.ON_FLOW_END]
+        await hub.close()
+
+    @pytest.mark.asyncio
+    async def test_consuming_an_instance_twice_is_rejected(self):
+        hub = StreamEventHub(redis_client=MockAsyncRedis())
+        first = hub.consume("instance")
+        next_event = asyncio.ensure_future(anext(first))
+        await asyncio.sleep(0)
+
+        with pytest.raises(ValueError):
+            await anext(hub.consume("instance"))
+
+        next_event.cancel()
+        await asyncio.wait({next_event})
+        await hub.close()
+
+    @pytest.mark.asyncio
+    async def test_reader_failures_are_raised_to_consumers(self):
+        client = MockAsyncRedis()
+        client.xread = lambda *args, **kwargs: asyncio.sleep(0, result=[[b"tempus:instance", None]])
+        hub = StreamEventHub(redis_client=client)
+
+        with pytest.raises(TypeError):
+            await asyncio.wait_for(anext(hub.consume("instance")), timeout=1)
+        await hub.close()
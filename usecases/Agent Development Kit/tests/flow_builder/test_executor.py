@@ -0,0 +1,366 @@
+import asyncio
+import json
+import sys
+import threading
+from typing import List
+
+import pytest
+from pydantic import BaseModel
+
+from ibm_watsonx_orchestrate.agent_builder.tools import tool
+from ibm_watsonx_orchestrate.flow_builder.flows import (
+    Assignment, DataMap, END, FlowEventType, FlowExecutionError, FlowFactory, ForeachPolicy, LocalFlowExecutor, START, TaskEventType
+)
+from ibm_watsonx_orchestrate.flow_builder.flows.flow import FlowRunStatus
+
+
+class Customer(BaseModel):
+    name: str
+    email: str
+
+
+class CustomerName(BaseModel):
+    customer_name: str
+
+
+class Counter(BaseModel):
+    count: int
+
+
+@tool
+def get_customers(customer_name: str) -> List[Customer]:
+    """
+    Returns the contacts of a customer.
+
+    Args:
+        customer_name (str): The name of the customer.
+    """
+    return [Customer(name=f"{customer_name} {i}", email=f"contact{i}@acme.com") for i in range(3)]
+
+
+@tool
+def send_invitation(record: Customer) -> str:
+    """
+    Sends an invitation to a customer contact.
+
+    Args:
+        record (Customer): The contact to invite.
+    """
+    return f"Invited {record['email']}"
+
+
+@tool
+def greet(customer_name: str) -> dict:
+    """
+    Greets a customer.
+
+    Args:
+        customer_name (str): The name of the customer.
+    """
+    return {"greeting": f"Hello {customer_name}"}
+
+
+@tool
+def shout(greeting: str) -> dict:
+    """
+    Shouts a greeting.
+
+    Args:
+        greeting (str): The greeting to shout.
+    """
+    return {"shouted": greeting.upper()}
+
+
+@tool
+def increment(count: int) -> Counter:
+    """
+    Adds one to a counter.
+
+    Args:
+        count (int): The counter.
+    """
+    return Counter(count=count + 1)
+
+
+@tool
+def fail(customer_name: str) -> str:
+    """
+    Always fails.
+
+    Args:
+        customer_name (str): The name of the customer.
+    """
+    raise RuntimeError("Mail server unavailable")
+
+
+def build_greeting_flow():
+    aflow = FlowFactory.create_flow(name="greeting", input_schema=CustomerName)
+    aflow.sequence(START, aflow.tool(greet), aflow.tool(shout), END)
+    return aflow
+
+
+def build_invitation_flow():
+    aflow = FlowFactory.create_flow(name="invitation", input_schema=CustomerName)
+    get_customers_node = aflow.tool(get_customers)
+    foreach_flow = aflow.foreach(item_schema=Customer)
+    foreach_flow.sequence(START, foreach_flow.tool(send_invitation), END)
+    aflow.sequence(START, get_customers_node, foreach_flow, END)
+    return aflow
+
+
+def build_branch_flow():
+    aflow = FlowFactory.create_flow(name="branch", input_schema=CustomerName)
+    greet_node = aflow.tool(greet)
+    fail_node = aflow.tool(fail)
+    branch = aflow.branch(evaluator="flow.input.customer_name.strip().lower() == 'ibm'")
+    branch.case(True, greet_node).case(False, fail_node)
+    aflow.edge(START, branch)
+    aflow.edge(greet_node, END)
+    aflow.edge(fail_node, END)
+    return aflow
+
+
+async def collect_events(executor, input_data):
+    return [event async for event in executor.run_events(input_data)]
+
+
+class TestLocalFlowExecutor:
+    @pytest.mark.asyncio
+    async def test_sequence_maps_outputs_to_inputs(self):
+        executor = LocalFlowExecutor(build_greeting_flow())
+
+        events = await collect_events(executor, {"customer_name": "IBM"})
+
+        assert [(event.kind, event.context.task_id) for event in events] == [
+            (FlowEventType.ON_FLOW_START, None),
+            (TaskEventType.ON_TASK_START, "greet"),
+            (TaskEventType.ON_TASK_END, "greet"),
+            (TaskEventType.ON_TASK_START, "shout"),
+            (TaskEventType.ON_TASK_END, "shout"),
+            (FlowEventType.ON_FLOW_END, None),
+        ]
+        assert events[3].context.data.input == {"greeting": "Hello IBM"}
+        assert events[-1].context.data.output == {"shouted": "HELLO IBM"}
+
+    @pytest.mark.asyncio
+    async def test_foreach_runs_body_for_each_item(self):
+        executor = LocalFlowExecutor(build_invitation_flow())
+
+        events = await collect_events(executor, {"customer_name": "IBM"})
+
+        invitations = [event.context.data.output["value"] for event in events if event.kind == TaskEventType.ON_TASK_END and event.context.task_id == "send_invitation"]
+        assert invitations == [f"Invited contact{i}@acme.com" for i in range(3)]
+        assert events[-1].kind == FlowEventType.ON_FLOW_END
+
+    @pytest.mark.asyncio
+    async def test_branch_takes_matching_case(self):
+        assert await LocalFlowExecutor(build_branch_flow()).run({"customer_name": " IBM "}) == {"greeting": "Hello  IBM "}
+
+        with pytest.raises(FlowExecutionError) as e:
+            await LocalFlowExecutor(build_branch_flow()).run({"customer_name": "Acme"})
+        assert e.value.node == "fail"
+        assert "Mail server unavailable" in str(e.value)
+
+    @pytest.mark.asyncio
+    async def test_loop_runs_until_evaluator_is_false(self):
+        aflow = FlowFactory.create_flow(name="counter", input_schema=Counter)
+        loop = aflow.loop(evaluator="flow.input.count < 3", input_schema=Counter, output_schema=Counter)
+        loop.sequence(START, loop.tool(increment), END)
+        aflow.sequence(START, loop, END)
+
+        events = await collect_events(LocalFlowExecutor(aflow), {"count": 0})
+
+        assert len([event for event in events if event.kind == TaskEventType.ON_TASK_END and event.context.task_id == "increment"]) == 3
+        assert events[-1].context.data.output == {"count": 3}
+
+    @pytest.mark.asyncio
+    async def test_input_map(self):
+        aflow = FlowFactory.create_flow(name="mapped")
+        aflow.sequence(START, aflow.tool(greet, input_map=DataMap(maps=[Assignment(target="customer_name", source="=flow.input.first + ' ' + flow.input.last")])), END)
+
+        assert await LocalFlowExecutor(aflow).run({"first": "Ada", "last": "Lovelace"}) == {"greeting": "Hello Ada Lovelace"}
+
+    @pytest.mark.asyncio
+    async def test_independent_branches_run_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        @tool
+        def first(customer_name: str) -> dict:
+            """
+            Waits for the second tool.
+
+            Args:
+                customer_name (str): The name of the customer.
+            """
+            barrier.wait()
+            return {"first": customer_name}
+
+        @tool
+        def second(customer_name: str) -> dict:
+            """
+            Waits for the first tool.
+
+            Args:
+                customer_name (str): The name of the customer.
+            """
+            barrier.wait()
+            return {"second": customer_name}
+
+        aflow = FlowFactory.create_flow(name="fan_out")
+        first_node, second_node = aflow.tool(first), aflow.tool(second)
+        aflow.edge(START, first_node).edge(START, second_node).edge(first_node, END).edge(second_node, END)
+
+        assert await LocalFlowExecutor(aflow).run({"customer_name": "IBM"}) == {"first": "IBM", "second": "IBM"}
+
+    @pytest.mark.asyncio
+    async def test_runs_serialized_model(self):
+        model = json.loads(json.dumps(build_branch_flow().to_json()))
+        executor = LocalFlowExecutor(model, tools={"greet": lambda customer_name: {"greeting": f"Hi {customer_name}"}})
+
+        assert await executor.run({"customer_name": "IBM"}) == {"greeting": "Hi IBM"}
+
+    @pytest.mark.asyncio
+    async def test_nodes_without_local_implementation_need_a_handler(self):
+        aflow = FlowFactory.create_flow(name="agent_flow")
+        aflow.sequence(START, aflow.agent(name="ask_agent", agent="weather_agent", input_schema=CustomerName), END)
+
+        with pytest.raises(FlowExecutionError, match="cannot run locally"):
+            await LocalFlowExecutor(aflow).run({"customer_name": "IBM"})
+
+        async def ask_agent(input_data):
+            return {"weather": f"Sunny at {input_data['customer_name']}"}
+
+        assert await LocalFlowExecutor(aflow, handlers={"ask_agent": ask_agent}).run({"customer_name": "IBM"}) == {"weather": "Sunny at IBM"}
+
+    @pytest.mark.asyncio
+    async def test_runs_without_services(self, monkeypatch):
+        def unavailable(*args, **kwargs):
+            raise AssertionError("The local executor must not reach Tempus or redis")
+
+        # The flows package exports the flow decorator under the name of the module
+        flow_module = sys.modules[FlowRunStatus.__module__]
+        for name in ("instantiate_client", "get_event_hub", "import_flow_model"):
+            monkeypatch.setattr(flow_module, name, unavailable)
+
+        sleeps = []
+        real_sleep = asyncio.sleep
+
+        async def record_sleep(seconds, *args, **kwargs):
+            sleeps.append(seconds)
+            return await real_sleep(0, *args, **kwargs)
+
+        monkeypatch.setattr(asyncio, "sleep", record_sleep)
+        executor = LocalFlowExecutor(build_invitation_flow())
+
+        for _ in range(20):
+            events = await collect_events(executor, {"customer_name": "IBM"})
+            assert events[-1].kind == FlowEventType.ON_FLOW_END
+
+        # Runs are driven by the nodes alone, never waiting on a deploy, a poll or a timer
+        assert sleeps == []
+
+
+class TestInvokeLocal:
+    @pytest.mark.asyncio
+    async def test_completed_run(self):
+        outputs = []
+
+        flow_run = await build_greeting_flow().compile().invoke_local({"customer_name": "IBM"}, on_flow_end_handler=outputs.append)
+
+        assert flow_run.status == FlowRunStatus.COMPLETED
+        assert flow_run.output == {"shouted": "HELLO IBM"}
+        assert outputs == [{"shouted": "HELLO IBM"}]
+        assert flow_run.duration is not None
+
+    @pytest.mark.asyncio
+    async def test_failed_run(self):
+        errors = []
+
+        flow_run = await build_branch_flow().compile().invoke_local({"customer_name": "Acme"}, on_flow_error_handler=errors.append)
+
+        assert flow_run.status == FlowRunStatus.FAILED
+        assert flow_run.error == {"node": "fail", "message": "Mail server unavailable"}
+        assert errors == [flow_run.error]
+
+
+class TestParallelForeach:
+    @staticmethod
+    def build_flow(policy, max_concurrency=None, delays=None, in_flight=None):
+        delays = delays or {}
+        in_flight = in_flight if in_flight is not None else {"now": 0, "max": 0}
+
+        @tool
+        async def invite(record: Customer) -> str:
+            """
+            Sends an invitation over the network.
+
+            Args:
+                record (Customer): The contact to invite.
+            """
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await asyncio.sleep(delays.get(record["name"], 0.02))
+            in_flight["now"] -= 1
+            return f"Invited {record['email']}"
+
+        aflow = FlowFactory.create_flow(name="invitation")
+        foreach_flow = aflow.foreach(item_schema=Customer).policy(policy, max_concurrency=max_concurrency)
+        foreach_flow.sequence(START, foreach_flow.tool(invite), END)
+        aflow.sequence(START, foreach_flow, END)
+        return aflow
+
+    @staticmethod
+    def get_items(count):
+        return {"items": [{"name": f"contact_{i}", "email": f"contact{i}@acme.com"} for i in range(count)]}
+
+    @staticmethod
+    def get_invitations(events):
+        return [event.context.data.output["value"] for event in events if event.kind == TaskEventType.ON_TASK_END and event.context.task_id == "invite"]
+
+    @pytest.mark.asyncio
+    async def test_parallel_items_overlap(self):
+        in_flight = {}
+        for policy in (ForeachPolicy.SEQUENTIAL, ForeachPolicy.PARALLEL):
+            in_flight[policy] = {"now": 0, "max": 0}
+            executor = LocalFlowExecutor(self.build_flow(policy, in_flight=in_flight[policy]))
+            await executor.run(self.get_items(20))
+
+        assert in_flight[ForeachPolicy.SEQUENTIAL]["max"] == 1
+        # Without a max_concurrency every item is started before the first one ends
+        assert in_flight[ForeachPolicy.PARALLEL]["max"] == 20
+
+    @pytest.mark.asyncio
+    async def test_output_order_is_stable(self):
+        # Later items end first
+        delays = {f"contact_{i}": 0.01 * (5 - i) for i in range(5)}
+        executor = LocalFlowExecutor(self.build_flow(ForeachPolicy.PARALLEL, delays=delays))
+
+        events = await collect_events(executor, self.get_items(5))
+
+        assert self.get_invitations(events) == [f"Invited contact{i}@acme.com" for i in reversed(range(5))]
+        foreach_output = next(event for event in events if event.kind == TaskEventType.ON_TASK_END and event.context.task_id.startswith("foreach"))
+        assert foreach_output.context.data.output["value"] == [f"Invited contact{i}@acme.com" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency(self):
+        in_flight = {"now": 0, "max": 0}
+        executor = LocalFlowExecutor(self.build_flow(ForeachPolicy.PARALLEL, max_concurrency=3, in_flight=in_flight, delays={}))
+
+        await executor.run(self.get_items(10))
+
+        assert in_flight["max"] == 3
+
+    def test_policy_serialisation(self):
+        foreach_spec = self.build_flow(ForeachPolicy.PARALLEL, max_concurrency=4).to_json()["nodes"]["foreach_1"]["spec"]
+        assert (foreach_spec["foreach_policy"], foreach_spec["max_concurrency"]) == ("PARALLEL", 4)
+
+        foreach_spec = self.build_flow(ForeachPolicy.SEQUENTIAL).to_json()["nodes"]["foreach_1"]["spec"]
+        assert foreach_spec["foreach_policy"] == "SEQUENTIAL"
+        assert "max_concurrency" not in foreach_spec
+
+    def test_max_concurrency_needs_parallel_policy(self):
+        aflow = FlowFactory.create_flow(name="invitation")
+        with pytest.raises(ValueError):
+            aflow.foreach(item_schema=Customer).policy(ForeachPolicy.SEQUENTIAL, max_concurrency=2)
+        with pytest.raises(ValueError):
+            aflow.foreach(item_schema=Customer).policy(ForeachPolicy.PARALLEL, max_concurrency=0)
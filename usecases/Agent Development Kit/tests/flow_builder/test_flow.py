@@ -0,0 +1,160 @@
+import asyncio
+import itertools
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel
+
+from ibm_watsonx_orchestrate.flow_builder.flows import (
+    CompiledFlow, FlowBatchStats, FlowContext, FlowEvent, FlowEventType, FlowFactory
+)
+from ibm_watsonx_orchestrate.flow_builder.flows.flow import FlowRun, FlowRunStatus
+from ibm_watsonx_orchestrate.flow_builder.types import FlowData
+
+
+class Customer(BaseModel):
+    name: str
+
+
+class MockTempusService:
+    """
+    Stands in for both the tempus client and the event hub, ending each run after delay seconds
+    """
+
+    def __init__(self, delay=0.01, fail_names=(), error_names=()):
+        self.delay = delay
+        self.fail_names = fail_names
+        self.error_names = error_names
+        self.ids = itertools.count()
+        self.inputs = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def arun_flow(self, name, input_data):
+        if input_data["name"] in self.fail_names:
+            raise ConnectionError("Unable to start flow")
+        instance_id = str(next(self.ids))
+        self.inputs[instance_id] = input_data
+        return {"instance_id": instance_id}
+
+    async def consume(self, instance_id):
+        input_data = self.inputs[instance_id]
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+
+        if input_data["name"] in self.error_names:
+            yield FlowEvent(kind=FlowEventType.ON_FLOW_ERROR, context=None, error={"message": "failed"})
+        else:
+            yield FlowEvent(kind=FlowEventType.ON_FLOW_END, context=FlowContext(data=FlowData(output=input_data)))
+
+
+@pytest.fixture
+def tempus():
+    service = MockTempusService()
+    with patch("ibm_watsonx_orchestrate.flow_builder.flows.flow.instantiate_client", return_value=service), \
+         patch("ibm_watsonx_orchestrate.flow_builder.flows.flow.get_event_hub", return_value=service):
+        yield service
+
+
+def get_compiled_flow(deployed=True):
+    with patch("ibm_watsonx_orchestrate.flow_builder.flows.flow.instantiate_client"):
+        send_invitation_flow = FlowFactory.create_flow(name="send_invitation", input_schema=Customer, output_schema=Customer)
+    return CompiledFlow(flow=send_invitation_flow, deployed=deployed)
+
+
+class TestInvokeMany:
+    @pytest.mark.asyncio
+    async def test_runs_every_input_with_bounded_concurrency(self, tempus):
+        inputs = [{"name": f"customer_{i}"} for i in range(50)]
+        batches = []
+
+        results = [result async for result in get_compiled_flow().invoke_many(inputs, max_concurrency=5, on_batch_end_handler=batches.append)]
+
+        assert sorted(input_data["name"] for input_data, _ in results) == sorted(input_data["name"] for input_data in inputs)
+        for input_data, flow_run in results:
+            assert flow_run.status == FlowRunStatus.COMPLETED
+            assert flow_run.output == input_data
+            assert flow_run.duration >= tempus.delay
+        assert tempus.max_in_flight == 5
+
+        stats, = batches
+        assert (stats.total, stats.completed, stats.failed) == (50, 50, 0)
+        assert stats.throughput > 0
+        assert tempus.delay <= stats.latency_p50 <= stats.latency_p90 <= stats.latency_p99
+
+    @pytest.mark.asyncio
+    async def test_failed_runs_do_not_stop_the_batch(self, tempus):
+        tempus.fail_names = ("not_started",)
+        tempus.error_names = ("errored",)
+        batches = []
+        inputs = [{"name": "not_started"}, {"name": "errored"}, {"name": "completed"}]
+
+        results = {input_data["name"]: flow_run async for input_data, flow_run in get_compiled_flow().invoke_many(inputs, on_batch_end_handler=batches.append)}
+
+        assert results["not_started"].status == FlowRunStatus.FAILED
+        assert results["not_started"].error == "Unable to start flow"
+        assert results["errored"].status == FlowRunStatus.FAILED
+        assert results["errored"].error == {"message": "failed"}
+        assert results["completed"].status == FlowRunStatus.COMPLETED
+        assert (batches[0].completed, batches[0].failed) == (1, 2)
+
+    @pytest.mark.asyncio
+    async def test_inputs_are_consumed_lazily(self, tempus):
+        consumed = []
+
+        def generate_inputs():
+            for i in range(1000):
+                consumed.append(i)
+                yield {"name": f"customer_{i}"}
+
+        runs = get_compiled_flow().invoke_many(generate_inputs(), max_concurrency=4)
+        await anext(runs)
+        await runs.aclose()
+
+        # At most the first window plus the runs started in place of those that ended
+        assert len(consumed) <= 8
+        assert len(tempus.inputs) <= 8
+        assert tempus.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_runs_overlap_up_to_the_window(self, tempus):
+        count = 200
+
+        results = [result async for result in get_compiled_flow().invoke_many(({"name": f"customer_{i}"} for i in range(count)), max_concurrency=50)]
+
+        assert len(results) == count
+        assert all(flow_run.status == FlowRunStatus.COMPLETED for _, flow_run in results)
+        # The whole window runs at once instead of one run at a time
+        assert tempus.max_in_flight == 50
+
+    @pytest.mark.asyncio
+    async def test_requires_deployed_flow(self):
+        with pytest.raises(ValueError):
+            await anext(get_compiled_flow(deployed=False).invoke_many([{"name": "customer"}]))
+
+        with pytest.raises(ValueError):
+            await anext(get_compiled_flow().invoke_many([{"name": "customer"}], max_concurrency=0))
+
+
+class TestFlowBatchStats:
+    def test_percentiles(self):
+        runs = [
+            FlowRun.model_construct(duration=duration / 100, status=FlowRunStatus.COMPLETED)
+            for duration in range(1, 101)
+        ]
+
+        stats = FlowBatchStats.from_runs(runs, elapsed=2)
+
+        assert (stats.total, stats.throughput) == (100, 50)
+        assert (stats.latency_p50, stats.latency_p90, stats.latency_p99) == (0.5, 0.9, 0.99)
+        assert "p99 0.99s" in str(stats)
+
+    def test_empty_batch(self):
+        stats = FlowBatchStats.from_runs([], elapsed=0)
+
+        assert stats.latency_p50 is None
+        assert "p50 n/a" in str(stats)
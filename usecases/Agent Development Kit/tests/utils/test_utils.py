@@ -0,0 +1,60 @@
+import io
+import zipfile
+
+from ibm_watsonx_orchestrate.utils.utils import check_file_in_zip, copy_zip_entry
+
+
+def build_zip(entries: dict[str, bytes], compression=zipfile.ZIP_DEFLATED) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression) as zip_file:
+        for name, data in entries.items():
+            zip_file.writestr(name, data)
+    return buffer.getvalue()
+
+
+class TestCheckFileInZip:
+    def test_check_file_in_zip(self):
+        with zipfile.ZipFile(io.BytesIO(), "w") as zip_file:
+            zip_file.writestr("export/agents/native/agent.yaml", "name: agent")
+
+            assert check_file_in_zip("export/agents", zip_file)
+            assert check_file_in_zip("export/agents/native/", zip_file)
+            assert not check_file_in_zip("export/tools", zip_file)
+            assert not check_file_in_zip("export/agents/native/agent.yaml", zip_file)
+
+            zip_file.writestr("export/tools/my_tool/tool.py", "")
+
+            assert check_file_in_zip("export/tools/my_tool/", zip_file)
+            assert not check_file_in_zip("export/tools/my_tool_2/", zip_file)
+
+
+class TestCopyZipEntry:
+    def test_copy_zip_entry(self):
+        data = b"print('hello')\n" * 1000
+        source = build_zip({"tool.py": data, "requirements.txt": b"requests\n"})
+
+        output = io.BytesIO()
+        with zipfile.ZipFile(io.BytesIO(source)) as zip_file_in, zipfile.ZipFile(output, "w") as zip_file_out:
+            zip_file_out.writestr("export/agent.yaml", "name: agent")
+            for item in zip_file_in.infolist():
+                copy_zip_entry(zip_file_in, item, zip_file_out, f"export/tools/my_tool/{item.filename}")
+
+        with zipfile.ZipFile(io.BytesIO(source)) as zip_file_in, zipfile.ZipFile(output) as zip_file_out:
+            assert zip_file_out.testzip() is None
+            assert zip_file_out.namelist() == ["export/agent.yaml", "export/tools/my_tool/tool.py", "export/tools/my_tool/requirements.txt"]
+            assert zip_file_out.read("export/tools/my_tool/tool.py") == data
+            copied = zip_file_out.getinfo("export/tools/my_tool/tool.py")
+            original = zip_file_in.getinfo("tool.py")
+            assert copied.compress_type == zipfile.ZIP_DEFLATED
+            assert (copied.CRC, copied.date_time, copied.external_attr) == (original.CRC, original.date_time, original.external_attr)
+
+    def test_copy_zip_entry_stored(self):
+        source = build_zip({"tool.py": b"x = 1\n"}, compression=zipfile.ZIP_STORED)
+
+        output = io.BytesIO()
+        with zipfile.ZipFile(io.BytesIO(source)) as zip_file_in, zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as zip_file_out:
+            copy_zip_entry(zip_file_in, zip_file_in.getinfo("tool.py"), zip_file_out, "copy.py")
+
+        with zipfile.ZipFile(output) as zip_file_out:
+            assert zip_file_out.getinfo("copy.py").compress_type == zipfile.ZIP_STORED
+            assert zip_file_out.read("copy.py") == b"x = 1\n"